@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+벡터 검색 SQL 벤치마크
+기존 검색 SQL(WHERE 1 - (embedding <=> q) > 임계값, 질의 벡터 3회 바인딩)과
+vector_search.nearest_sql(인덱스로 상위 k개 → 임계값, 1회 바인딩)의 실행 계획 / 지연 시간 / 결과 수 / 재현율 비교
+
+별도 테이블(기본값: vector_search_benchmark)에 임의 벡터를 채워 측정하고 끝나면 삭제 (--keep으로 유지)
+이미 있는 테이블은 이름이 vector_search_benchmark로 시작할 때만 다시 생성 (그 밖의 테이블은 --force 필요 - 운영 테이블 보호)
+
+사용법:
+    python benchmark_vector_search.py                                    # 10만 행, 1536차원, HNSW
+    python benchmark_vector_search.py --rows 100000 --dimension 384 --method ivfflat --threshold 0.5
+    python benchmark_vector_search.py --output search-benchmark.json
+
+연결 정보는 DualDatabaseService와 같은 DB_HOST / DB_PORT / DB_NAME / DB_USER / DB_PASSWORD
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import psycopg2
+
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir.parent))
+
+from langchain_service.services.table_embeddings import connection_params  # noqa: E402
+from langchain_service.services.vector_index import (  # noqa: E402
+    METHOD_IVFFLAT, SEARCH_PARAMETERS, IndexState, ivfflat_lists, vector_index_manager
+)
+from langchain_service.services.vector_search import explain, nearest_sql, vector_literal  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("benchmark_vector_search")
+
+COLUMNS = ['id', 'title', 'source']
+BENCHMARK_PREFIX = 'vector_search_benchmark'
+
+
+def legacy_sql(table: str) -> str:
+    """기존 PgVectorService.search_similar_articles SQL (질의 벡터 텍스트 3회 바인딩)"""
+    return f"""
+        SELECT {', '.join(COLUMNS)},
+               1 - (embedding <=> %s) as similarity
+        FROM {table}
+        WHERE 1 - (embedding <=> %s) > %s
+        ORDER BY embedding <=> %s
+        LIMIT %s
+    """
+
+
+def table_exists(cur, table: str) -> bool:
+    cur.execute("SELECT to_regclass(%s) IS NOT NULL", (table,))
+    return cur.fetchone()[0]
+
+
+def populate(cur, table: str, rows: int, dimension: int, clusters: int):
+    """군집 중심 + 잡음 벡터 (DB 안에서 생성 - 대용량 텍스트 전송 없이)"""
+    cur.execute(f"DROP TABLE IF EXISTS {table}")
+    cur.execute(f"CREATE TABLE {table} (id SERIAL PRIMARY KEY, title TEXT, source TEXT, embedding vector({dimension}))")
+    cur.execute("DROP TABLE IF EXISTS benchmark_centers")
+    cur.execute("""
+        CREATE TEMP TABLE benchmark_centers AS
+        SELECT c AS center, array_agg(random() - 0.5) AS values
+        FROM generate_series(1, %s) c, generate_series(1, %s) d
+        GROUP BY c
+    """, (clusters, dimension))
+    started = time.perf_counter()
+    cur.execute(f"""
+        INSERT INTO {table} (title, source, embedding)
+        SELECT 'article ' || g, (ARRAY['coindesk', 'cointelegraph', 'decrypt'])[1 + g %% 3],
+               (SELECT array_agg(v + (random() - 0.5) * 0.6) FROM unnest(c.values) v)::vector
+        FROM generate_series(1, %s) g
+        JOIN benchmark_centers c ON c.center = 1 + g %% %s
+    """, (rows, clusters))
+    cur.execute("DROP TABLE benchmark_centers")
+    cur.execute(f"ANALYZE {table}")
+    logger.info(f"📦 {rows}행 생성 ({dimension}차원, {time.perf_counter() - started:.1f}초)")
+
+
+def measure(cur, sql: str, make_params, queries: List[Dict[str, Any]], truth: List[List[int]], k: int) -> Dict[str, Any]:
+    latencies, counts, recalls = [], [], []
+    for query, expected in zip(queries, truth):
+        params = make_params(query)
+        started = time.perf_counter()
+        cur.execute(sql, params)
+        found = [row[0] for row in cur.fetchall()]
+        latencies.append((time.perf_counter() - started) * 1000)
+        counts.append(len(found))
+        recalls.append(len(set(found) & set(expected)) / max(len(expected), 1) if expected else 1.0)
+    summary = explain(cur, sql, make_params(queries[0]), analyze=True)
+    ordered = sorted(latencies)
+    return {
+        'plan_index_scans': summary['index_scans'],
+        'plan_seq_scans': summary['seq_scans'],
+        'p50_ms': round(statistics.median(latencies), 2),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(0.95 * (len(ordered) - 1)))], 2),
+        'avg_results': round(statistics.mean(counts), 2),
+        f'recall@{k}': round(statistics.mean(recalls), 4),
+        'query_bytes': len(cur.mogrify(sql, make_params(queries[0])))
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="벡터 검색 SQL 벤치마크")
+    parser.add_argument('--table', default='vector_search_benchmark', help='벤치마크 테이블 (실행 시 다시 생성)')
+    parser.add_argument('--rows', type=int, default=100000, help='행 수')
+    parser.add_argument('--dimension', type=int, default=1536, help='벡터 차원')
+    parser.add_argument('--clusters', type=int, default=1000, help='군집 수')
+    parser.add_argument('--method', choices=['hnsw', 'ivfflat'], default='hnsw', help='인덱스 방식')
+    parser.add_argument('--search-value', type=int, default=None, help='ef_search / probes (기본값: 재현율 목표 경험식)')
+    parser.add_argument('--queries', type=int, default=50, help='질의 수')
+    parser.add_argument('--k', type=int, default=10, help='상위 k')
+    parser.add_argument('--threshold', type=float, default=0.3, help='유사도 임계값')
+    parser.add_argument('--keep', action='store_true', help='끝난 뒤 테이블 유지')
+    parser.add_argument('--force', action='store_true',
+                        help=f'{BENCHMARK_PREFIX}로 시작하지 않는 기존 테이블도 삭제 후 다시 생성')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    conn = psycopg2.connect(**connection_params())
+    conn.autocommit = True
+    table, k = args.table, args.k
+    with conn.cursor() as cur:
+        if not table.startswith(BENCHMARK_PREFIX) and table_exists(cur, table) and not args.force:
+            logger.error(f"❌ {table} 테이블이 이미 있습니다 - 벤치마크는 테이블을 삭제하므로 "
+                         f"{BENCHMARK_PREFIX}로 시작하는 이름을 쓰거나 --force로 실행하세요")
+            conn.close()
+            return 1
+    try:
+        with conn.cursor() as cur:
+            populate(cur, table, args.rows, args.dimension, args.clusters)
+            lists = ivfflat_lists(args.rows) if args.method == METHOD_IVFFLAT else None
+            started = time.perf_counter()
+            cur.execute(vector_index_manager.index_sql(table, f"{table}_embedding_idx", args.method, lists))
+            cur.execute(f"ANALYZE {table}")
+            build_seconds = round(time.perf_counter() - started, 1)
+            logger.info(f"🔨 {args.method} 인덱스 생성 {build_seconds}초")
+
+            # 질의: 저장된 벡터에 잡음 (저장 행 자체와 정확히 같지 않게)
+            cur.execute(f"""
+                SELECT (SELECT array_agg(v + (random() - 0.5) * 0.2) FROM unnest(embedding::real[]) v)::real[]
+                FROM {table} ORDER BY random() LIMIT %s
+            """, (args.queries,))
+            queries = [row[0] for row in cur.fetchall()]
+
+            # 정답: 인덱스 없이 정확 검색 후 임계값
+            conn.autocommit = False
+            cur.execute("SET LOCAL enable_indexscan = off")
+            cur.execute("SET LOCAL enable_bitmapscan = off")
+            truth = []
+            for query in queries:
+                cur.execute(f"""
+                    SELECT id, 1 - (embedding <=> %s::vector) FROM {table}
+                    ORDER BY embedding <=> %s::vector LIMIT %s
+                """, (vector_literal(query), vector_literal(query), k))
+                truth.append([row[0] for row in cur.fetchall() if row[1] > args.threshold])
+            conn.rollback()
+
+            state_value = args.search_value
+            if state_value is None:
+                state_value = vector_index_manager.search_value(
+                    IndexState(table, f"{table}_embedding_idx", args.method, lists, args.rows, args.rows, None, (), None), k
+                )
+            cur.execute("SELECT set_config(%s, %s, false)", (SEARCH_PARAMETERS[args.method], str(state_value)))
+
+            results = {
+                'legacy': measure(
+                    cur, legacy_sql(table),
+                    lambda query: (vector_literal(query), vector_literal(query), args.threshold, vector_literal(query), k),
+                    queries, truth, k
+                ),
+                'nearest_sql': measure(
+                    cur, nearest_sql(table, COLUMNS),
+                    lambda query: {'query': vector_literal(query), 'threshold': args.threshold, 'limit': k},
+                    queries, truth, k
+                ),
+            }
+            conn.rollback()
+    finally:
+        conn.autocommit = True
+        if not args.keep:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.close()
+
+    print()
+    print(f"{args.rows}행 × {args.dimension}차원, {args.method} ({SEARCH_PARAMETERS[args.method]}={state_value}), "
+          f"k={k}, 임계값 {args.threshold}")
+    header = f"{'sql':<14}{'index scan':>12}{'p50 ms':>10}{'p95 ms':>10}{'results':>9}{f'recall@{k}':>11}{'bytes':>9}"
+    print(header)
+    print('-' * len(header))
+    for name, row in results.items():
+        print(f"{name:<14}{'yes' if row['plan_index_scans'] else 'NO':>12}{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}"
+              f"{row['avg_results']:>9.1f}{row[f'recall@{k}']:>11.4f}{row['query_bytes']:>9}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({
+            'rows': args.rows, 'dimension': args.dimension, 'method': args.method,
+            'search_value': state_value, 'k': k, 'threshold': args.threshold,
+            'index_build_seconds': build_seconds, 'results': results
+        }, ensure_ascii=False, indent=2), encoding='utf-8')
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -31,7 +31,8 @@ if sys.platform == "win32":
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from services.dual_db_service import DualDatabaseService
+from services.dual_db_service import DualDatabaseService, EMBEDDING_SOURCE_SUMMARY
+from services.embedding_service import embedding_service
 
 class BitcoinNewsPipeline:
     def __init__(self):
@@ -93,7 +94,7 @@ class BitcoinNewsPipeline:
             self.logger.info(f"NewsData.io API 요청 시작 (한국어 비트코인 뉴스, 최대 {limit}개)")
             
             response = requests.get(
-                'https://newsdata.io/api/1/news',
+                f"{os.getenv('NEWSDATA_BASE_URL', 'https://newsdata.io/api/1')}/news",
                 params=params,
                 timeout=30
             )
@@ -370,33 +371,31 @@ class BitcoinNewsPipeline:
         
         embedded_articles = []
         
-        for i, article in enumerate(articles):
-            try:
-                summary = article.get('summary', '')
-                if not summary:
-                    self.logger.warning(f"요약이 없음: {article.get('title', 'No title')}")
-                    continue
-                
-                self.logger.info(f"임베딩 생성: {i+1}/{len(articles)} - {article.get('title', '')[:50]}...")
-                
-                # 임베딩 생성
-                response = self.openai_client.embeddings.create(
-                    model="text-embedding-ada-002",
-                    input=summary
-                )
-                
-                embedding = response.data[0].embedding
-                
-                article['embedding'] = embedding
-                embedded_articles.append(article)
-                self.logger.info(f"임베딩 생성 완료: {len(embedding)} 차원")
-                
-                # API 제한 방지를 위한 대기
-                time.sleep(0.5)
-                
-            except Exception as e:
-                self.logger.error(f"임베딩 생성 실패: {article.get('title', 'No title')} - {e}")
+        candidates = []
+        for article in articles:
+            if not article.get('summary', ''):
+                self.logger.warning(f"요약이 없음: {article.get('title', 'No title')}")
                 continue
+            candidates.append(article)
+        
+        # 요약 전체를 토큰 예산 단위 배치로 임베딩 (캐시에 있는 요약은 API 호출 없음,
+        # 분당 한도 페이싱 / 실패 배치 재시도는 임베딩 서비스가 처리)
+        try:
+            embeddings = embedding_service.embed_many(
+                [article['summary'] for article in candidates],
+                self.dual_db_service.ingest_model,
+                skip_failed=True
+            )
+        except Exception as e:
+            self.logger.error(f"임베딩 생성 실패: {e}")
+            return []
+        
+        for article, embedding in zip(candidates, embeddings):
+            if embedding is None:
+                self.logger.error(f"임베딩 생성 실패: {article.get('title', 'No title')}")
+                continue
+            article['embedding'] = embedding
+            embedded_articles.append(article)
         
         self.logger.info(f"임베딩 생성 완료: {len(embedded_articles)}개")
         return embedded_articles
@@ -404,6 +403,7 @@ class BitcoinNewsPipeline:
     def step5_store_in_vector_db(self, articles: List[Dict[str, Any]]) -> int:
         """
         5단계: Vector DB에 저장 (중복 체크 포함)
+        4단계의 요약 임베딩을 중복 확인과 저장에 그대로 사용 (기사당 임베딩 1회)
         """
         self.logger.info("5단계: Vector DB 저장 시작")
         
@@ -423,12 +423,20 @@ class BitcoinNewsPipeline:
                     except:
                         published_date = datetime.now()
                 
-                # 기존 데이터베이스에서 중복 체크
-                existing = self.dual_db_service.search_similar_articles(
-                    query=title,
-                    limit=1,
-                    similarity_threshold=0.9
-                )
+                # 기존 데이터베이스에서 중복 체크 (요약 임베딩 재사용, 없으면 제목 임베딩)
+                embedding = article.get('embedding')
+                if embedding is not None:
+                    existing = self.dual_db_service.search_similar_by_embedding(
+                        embedding,
+                        limit=1,
+                        similarity_threshold=0.9
+                    )
+                else:
+                    existing = self.dual_db_service.search_similar_articles(
+                        query=title,
+                        limit=1,
+                        similarity_threshold=0.9
+                    )
                 
                 if existing and len(existing) > 0:
                     # 제목이 매우 유사한 기사가 이미 존재
@@ -448,10 +456,17 @@ class BitcoinNewsPipeline:
                     'sentiment': 'neutral',  # 기본값
                     'raw_data': article.get('raw_data', {})
                 }
+                if embedding is not None:
+                    db_article.update({
+                        'embedding': embedding,
+                        'embedding_model': self.dual_db_service.ingest_model,
+                        'embedding_source': EMBEDDING_SOURCE_SUMMARY,
+                        'embedding_text': article.get('summary', '')
+                    })
                 
                 # 데이터베이스에 저장
                 try:
-                    success = self.dual_db_service.insert_news_article(db_article)
+                    success = self.dual_db_service.insert_news_article(db_article, invalidate_cache=False)
                     
                     if success:
                         stored_count += 1
@@ -470,6 +485,11 @@ class BitcoinNewsPipeline:
                 continue
         
         self.logger.info(f"Vector DB 저장 완료: 저장 {stored_count}개, 중복 {duplicate_count}개, 오류 {error_count}개")
+        
+        # 저장 단계가 끝난 뒤 한 번만 챗봇 응답 캐시 무효화
+        if stored_count:
+            self.dual_db_service.invalidate_response_cache(f"{stored_count} articles stored")
+        
         return stored_count
     
     def _extract_keywords(self, text: str) -> List[str]:
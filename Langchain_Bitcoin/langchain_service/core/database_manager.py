@@ -14,6 +14,12 @@ import redis
 import json
 from dataclasses import dataclass, asdict
 
+from langchain_service.services.metrics import track_db
+from langchain_service.services.execution_service import execution_layer
+from langchain_service.services.table_embeddings import table_embedding_models
+from langchain_service.services.vector_index import vector_index_manager
+from langchain_service.services.vector_search import nearest_sql, register_vector_codec
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -74,7 +80,7 @@ class DatabaseManager:
             logger.info("🔧 통합 데이터베이스 매니저 초기화 중...")
             
             # PgVector 연결 풀 생성
-            self.pgvector_pool = await asyncpg.create_pool(**self.pgvector_config)
+            self.pgvector_pool = await asyncpg.create_pool(**self.pgvector_config, init=register_vector_codec)
             logger.info("✅ PgVector 연결 풀 생성 완료")
             
             # PostgreSQL 연결 풀 생성
@@ -175,6 +181,7 @@ class DatabaseManager:
         except Exception as e:
             logger.debug(f"캐시 저장 실패: {e}")
     
+    @track_db('news_search_advanced')
     async def search_news_advanced(
         self, 
         query: str, 
@@ -204,27 +211,25 @@ class DatabaseManager:
                 if use_vector_search:
                     # 벡터 검색 시도
                     try:
-                        # OpenAI 임베딩 생성
-                        from openai import OpenAI
-                        client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-                        
-                        embedding_response = client.embeddings.create(
-                            model="text-embedding-ada-002",
-                            input=query
+                        # 질의 임베딩 (crypto_news 벡터와 같은 모델, 검색 질의 LRU → 공용 임베딩 캐시,
+                        # 블로킹 호출은 실행 계층에서)
+                        query_embedding = await execution_layer.run_blocking(
+                            'news_search', table_embedding_models.embed_query, 'crypto_news', query
+                        )
+                        # 벡터 검색 실행 (인덱스로 상위 limit개 → 임계값, 질의 벡터는 이진 코덱으로 1회 바인딩)
+                        vector_query = nearest_sql(
+                            'crypto_news', ['id', 'title', 'summary', 'url', 'source', 'published_date'],
+                            query='$1::vector', limit='$2', threshold='$3', similarity='similarity_score'
                         )
-                        query_embedding = embedding_response.data[0].embedding
-                        
-                        # 벡터 검색 실행
-                        vector_query = """
-                            SELECT id, title, summary, url, source, published_date,
-                                   1 - (embedding <=> $1::vector) as similarity_score
-                            FROM crypto_news 
-                            WHERE embedding IS NOT NULL
-                            ORDER BY embedding <=> $1::vector
-                            LIMIT $2
-                        """
                         
-                        rows = await conn.fetch(vector_query, query_embedding, limit)
+                        # 재현율 목표에 맞춘 probes / ef_search (트랜잭션 로컬 설정)
+                        settings = await execution_layer.run_blocking(
+                            'news_search', vector_index_manager.search_settings, 'crypto_news', limit
+                        )
+                        async with conn.transaction():
+                            for name, value in settings.items():
+                                await conn.execute("SELECT set_config($1, $2, true)", name, value)
+                            rows = await conn.fetch(vector_query, query_embedding, limit, similarity_threshold)
                         
                         for row in rows:
                             if row['similarity_score'] >= similarity_threshold:
@@ -243,6 +248,9 @@ class DatabaseManager:
                         
                     except Exception as vector_error:
                         logger.warning(f"벡터 검색 실패, 키워드 검색으로 폴백: {vector_error}")
+                        if 'dimensions' in str(vector_error):
+                            # 재임베딩 교체 직후 (컬럼 차원 변경) → 다음 검색에서 모델 기록을 다시 읽음
+                            table_embedding_models.invalidate('crypto_news')
                         use_vector_search = False
                 
                 # 벡터 검색 실패 또는 결과 부족 시 키워드 검색
@@ -300,6 +308,7 @@ class DatabaseManager:
             logger.error(f"고급 뉴스 검색 실패: {e}")
             return []
     
+    @track_db('recent_news')
     async def get_recent_news(self, hours: int = 24, limit: int = 10) -> List[NewsArticle]:
         """최근 뉴스 조회"""
         cache_key = self.get_cache_key("recent_news", {"hours": hours, "limit": limit})
@@ -345,6 +354,7 @@ class DatabaseManager:
             logger.error(f"최근 뉴스 조회 실패: {e}")
             return []
     
+    @track_db('statistics')
     async def get_database_stats(self) -> Dict[str, Any]:
         """데이터베이스 통계 조회"""
         cache_key = "db_stats"
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+로컬 Intent 분류기 평가
+서비스와 같은 학습 데이터(Intent 예시 + 로컬 학습 문장, 선택: 트래픽 기록)로 학습한 뒤
+학습에 쓰지 않은 평가 문장(intent_examples.EVALUATION_EXAMPLES)으로 측정
+
+- 정확도: 평가 문장 전체 / Intent별 (신뢰도와 관계없이 가장 높은 Intent)
+- 임계값별 로컬 처리 비율(hit)과 정밀도: 서비스 임계값(원격 분류 생략 / 폴백) + 목표 정밀도별 임계값
+- 의미 없는 입력(OUT_OF_DOMAIN_EXAMPLES)이 세션 상태를 바꾸는 Intent로 분류되는 수
+- 교차 검증 정확도 / 온도 / 학습 시간
+
+같은 --seed면 같은 결과 (교차 검증 분할 고정)
+임계값 목표는 서비스와 같은 LOCAL_INTENT_PRECISION / LOCAL_INTENT_FALLBACK_PRECISION
+
+사용법:
+    python evaluate_intent_classifier.py
+    python evaluate_intent_classifier.py --traffic .cache/intent_traffic.jsonl --output intent-eval.json
+    python evaluate_intent_classifier.py --min-accuracy 0.9                  # 미달 시 종료 코드 1
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir.parent))
+
+from langchain_service.services.intent_examples import (  # noqa: E402
+    EVALUATION_EXAMPLES, INTENT_EXAMPLES, LOCAL_TRAINING_EXAMPLES, OUT_OF_DOMAIN_EXAMPLES, merge_examples
+)
+from langchain_service.services.local_intent_classifier import (  # noqa: E402
+    IntentTrafficLog, LocalIntentClassifier
+)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("evaluate_intent_classifier")
+
+PRECISION_TARGETS = (0.8, 0.85, 0.9, 0.95, 0.98)
+# custom_crypto_agent.STATEFUL_INTENTS (에이전트 모듈은 LangChain이 필요해 직접 가져오지 않음)
+STATEFUL_INTENTS = {'language_change'}
+
+
+def training_samples(traffic_path: str, evaluation_texts: set) -> Tuple[List[Tuple[str, str]], int]:
+    """서비스와 같은 학습 문장 (트래픽 기록 중 평가 문장과 같은 문장은 제외) → (문장 목록, 트래픽 문장 수)"""
+    examples = merge_examples(INTENT_EXAMPLES, LOCAL_TRAINING_EXAMPLES)
+    samples = [(text, intent) for intent, texts in examples.items() for text in texts]
+    known = {text for text, _ in samples} | evaluation_texts
+    traffic = [
+        (text, intent) for text, intent in IntentTrafficLog(path=traffic_path or '').load(list(examples))
+        if text not in known
+    ]
+    return samples + traffic, len(traffic)
+
+
+def at_threshold(threshold: float, confidence: List[float], correct: List[bool]) -> Dict[str, Any]:
+    """임계값 이상인 예측의 비율(로컬 처리)과 정밀도"""
+    used = [ok for conf, ok in zip(confidence, correct) if conf >= threshold]
+    return {
+        'threshold': round(threshold, 3),
+        'hit_rate': round(len(used) / len(correct), 3),
+        'precision': round(sum(used) / len(used), 3) if used else None
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="로컬 Intent 분류기 평가")
+    parser.add_argument('--traffic', default=None, help='학습에 추가할 트래픽 기록 (INTENT_TRAFFIC_LOG 형식)')
+    parser.add_argument('--seed', type=int, default=0, help='교차 검증 분할 시드')
+    parser.add_argument('--min-accuracy', type=float, default=None, help='평가 정확도가 이 값 미만이면 종료 코드 1')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    evaluation = [(text, intent) for intent, texts in EVALUATION_EXAMPLES.items() for text in texts]
+    samples, traffic_count = training_samples(args.traffic, {text for text, _ in evaluation})
+    overlap = {text for text, _ in samples} & {text for text, _ in evaluation}
+    if overlap:
+        logger.error(f"❌ 평가 문장이 학습 데이터에 포함됨: {sorted(overlap)[:5]}")
+        return 1
+
+    classifier = LocalIntentClassifier.train(samples, seed=args.seed)
+    confidence_threshold, fallback_threshold = classifier.thresholds()
+
+    predictions = classifier.predict_many([text for text, _ in evaluation])
+    confidence = [prediction['confidence'] for prediction in predictions]
+    correct = [prediction['intent'] == intent for prediction, (_, intent) in zip(predictions, evaluation)]
+    per_intent = {
+        intent: round(
+            sum(ok for ok, (_, expected) in zip(correct, evaluation) if expected == intent) / len(texts), 3
+        )
+        for intent, texts in EVALUATION_EXAMPLES.items()
+    }
+    errors = [
+        {'text': text, 'expected': intent, 'predicted': prediction['intent'],
+         'confidence': round(prediction['confidence'], 3)}
+        for prediction, (text, intent), ok in zip(predictions, evaluation, correct) if not ok
+    ]
+
+    out_of_domain = classifier.predict_many(OUT_OF_DOMAIN_EXAMPLES)
+    stateful = [
+        {'text': text, 'intent': prediction['intent'], 'confidence': round(prediction['confidence'], 3)}
+        for text, prediction in zip(OUT_OF_DOMAIN_EXAMPLES, out_of_domain)
+        if prediction['intent'] in STATEFUL_INTENTS and prediction['confidence'] >= confidence_threshold
+    ]
+
+    accuracy = round(sum(correct) / len(correct), 3)
+    results = {
+        'training_samples': len(samples),
+        'traffic_samples': traffic_count,
+        'evaluation_samples': len(evaluation),
+        'classifier': classifier.get_stats(),
+        'accuracy': accuracy,
+        'per_intent_accuracy': per_intent,
+        'serving': at_threshold(confidence_threshold, confidence, correct),
+        'fallback': at_threshold(fallback_threshold, confidence, correct),
+        'precision_targets': {
+            str(target): at_threshold(classifier.threshold(target), confidence, correct) for target in PRECISION_TARGETS
+        },
+        'out_of_domain_stateful': stateful,
+        'errors': errors
+    }
+
+    print()
+    print(f"학습 {len(samples)}개 (트래픽 {traffic_count}개), 평가 {len(evaluation)}개, "
+          f"교차 검증 정확도 {classifier.stats['cv_accuracy']:.3f}, 온도 {classifier.temperature:.3f}, "
+          f"학습 {classifier.stats['train_seconds']}초")
+    print(f"평가 정확도 {accuracy:.3f}  " + "  ".join(f"{intent} {value:.3f}" for intent, value in per_intent.items()))
+    header = f"{'threshold':<22}{'confidence':>11}{'hit rate':>10}{'precision':>11}"
+    print(header)
+    print('-' * len(header))
+    rows = [('serving', results['serving']), ('fallback', results['fallback'])] + [
+        (f"precision {target}", row) for target, row in results['precision_targets'].items()
+    ]
+    for name, row in rows:
+        precision = f"{row['precision']:.3f}" if row['precision'] is not None else '-'
+        print(f"{name:<22}{row['threshold']:>11.3f}{row['hit_rate']:>10.3f}{precision:>11}")
+    print(f"세션 상태 변경 Intent로 분류된 의미 없는 입력: {len(stateful)}/{len(OUT_OF_DOMAIN_EXAMPLES)}")
+    for error in errors:
+        print(f"  ✗ {error['text']!r}: {error['expected']} → {error['predicted']} ({error['confidence']:.3f})")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding='utf-8')
+    if args.min_accuracy is not None and accuracy < args.min_accuracy:
+        logger.error(f"❌ 평가 정확도 {accuracy:.3f} < {args.min_accuracy}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
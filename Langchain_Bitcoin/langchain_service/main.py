@@ -11,6 +11,8 @@ Spring Boot 백엔드와 연동되는 RAG 기반 챗봇 서비스
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
 from typing import Optional, List
 import os
@@ -19,6 +21,7 @@ from pathlib import Path
 import logging
 from datetime import datetime
 import asyncio
+import json
 
 # 프로젝트 루트를 Python path에 추가
 project_root = Path(__file__).parent.parent
@@ -31,11 +34,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+from langchain_service.services.execution_service import execution_layer
+from langchain_service.services.request_coalescer import request_coalescer
+from langchain_service.services.response_cache import response_cache
+from langchain_service.services.embedding_service import embedding_service
+from langchain_service.services.article_index import article_index
+from langchain_service.services.vector_index import vector_index_manager
+from langchain_service.services.health_monitor import health_monitor, probe_redis
+from langchain_service.services.metrics import metrics, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from langchain_service.services.response_encoding import FastJSONResponse, ResponseEncodingMiddleware
+from langchain_service.services.startup_manager import startup_manager
+from langchain_service.services.job_manager import job_manager, JOB_FAILED
+from langchain_service.services.admission_control import (
+    admission_controller, AdmissionRejected, priority_for_intent
+)
+
 # FastAPI 앱 초기화
 app = FastAPI(
     title="Crypto Chatbot LangChain Service",
     description="LangChain + RAG를 활용한 비트코인 챗봇 AI 서비스",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse  # orjson 직렬화 (datetime 지원)
 )
 
 # CORS 미들웨어 설정
@@ -47,6 +66,9 @@ app.add_middleware(
     allow_headers=["*"],  # 모든 헤더 허용
 )
 
+# 응답 압축 (brotli/gzip, 1KB 이상) 및 엔드포인트별 응답 크기/직렬화 시간 기록
+app.add_middleware(ResponseEncodingMiddleware)
+
 # 요청/응답 모델 정의
 class ChatRequest(BaseModel):
     """채팅 요청 모델"""
@@ -66,14 +88,40 @@ class ChatResponse(BaseModel):
     timestamp: Optional[str] = None
     error: Optional[str] = None
 
+class ChatBatchRequest(BaseModel):
+    """일괄 채팅 요청 모델"""
+    requests: List[ChatRequest]
+
+class ChatBatchItem(BaseModel):
+    """일괄 채팅 항목 결과"""
+    index: int
+    success: bool
+    response: ChatResponse
+    error: Optional[str] = None
+
+class ChatBatchResponse(BaseModel):
+    """일괄 채팅 응답 모델"""
+    results: List[ChatBatchItem]
+    total: int
+    succeeded: int
+    failed: int
+    elapsed_ms: float
+
+CHAT_BATCH_MAX_ITEMS = int(os.getenv('CHAT_BATCH_MAX_ITEMS', 100))
+
 class PipelineRequest(BaseModel):
     """파이프라인 요청 모델"""
     hours_back: int = 24
+    wait: bool = False  # True면 작업 완료까지 기다렸다가 결과 반환 (기존 동기 방식 호환)
 
 class SearchRequest(BaseModel):
-    """뉴스 검색 요청 모델"""
+    """뉴스 검색 요청 모델 (발행일 / 출처 / 감성 필터 선택)"""
     query: str
     limit: int = 10
+    published_after: Optional[datetime] = None
+    published_before: Optional[datetime] = None
+    sources: Optional[List[str]] = None
+    sentiments: Optional[List[str]] = None
 
 # 전역 변수들
 chatbot_agent = None
@@ -82,92 +130,173 @@ news_pipeline = None
 
 @app.on_event("startup")
 async def startup_event():
-    """서비스 시작 시 초기화"""
-    global chatbot_agent, vector_db, news_pipeline
-    
+    """서비스 시작 시 초기화 (무거운 구성요소는 백그라운드에서 단계적으로 초기화하고 즉시 요청 수신)"""
     logger.info("🚀 LangChain 서비스 초기화 중...")
     
     try:
         # 환경 변수 로드
         from dotenv import load_dotenv
         load_dotenv()
-        
-        # OpenAI API 키 확인
-        if not os.getenv('OPENAI_API_KEY'):
-            logger.error("❌ OPENAI_API_KEY가 설정되지 않았습니다!")
-            raise ValueError("OpenAI API 키가 필요합니다.")
-        
+    except ImportError:
+        logger.warning("⚠️ python-dotenv가 없어 .env 파일을 로드하지 않습니다")
+    
+    # OpenAI API 키 확인 (없으면 에이전트 구성요소가 실패 상태로 보고됨)
+    if not os.getenv('OPENAI_API_KEY'):
+        logger.error("❌ OPENAI_API_KEY가 설정되지 않았습니다!")
+    else:
         logger.info("✅ 환경변수 확인 완료")
-        
-        # 벡터 DB 초기화
-        logger.info("🔧 벡터 서비스 초기화 중...")
-        from langchain_service.services.vector_service import VectorService
-        vector_db = VectorService()
-        await vector_db.initialize()
-        logger.info("✅ 벡터 서비스 초기화 완료")
-        
-        # Custom 챗봇 에이전트 초기화 (안정적)
-        logger.info("🔥 Custom 챗봇 에이전트 초기화 중...")
-        from langchain_service.services.custom_crypto_agent import CustomCryptoAgent
-        chatbot_agent = CustomCryptoAgent(vector_db)
-        await chatbot_agent.initialize()
-        logger.info("✅ Custom 챗봇 에이전트 초기화 완료")
-        
-        # 뉴스 파이프라인 초기화
-        try:
-            logger.info("📰 뉴스 파이프라인 초기화 중...")
-            from news_pipeline import NewsPipeline
-            news_pipeline = NewsPipeline()
-            logger.info("✅ 뉴스 파이프라인 초기화 완료")
-        except Exception as pipeline_error:
-            logger.warning(f"⚠️ 뉴스 파이프라인 초기화 실패 (일부 기능 제한): {pipeline_error}")
-        
-        logger.info("🎉 LangChain 서비스 초기화 완료!")
-        
-    except Exception as e:
-        logger.error(f"💥 서비스 초기화 실패: {e}")
-        logger.error("서비스가 정상적으로 작동하지 않을 수 있습니다.")
-        # 완전히 중단하지 않고 계속 실행 (일부 기능은 제한됨)
+    
+    # 구성요소 등록: 벡터 DB → 에이전트 → Intent 임베딩 / 뉴스 파이프라인은 독립적으로 동시 진행
+    startup_manager.register("vector_db", _init_vector_db, critical=True)
+    startup_manager.register("chatbot_agent", _init_chatbot_agent, depends_on=["vector_db"], critical=True)
+    startup_manager.register("intent_embeddings", _init_intent_embeddings, depends_on=["chatbot_agent"], critical=False)
+    startup_manager.register("news_pipeline", _init_news_pipeline, critical=False)
+    startup_manager.register("article_index", _init_article_index, depends_on=["vector_db"], critical=False)
+    startup_manager.start()
+    
+    # 의존성 백그라운드 점검 시작 (초기화 진행 중에도 /ready가 상태를 보고하도록 항상 시작)
+    health_monitor.register("vector_db", _probe_vector_db, critical=True)
+    health_monitor.register("chatbot_agent", _probe_chatbot_agent, critical=True)
+    health_monitor.register("redis", probe_redis, critical=False)
+    health_monitor.register("news_pipeline", _probe_news_pipeline, critical=False)
+    health_monitor.set_stats_provider(_collect_database_stats)
+    await health_monitor.start()
+    
+    # 멀티 워커 지표 파일 기록 (PROMETHEUS_MULTIPROC_DIR 설정 시)
+    await metrics.start_multiprocess()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서비스 종료 시 정리"""
+    await startup_manager.stop()
+    await health_monitor.stop()
+    await metrics.stop_multiprocess()
+    execution_layer.shutdown()
+
+async def _init_vector_db():
+    """벡터 DB 초기화 (성공 시에만 전역 변수 설정)"""
+    global vector_db
+    from langchain_service.services.vector_service import VectorService
+    service = VectorService()
+    await service.initialize()
+    vector_db = service
+
+async def _init_chatbot_agent():
+    """Custom 챗봇 에이전트 초기화 (Intent 임베딩은 별도 구성요소, 로드 전까지 키워드 분류)"""
+    global chatbot_agent
+    if not os.getenv('OPENAI_API_KEY'):
+        raise ValueError("OpenAI API 키가 필요합니다.")
+    from langchain_service.services.custom_crypto_agent import CustomCryptoAgent
+    agent = CustomCryptoAgent(vector_db)
+    await agent.initialize(load_intent_embeddings=False)
+    chatbot_agent = agent
+
+async def _init_intent_embeddings():
+    """Intent 예시 문장 임베딩 로드 (실패해도 키워드 분류로 계속 동작)"""
+    await chatbot_agent._initialize_intent_embeddings()
+
+async def _init_news_pipeline():
+    """뉴스 파이프라인 초기화 (DDL 포함 블로킹 생성자는 실행 계층에서)"""
+    global news_pipeline
+    from news_pipeline import NewsPipeline
+    news_pipeline = await execution_layer.run_blocking('pipeline', NewsPipeline)
+
+async def _init_article_index():
+    """기사 벡터 메모리 인덱스 로드 (디스크 + 이후 저장분, 실패해도 PgVector 검색으로 동작)"""
+    dual_db = await execution_layer.run_blocking('pipeline', vector_db._get_dual_db)
+    await execution_layer.run_blocking(
+        'pipeline', article_index.load, dual_db.get_pgvector_connection, dual_db.search_model, dual_db.embedding_dimension
+    )
+
+def _component_unavailable(name: str, detail: str) -> HTTPException:
+    """구성요소 미사용 가능 응답 (초기화 중이면 Retry-After 포함)"""
+    if startup_manager.is_initializing(name):
+        return HTTPException(
+            status_code=503,
+            detail=f"{detail} (초기화 진행 중, 잠시 후 다시 시도해주세요)",
+            headers={"Retry-After": "5"}
+        )
+    return HTTPException(status_code=503, detail=detail)
+
+def _agent_unavailable_response(session_id: str) -> ChatResponse:
+    """에이전트 미준비 시 기본 응답 (초기화 중 / 초기화 실패 구분)"""
+    if startup_manager.is_initializing("chatbot_agent"):
+        return ChatResponse(
+            message="AI 에이전트를 준비하고 있습니다. 잠시 후 다시 시도해주세요.",
+            session_id=session_id,
+            data_sources=["fallback"],
+            error="Agent initializing"
+        )
+    return ChatResponse(
+        message="현재 AI 에이전트가 초기화되지 않아 기본 응답만 제공할 수 있습니다. 서버 관리자에게 문의해주세요.",
+        session_id=session_id,
+        data_sources=["fallback"],
+        error="Agent not initialized"
+    )
+
+async def _probe_vector_db():
+    """벡터 DB(Postgres) 점검"""
+    if not vector_db:
+        return None
+    return await vector_db.health_check()
+
+async def _probe_chatbot_agent():
+    """챗봇 에이전트 점검"""
+    if not chatbot_agent:
+        return None
+    return await chatbot_agent.health_check()
+
+async def _probe_news_pipeline():
+    """뉴스 파이프라인 점검 (초기화 여부)"""
+    return True if news_pipeline else None
+
+async def _collect_database_stats():
+    """데이터베이스 통계 (COUNT 쿼리 - 상태 모니터가 긴 주기로 갱신)"""
+    if not vector_db:
+        return {}
+    return await vector_db.get_database_stats()
+
+@app.get("/live")
+async def liveness_check():
+    """생존 확인 (의존성 점검 없이 프로세스/이벤트 루프 상태만 반환)"""
+    return health_monitor.liveness()
+
+@app.get("/ready")
+async def readiness_check():
+    """준비 상태 확인 (필수 의존성이 모두 정상일 때만 200)"""
+    snapshot = health_monitor.snapshot()
+    startup = startup_manager.snapshot()
+    status_code = 200 if snapshot["ready"] else 503
+    headers = {"Retry-After": "5"} if startup["phase"] == "starting" else None
+    return FastJSONResponse(status_code=status_code, headers=headers, content={
+        "status": "ready" if snapshot["ready"] else "not_ready",
+        "startup_phase": startup["phase"],
+        "checks": snapshot["checks"],
+        "last_probe_cycle": snapshot["last_probe_cycle"]
+    })
 
 @app.get("/health")
 async def health_check():
-    """서비스 상태 확인"""
+    """서비스 상태 확인 (백그라운드 점검의 마지막 스냅샷을 즉시 반환)"""
     try:
+        snapshot = health_monitor.snapshot()
+        
         # 기본 상태
         status = {
             "status": "healthy",
             "timestamp": datetime.now().isoformat(),
             "service": "LangChain Crypto Chatbot",
-            "version": "1.0.0"
+            "version": "1.0.0",
+            "vector_db": health_monitor.status_of("vector_db"),
+            "chatbot_agent": health_monitor.status_of("chatbot_agent"),
+            "checks": snapshot["checks"],
+            "last_probe_cycle": snapshot["last_probe_cycle"],
+            "startup": startup_manager.snapshot()
         }
         
-        # 벡터 DB 상태 확인
-        if vector_db:
-            try:
-                db_status = await vector_db.health_check()
-                status["vector_db"] = "healthy" if db_status else "unhealthy"
-                
-                # 데이터베이스 통계 추가
-                stats = await vector_db.get_database_stats()
-                if stats:
-                    status["database_stats"] = stats
-            except Exception as e:
-                status["vector_db"] = f"error: {str(e)}"
-        else:
-            status["vector_db"] = "not_initialized"
-            
-        # 챗봇 에이전트 상태 확인
-        if chatbot_agent:
-            try:
-                agent_status = await chatbot_agent.health_check()
-                if isinstance(agent_status, dict):
-                    status["chatbot_agent"] = agent_status
-                else:
-                    status["chatbot_agent"] = "healthy" if agent_status else "unhealthy"
-            except Exception as e:
-                status["chatbot_agent"] = f"error: {str(e)}"
-        else:
-            status["chatbot_agent"] = "not_initialized"
+        # 데이터베이스 통계 (긴 주기로 갱신된 값)
+        if snapshot["database_stats"]:
+            status["database_stats"] = snapshot["database_stats"]
         
         # 전체 상태 평가
         if (status.get("vector_db") == "healthy" and 
@@ -186,42 +315,58 @@ async def health_check():
         logger.error(f"❌ 상태 확인 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _chat_priority(message: str) -> int:
+    """허용 제어 우선순위 (임베딩 호출 없는 로컬 분류 기준)"""
+    return priority_for_intent(chatbot_agent.classify_intent_quick(message)['intent'])
+
+def _admission_error(rejected: AdmissionRejected) -> HTTPException:
+    """허용 거절 응답 (429: 대기열 초과 / 503: 대기 기한 초과)"""
+    if rejected.status_code == 429:
+        detail = "요청이 많아 지금은 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
+    else:
+        detail = "서버가 혼잡하여 제한 시간 내에 처리를 시작하지 못했습니다. 잠시 후 다시 시도해주세요."
+    return HTTPException(
+        status_code=rejected.status_code,
+        detail=detail,
+        headers={"Retry-After": str(rejected.retry_after)}
+    )
+
+def _release_once(admitted_at: float):
+    """슬롯 반환 함수 (스트림 종료와 응답 완료 후 작업 양쪽에서 호출되므로 1회만 반환)"""
+    released = False
+    
+    def release():
+        nonlocal released
+        if not released:
+            released = True
+            admission_controller.release(admitted_at)
+    return release
+
 @app.post("/chat", response_model=ChatResponse)
 async def chat_endpoint(request: ChatRequest):
     """채팅 처리 엔드포인트"""
     try:
         logger.info(f"💬 채팅 요청 수신: {request.message[:50]}...")
         
-        # 챗봇 에이전트가 초기화되지 않은 경우
+        # 챗봇 에이전트가 초기화되지 않은 경우 (초기화 중 / 실패)
         if not chatbot_agent:
             # 기본 응답 제공 (제한된 기능)
-            return ChatResponse(
-                message="현재 AI 에이전트가 초기화되지 않아 기본 응답만 제공할 수 있습니다. 서버 관리자에게 문의해주세요.",
-                session_id=request.session_id,
-                data_sources=["fallback"],
-                error="Agent not initialized"
-            )
+            return _agent_unavailable_response(request.session_id)
         
-        # 메시지 처리
-        response_data = await chatbot_agent.process_message(
-            message=request.message,
-            session_id=request.session_id,
-            use_rag=request.use_rag
-        )
+        # 메시지 처리 (허용 제어: 처리 한도 초과 시 우선순위 대기, 기한/대기열 초과 시 즉시 거절)
+        try:
+            async with admission_controller.slot(_chat_priority(request.message)):
+                response_data = await chatbot_agent.process_message(
+                    message=request.message,
+                    session_id=request.session_id,
+                    use_rag=request.use_rag
+                )
+        except AdmissionRejected as rejected:
+            raise _admission_error(rejected)
         
         # 딕셔너리에서 ChatResponse 객체로 변환
         if isinstance(response_data, dict):
-            response = ChatResponse(
-                message=response_data.get('message', '응답을 생성할 수 없습니다.'),
-                session_id=response_data.get('session_id', request.session_id),
-                data_sources=response_data.get('data_sources'),
-                confidence_score=response_data.get('confidence_score'),
-                intent=response_data.get('intent'),
-                processing_method=response_data.get('processing_method'),
-                analysis_depth=response_data.get('analysis_depth'),
-                timestamp=response_data.get('timestamp'),
-                error=response_data.get('error')
-            )
+            response = _build_chat_response(response_data, request.session_id)
         else:
             # 이미 ChatResponse 객체인 경우
             response = response_data
@@ -242,6 +387,113 @@ async def chat_endpoint(request: ChatRequest):
         )
         return error_response
 
+@app.post("/chat/batch", response_model=ChatBatchResponse)
+async def chat_batch_endpoint(request: ChatBatchRequest):
+    """일괄 채팅 처리 엔드포인트 (동일 질문 병합, 배치 Intent 분류, 입력 순서대로 항목별 결과 반환)"""
+    items = request.requests
+    if len(items) > CHAT_BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"일괄 요청은 최대 {CHAT_BATCH_MAX_ITEMS}건까지 가능합니다.")
+    
+    logger.info(f"📦 일괄 채팅 요청 수신: {len(items)}건")
+    started = datetime.now()
+    
+    if not chatbot_agent:
+        responses = [_agent_unavailable_response(item.session_id) for item in items]
+    else:
+        # 일괄 요청 전체를 낮은 우선순위 1건으로 허용 (항목별 동시 실행은 에이전트의 일괄 처리 한도로 제한)
+        try:
+            async with admission_controller.slot(priority_for_intent('batch')):
+                results = await chatbot_agent.process_batch([item.model_dump() for item in items])
+        except AdmissionRejected as rejected:
+            raise _admission_error(rejected)
+        responses = [_build_chat_response(result, item.session_id) for result, item in zip(results, items)]
+    
+    batch_items = [
+        ChatBatchItem(index=index, success=response.error is None, response=response, error=response.error)
+        for index, response in enumerate(responses)
+    ]
+    succeeded = sum(1 for item in batch_items if item.success)
+    
+    logger.info(f"✅ 일괄 채팅 응답 완료: 성공 {succeeded}/{len(items)}건")
+    return ChatBatchResponse(
+        results=batch_items,
+        total=len(items),
+        succeeded=succeeded,
+        failed=len(items) - succeeded,
+        elapsed_ms=round((datetime.now() - started).total_seconds() * 1000, 1)
+    )
+
+def _format_sse(event: str, data: dict) -> str:
+    """Server-Sent Events 프레임 생성"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def _build_chat_response(response_data: dict, session_id: str) -> ChatResponse:
+    """에이전트 결과 딕셔너리를 ChatResponse로 변환"""
+    return ChatResponse(
+        message=response_data.get('message', '응답을 생성할 수 없습니다.'),
+        session_id=response_data.get('session_id', session_id),
+        data_sources=response_data.get('data_sources'),
+        confidence_score=response_data.get('confidence_score'),
+        intent=response_data.get('intent'),
+        processing_method=response_data.get('processing_method'),
+        analysis_depth=response_data.get('analysis_depth'),
+        timestamp=response_data.get('timestamp'),
+        error=response_data.get('error')
+    )
+
+@app.post("/chat/stream")
+async def chat_stream_endpoint(request: ChatRequest):
+    """채팅 처리 엔드포인트 (Server-Sent Events 스트리밍)"""
+    logger.info(f"📡 스트리밍 채팅 요청 수신: {request.message[:50]}...")
+    
+    # 허용 제어는 스트림 시작 전에 수행하여 거절 시 429/503을 바로 반환
+    agent = chatbot_agent
+    release = None
+    if agent:
+        try:
+            release = _release_once(await admission_controller.acquire(_chat_priority(request.message)))
+        except AdmissionRejected as rejected:
+            raise _admission_error(rejected)
+    
+    async def event_generator():
+        # 챗봇 에이전트가 초기화되지 않은 경우
+        if not agent:
+            fallback = _agent_unavailable_response(request.session_id)
+            yield _format_sse("message", {"text": fallback.message})
+            yield _format_sse("done", fallback.model_dump())
+            return
+        
+        try:
+            async for event in agent.process_message_stream(
+                message=request.message,
+                session_id=request.session_id,
+                use_rag=request.use_rag
+            ):
+                data = event['data']
+                if event['event'] == 'done':
+                    data = _build_chat_response(data, request.session_id).model_dump()
+                    logger.info(f"✅ 스트리밍 채팅 응답 완료: {len(data['message'])}자")
+                yield _format_sse(event['event'], data)
+        except Exception as e:
+            logger.error(f"💥 스트리밍 채팅 처리 중 오류: {e}")
+            yield _format_sse("error", {
+                "message": "죄송합니다. 처리 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
+                "error": str(e)
+            })
+        finally:
+            if release:
+                release()
+    
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        background=BackgroundTask(release) if release else None,
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # 프록시(nginx) 버퍼링 비활성화
+        }
+    )
+
 @app.get("/")
 async def root():
     """루트 엔드포인트"""
@@ -258,7 +510,13 @@ async def root():
         ],
         "endpoints": {
             "chat": "POST /chat",
+            "chat_stream": "POST /chat/stream",
+            "chat_batch": "POST /chat/batch",
             "health": "GET /health",
+            "live": "GET /live",
+            "ready": "GET /ready",
+            "metrics": "GET /metrics",
+            "pipeline_jobs": "GET /pipeline/jobs/{job_id}",
             "docs": "GET /docs"
         },
         "timestamp": datetime.now().isoformat()
@@ -282,21 +540,155 @@ async def get_stats():
         if chatbot_agent:
             stats["agent"] = {
                 "tools_count": 6,  # Custom Agent는 6개 도구 사용
-                "active_sessions": len(chatbot_agent.session_histories),
+                "active_sessions": await execution_layer.run_blocking('session', chatbot_agent.session_store.active_session_count),
+                "session_backend": chatbot_agent.session_store.backend,
                 "agent_type": "CustomCryptoAgent",
-                "status": "operational"
+                "status": "operational",
+                "intent_index": chatbot_agent.intent_index.get_stats() if chatbot_agent.intent_index else None,
+                "local_classifier": chatbot_agent.local_classifier.get_stats() if chatbot_agent.local_classifier else None
             }
         else:
             stats["agent"] = {
                 "status": "not_initialized"
             }
         
+        # 단계적 시작 (구성요소별 상태 및 소요 시간)
+        stats["startup"] = startup_manager.snapshot()
+        
+        # 실행 계층 (스레드/프로세스 풀, Intent별 대기열)
+        stats["execution"] = execution_layer.get_stats()
+        
+        # 동일 요청 병합 (hit/fan-out)
+        stats["coalescing"] = request_coalescer.get_stats()
+        
+        # Intent별 응답 캐시
+        stats["response_cache"] = response_cache.get_stats()
+        stats["embedding_cache"] = embedding_service.get_stats()
+        
+        # 허용 제어 (처리 중 / 대기열 / 거절 횟수)
+        stats["admission"] = admission_controller.get_stats()
+        
+        # 백그라운드 파이프라인 작업
+        stats["jobs"] = job_manager.get_stats()
+        
         return stats
         
     except Exception as e:
         logger.error(f"❌ 통계 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _collect_runtime_metrics():
+    """실행 계층 / 캐시 / 요청 병합 / 상태 점검 통계를 지표로 변환"""
+    execution = execution_layer.get_stats()
+    intents = execution["intents"]
+    yield ("execution_thread_pool_utilization", "gauge", "스레드 풀 사용률 (0~1)",
+           [({}, execution["thread_pool_utilization"])])
+    yield ("execution_active", "gauge", "Intent별 실행 중인 작업 수",
+           [({"intent": name}, stats["active"]) for name, stats in intents.items()])
+    yield ("execution_queue_depth", "gauge", "Intent별 대기 중인 작업 수",
+           [({"intent": name}, stats["waiting"]) for name, stats in intents.items()])
+    yield ("execution_completed_total", "counter", "Intent별 완료된 작업 수",
+           [({"intent": name}, stats["completed"]) for name, stats in intents.items()])
+    yield ("execution_failed_total", "counter", "Intent별 실패한 작업 수",
+           [({"intent": name}, stats["failed"]) for name, stats in intents.items()])
+    yield ("execution_abandoned_total", "counter", "Intent별 호출자가 취소/타임아웃한 뒤에도 계속 실행된 작업 수",
+           [({"intent": name}, stats["abandoned"]) for name, stats in intents.items()])
+    
+    cache = response_cache.get_stats()
+    yield ("response_cache_requests_total", "counter", "응답 캐시 조회 결과별 횟수", [
+        ({"result": "local_hit"}, cache["local_hits"]),
+        ({"result": "redis_hit"}, cache["redis_hits"]),
+        ({"result": "miss"}, cache["misses"])
+    ])
+    yield ("response_cache_hit_ratio", "gauge", "응답 캐시 적중률", [({}, cache["hit_ratio"])])
+    yield ("response_cache_entries", "gauge", "로컬 응답 캐시 항목 수", [({}, cache["entries"])])
+    yield ("response_cache_evictions_total", "counter", "LRU 제거 횟수", [({}, cache["evictions"])])
+    yield ("response_cache_bytes", "gauge", "로컬 응답 캐시 크기 (바이트)", [({}, cache["bytes"])])
+    yield ("response_cache_oversized_total", "counter", "크기 상한을 넘어 캐시하지 않은 응답 수", [({}, cache["oversized"])])
+    
+    embedding = embedding_service.get_stats()
+    yield ("embedding_cache_requests_total", "counter", "임베딩 캐시 조회 결과별 텍스트 수", [
+        ({"result": "local_hit"}, embedding["local_hits"]),
+        ({"result": "store_hit"}, embedding["store_hits"]),
+        ({"result": "miss"}, embedding["misses"])
+    ])
+    yield ("embedding_cache_hit_ratio", "gauge", "임베딩 캐시 적중률", [({}, embedding["hit_ratio"])])
+    yield ("embedding_cache_entries", "gauge", "로컬 임베딩 캐시 항목 수", [({}, embedding["entries"])])
+    yield ("embedding_provider_calls_total", "counter", "임베딩 모델 호출 횟수", [({}, embedding["provider_calls"])])
+    yield ("embedding_batch_retries_total", "counter", "임베딩 배치 재시도 횟수", [({}, embedding["batch_retries"])])
+    yield ("embedding_rate_limited_total", "counter", "임베딩 API 429 응답 횟수", [({}, embedding["rate_limited"])])
+    yield ("embedding_failed_texts_total", "counter", "재시도 후에도 임베딩하지 못한 텍스트 수", [({}, embedding["failed_texts"])])
+    query_cache = embedding["query_cache"]
+    yield ("embedding_query_cache_requests_total", "counter", "검색 질의 임베딩 LRU 조회 결과별 횟수", [
+        ({"result": "hit"}, query_cache["hits"]),
+        ({"result": "miss"}, query_cache["misses"])
+    ])
+    yield ("embedding_query_cache_bytes", "gauge", "검색 질의 임베딩 LRU 메모리 사용량 (추정)", [({}, query_cache["bytes"])])
+    yield ("embedding_query_cache_evictions_total", "counter", "검색 질의 임베딩 LRU 제거 횟수", [({}, query_cache["evictions"])])
+    
+    index = article_index.get_stats()
+    yield ("article_index_searches_total", "counter", "기사 메모리 인덱스 검색 결과별 횟수", [
+        ({"result": "hit"}, index["hits"]),
+        ({"result": "miss"}, index["misses"])
+    ])
+    yield ("article_index_articles", "gauge", "기사 메모리 인덱스 항목 수", [({}, index["articles"])])
+    yield ("article_index_memory_bytes", "gauge", "기사 메모리 인덱스 메모리 사용량 (추정)", [({}, index["memory_bytes"])])
+    
+    vector_indexes = vector_index_manager.get_stats()
+    yield ("vector_index_rows_since_build", "gauge", "벡터 인덱스 생성 후 추가된 행 수 (추정)", [
+        ({"table": table}, info["rows_since_build"])
+        for table, info in vector_indexes.items()
+    ])
+    yield ("vector_index_estimated_recall", "gauge", "벡터 인덱스 추정 재현율 (보정 기준)", [
+        ({"table": table}, info["estimated_recall"])
+        for table, info in vector_indexes.items()
+    ])
+    
+    coalescing = request_coalescer.get_stats()
+    yield ("request_coalescing_total", "counter", "요청 병합 결과별 횟수", [
+        ({"role": "leader"}, coalescing["leaders"]),
+        ({"role": "follower"}, coalescing["hits"])
+    ])
+    yield ("request_coalescing_hit_ratio", "gauge", "요청 병합 비율", [({}, coalescing["hit_ratio"])])
+    yield ("request_coalescing_in_flight", "gauge", "진행 중인 병합 키 수", [({}, coalescing["in_flight"])])
+    
+    snapshot = health_monitor.snapshot()
+    yield ("dependency_up", "gauge", "의존성 점검 결과 (1: 정상)", [
+        ({"dependency": name}, 1 if check.get("status") == "healthy" else 0)
+        for name, check in snapshot["checks"].items()
+    ])
+    yield ("dependency_probe_latency_seconds", "gauge", "마지막 의존성 점검 소요 시간", [
+        ({"dependency": name}, check.get("latency_ms", 0) / 1000)
+        for name, check in snapshot["checks"].items()
+    ])
+    
+    admission = admission_controller.get_stats()
+    yield ("admission_in_flight", "gauge", "허용되어 처리 중인 채팅 요청 수", [({}, admission["in_flight"])])
+    yield ("admission_queue_depth", "gauge", "우선순위별 대기 중인 채팅 요청 수", [
+        ({"priority": name}, depth) for name, depth in admission["queue_depth_by_priority"].items()
+    ])
+    yield ("admission_admitted_total", "counter", "허용된 채팅 요청 수", [({}, admission["admitted"])])
+    yield ("admission_shed_total", "counter", "거절 사유별 채팅 요청 수", [
+        ({"reason": reason}, count) for reason, count in admission["shed"].items()
+    ])
+    
+    startup = startup_manager.snapshot()
+    yield ("startup_component_ready", "gauge", "단계적 시작 구성요소 준비 여부 (1: 준비 완료)", [
+        ({"component": name}, 1 if component["state"] == "ready" else 0)
+        for name, component in startup["components"].items()
+    ])
+    yield ("startup_component_init_seconds", "gauge", "구성요소 초기화 소요 시간", [
+        ({"component": name}, component["init_ms"] / 1000)
+        for name, component in startup["components"].items()
+    ])
+
+metrics.register_collector(_collect_runtime_metrics)
+
+@app.get("/metrics")
+async def metrics_endpoint():
+    """Prometheus 지표 (Intent/도구/DB/외부 호출 지연 히스토그램, 캐시 적중률, 풀 사용률 - 멀티 워커는 전체 합계)"""
+    return PlainTextResponse(metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
 @app.get("/tools")
 async def get_available_tools():
     """사용 가능한 도구 목록"""
@@ -348,52 +740,101 @@ async def get_available_tools():
 
 # ===== 뉴스 파이프라인 관련 엔드포인트 =====
 
+# 파이프라인 작업 단계 (진행률 계산용)
+PIPELINE_STAGES = ['collect', 'preprocess', 'store']
+
+async def _pipeline_job_response(job, created: bool, wait: bool, label: str):
+    """파이프라인 작업 제출 결과 응답 (wait=True면 완료 후 결과, 아니면 202 + 작업 ID)"""
+    if wait:
+        await job_manager.wait(job)
+        if job.status == JOB_FAILED:
+            raise HTTPException(status_code=500, detail=f"{label} 실패: {job.error}")
+        result = job.result or {}
+        logger.info(f"✅ {label} 완료: 수집={result.get('collected_count', 0)}, 처리={result.get('processed_count', 0)}, 저장={result.get('saved_count', 0)}")
+        return {
+            "success": True,
+            "message": f"{label} 완료",
+            "job_id": job.id,
+            **result
+        }
+    
+    return FastJSONResponse(status_code=202, content={
+        "success": True,
+        "message": f"{label} 작업이 시작되었습니다." if created else "진행 중인 파이프라인 작업에 병합되었습니다.",
+        "job_id": job.id,
+        "merged": not created,
+        "status_url": f"/pipeline/jobs/{job.id}",
+        "job": job.to_dict()
+    })
+
 @app.post("/pipeline/run")
 async def run_news_pipeline(request: PipelineRequest):
-    """뉴스 파이프라인 실행"""
+    """뉴스 파이프라인 실행 (백그라운드 작업으로 제출, 진행 상황은 /pipeline/jobs/{id}로 조회)"""
     try:
         if not news_pipeline:
-            raise HTTPException(status_code=503, detail="뉴스 파이프라인이 초기화되지 않았습니다.")
+            raise _component_unavailable("news_pipeline", "뉴스 파이프라인이 초기화되지 않았습니다.")
         
-        logger.info(f"📰 뉴스 파이프라인 실행 시작 (최근 {request.hours_back}시간)")
+        logger.info(f"📰 뉴스 파이프라인 실행 요청 (최근 {request.hours_back}시간)")
         
-        result = news_pipeline.run_pipeline(hours_back=request.hours_back, use_cache=False)
-        
-        logger.info(f"✅ 뉴스 파이프라인 실행 완료: 수집={result.get('collected_count', 0)}, 처리={result.get('processed_count', 0)}, 저장={result.get('saved_count', 0)}")
-        
-        return {
-            "success": True,
-            "message": "뉴스 파이프라인 실행 완료",
-            **result
-        }
+        # 수집/저장 대상이 같으므로 전체 실행과 증분 업데이트는 같은 그룹으로 묶어 중복 실행 방지
+        job, created = job_manager.submit(
+            'pipeline_run',
+            news_pipeline.run_pipeline,
+            {'hours_back': request.hours_back, 'use_cache': False},
+            PIPELINE_STAGES,
+            group='news_pipeline'
+        )
+        return await _pipeline_job_response(job, created, request.wait, "뉴스 파이프라인 실행")
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 뉴스 파이프라인 실행 실패: {e}")
         raise HTTPException(status_code=500, detail=f"파이프라인 실행 실패: {str(e)}")
 
 @app.post("/pipeline/incremental")
 async def run_incremental_update(request: PipelineRequest):
-    """증분 뉴스 업데이트"""
+    """증분 뉴스 업데이트 (백그라운드 작업으로 제출)"""
     try:
         if not news_pipeline:
-            raise HTTPException(status_code=503, detail="뉴스 파이프라인이 초기화되지 않았습니다.")
-        
-        logger.info(f"🔄 증분 뉴스 업데이트 시작 (최근 {request.hours_back}시간)")
+            raise _component_unavailable("news_pipeline", "뉴스 파이프라인이 초기화되지 않았습니다.")
         
-        result = news_pipeline.run_incremental_update(hours_back=request.hours_back)
+        logger.info(f"🔄 증분 뉴스 업데이트 요청 (최근 {request.hours_back}시간)")
         
-        logger.info(f"✅ 증분 업데이트 완료: 수집={result.get('collected_count', 0)}, 처리={result.get('processed_count', 0)}, 저장={result.get('saved_count', 0)}")
-        
-        return {
-            "success": True,
-            "message": "증분 업데이트 완료",
-            **result
-        }
+        job, created = job_manager.submit(
+            'pipeline_incremental',
+            news_pipeline.run_incremental_update,
+            {'hours_back': request.hours_back},
+            PIPELINE_STAGES,
+            group='news_pipeline'
+        )
+        return await _pipeline_job_response(job, created, request.wait, "증분 업데이트")
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 증분 업데이트 실패: {e}")
         raise HTTPException(status_code=500, detail=f"증분 업데이트 실패: {str(e)}")
 
+@app.get("/pipeline/jobs")
+async def list_pipeline_jobs(limit: int = 20):
+    """최근 파이프라인 작업 목록"""
+    return {
+        "success": True,
+        "jobs": job_manager.list_jobs(limit=limit)
+    }
+
+@app.get("/pipeline/jobs/{job_id}")
+async def get_pipeline_job(job_id: str):
+    """파이프라인 작업 상태 조회 (단계별 진행률, 건수, 오류)"""
+    job = job_manager.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+    return {
+        "success": True,
+        **job.to_dict()
+    }
+
 @app.get("/pipeline/status")
 async def get_pipeline_status():
     """뉴스 파이프라인 상태 조회"""
@@ -402,10 +843,11 @@ async def get_pipeline_status():
             return {
                 "success": False,
                 "message": "뉴스 파이프라인이 초기화되지 않았습니다.",
-                "services_initialized": False
+                "services_initialized": False,
+                "startup_state": startup_manager.state("news_pipeline")
             }
         
-        status = news_pipeline.get_pipeline_status()
+        status = await execution_layer.run_blocking('health', news_pipeline.get_pipeline_status)
         
         return {
             "success": True,
@@ -422,14 +864,20 @@ async def search_news(request: SearchRequest):
     """뉴스 검색 (벡터 유사도 기반)"""
     try:
         if not news_pipeline:
-            raise HTTPException(status_code=503, detail="뉴스 파이프라인이 초기화되지 않았습니다.")
+            raise _component_unavailable("news_pipeline", "뉴스 파이프라인이 초기화되지 않았습니다.")
         
         logger.info(f"🔍 뉴스 검색: '{request.query}' (limit={request.limit})")
         
-        results = news_pipeline.pgvector_service.search_similar_articles(
+        results = await execution_layer.run_blocking(
+            'news_search',
+            news_pipeline.dual_db_service.search_similar_articles,
             query=request.query,
             limit=request.limit,
-            similarity_threshold=0.2
+            similarity_threshold=0.2,
+            published_after=request.published_after,
+            published_before=request.published_before,
+            sources=request.sources,
+            sentiments=request.sentiments
         )
         
         logger.info(f"✅ 뉴스 검색 완료: {len(results)}개 결과")
@@ -442,6 +890,8 @@ async def search_news(request: SearchRequest):
             "results": results
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 뉴스 검색 실패: {e}")
         raise HTTPException(status_code=500, detail=f"뉴스 검색 실패: {str(e)}")
@@ -451,9 +901,9 @@ async def get_news_statistics():
     """뉴스 통계 조회"""
     try:
         if not news_pipeline:
-            raise HTTPException(status_code=503, detail="뉴스 파이프라인이 초기화되지 않았습니다.")
+            raise _component_unavailable("news_pipeline", "뉴스 파이프라인이 초기화되지 않았습니다.")
         
-        stats = news_pipeline.pgvector_service.get_statistics()
+        stats = await execution_layer.run_blocking('health', news_pipeline.dual_db_service.get_statistics)
         
         return {
             "success": True,
@@ -461,6 +911,8 @@ async def get_news_statistics():
             **stats
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 뉴스 통계 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=f"통계 조회 실패: {str(e)}")
@@ -470,9 +922,11 @@ async def get_recent_news(hours: int = 24, limit: int = 50):
     """최근 뉴스 조회"""
     try:
         if not news_pipeline:
-            raise HTTPException(status_code=503, detail="뉴스 파이프라인이 초기화되지 않았습니다.")
+            raise _component_unavailable("news_pipeline", "뉴스 파이프라인이 초기화되지 않았습니다.")
         
-        results = news_pipeline.pgvector_service.get_recent_articles(hours=hours, limit=limit)
+        results = await execution_layer.run_blocking(
+            'news_search', news_pipeline.dual_db_service.get_recent_articles, hours=hours, limit=limit
+        )
         
         return {
             "success": True,
@@ -481,6 +935,8 @@ async def get_recent_news(hours: int = 24, limit: int = 50):
             "results": results
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"❌ 최근 뉴스 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=f"최근 뉴스 조회 실패: {str(e)}")
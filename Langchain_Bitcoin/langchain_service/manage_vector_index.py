@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+벡터 인덱스 관리 (HNSW / IVFFlat 선택, 행 수 기준 재생성, probes / ef_search 보정)
+
+status: 테이블별 인덱스 방식 / lists / 생성 후 추가된 행 / 추정 재현율 / 필요한 작업
+maintain: 필요한 작업만 실행 (인덱스 없음 / 방식 변경 / 생성 기록 없음 / lists가 행 수와 맞지 않으면 재생성 → 보정,
+          행이 IVFFlat 최소 행 수보다 적은데 생성 기록 없는 IVFFlat이면 제거 → 정확 검색)
+rebuild: 점검 결과와 관계없이 다시 생성 (CONCURRENTLY → 짧은 잠금으로 교체) 후 보정
+calibrate: 인덱스는 그대로 두고 probes / ef_search 값별 재현율만 다시 측정
+
+사용법:
+    python manage_vector_index.py status
+    python manage_vector_index.py maintain                                   # 두 테이블 모두
+    python manage_vector_index.py rebuild --table crypto_news_summary --method ivfflat
+    python manage_vector_index.py calibrate --table crypto_news --queries 50
+
+서비스는 VECTOR_INDEX_REFRESH_SECONDS 안에 새 인덱스 / 보정 결과로 검색 설정을 바꿈
+연결 정보는 DualDatabaseService와 같은 DB_HOST / DB_PORT / DB_NAME / DB_USER / DB_PASSWORD
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+import psycopg2
+
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir.parent))
+
+from langchain_service.services.table_embeddings import connection_params  # noqa: E402
+from langchain_service.services.vector_index import (  # noqa: E402
+    TABLE_VECTOR_INDEXES, ensure_builds_table, read_index_state, vector_index_manager
+)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("manage_vector_index")
+
+
+def connect():
+    return psycopg2.connect(**connection_params())
+
+
+def status(tables) -> int:
+    """인덱스 상태 + 필요한 작업"""
+    conn = connect()
+    try:
+        report = {}
+        with conn.cursor() as cur:
+            ensure_builds_table(cur)
+            for table in tables:
+                cur.execute("SELECT to_regclass(%s)", (table,))
+                if cur.fetchone()[0] is None:
+                    continue
+                state = read_index_state(cur, table, TABLE_VECTOR_INDEXES[table])
+                plan = vector_index_manager.plan(cur, table)
+                report[table] = {
+                    **vector_index_manager.health(state),
+                    'planned_action': plan['action'],
+                    'reason': plan['reason']
+                }
+        conn.commit()
+    finally:
+        conn.close()
+    print(json.dumps(report, ensure_ascii=False, indent=2, default=str))
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="벡터 인덱스 관리")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    for name, help_text in (('status', '인덱스 상태 / 추정 재현율'),
+                            ('maintain', '필요한 작업만 실행'),
+                            ('rebuild', '다시 생성 후 보정'),
+                            ('calibrate', 'probes / ef_search 재현율 측정')):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('--table', choices=sorted(TABLE_VECTOR_INDEXES), default=None,
+                             help='대상 테이블 (기본값: 모두)')
+        if name in ('maintain', 'rebuild'):
+            command.add_argument('--method', choices=['auto', 'hnsw', 'ivfflat'], default=None,
+                                 help='인덱스 방식 (기본값: VECTOR_INDEX_METHOD)')
+        if name != 'status':
+            command.add_argument('--queries', type=int, default=None, help='보정 질의 수')
+
+    args = parser.parse_args()
+    tables = [args.table] if args.table else sorted(TABLE_VECTOR_INDEXES)
+    if args.command == 'status':
+        return status(tables)
+
+    if getattr(args, 'method', None):
+        vector_index_manager.method = args.method
+    if args.queries:
+        vector_index_manager.calibration_queries = args.queries
+
+    for table in tables:
+        try:
+            if args.command == 'calibrate':
+                curve = vector_index_manager.calibrate(table, connect)
+                logger.info(f"📏 {table}: {curve or '인덱스 없음'}")
+            else:
+                plan = vector_index_manager.maintain(table, connect, rebuild=args.command == 'rebuild')
+                logger.info(f"✅ {table}: {plan['action'] or '작업 없음'} {plan['reason'] or ''}")
+        except psycopg2.Error as e:
+            logger.error(f"❌ {table} 실패: {e}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+벡터 압축 저장 마이그레이션 / 재현율 보고서
+
+migrate: 압축 컬럼 추가 → 기존 행을 배치 단위로 채움(중단 후 다시 실행하면 남은 행부터) → HNSW 인덱스 생성
+report: 전체 정밀도 정확 검색 결과 대비 현재 스키마 / 압축 방식별 재현율(recall@k)과 지연 시간, 인덱스 크기 비교
+
+사용법:
+    python migrate_vector_storage.py migrate --storage halfvec
+    python migrate_vector_storage.py migrate --storage binary --batch-size 500 --sleep 0.2
+    python migrate_vector_storage.py migrate --storage halfvec --drop-full-index   # 전체 정밀도 IVFFlat 인덱스 제거
+    python migrate_vector_storage.py report --storage halfvec,binary --factors 1,4,10 --output storage-report.json
+
+마이그레이션 후 서비스에 EMBEDDING_STORAGE를 같은 값으로 설정 (pgvector 0.7 이상 필요)
+연결 정보는 DualDatabaseService와 같은 DB_HOST / DB_PORT / DB_NAME / DB_USER / DB_PASSWORD
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import psycopg2
+
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir.parent))
+
+from langchain_service.services.table_embeddings import connection_params  # noqa: E402
+from langchain_service.services.vector_storage import VectorStorage, parse_storage  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("migrate_vector_storage")
+
+FULL_INDEX_NAME = 'idx_summary_embedding'
+
+
+def connect():
+    """PgVector 연결 (DualDatabaseService와 같은 환경변수)"""
+    return psycopg2.connect(**connection_params())
+
+
+def migrate(args) -> int:
+    """압축 컬럼 추가 / 채우기 / 인덱스 생성"""
+    storage = parse_storage(args.storage, args.dimension)
+    if not storage.compact:
+        logger.error("full은 마이그레이션이 필요 없습니다")
+        return 1
+
+    conn = connect()
+    try:
+        try:
+            with conn.cursor() as cur:
+                storage.ensure_schema(cur, args.table, create_index=False)
+            conn.commit()
+        except psycopg2.Error as e:
+            logger.error(f"❌ 압축 컬럼 생성 실패 (pgvector 0.7 이상 필요): {e}")
+            return 1
+        logger.info(f"🧱 압축 컬럼 준비: {args.table}.{storage.column} {storage.column_type}")
+
+        # 배치 단위로 채움 (NULL인 행만 대상 → 중단 후 다시 실행해도 이어서 진행)
+        with conn.cursor() as cur:
+            cur.execute(f"SELECT count(*) FROM {args.table} WHERE {storage.column} IS NULL AND embedding IS NOT NULL")
+            remaining = cur.fetchone()[0]
+        logger.info(f"📦 채울 행: {remaining}개")
+
+        done = 0
+        started = time.perf_counter()
+        while True:
+            with conn.cursor() as cur:
+                cur.execute(f"""
+                    UPDATE {args.table}
+                    SET {storage.column} = {storage.compact_expression('embedding')}
+                    WHERE id IN (
+                        SELECT id FROM {args.table}
+                        WHERE {storage.column} IS NULL AND embedding IS NOT NULL
+                        ORDER BY id
+                        LIMIT %s
+                        FOR UPDATE SKIP LOCKED
+                    )
+                """, (args.batch_size,))
+                updated = cur.rowcount
+            conn.commit()
+            if not updated:
+                break
+            done += updated
+            rate = done / max(time.perf_counter() - started, 1e-9)
+            logger.info(f"  {done}/{remaining} ({rate:.0f}행/초)")
+            if args.sleep:
+                time.sleep(args.sleep)
+
+        # 인덱스는 채운 뒤 한 번에 생성 (CONCURRENTLY: 수집 파이프라인 쓰기를 막지 않음)
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            logger.info(f"🔨 인덱스 생성: {storage.index_name(args.table)}")
+            storage.create_index(cur, args.table, concurrently=True)
+            if args.drop_full_index:
+                cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {FULL_INDEX_NAME}")
+                logger.info(f"🗑️ 전체 정밀도 인덱스 제거: {FULL_INDEX_NAME}")
+        logger.info(f"✅ 마이그레이션 완료: {done}행, {time.perf_counter() - started:.1f}초 "
+                    f"→ EMBEDDING_STORAGE={args.storage}")
+        return 0
+    finally:
+        conn.close()
+
+
+def _sample_queries(cur, table: str, count: int) -> List[Dict[str, Any]]:
+    """저장된 기사 벡터를 질의로 사용 (자기 자신은 결과에서 제외)"""
+    cur.execute(f"""
+        SELECT id, embedding::text FROM {table}
+        WHERE embedding IS NOT NULL
+        ORDER BY random()
+        LIMIT %s
+    """, (count,))
+    return [{'id': row[0], 'vector': json.loads(row[1])} for row in cur.fetchall()]
+
+
+def _exact_neighbors(cur, table: str, query: Dict[str, Any], k: int) -> List[int]:
+    """인덱스 없이 전체 정밀도 정확 검색 (정답)"""
+    cur.execute("SET LOCAL enable_indexscan = off")
+    cur.execute("SET LOCAL enable_bitmapscan = off")
+    cur.execute(f"""
+        SELECT id FROM {table}
+        WHERE embedding IS NOT NULL AND id <> %(id)s
+        ORDER BY embedding <=> %(query)s::vector
+        LIMIT %(k)s
+    """, {'id': query['id'], 'query': query['vector'], 'k': k})
+    ids = [row[0] for row in cur.fetchall()]
+    cur.execute("RESET enable_indexscan")
+    cur.execute("RESET enable_bitmapscan")
+    return ids
+
+
+def _measure(cur, table: str, storage: VectorStorage, queries, truth, k: int, factor: int) -> Dict[str, Any]:
+    """검색 SQL 재현율 / 지연 시간"""
+    sql = storage.search_sql(table, ['id'])
+    latencies, recalls = [], []
+    for query, expected in zip(queries, truth):
+        started = time.perf_counter()
+        cur.execute(sql, {
+            'query': query['vector'], 'threshold': -1.0, 'limit': k + 1, 'candidates': (k + 1) * factor
+        })
+        found = [row[0] for row in cur.fetchall() if row[0] != query['id']][:k]
+        latencies.append((time.perf_counter() - started) * 1000)
+        recalls.append(len(set(found) & set(expected)) / max(len(expected), 1))
+    ordered = sorted(latencies)
+    return {
+        'storage': storage.kind if storage.compact_dimension == storage.dimension
+        else f"{storage.kind}:{storage.compact_dimension}",
+        'rerank_factor': factor if storage.compact else None,
+        f'recall@{k}': round(statistics.mean(recalls), 4),
+        'p50_ms': round(statistics.median(latencies), 2),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(0.95 * (len(ordered) - 1)))], 2),
+    }
+
+
+def _relation_sizes(cur, table: str) -> Dict[str, Any]:
+    """테이블 / 인덱스 크기"""
+    cur.execute("""
+        SELECT indexrelid::regclass::text, pg_relation_size(indexrelid)
+        FROM pg_index WHERE indrelid = %s::regclass
+    """, (table,))
+    indexes = {name: size for name, size in cur.fetchall()}
+    cur.execute("SELECT pg_total_relation_size(%s::regclass), pg_relation_size(%s::regclass)", (table, table))
+    total, heap = cur.fetchone()
+    return {'table_total_bytes': total, 'heap_bytes': heap, 'index_bytes': indexes}
+
+
+def report(args) -> int:
+    """재현율 / 지연 시간 / 크기 보고서"""
+    k = args.k
+    factors = [int(value) for value in args.factors.split(',')]
+    storages = [parse_storage(spec, args.dimension) for spec in args.storage.split(',') if spec.strip()]
+
+    conn = connect()
+    try:
+        with conn.cursor() as cur:
+            queries = _sample_queries(cur, args.table, args.queries)
+            if not queries:
+                logger.error("임베딩이 저장된 행이 없습니다")
+                return 1
+            truth = [_exact_neighbors(cur, args.table, query, k) for query in queries]
+            conn.commit()
+
+            # 현재 스키마 (전체 정밀도 검색 SQL) 기준
+            rows = [_measure(cur, args.table, parse_storage('full', args.dimension), queries, truth, k, 1)]
+            for storage in storages:
+                if not storage.compact:
+                    continue
+                cur.execute("""
+                    SELECT 1 FROM information_schema.columns WHERE table_name = %s AND column_name = %s
+                """, (args.table, storage.column))
+                if not cur.fetchone():
+                    logger.warning(f"⚠️ {storage.column} 컬럼이 없어 건너뜀 (먼저 migrate 실행)")
+                    continue
+                cur.execute(f"SELECT avg(pg_column_size({storage.column})) FROM {args.table}")
+                column_bytes = cur.fetchone()[0]
+                for factor in factors:
+                    row = _measure(cur, args.table, storage, queries, truth, k, factor)
+                    row['avg_column_bytes'] = float(column_bytes or 0)
+                    rows.append(row)
+            conn.commit()
+            sizes = _relation_sizes(cur, args.table)
+    finally:
+        conn.close()
+
+    print()
+    header = f"{'storage':<16}{'rerank':>8}{f'recall@{k}':>12}{'p50 ms':>10}{'p95 ms':>10}{'col bytes':>11}"
+    print(header)
+    print('-' * len(header))
+    for row in rows:
+        print(f"{row['storage']:<16}{row['rerank_factor'] or '-':>8}{row[f'recall@{k}']:>12.4f}"
+              f"{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}{row.get('avg_column_bytes', '-'):>11}")
+    print()
+    for name, size in sizes['index_bytes'].items():
+        print(f"{name:<48}{size / 1024 / 1024:>10.1f} MiB")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({
+            'table': args.table, 'queries': len(queries), 'k': k, 'results': rows, 'sizes': sizes
+        }, ensure_ascii=False, indent=2), encoding='utf-8')
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="벡터 압축 저장 마이그레이션 / 재현율 보고서")
+    parser.add_argument('--table', default='crypto_news_summary', help='대상 테이블')
+    parser.add_argument('--dimension', type=int, default=1536, help='embedding 컬럼 차원')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    migrate_parser = commands.add_parser('migrate', help='압축 컬럼 추가 / 채우기 / 인덱스 생성')
+    migrate_parser.add_argument('--storage', required=True, help='halfvec | halfvec:<차원> | binary')
+    migrate_parser.add_argument('--batch-size', type=int, default=1000, help='UPDATE 1회당 행 수')
+    migrate_parser.add_argument('--sleep', type=float, default=0.0, help='배치 사이 대기 (초, DB 부하 조절)')
+    migrate_parser.add_argument('--drop-full-index', action='store_true', help='전체 정밀도 IVFFlat 인덱스 제거')
+
+    report_parser = commands.add_parser('report', help='재현율 / 지연 시간 비교')
+    report_parser.add_argument('--storage', default='halfvec,binary', help='쉼표로 구분한 저장 방식 (마이그레이션된 것만)')
+    report_parser.add_argument('--factors', default='1,2,4,10', help='재정렬 후보 배수 목록')
+    report_parser.add_argument('--queries', type=int, default=100, help='질의 수 (저장된 기사 벡터 표본)')
+    report_parser.add_argument('--k', type=int, default=10, help='재현율 기준 상위 k')
+    report_parser.add_argument('--output', default=None, help='결과 JSON 저장 경로')
+
+    args = parser.parse_args()
+    return migrate(args) if args.command == 'migrate' else report(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
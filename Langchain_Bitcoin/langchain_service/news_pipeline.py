@@ -13,7 +13,7 @@ import os
 import json
 import logging
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional
 
 # Windows 콘솔 UTF-8 설정
 if sys.platform == "win32":
@@ -35,8 +35,8 @@ from services.dual_db_service import DualDatabaseService
 
 class NewsPipeline:
     def __init__(self, 
-                 redis_host: str = "localhost",
-                 redis_port: int = 6379,
+                 redis_host: str = None,
+                 redis_port: int = None,
                  pg_host: str = "localhost",
                  pg_port: int = 5433,
                  openai_api_key: str = None):
@@ -65,7 +65,10 @@ class NewsPipeline:
         
         # 서비스 초기화
         try:
-            self.collector = NewsCollector(redis_host=redis_host, redis_port=redis_port)
+            self.collector = NewsCollector(
+                redis_host=redis_host or os.getenv('REDIS_HOST', 'localhost'),
+                redis_port=redis_port or int(os.getenv('REDIS_PORT', 6379))
+            )
             self.preprocessor = NewsPreprocessor(openai_api_key=openai_api_key)
             self.dual_db_service = DualDatabaseService()
             
@@ -75,8 +78,23 @@ class NewsPipeline:
             self.logger.error(f"뉴스 파이프라인 초기화 실패: {e}")
             raise
     
-    def run_pipeline(self, hours_back: int = 24, use_cache: bool = True) -> Dict[str, Any]:
-        """전체 파이프라인 실행"""
+    def run_pipeline(self, hours_back: int = 24, use_cache: bool = True,
+                     progress_callback: Optional[Callable[..., None]] = None) -> Dict[str, Any]:
+        """
+        전체 파이프라인 실행
+
+        Args:
+            hours_back: 수집 대상 기간 (시간)
+            use_cache: Redis 수집 캐시 사용 여부
+            progress_callback: 단계 진행 상황 콜백 (stage, status, **건수) - 백그라운드 작업 진행률 보고용
+        """
+        def report(stage: str, status: str = 'running', **info):
+            if progress_callback:
+                try:
+                    progress_callback(stage, status, **info)
+                except Exception as callback_error:
+                    self.logger.debug(f"진행 상황 보고 실패: {callback_error}")
+        
         start_time = datetime.now()
         results = {
             'start_time': start_time.isoformat(),
@@ -94,6 +112,7 @@ class NewsPipeline:
             
             # 1단계: 뉴스 수집
             self.logger.info("1단계: 뉴스 수집 시작")
+            report('collect')
             
             raw_articles = []
             
@@ -112,13 +131,17 @@ class NewsPipeline:
             
             results['collected_count'] = len(raw_articles)
             self.logger.info(f"총 {len(raw_articles)}개 뉴스 수집 완료")
+            report('collect', 'completed', count=len(raw_articles))
             
             if not raw_articles:
                 self.logger.warning("수집된 뉴스가 없습니다")
+                report('preprocess', 'skipped')
+                report('store', 'skipped')
                 return results
             
             # 2단계: 뉴스 전처리
             self.logger.info("2단계: 뉴스 전처리 시작")
+            report('preprocess', done=0, total=len(raw_articles), errors=0)
             
             processed_articles = []
             for i, article_data in enumerate(raw_articles):
@@ -148,17 +171,23 @@ class NewsPipeline:
                     self.logger.error(error_msg)
                     results['errors'].append(error_msg)
                     continue
+                finally:
+                    report('preprocess', done=i + 1, total=len(raw_articles), errors=len(results['errors']))
             
             results['processed_count'] = len(processed_articles)
             self.logger.info(f"총 {len(processed_articles)}개 뉴스 전처리 완료")
+            report('preprocess', 'completed', done=len(raw_articles), total=len(raw_articles),
+                   count=len(processed_articles), errors=len(results['errors']))
             
             # 3단계: 데이터베이스 저장
             self.logger.info("3단계: 데이터베이스 저장 시작")
+            report('store', total=len(processed_articles))
             
             saved_count = self.dual_db_service.batch_insert_articles(processed_articles)
             results['saved_count'] = saved_count
             
             self.logger.info(f"총 {saved_count}개 뉴스 저장 완료")
+            report('store', 'completed', total=len(processed_articles), count=saved_count)
             
             # 완료 처리
             end_time = datetime.now()
@@ -184,10 +213,11 @@ class NewsPipeline:
         
         return results
     
-    def run_incremental_update(self, hours_back: int = 6) -> Dict[str, Any]:
+    def run_incremental_update(self, hours_back: int = 6,
+                               progress_callback: Optional[Callable[..., None]] = None) -> Dict[str, Any]:
         """증분 업데이트 실행 (최근 N시간 뉴스만)"""
         self.logger.info(f"증분 업데이트 시작 (최근 {hours_back}시간)")
-        return self.run_pipeline(hours_back=hours_back, use_cache=False)
+        return self.run_pipeline(hours_back=hours_back, use_cache=False, progress_callback=progress_callback)
     
     def get_pipeline_status(self) -> Dict[str, Any]:
         """파이프라인 상태 확인"""
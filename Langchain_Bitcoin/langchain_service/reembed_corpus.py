@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+임베딩 재생성 / 모델 교체
+
+crypto_news(로컬 MiniLM 384차원)와 crypto_news_summary(OpenAI ada 1536차원)를 같은 모델로 맞추거나
+모델을 바꿀 때 사용. 그림자 컬럼에 배치 단위로 채운 뒤(중단 후 다시 실행하면 이어서 진행) 한 트랜잭션에서 교체
+
+사용법:
+    python reembed_corpus.py backfill --table crypto_news --model openai:text-embedding-ada-002
+    python reembed_corpus.py backfill --table crypto_news --model openai:text-embedding-ada-002 \\
+        --batch-size 200 --rows-per-second 50 --swap      # 채우기 → 인덱스 → 교체까지 한 번에
+    python reembed_corpus.py swap --table crypto_news --model openai:text-embedding-ada-002
+    python reembed_corpus.py swap --table crypto_news --model openai:text-embedding-ada-002 --force
+                                                           # 임베딩이 계속 실패하는 행을 검색에서 빼고 교체
+    python reembed_corpus.py cleanup --table crypto_news   # 교체 전 벡터 컬럼(embedding_prev) 제거
+    python reembed_corpus.py status
+
+교체는 새 벡터가 없는 행(임베딩 실패 / 잠금 직전 추가)이 남아 있으면 취소 - 다시 실행하면 그 행부터 채움
+교체 후 검색 / 저장 경로(DatabaseManager / CryptoNewsSearchTool / PgVectorService / DualDatabaseService)는
+EMBEDDING_MODEL_REFRESH_SECONDS 안에 새 모델로 임베딩
+연결 정보는 DualDatabaseService와 같은 DB_HOST / DB_PORT / DB_NAME / DB_USER / DB_PASSWORD
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+import psycopg2
+
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir.parent))
+
+from langchain_service.services.reembedding import ReembeddingJob, cleanup, job_status  # noqa: E402
+from langchain_service.services.table_embeddings import connection_params  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("reembed_corpus")
+
+
+def _job(conn, args) -> ReembeddingJob:
+    return ReembeddingJob(
+        conn, args.table, args.model,
+        batch_size=args.batch_size, rows_per_second=args.rows_per_second,
+        sleep=args.sleep, lock_timeout=args.lock_timeout
+    )
+
+
+def backfill(args) -> int:
+    """그림자 컬럼 채우기 → HNSW 인덱스 (→ --swap이면 교체)"""
+    conn = psycopg2.connect(**connection_params())
+    try:
+        job = _job(conn, args)
+        result = job.backfill(max_rows=args.max_rows)
+        logger.info(f"📊 채우기 결과: {result}")
+        if args.max_rows is not None and job.remaining(result['last_id']):
+            logger.info("⏸️ --max-rows 도달 - 다시 실행하면 이어서 진행")
+            return 0
+        job.create_index()
+        if args.swap:
+            try:
+                job.swap(force=args.force)
+            except (RuntimeError, psycopg2.Error) as e:
+                logger.error(f"❌ 교체 실패 (변경 없음): {e}")
+                return 1
+        else:
+            logger.info(f"✅ 채우기 완료 → 교체: python reembed_corpus.py swap --table {args.table} --model {args.model}")
+        return 0
+    finally:
+        conn.close()
+
+
+def swap(args) -> int:
+    """남은 행 채우기 + 컬럼 교체"""
+    conn = psycopg2.connect(**connection_params())
+    try:
+        job = _job(conn, args)
+        job.create_index()
+        job.swap(force=args.force)
+        return 0
+    except (RuntimeError, psycopg2.Error) as e:
+        logger.error(f"❌ 교체 실패 (변경 없음): {e}")
+        return 1
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="임베딩 재생성 / 모델 교체")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    for name, help_text in (('backfill', '그림자 컬럼 채우기 (이어서 진행)'), ('swap', 'embedding 컬럼 교체')):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('--table', required=True, choices=['crypto_news', 'crypto_news_summary'])
+        command.add_argument('--model', required=True, help='openai:<모델> | local:<모델>')
+        command.add_argument('--batch-size', type=int, default=256, help='배치당 행 수')
+        command.add_argument('--rows-per-second', type=float, default=0.0, help='처리 속도 상한 (0: 제한 없음)')
+        command.add_argument('--sleep', type=float, default=0.0, help='배치 사이 대기 (초)')
+        command.add_argument('--lock-timeout', type=float, default=10.0, help='교체 시 잠금 대기 한도 (초)')
+        command.add_argument('--force', action='store_true', help='새 벡터가 없는 행이 남아 있어도 교체')
+        if name == 'backfill':
+            command.add_argument('--max-rows', type=int, default=None, help='이번 실행에서 처리할 최대 행 수')
+            command.add_argument('--swap', action='store_true', help='채우기가 끝나면 바로 교체')
+
+    cleanup_parser = commands.add_parser('cleanup', help='교체 전 벡터 컬럼 제거')
+    cleanup_parser.add_argument('--table', required=True, choices=['crypto_news', 'crypto_news_summary'])
+
+    commands.add_parser('status', help='진행 기록 / 테이블별 모델')
+
+    args = parser.parse_args()
+    if args.command == 'backfill':
+        return backfill(args)
+    if args.command == 'swap':
+        return swap(args)
+
+    conn = psycopg2.connect(**connection_params())
+    try:
+        if args.command == 'cleanup':
+            cleanup(conn, args.table)
+        else:
+            print(json.dumps(job_status(conn), ensure_ascii=False, indent=2, default=str))
+        return 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
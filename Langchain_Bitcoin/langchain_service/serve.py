@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+프로덕션 멀티 워커 실행기
+
+gunicorn(preload) + UvicornWorker로 N개 워커를 실행
+마스터 프로세스에서 앱 로드와 워밍업(Intent 임베딩, SentenceTransformer, 도구 모듈)을 마친 뒤 fork하여
+워커들이 copy-on-write로 공유
+
+사용법:
+    SESSION_BACKEND=redis WEB_CONCURRENCY=4 python serve.py
+
+환경변수:
+    WEB_CONCURRENCY: 워커 수 (기본값: CPU 코어 수)
+    PORT / HOST: 바인드 주소 (기본값: 0.0.0.0:8001)
+    SESSION_BACKEND: 세션 저장소 (멀티 워커에서는 redis 권장)
+    WORKER_TIMEOUT: 워커 응답 제한 시간 (기본값: 120초)
+    PROMETHEUS_MULTIPROC_DIR: 워커 지표 파일 디렉터리 - /metrics가 모든 워커 합계를 응답
+        (멀티 워커 기본값: 임시 디렉터리, 시작 시 이전 실행의 파일 삭제)
+
+개발 모드(자동 리로드)는 기존대로 python main.py 사용
+"""
+
+import gc
+import glob
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# main.py와 동일한 import 경로 구성 (langchain_service.* 및 services.*)
+current_dir = Path(__file__).parent
+sys.path.insert(0, str(current_dir.parent))
+sys.path.insert(0, str(current_dir))
+
+try:
+    from gunicorn.app.base import BaseApplication
+    GUNICORN_AVAILABLE = True
+except ImportError:
+    GUNICORN_AVAILABLE = False
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("serve")
+
+
+def _preload_app():
+    """앱 로드 및 fork 전 워밍업 (마스터 프로세스에서 1회 실행)"""
+    from langchain_service.services.warmup import run_prefork_warmup
+    from main import app
+
+    run_prefork_warmup()
+
+    # 워밍업으로 생성된 객체들을 GC 추적 대상에서 제외하여 fork 후 참조 카운트 갱신으로 인한 페이지 복사 최소화
+    gc.collect()
+    gc.freeze()
+    return app
+
+
+if GUNICORN_AVAILABLE:
+    class PreforkApplication(BaseApplication):
+        """워밍업된 앱을 fork하는 gunicorn 애플리케이션"""
+
+        def __init__(self, options: dict):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            return _preload_app()
+
+
+def _prepare_metrics_dir(workers: int):
+    """워커 지표 파일 디렉터리 준비 (앱 import 전 - 지표 저장소가 import 시점에 환경변수를 읽음)"""
+    directory = os.getenv('PROMETHEUS_MULTIPROC_DIR')
+    if not directory:
+        if workers <= 1:
+            return
+        directory = os.environ['PROMETHEUS_MULTIPROC_DIR'] = tempfile.mkdtemp(prefix='langchain-metrics-')
+    os.makedirs(directory, exist_ok=True)
+    # 이전 실행의 워커 파일이 합계에 섞이지 않도록 정리
+    for path in glob.glob(os.path.join(directory, 'metrics_*.json*')):
+        os.remove(path)
+    logger.info(f"📊 워커 지표 디렉터리: {directory}")
+
+
+def main():
+    """멀티 워커 서버 실행"""
+    workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+    host = os.getenv('HOST', '0.0.0.0')
+    port = int(os.getenv('PORT', 8001))
+
+    if workers > 1 and os.getenv('SESSION_BACKEND', 'memory').lower() == 'memory':
+        logger.warning("⚠️ 멀티 워커에서 메모리 세션 저장소를 사용하면 세션 언어 설정이 워커 간에 공유되지 않습니다 (SESSION_BACKEND=redis 권장)")
+
+    _prepare_metrics_dir(workers)
+
+    print("🚀 Crypto Chatbot LangChain Service (production)")
+    print(f"📡 서버 주소: http://{host}:{port} | 워커: {workers}개")
+
+    if not GUNICORN_AVAILABLE:
+        # gunicorn 미설치 환경 (Windows 등): uvicorn 멀티 워커로 대체 (워커별 초기화, pre-fork 공유 없음)
+        logger.warning("⚠️ gunicorn이 설치되지 않아 uvicorn 멀티 워커로 실행합니다 (pre-fork 워밍업 비활성화)")
+        import uvicorn
+        uvicorn.run("main:app", host=host, port=port, workers=workers, log_level="info")
+        return
+
+    options = {
+        'bind': f"{host}:{port}",
+        'workers': workers,
+        'worker_class': 'uvicorn.workers.UvicornWorker',
+        'preload_app': True,
+        'timeout': int(os.getenv('WORKER_TIMEOUT', 120)),
+        'graceful_timeout': 30,
+        'keepalive': 5,
+        'accesslog': '-',
+    }
+    PreforkApplication(options).run()
+
+
+if __name__ == "__main__":
+    main()
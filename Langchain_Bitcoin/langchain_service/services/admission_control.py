@@ -0,0 +1,216 @@
+"""
+채팅 요청 허용 제어 (Admission Control / Load Shedding)
+OpenAI 지연 등으로 처리가 밀릴 때 요청을 무한정 쌓지 않고 빠르게 거절하여
+아무도 받지 않을 응답에 할당량을 쓰지 않도록 함
+
+- 동시 처리 한도: 한도 초과 요청은 우선순위 대기열에서 대기
+- 우선순위: 가벼운 가격 조회가 종합 분석보다 먼저 처리됨
+- 대기 기한: 기한 내에 시작하지 못하면 503 + Retry-After
+- 대기열 초과 / 과부하 시 낮은 우선순위부터 429 + Retry-After
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 우선순위 (숫자가 작을수록 먼저 처리)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+PRIORITY_NAMES = {PRIORITY_HIGH: 'high', PRIORITY_NORMAL: 'normal', PRIORITY_LOW: 'low'}
+
+# Intent별 우선순위 (키워드 분류 결과 기준 - 허용 판단에는 임베딩 호출을 쓰지 않음)
+INTENT_PRIORITIES = {
+    'price_lookup': PRIORITY_HIGH,
+    'language_change': PRIORITY_HIGH,
+    'casual_chat': PRIORITY_NORMAL,
+    'news_sentiment': PRIORITY_NORMAL,
+    'historical_data': PRIORITY_NORMAL,
+    'technical_analysis': PRIORITY_LOW,
+    'comprehensive_analysis': PRIORITY_LOW,
+    'batch': PRIORITY_LOW
+}
+
+
+def priority_for_intent(intent: Optional[str]) -> int:
+    """Intent의 허용 우선순위"""
+    return INTENT_PRIORITIES.get(intent, PRIORITY_NORMAL)
+
+
+class AdmissionRejected(Exception):
+    """허용 거절 (HTTP 상태 코드와 Retry-After 포함)"""
+
+    def __init__(self, reason: str, status_code: int, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """우선순위 대기열 기반 동시 처리 한도 관리"""
+
+    def __init__(self,
+                 max_in_flight: int = None,
+                 max_queue: int = None,
+                 queue_timeout: float = None,
+                 shed_ratio: float = None):
+        """
+        초기화
+
+        Args:
+            max_in_flight: 동시 처리 한도
+            max_queue: 대기열 최대 길이
+            queue_timeout: 대기 기한 (초)
+            shed_ratio: 대기열이 이 비율 이상 차면 낮은 우선순위 요청을 즉시 거절
+        """
+        self.enabled = os.getenv('ADMISSION_CONTROL_ENABLED', 'true').lower() == 'true'
+        self.max_in_flight = max_in_flight or int(os.getenv('ADMISSION_MAX_IN_FLIGHT', 32))
+        self.max_queue = max_queue or int(os.getenv('ADMISSION_MAX_QUEUE', 100))
+        self.queue_timeout = queue_timeout or float(os.getenv('ADMISSION_QUEUE_TIMEOUT', 10.0))
+        self.shed_ratio = shed_ratio or float(os.getenv('ADMISSION_SHED_RATIO', 0.8))
+
+        self._in_flight = 0
+        self._waiters: List = []  # (우선순위, 순번, future)
+        self._sequence = itertools.count()
+
+        # 통계
+        self._admitted = 0
+        self._queued = 0
+        self._shed: Dict[str, int] = {'queue_full': 0, 'low_priority': 0, 'deadline': 0}
+        self._avg_service_time = 1.0
+        self._avg_queue_time = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """대기 중인 요청 수"""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def _queue_depth_by_priority(self) -> Dict[str, int]:
+        depth = {name: 0 for name in PRIORITY_NAMES.values()}
+        for priority, _, future in self._waiters:
+            if not future.done():
+                depth[PRIORITY_NAMES.get(priority, 'normal')] += 1
+        return depth
+
+    def _retry_after(self) -> int:
+        """대기열을 소진하는 데 걸릴 예상 시간 (초, 1~60)"""
+        estimate = self._avg_service_time * (self.queue_depth + 1) / self.max_in_flight
+        return max(1, min(60, int(estimate + 0.999)))
+
+    def _reject(self, reason: str, status_code: int) -> AdmissionRejected:
+        self._shed[reason] += 1
+        retry_after = self._retry_after()
+        logger.warning(f"🚦 요청 거절 ({reason}): 처리 중 {self._in_flight}, 대기 {self.queue_depth}, Retry-After {retry_after}초")
+        return AdmissionRejected(reason, status_code, retry_after)
+
+    async def acquire(self, priority: int = PRIORITY_NORMAL) -> float:
+        """
+        처리 슬롯 획득 (대기 필요 시 우선순위 대기열에서 대기)
+
+        Returns:
+            획득 시각 (release에 전달)
+
+        Raises:
+            AdmissionRejected: 대기열 초과(429) 또는 대기 기한 초과(503)
+        """
+        if not self.enabled:
+            return time.perf_counter()
+
+        if self._in_flight < self.max_in_flight and self.queue_depth == 0:
+            return self._admit(0.0)
+
+        depth = self.queue_depth
+        if depth >= self.max_queue:
+            raise self._reject('queue_full', 429)
+        if priority >= PRIORITY_LOW and depth >= self.max_queue * self.shed_ratio:
+            raise self._reject('low_priority', 429)
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._sequence), future)
+        heapq.heappush(self._waiters, entry)
+        self._queued += 1
+        queued_at = time.perf_counter()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # 기한 직전에 슬롯을 받은 경우 그대로 처리
+                return self._admit(time.perf_counter() - queued_at, counted=True)
+            future.cancel()
+            raise self._reject('deadline', 503)
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료 등으로 대기 취소: 이미 받은 슬롯은 다음 대기자에게 넘김
+            if future.done() and not future.cancelled():
+                self._in_flight -= 1
+                self._wake_next()
+            else:
+                future.cancel()
+            raise
+
+        return self._admit(time.perf_counter() - queued_at, counted=True)
+
+    def _admit(self, queue_time: float, counted: bool = False) -> float:
+        """허용 처리 (counted: 깨우는 쪽에서 이미 처리 중 수를 증가시킨 경우)"""
+        if not counted:
+            self._in_flight += 1
+        self._admitted += 1
+        self._avg_queue_time = self._avg_queue_time * 0.9 + queue_time * 0.1
+        return time.perf_counter()
+
+    def release(self, admitted_at: float):
+        """처리 슬롯 반환 및 다음 대기자 깨우기"""
+        if not self.enabled:
+            return
+        service_time = time.perf_counter() - admitted_at
+        self._avg_service_time = self._avg_service_time * 0.9 + service_time * 0.1
+        self._in_flight -= 1
+        self._wake_next()
+
+    def _wake_next(self):
+        """가장 높은 우선순위의 대기자에게 슬롯 넘김 (취소된 대기자는 건너뜀)"""
+        while self._waiters and self._in_flight < self.max_in_flight:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._in_flight += 1
+            future.set_result(True)
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_NORMAL):
+        """처리 슬롯 컨텍스트 매니저"""
+        admitted_at = await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release(admitted_at)
+
+    def get_stats(self) -> Dict:
+        """허용 제어 통계"""
+        return {
+            'enabled': self.enabled,
+            'max_in_flight': self.max_in_flight,
+            'max_queue': self.max_queue,
+            'queue_timeout_seconds': self.queue_timeout,
+            'in_flight': self._in_flight,
+            'queue_depth': self.queue_depth,
+            'queue_depth_by_priority': self._queue_depth_by_priority(),
+            'admitted': self._admitted,
+            'queued': self._queued,
+            'shed': dict(self._shed),
+            'avg_queue_time_ms': round(self._avg_queue_time * 1000, 1),
+            'avg_service_time_ms': round(self._avg_service_time * 1000, 1)
+        }
+
+
+# 전역 허용 제어 인스턴스
+admission_controller = AdmissionController()
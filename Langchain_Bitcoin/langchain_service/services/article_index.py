@@ -0,0 +1,561 @@
+"""
+기사 벡터 메모리 인덱스
+crypto_news_summary 벡터를 프로세스 메모리에 미러링하여 연결 생성 / Postgres 왕복 없이 유사도 검색
+
+- hnswlib가 설치되어 있으면 HNSW 그래프, 없으면 정규화 행렬 정확 검색 (numpy 행렬-벡터 곱)
+- 날짜 / 출처 / 감성 필터: 메타데이터 배열 마스크 → 통과한 행이 적으면 그 행만 정확 검색,
+  많으면 HNSW 후보를 넉넉히 뽑아 거르고 부족하면 정확 검색
+- 시작 시 디스크(.npz)에서 로드한 뒤 그 이후 행만 DB에서 추가 → 재시작 시 전체 벡터를 다시 읽지 않음
+- 같은 프로세스의 저장(insert_news_article)은 바로 추가, 다른 프로세스(뉴스 파이프라인)의 저장은
+  ARTICLE_INDEX_REFRESH_SECONDS마다 백그라운드로 가져옴 (행 수가 줄었으면 삭제된 기사 제거)
+- 준비 전 / 모델 또는 차원 불일치면 None 반환 → 호출자가 Postgres로 검색
+- 검색 모델이 바뀌면(재임베딩 교체) 백그라운드로 새 모델 벡터를 다시 적재 (적재 전까지 Postgres 검색)
+
+환경변수
+- ARTICLE_INDEX_ENABLED: 사용 여부 (기본값: true)
+- ARTICLE_INDEX_DIR: 저장 디렉터리 (기본값: langchain_service/.cache/article_index)
+- ARTICLE_INDEX_REFRESH_SECONDS: 다른 프로세스 저장분 확인 주기 (기본값: 30)
+- ARTICLE_INDEX_HNSW_M / ARTICLE_INDEX_EF_CONSTRUCTION / ARTICLE_INDEX_EF_SEARCH: HNSW 설정 (16 / 200 / 64)
+- ARTICLE_INDEX_EXACT_MAX_ROWS: 필터 통과 행이 이 수 이하이면 정확 검색 (기본값: 5000)
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import hnswlib
+    HNSWLIB_AVAILABLE = True
+except ImportError:
+    HNSWLIB_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+TABLE = 'crypto_news_summary'
+DEFAULT_INDEX_DIR = Path(__file__).parent.parent / '.cache' / 'article_index'
+
+# 메모리에 함께 보관하는 결과 컬럼 (DualDatabaseService.SEARCH_COLUMNS와 같은 구성)
+PAYLOAD_COLUMNS = ['id', 'title', 'summary', 'url', 'source', 'published_date', 'keywords', 'sentiment', 'created_at']
+DATETIME_COLUMNS = ('published_date', 'created_at')
+
+LOAD_BATCH_ROWS = 2000
+# 추가분 적재 시 마지막 위치보다 앞쪽도 다시 확인 (늦게 커밋된 다른 프로세스의 작은 id 누락 방지)
+CATCH_UP_OVERLAP_IDS = 100
+FILTER_OVERSAMPLE = 10
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32)
+
+
+def _timestamp(value) -> float:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float('nan')
+
+
+def _parse_vector(text: str) -> np.ndarray:
+    """pgvector 텍스트 표현 '[x,y,...]' → float32 배열 (C 파서, JSON보다 빠름)"""
+    return np.array(text[1:-1].split(','), dtype=np.float32)
+
+
+class _ResizeGate:
+    """
+    HNSW 검색과 크기 변경 조정
+
+    hnswlib는 knn_query와 add_items를 동시에 실행할 수 있지만 resize_index는 단독으로 실행해야 함
+    → 검색끼리는 동시에, 크기 변경(드물게 두 배씩)만 진행 중인 검색이 끝난 뒤 단독 실행
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._searches = 0
+        self._resizing = False
+
+    @contextmanager
+    def search(self):
+        with self._condition:
+            while self._resizing:
+                self._condition.wait()
+            self._searches += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._searches -= 1
+                if not self._searches:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def resize(self):
+        with self._condition:
+            self._resizing = True
+            while self._searches:
+                self._condition.wait()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._resizing = False
+                self._condition.notify_all()
+
+
+class ArticleVectorIndex:
+    """crypto_news_summary 메모리 미러 (행 번호 = HNSW 라벨)"""
+
+    def __init__(self, index_dir: Path = None):
+        self.enabled = os.getenv('ARTICLE_INDEX_ENABLED', 'true').lower() == 'true'
+        self.index_dir = Path(index_dir or os.getenv('ARTICLE_INDEX_DIR') or DEFAULT_INDEX_DIR)
+        self.refresh_seconds = float(os.getenv('ARTICLE_INDEX_REFRESH_SECONDS', 30))
+        self.hnsw_m = int(os.getenv('ARTICLE_INDEX_HNSW_M', 16))
+        self.ef_construction = int(os.getenv('ARTICLE_INDEX_EF_CONSTRUCTION', 200))
+        self.ef_search = int(os.getenv('ARTICLE_INDEX_EF_SEARCH', 64))
+        self.exact_max_rows = int(os.getenv('ARTICLE_INDEX_EXACT_MAX_ROWS', 5000))
+        self.backend = 'hnsw' if HNSWLIB_AVAILABLE else 'exact'
+
+        self.model: Optional[str] = None
+        self.dimension = 0
+        self._connect: Optional[Callable] = None
+        # 디스크 + DB 추가분 적재가 끝나야 검색에 사용 (적재 중 일부만 들어 있는 인덱스로 응답하지 않도록)
+        self._loaded = False
+        self._reset()
+
+        # 쓰기(추가 / 삭제 / 적재 / 저장)끼리만 직렬화 - 검색은 이 잠금을 기다리지 않음
+        self._lock = threading.RLock()
+        self._gate = _ResizeGate()
+        self._refreshing = threading.Lock()
+        self._refreshed_at = 0.0
+        self._reload_attempted_at = float('-inf')
+        self._hits = 0
+        self._misses = 0
+
+    def _reset(self, capacity: int = 1024):
+        self.size = 0
+        self.max_id = 0
+        self._loaded_id = 0
+        self._vectors = np.zeros((capacity, self.dimension), dtype=np.float32)
+        self._ids = np.zeros(capacity, dtype=np.int64)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._published = np.full(capacity, np.nan)
+        self._source_codes = np.full(capacity, -1, dtype=np.int32)
+        self._sentiment_codes = np.full(capacity, -1, dtype=np.int32)
+        self._payloads: List[Optional[Dict[str, Any]]] = []
+        self._rows: Dict[int, int] = {}
+        self._codes: Dict[str, Dict[str, int]] = {'source': {}, 'sentiment': {}}
+        self._hnsw = None
+        if self.backend == 'hnsw' and self.dimension:
+            self._hnsw = hnswlib.Index(space='cosine', dim=self.dimension)
+            self._hnsw.init_index(max_elements=capacity, ef_construction=self.ef_construction, M=self.hnsw_m)
+            self._hnsw.set_ef(self.ef_search)
+
+    @property
+    def ready(self) -> bool:
+        return self.enabled and self.model is not None and self._loaded
+
+    @property
+    def path(self) -> Path:
+        return self.index_dir / f"{TABLE}-{re.sub(r'[^A-Za-z0-9_.-]', '_', self.model or '')}.npz"
+
+    # ------------------------------------------------------------------ 적재
+
+    def load(self, connect: Callable, model: str, dimension: int) -> str:
+        """
+        디스크 인덱스 로드 + 이후 추가된 행 적재 (블로킹, 시작 시 1회)
+
+        Args:
+            connect: PgVector 연결 생성 함수
+            model: 벡터 컬럼 임베딩 모델 (검색 질의 모델과 같아야 사용)
+            dimension: 벡터 차원
+
+        Returns:
+            'disk' (디스크 + 추가분) 또는 'db' (전체 적재)
+        """
+        if not self.enabled:
+            return 'disabled'
+        started = time.perf_counter()
+        with self._lock:
+            self._loaded = False
+            self.model, self.dimension, self._connect = model, dimension, connect
+            source = 'disk' if self._load_file() else 'db'
+            if source == 'db':
+                self._reset()
+        added = self._catch_up(connect)
+        self._loaded = True
+        self._refreshed_at = time.monotonic()
+        if added or source == 'db':
+            self.save()
+        logger.info(
+            f"✅ 기사 벡터 인덱스 로드 ({self.backend}, {source}): {self.count}개, 추가 {added}개, "
+            f"{time.perf_counter() - started:.1f}초"
+        )
+        return source
+
+    def _catch_up(self, connect: Callable) -> int:
+        """max_id 이후 행 적재 (행 수가 줄었으면 삭제된 기사도 제거)"""
+        conn = connect()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"SELECT count(*) FROM {TABLE} WHERE embedding IS NOT NULL AND id <= %s", (self.max_id,))
+                if cur.fetchone()[0] < self.count:
+                    cur.execute(f"SELECT id FROM {TABLE} WHERE embedding IS NOT NULL AND id <= %s", (self.max_id,))
+                    existing = {row[0] for row in cur.fetchall()}
+                    deleted = [article_id for article_id in list(self._rows) if article_id not in existing]
+                    for article_id in deleted:
+                        self.remove(article_id)
+                    logger.info(f"🗑️ 기사 벡터 인덱스에서 삭제된 기사 제거: {len(deleted)}개")
+            # 서버 측 커서로 나눠 읽음 (전체 벡터를 한 번에 메모리에 올리지 않음)
+            added = 0
+            with conn.cursor(name='article_index_load') as cur:
+                cur.itersize = LOAD_BATCH_ROWS
+                cur.execute(f"""
+                    SELECT {', '.join(PAYLOAD_COLUMNS)}, embedding::text
+                    FROM {TABLE}
+                    WHERE embedding IS NOT NULL AND id > %s
+                    ORDER BY id
+                """, (max(0, self._loaded_id - CATCH_UP_OVERLAP_IDS),))
+                while True:
+                    rows = cur.fetchmany(LOAD_BATCH_ROWS)
+                    if not rows:
+                        break
+                    self._loaded_id = max(self._loaded_id, rows[-1][0])
+                    rows = [row for row in rows if row[0] not in self._rows]
+                    if not rows:
+                        continue
+                    payloads = [dict(zip(PAYLOAD_COLUMNS, row[:-1])) for row in rows]
+                    vectors = np.stack([_parse_vector(row[-1]) for row in rows])
+                    self.add_many(payloads, vectors)
+                    added += len(rows)
+            conn.commit()
+            return added
+        finally:
+            conn.close()
+
+    def maybe_refresh(self):
+        """주기가 지났으면 다른 프로세스 저장분을 백그라운드로 적재 (검색 지연에 영향 없음)"""
+        if not self.ready or time.monotonic() - self._refreshed_at < self.refresh_seconds:
+            return
+        if not self._refreshing.acquire(blocking=False):
+            return
+        self._refreshed_at = time.monotonic()
+
+        def refresh():
+            try:
+                added = self._catch_up(self._connect)
+                if added:
+                    logger.info(f"🔄 기사 벡터 인덱스 갱신: +{added}개")
+            except Exception as e:
+                logger.warning(f"⚠️ 기사 벡터 인덱스 갱신 실패: {e}")
+            finally:
+                self._refreshing.release()
+
+        threading.Thread(target=refresh, name='article-index-refresh', daemon=True).start()
+
+    def maybe_reload(self, model: str, dimension: int):
+        """
+        검색 모델이 인덱스 모델과 다르면 백그라운드로 다시 적재 (재임베딩 교체 후 재시작 없이)
+
+        적재 실패 시 ARTICLE_INDEX_REFRESH_SECONDS 이후 다시 시도
+        """
+        if not self.enabled or self._connect is None or model == self.model:
+            return
+        if time.monotonic() - self._reload_attempted_at < self.refresh_seconds:
+            return
+        if not self._refreshing.acquire(blocking=False):
+            return
+        self._reload_attempted_at = time.monotonic()
+
+        def reload():
+            try:
+                logger.info(f"🔄 검색 모델 변경 ({self.model} → {model}) - 기사 벡터 인덱스 다시 적재")
+                self.load(self._connect, model, dimension)
+            except Exception as e:
+                logger.warning(f"⚠️ 기사 벡터 인덱스 다시 적재 실패: {e}")
+            finally:
+                self._refreshing.release()
+
+        threading.Thread(target=reload, name='article-index-reload', daemon=True).start()
+
+    # ------------------------------------------------------------------ 추가 / 삭제
+
+    def add(self, payload: Dict[str, Any], embedding: Sequence[float], model: str = None):
+        """저장 직후 1건 추가 (같은 id면 교체, 인덱스와 다른 모델의 벡터는 제외)"""
+        if not self.ready or (model is not None and model != self.model):
+            return
+        try:
+            self.add_many([payload], np.asarray([embedding], dtype=np.float32))
+        except Exception as e:
+            logger.warning(f"⚠️ 기사 벡터 인덱스 추가 실패 (다음 갱신 때 적재): {e}")
+
+    def add_many(self, payloads: List[Dict[str, Any]], vectors: np.ndarray):
+        """
+        여러 건 추가 (같은 id면 교체)
+
+        메타데이터 / 벡터 배열을 채운 뒤 size와 id 매핑을 갱신하므로, 동시에 실행 중인 검색은
+        채워지지 않은 행을 보지 않음 (HNSW 삽입도 검색과 동시에 진행)
+        """
+        if not payloads:
+            return
+        if vectors.shape[1] != self.dimension:
+            logger.warning(f"⚠️ 기사 벡터 차원 불일치 ({vectors.shape[1]} != {self.dimension}), 인덱스 추가 생략")
+            return
+        vectors = _normalize(vectors)
+        with self._lock:
+            labels, new_rows, size = [], {}, self.size
+            for payload in payloads:
+                row = self._rows.get(payload['id'], new_rows.get(payload['id']))
+                if row is None:
+                    row = new_rows[payload['id']] = size
+                    size += 1
+                labels.append(row)
+            self._ensure_capacity(size)
+            self._payloads.extend([None] * (size - len(self._payloads)))
+
+            labels = np.asarray(labels, dtype=np.int64)
+            for row, payload in zip(labels, payloads):
+                self._ids[row] = payload['id']
+                self._published[row] = _timestamp(payload.get('published_date'))
+                self._source_codes[row] = self._code('source', payload.get('source'))
+                self._sentiment_codes[row] = self._code('sentiment', payload.get('sentiment'))
+                self._payloads[row] = payload
+            self._vectors[labels] = vectors
+            self._alive[labels] = True
+            self.size = size
+            if self._hnsw is not None:
+                self._hnsw.add_items(vectors, labels)
+            self._rows.update(new_rows)
+            self.max_id = max(self.max_id, max(int(payload['id']) for payload in payloads))
+
+    def remove(self, article_id: int):
+        with self._lock:
+            row = self._rows.pop(article_id, None)
+            if row is None:
+                return
+            self._alive[row] = False
+            self._payloads[row] = None
+            if self._hnsw is not None:
+                self._hnsw.mark_deleted(row)
+
+    def _code(self, field: str, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        codes = self._codes[field]
+        if value not in codes:
+            codes[value] = len(codes)
+        return codes[value]
+
+    def _ensure_capacity(self, needed: int):
+        capacity = len(self._ids)
+        if needed <= capacity:
+            return
+        capacity = max(needed, capacity * 2)
+
+        def grow(array, fill):
+            grown = np.full((capacity,) + array.shape[1:], fill, dtype=array.dtype)
+            grown[:len(array)] = array
+            return grown
+
+        # 새 배열을 만든 뒤 교체 (진행 중인 정확 검색은 이전 배열을 계속 사용)
+        self._vectors = grow(self._vectors, 0)
+        self._ids = grow(self._ids, 0)
+        self._alive = grow(self._alive, False)
+        self._published = grow(self._published, np.nan)
+        self._source_codes = grow(self._source_codes, -1)
+        self._sentiment_codes = grow(self._sentiment_codes, -1)
+        if self._hnsw is not None:
+            with self._gate.resize():
+                self._hnsw.resize_index(capacity)
+
+    @property
+    def count(self) -> int:
+        return len(self._rows)
+
+    # ------------------------------------------------------------------ 검색
+
+    def search(self,
+               query_embedding: Sequence[float],
+               limit: int = 10,
+               similarity_threshold: float = 0.3,
+               model: str = None,
+               published_after: datetime = None,
+               published_before: datetime = None,
+               sources: Sequence[str] = None,
+               sentiments: Sequence[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        유사 기사 검색 (DualDatabaseService.search_similar_by_embedding과 같은 결과 형식)
+
+        Returns:
+            유사도 순 결과 목록, 인덱스를 쓸 수 없으면 None (→ Postgres 검색)
+        """
+        if model is not None and model != self.model:
+            self.maybe_reload(model, len(query_embedding))
+        if not self.ready or (model is not None and model != self.model) or len(query_embedding) != self.dimension:
+            self._misses += 1
+            return None
+        self.maybe_refresh()
+
+        try:
+            rows, scores = self._search_rows(
+                np.asarray(query_embedding, dtype=np.float32), limit,
+                published_after, published_before, sources, sentiments
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ 기사 벡터 인덱스 검색 실패, Postgres 검색: {e}")
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        results = []
+        for row, score in zip(rows, scores):
+            payload = self._payloads[row]
+            if payload is None or score <= similarity_threshold:
+                continue
+            results.append({**payload, 'similarity': float(score)})
+        return results
+
+    def _search_rows(self, query: np.ndarray, limit: int, published_after, published_before, sources, sentiments):
+        """(행 번호, 코사인 유사도) 유사도 순"""
+        query = _normalize(query)
+        size = self.size
+        mask = self._filter_mask(size, published_after, published_before, sources, sentiments)
+        if mask is None and self._hnsw is not None:
+            return self._hnsw_search(query, limit)
+
+        if mask is None:
+            mask = self._alive[:size]
+        if self._hnsw is not None and mask.sum() > self.exact_max_rows:
+            # 필터 통과 행이 많으면 HNSW 후보를 넉넉히 뽑아 거름 (부족하면 정확 검색)
+            rows, scores = self._hnsw_search(query, limit * FILTER_OVERSAMPLE)
+            keep = rows < size
+            rows, scores = rows[keep], scores[keep]
+            keep = mask[rows]
+            if keep.sum() >= limit:
+                return rows[keep][:limit], scores[keep][:limit]
+        return self._exact_search(query, mask, limit)
+
+    def _hnsw_search(self, query: np.ndarray, k: int):
+        k = min(k, self.count)
+        if k <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        with self._gate.search():
+            labels, distances = self._hnsw.knn_query(query, k=k)
+        return labels[0].astype(np.int64), 1.0 - distances[0]
+
+    def _exact_search(self, query: np.ndarray, mask: np.ndarray, k: int):
+        """마스크 행 정확 검색 (통과 행이 많으면 전체 행렬 곱 1회, 적으면 해당 행만 복사해 계산)"""
+        vectors = self._vectors
+        candidates = np.flatnonzero(mask)
+        if not len(candidates):
+            return candidates, np.zeros(0, dtype=np.float32)
+        if len(candidates) * 4 > len(mask):
+            scores = (vectors[:len(mask)] @ query)[candidates]
+        else:
+            scores = vectors[candidates] @ query
+        k = min(k, len(candidates))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return candidates[top], scores[top]
+
+    def _filter_mask(self, size: int, published_after, published_before, sources, sentiments) -> Optional[np.ndarray]:
+        if published_after is None and published_before is None and not sources and not sentiments:
+            return None
+        mask = self._alive[:size].copy()
+        if published_after is not None:
+            mask &= self._published[:size] >= published_after.timestamp()
+        if published_before is not None:
+            mask &= self._published[:size] < published_before.timestamp()
+        for field, values, codes in (('source', sources, self._source_codes),
+                                     ('sentiment', sentiments, self._sentiment_codes)):
+            if values:
+                wanted = [self._codes[field][value] for value in values if value in self._codes[field]]
+                mask &= np.isin(codes[:size], wanted)
+        return mask
+
+    # ------------------------------------------------------------------ 저장
+
+    def save(self):
+        """원자적 저장 (임시 파일 기록 후 교체)"""
+        if not self.ready:
+            return
+        with self._lock:
+            size = self.size
+            alive = self._alive[:size]
+            payloads = [
+                {key: value.isoformat() if isinstance(value, datetime) else value for key, value in payload.items()}
+                for payload in self._payloads if payload is not None
+            ]
+            vectors = self._vectors[:size][alive]
+        path = self.path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.npz.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    np.savez(
+                        f,
+                        model=np.asarray(self.model),
+                        vectors=vectors,
+                        payloads=np.asarray(json.dumps(payloads, ensure_ascii=False, default=str))
+                    )
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+            logger.info(f"💾 기사 벡터 인덱스 저장: {path} ({len(payloads)}개)")
+        except Exception as e:
+            logger.warning(f"⚠️ 기사 벡터 인덱스 저장 실패 (다음 시작 시 DB에서 적재): {e}")
+
+    def _load_file(self) -> bool:
+        """디스크 인덱스 로드 (모델 / 차원이 다르거나 손상되면 False)"""
+        path = self.path
+        if not path.exists():
+            return False
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data['model']) != self.model or data['vectors'].shape[1] != self.dimension:
+                    return False
+                vectors = data['vectors']
+                payloads = json.loads(str(data['payloads']))
+        except Exception as e:
+            logger.warning(f"⚠️ 기사 벡터 인덱스 로드 실패 ({path.name}), DB에서 적재: {e}")
+            return False
+        for payload in payloads:
+            for column in DATETIME_COLUMNS:
+                if payload.get(column):
+                    payload[column] = datetime.fromisoformat(payload[column])
+        self._reset(max(1024, len(payloads)))
+        if payloads:
+            self.add_many(payloads, vectors)
+        self._loaded_id = self.max_id
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self._hits + self._misses
+        return {
+            'enabled': self.enabled,
+            'ready': self.ready,
+            'backend': self.backend,
+            'model': self.model,
+            'articles': self.count,
+            'max_id': self.max_id,
+            'hits': self._hits,
+            'misses': self._misses,
+            'hit_ratio': round(self._hits / total, 4) if total else 0.0,
+            'memory_bytes': int(self._vectors.nbytes)
+        }
+
+
+# 전역 인스턴스
+article_index = ArticleVectorIndex()
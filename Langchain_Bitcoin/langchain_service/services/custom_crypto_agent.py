@@ -3,19 +3,58 @@ Custom Crypto Agent - LangChain 완전 우회
 규칙 기반 처리로 도구 결과 강제 사용
 """
 
+import asyncio
 import logging
 import os
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, AsyncIterator, Callable, Tuple
 from datetime import datetime
 from langchain_openai import ChatOpenAI
 
 # 로컬 imports
 from langchain_service.tools.news_tools import CryptoNewsSearchTool, LatestNewsLookupTool, DatabaseStatsTool
 from langchain_service.tools.price_tools import CryptoPriceChecker, MultiCoinPriceChecker, CoinMarketCapTool
+from langchain_service.services.execution_service import execution_layer
+from langchain_service.services.request_coalescer import request_coalescer
+from langchain_service.services.response_cache import response_cache
+from langchain_service.services.session_store import create_session_store
+from langchain_service.services.embedding_service import embedding_service
+from langchain_service.services.embedding_providers import USE_INTENT
+from langchain_service.services.intent_examples import INTENT_EXAMPLES, LOCAL_TRAINING_EXAMPLES, merge_examples
+from langchain_service.services.intent_index import IntentIndex, load_or_build_index
+from langchain_service.services.local_intent_classifier import (
+    IntentTrafficLog, LocalIntentClassifier, train_local_classifier
+)
+from langchain_service.services.metrics import (
+    INTENT_CLASSIFICATION_PATH, ErrorResult, track_intent, track_classification, track_external, track_tool
+)
+from langchain_service.services.stream_events import (
+    intent_event, progress_event, token_event, message_event, done_event, error_event
+)
 
 logger = logging.getLogger(__name__)
 
+# 의미 분류 최소 유사도 (제공자마다 유사도 분포가 달라 로컬 모델 사용 시 조정)
+INTENT_SIMILARITY_THRESHOLD = float(os.getenv('INTENT_SIMILARITY_THRESHOLD', 0.5))
+
+INTENT_TOP_K = int(os.getenv('INTENT_TOP_K', 3))
+
+# 로컬 분류기 임계값은 학습 후 교차 검증 정밀도로 계산 (LOCAL_INTENT_PRECISION: 원격 임베딩 분류 생략,
+# LOCAL_INTENT_FALLBACK_PRECISION: 임베딩 분류를 쓸 수 없을 때 / 요청 처리 전 빠른 분류, 미만이면 키워드 방식)
+# LOCAL_INTENT_CONFIDENCE / LOCAL_INTENT_FALLBACK_CONFIDENCE를 지정하면 측정값 대신 고정 임계값 사용
+_configured_confidence = os.getenv('LOCAL_INTENT_CONFIDENCE')
+_configured_fallback_confidence = os.getenv('LOCAL_INTENT_FALLBACK_CONFIDENCE')
+LOCAL_INTENT_CONFIDENCE = float(_configured_confidence) if _configured_confidence else None
+LOCAL_INTENT_FALLBACK_CONFIDENCE = float(_configured_fallback_confidence) if _configured_fallback_confidence else None
+# 세션 상태를 바꾸는 Intent는 신뢰도가 낮은 로컬 결과로 선택하지 않음
+STATEFUL_INTENTS = {'language_change'}
+# 임베딩 분류 결과 중 로컬 분류기 학습용으로 기록할 최소 유사도
+INTENT_TRAFFIC_MIN_SIMILARITY = float(os.getenv('INTENT_TRAFFIC_MIN_SIMILARITY', 0.85))
+
+# 프로세스 공유 Intent 인덱스 (pre-fork 워밍업으로 채워지면 워커들이 copy-on-write로 공유)
+_shared_intent_index: Optional[IntentIndex] = None
+
+
 class CustomCryptoAgent:
     """완전 커스텀 암호화폐 AI 에이전트 - LangChain 우회"""
 
@@ -32,81 +71,33 @@ class CustomCryptoAgent:
         self.multi_price_checker = None
         self.market_cap_tool = None
         
-        # 세션별 메모리 (간단한 대화 기록)
-        self.session_histories = {}
-        
-        # 세션별 언어 설정 (기본값: 한글)
-        self.session_languages = {}
+        # 세션별 상태 (언어 설정, 활동 기록) - 멀티 워커에서는 공유 백엔드 사용
+        self.session_store = create_session_store()
         
         # Intent 분류를 위한 예시 문장들 (Sentence Embedding용)
-        self.intent_examples = {
-            'news_sentiment': [
-                '비트코인 최신뉴스 알려줘',
-                '암호화폐 관련 소식이 궁금해',
-                '비트코인 뉴스 요약해줘',
-                '최근 비트코인 기사 보여줘',
-                '비트코인 트럼프 관련 뉴스',
-                '코인 시장 분석 기사',
-                'Bitcoin latest news please',
-                'crypto news headlines today'
-            ],
-            'price_lookup': [
-                '비트코인 지금 얼마야?',
-                'BTC 현재 가격이 궁금해',
-                '비트코인 시세 알려줘',
-                '암호화폐 가격 확인하고 싶어',
-                '비트코인 값 얼마인지 알려줘',
-                '코인 현재 시세 보여줘',
-                'What is Bitcoin price now?',
-                'How much is BTC today?'
-            ],
-            'historical_data': [
-                '어제 비트코인 종가가 어땠어?',
-                '과거 비트코인 데이터 보고 싶어',
-                '지난주 암호화폐 시세는?',
-                '이전 가격 정보 알려줘',
-                '작년 비트코인 최고가는?',
-                '과거 통계 데이터 확인하고 싶어',
-                'Yesterday Bitcoin closing price',
-                'Historical crypto data'
-            ],  
-            'technical_analysis': [
-                '20일 이평선과 현재 가격 차이 보여줘',
-                '비트코인 차트 분석해줘',
-                '기술적 지표 확인하고 싶어',
-                'RSI 지수는 어떻게 돼?',
-                'MACD 패턴 분석 부탁해',
-                '추세선 분석 결과는?',
-                'Bitcoin technical analysis',
-                'Chart pattern analysis'
-            ],
-            'casual_chat': [
-                '안녕하세요',
-                '고마워요',
-                '도움이 되었어요',
-                '안녕히 가세요',
-                '반갑습니다',
-                '오늘 날씨 어때요?',
-                'Hello there',
-                'Thank you so much',
-                'Good morning',
-                'How are you?'
-            ],
-            'language_change': [
-                '아니 한글말고 영어로 대답해줘',
-                '영어로 답변해줘',
-                '영어로 말해줘',
-                'Please answer in English',
-                'Switch to English',
-                'Respond in English'
-            ]
-        }
+        self.intent_examples = INTENT_EXAMPLES
         
-        # 예시 문장들의 임베딩 저장소 (초기화 후 설정)
-        self.intent_embeddings = {}
-
-    async def initialize(self):
-        """에이전트 초기화"""
+        # 예시 문장 임베딩 인덱스 (초기화 후 설정, 그 전에는 키워드 분류)
+        self.intent_index: Optional[IntentIndex] = None
+        
+        # 로컬 n-gram 분류기 (예시 문장 + 트래픽 기록으로 학습, 신뢰도가 높으면 원격 호출 생략)
+        self.local_classifier: Optional[LocalIntentClassifier] = None
+        self.local_confidence = 1.0
+        self.local_fallback_confidence = 1.0
+        self.intent_traffic_log = IntentTrafficLog()
+        
+        # 일괄 처리 요청들이 공유하는 동시 처리 한도 (이벤트 루프에서 처음 사용할 때 생성)
+        self.batch_concurrency = int(os.getenv('CHAT_BATCH_CONCURRENCY', 8))
+        self._batch_semaphore: Optional[asyncio.Semaphore] = None
+
+    async def initialize(self, load_intent_embeddings: bool = True):
+        """
+        에이전트 초기화
+
+        Args:
+            load_intent_embeddings: False면 Intent 임베딩 로드를 건너뜀 (단계적 시작에서 별도 구성요소로 로드,
+                                    로드 전까지는 키워드 기반 분류로 응답)
+        """
         try:
             logger.info("🔥 Custom Crypto Agent 초기화 중...")
 
@@ -116,8 +107,12 @@ class CustomCryptoAgent:
             # 도구들 초기화
             await self._initialize_tools()
 
+            # 로컬 Intent 분류기 학습 (임베딩 인덱스보다 먼저 - 로드 전에도 네트워크 없이 분류)
+            await self._initialize_local_classifier()
+
             # Intent 예시 문장들의 임베딩 초기화
-            await self._initialize_intent_embeddings()
+            if load_intent_embeddings:
+                await self._initialize_intent_embeddings()
 
             logger.info("✅ Custom Crypto Agent 초기화 완료")
 
@@ -164,119 +159,214 @@ class CustomCryptoAgent:
             logger.error(f"❌ 도구 초기화 실패: {e}")
             raise
 
+    async def _initialize_local_classifier(self):
+        """로컬 Intent 분류기 학습 (실패해도 임베딩 / 키워드 분류로 동작)"""
+        try:
+            classifier = await execution_layer.run_blocking(
+                'intent_classification', train_local_classifier,
+                merge_examples(self.intent_examples, LOCAL_TRAINING_EXAMPLES), self.intent_traffic_log
+            )
+            self.local_confidence, self.local_fallback_confidence = classifier.thresholds(
+                LOCAL_INTENT_CONFIDENCE, LOCAL_INTENT_FALLBACK_CONFIDENCE
+            )
+            self.local_classifier = classifier
+            logger.info(
+                f"🎯 로컬 Intent 임계값: 원격 분류 생략 {self.local_confidence:.3f}, "
+                f"폴백 {self.local_fallback_confidence:.3f}"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ 로컬 Intent 분류기 학습 실패 (임베딩 분류만 사용): {e}")
+
     async def _initialize_intent_embeddings(self):
-        """Intent 예시 문장들의 임베딩 초기화"""
+        """Intent 예시 문장 임베딩 인덱스 초기화 (디스크에 저장된 인덱스가 있으면 임베딩 호출 없음)"""
         try:
-            logger.info("🧠 Intent 임베딩 초기화 중...")
-            
-            for intent, examples in self.intent_examples.items():
-                embeddings = []
-                for example in examples:
-                    try:
-                        embedding = await self._get_sentence_embedding(example)
-                        if embedding:
-                            embeddings.append(embedding)
-                    except Exception as e:
-                        logger.warning(f"예시 문장 임베딩 실패: {example[:30]}... - {e}")
-                        continue
-                
-                self.intent_embeddings[intent] = embeddings
-                logger.debug(f"'{intent}' Intent: {len(embeddings)}개 임베딩 생성")
+            # pre-fork 워밍업에서 이미 로드된 경우 공유 인덱스 사용
+            model = embedding_service.model_for(USE_INTENT)
+            if _shared_intent_index is not None and _shared_intent_index.model == model:
+                self.intent_index = _shared_intent_index
+                logger.info(f"✅ 사전 로드된 Intent 인덱스 사용: 총 {self.intent_index.size}개")
+                return
+            
+            logger.info("🧠 Intent 인덱스 초기화 중...")
+            
+            # 디스크 인덱스 로드, 없으면 전체 예시 문장을 한 번의 배치 요청으로 임베딩하여 생성
+            index, source = await execution_layer.run_blocking(
+                'intent_classification', load_or_build_index,
+                model, self.intent_examples, self._get_sentence_embeddings
+            )
+            # 완성된 뒤 한 번에 교체 (초기화 도중에는 None → 키워드 분류)
+            self.intent_index = index
             
-            total_embeddings = sum(len(embs) for embs in self.intent_embeddings.values())
-            logger.info(f"✅ Intent 임베딩 초기화 완료: 총 {total_embeddings}개")
+            logger.info(f"✅ Intent 인덱스 초기화 완료 ({source}): 총 {index.size}개")
             
         except Exception as e:
             logger.error(f"❌ Intent 임베딩 초기화 실패: {e}")
             raise
 
-    async def _get_sentence_embedding(self, text: str):
-        """text-embedding-ada-002로 문장 임베딩 생성"""
+    @staticmethod
+    def _get_sentence_embedding(text: str):
+        """Intent 분류용 문장 임베딩 생성 (블로킹 호출 - 실행 계층에서 호출, 공용 임베딩 캐시 사용)
+        제공자는 EMBEDDING_PROVIDER_INTENT (기본값: text-embedding-ada-002, local이면 네트워크 왕복 없음)"""
         try:
-            from openai import OpenAI
-            import os
-            
-            client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-            response = client.embeddings.create(
-                model="text-embedding-ada-002",
-                input=text
-            )
-            return response.data[0].embedding
+            return embedding_service.embed(text, use=USE_INTENT)
         except Exception as e:
             logger.error(f"임베딩 생성 실패 [{text[:30]}...]: {e}")
             return None
 
-    def _cosine_similarity(self, vec1, vec2):
-        """코사인 유사도 계산"""
-        try:
-            import numpy as np
-            vec1 = np.array(vec1)
-            vec2 = np.array(vec2)
-            return np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
-        except Exception as e:
-            logger.error(f"유사도 계산 실패: {e}")
-            return 0.0
+    @staticmethod
+    def _get_sentence_embeddings(texts: List[str]) -> List[List[float]]:
+        """여러 문장을 한 번의 요청으로 임베딩 (블로킹 호출, 캐시에 없는 문장만 요청, 실패 시 예외 전파)"""
+        return embedding_service.embed_many(texts, use=USE_INTENT)
 
     async def classify_intent_semantic(self, user_input: str) -> Dict[str, Any]:
-        """Sentence Embedding 기반 Intent 분류"""
+        """Intent 분류 - 로컬 분류기 신뢰도가 충분하면 바로 사용, 아니면 Sentence Embedding 기반"""
+        local_result = None
         try:
             logger.debug(f"🧠 의미 기반 Intent 분류 시작: '{user_input[:50]}...'")
             
+            local_result = self._classify_local(user_input)
+            if local_result and local_result['confidence'] >= self.local_confidence:
+                INTENT_CLASSIFICATION_PATH.inc(path='local')
+                return local_result
+            
+            # Intent 인덱스 로드 전 (단계적 시작 중): 임베딩 호출 없이 로컬 / 키워드 방식 사용
+            if self.intent_index is None:
+                return self._low_confidence_fallback(user_input, local_result)
+            
             # 사용자 입력의 임베딩 생성
-            user_embedding = await self._get_sentence_embedding(user_input)
+            user_embedding = await execution_layer.run_blocking(
+                'intent_classification', self._get_sentence_embedding, user_input
+            )
             if not user_embedding:
-                logger.warning("사용자 입력 임베딩 생성 실패, 키워드 방식으로 폴백")
-                return self.classify_intent_fallback(user_input)
+                logger.warning("사용자 입력 임베딩 생성 실패, 로컬 / 키워드 방식으로 폴백")
+                return self._low_confidence_fallback(user_input, local_result)
             
-            # 각 Intent별 최대 유사도 계산
-            intent_similarities = {}
+            return self._classify_with_embedding(user_input, user_embedding, local_result)
             
-            for intent, example_embeddings in self.intent_embeddings.items():
-                max_similarity = 0.0
-                best_example_idx = -1
-                
-                for idx, example_embedding in enumerate(example_embeddings):
-                    if example_embedding:
-                        similarity = self._cosine_similarity(user_embedding, example_embedding)
-                        if similarity > max_similarity:
-                            max_similarity = similarity
-                            best_example_idx = idx
-                
-                intent_similarities[intent] = {
-                    'similarity': max_similarity,
-                    'best_example_idx': best_example_idx
-                }
-            
-            # 가장 유사한 Intent 선택
-            best_intent = max(intent_similarities.keys(), 
-                            key=lambda x: intent_similarities[x]['similarity'])
-            best_similarity = intent_similarities[best_intent]['similarity']
-            
-            # 신뢰도가 너무 낮으면 키워드 방식으로 폴백
-            if best_similarity < 0.5:
-                logger.info(f"의미 분류 신뢰도 낮음 ({best_similarity:.3f}), 키워드 방식으로 폴백")
-                return self.classify_intent_fallback(user_input)
-            
-            # 최고 유사도 예시 문장 로깅
-            best_example_idx = intent_similarities[best_intent]['best_example_idx']
-            if best_example_idx >= 0:
-                best_example = self.intent_examples[best_intent][best_example_idx]
-                logger.debug(f"가장 유사한 예시: '{best_example}' (유사도: {best_similarity:.3f})")
-            
-            logger.info(f"🎯 의미 기반 Intent 분류: {best_intent} (신뢰도: {best_similarity:.3f})")
-            
-            return {
-                'intent': best_intent,
-                'score': best_similarity,
-                'confidence': best_similarity,
-                'method': 'semantic_embedding',
-                'similarities': {k: v['similarity'] for k, v in intent_similarities.items()},
-                'matched_patterns': [f"semantic_match_{best_similarity:.3f}"]
+        except Exception as e:
+            logger.error(f"의미 기반 분류 실패: {e}")
+            return self._low_confidence_fallback(user_input, local_result)
+
+    async def classify_intents_batch(self, user_inputs: List[str]) -> List[Dict[str, Any]]:
+        """여러 문장 Intent 분류 (로컬 신뢰도가 낮은 문장만 한 번의 배치 임베딩 호출, 실패 시 로컬 / 키워드 방식)"""
+        if not user_inputs:
+            return []
+        
+        local_results = self._classify_local_many(user_inputs)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(user_inputs)
+        pending = []
+        for index, local_result in enumerate(local_results):
+            if local_result and local_result['confidence'] >= self.local_confidence:
+                INTENT_CLASSIFICATION_PATH.inc(path='local')
+                results[index] = local_result
+            else:
+                pending.append(index)
+        if not pending:
+            return results
+        if self.intent_index is None:
+            for index in pending:
+                results[index] = self._low_confidence_fallback(user_inputs[index], local_results[index])
+            return results
+        
+        try:
+            with track_classification('semantic_batch'):
+                user_embeddings = await execution_layer.run_blocking(
+                    'intent_classification', self._get_sentence_embeddings, [user_inputs[index] for index in pending]
+                )
+                # 남은 입력 전체를 행렬 곱 1회로 분류
+                matches = self.intent_index.classify_many(user_embeddings, INTENT_TOP_K)
+                for index, match in zip(pending, matches):
+                    results[index] = self._semantic_result(user_inputs[index], match, local_results[index])
+        except Exception as e:
+            logger.warning(f"배치 Intent 분류 실패, 로컬 / 키워드 방식으로 폴백: {e}")
+            for index in pending:
+                results[index] = self._low_confidence_fallback(user_inputs[index], local_results[index])
+        return results
+
+    def _classify_local(self, user_input: str) -> Optional[Dict[str, Any]]:
+        """로컬 n-gram 분류 (분류기 학습 전이면 None)"""
+        return self._classify_local_many([user_input])[0]
+
+    def _classify_local_many(self, user_inputs: List[str]) -> List[Optional[Dict[str, Any]]]:
+        if self.local_classifier is None:
+            return [None] * len(user_inputs)
+        try:
+            predictions = self.local_classifier.predict_many(user_inputs)
+        except Exception as e:
+            logger.warning(f"로컬 Intent 분류 실패: {e}")
+            return [None] * len(user_inputs)
+        return [
+            {
+                'intent': prediction['intent'],
+                'score': prediction['confidence'],
+                'confidence': prediction['confidence'],
+                'method': 'local_ngram',
+                'probabilities': prediction['probabilities'],
+                'matched_patterns': [f"local_ngram_{prediction['confidence']:.3f}"]
             }
-            
+            for prediction in predictions
+        ]
+
+    def _usable_local_result(self, local_result: Optional[Dict[str, Any]]) -> bool:
+        """임베딩 분류 대신 쓸 수 있는 로컬 결과인지 (폴백 임계값, 세션 상태 변경 Intent는 원격 생략 임계값)"""
+        if not local_result or local_result['confidence'] < self.local_fallback_confidence:
+            return False
+        return local_result['intent'] not in STATEFUL_INTENTS or local_result['confidence'] >= self.local_confidence
+
+    def _low_confidence_fallback(self, user_input: str, local_result: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """임베딩 분류를 쓸 수 없거나 신뢰도가 낮을 때: 신뢰할 만한 로컬 분류 결과, 아니면 키워드 방식"""
+        if self._usable_local_result(local_result):
+            INTENT_CLASSIFICATION_PATH.inc(path='local_fallback')
+            return local_result
+        INTENT_CLASSIFICATION_PATH.inc(path='keyword')
+        return self.classify_intent_fallback(user_input)
+
+    def classify_intent_quick(self, user_input: str) -> Dict[str, Any]:
+        """네트워크 호출 없는 분류 (허용 제어 우선순위 등 요청 처리 전 판단용)"""
+        local_result = self._classify_local(user_input)
+        if self._usable_local_result(local_result):
+            return local_result
+        return self.classify_intent_fallback(user_input)
+
+    def _classify_with_embedding(self, user_input: str, user_embedding: List[float],
+                                 local_result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """입력 임베딩과 Intent 예시 인덱스의 유사도로 분류 (행렬-벡터 곱 1회)"""
+        try:
+            return self._semantic_result(
+                user_input, self.intent_index.classify(user_embedding, INTENT_TOP_K), local_result
+            )
         except Exception as e:
             logger.error(f"의미 기반 분류 실패: {e}")
-            return self.classify_intent_fallback(user_input)
+            return self._low_confidence_fallback(user_input, local_result)
+
+    def _semantic_result(self, user_input: str, match: Dict[str, Any],
+                         local_result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """인덱스 분류 결과를 Intent 결과 형식으로 변환 (신뢰도가 낮으면 로컬 / 키워드 방식)"""
+        best_intent = match['intent']
+        best_similarity = match['similarity']
+        
+        # 신뢰도가 너무 낮으면 로컬 / 키워드 방식으로 폴백
+        if best_similarity < INTENT_SIMILARITY_THRESHOLD:
+            logger.info(f"의미 분류 신뢰도 낮음 ({best_similarity:.3f}), 로컬 / 키워드 방식으로 폴백")
+            return self._low_confidence_fallback(user_input, local_result)
+        
+        INTENT_CLASSIFICATION_PATH.inc(path='embedding')
+        # 확실한 임베딩 분류 결과는 다음 학습 데이터로 기록 (로컬 분류기가 점차 더 많은 질문을 처리)
+        if best_similarity >= INTENT_TRAFFIC_MIN_SIMILARITY:
+            self.intent_traffic_log.append(user_input, best_intent, 'embedding', best_similarity)
+        
+        logger.debug(f"가장 유사한 예시: '{match['best_example']}' (유사도: {best_similarity:.3f})")
+        logger.info(f"🎯 의미 기반 Intent 분류: {best_intent} (신뢰도: {best_similarity:.3f})")
+        
+        return {
+            'intent': best_intent,
+            'score': best_similarity,
+            'confidence': best_similarity,
+            'method': 'semantic_embedding',
+            'similarities': match['similarities'],
+            'top_examples': match['top_examples'],
+            'matched_patterns': [f"semantic_match_{best_similarity:.3f}"]
+        }
 
     def classify_intent_fallback(self, user_input: str) -> Dict[str, Any]:
         """키워드 기반 폴백 분류 (간단한 규칙)"""
@@ -309,22 +399,139 @@ class CustomCryptoAgent:
 
     async def classify_intent(self, user_input: str) -> Dict[str, Any]:
         """Intent 분류 - Sentence Embedding 기반 (기본)"""
-        return await self.classify_intent_semantic(user_input)
+        with track_classification('semantic'):
+            return await self.classify_intent_semantic(user_input)
+
+    async def process_message(self, message: str, session_id: str, use_rag: bool = True,
+                              intent_result: Optional[Dict[str, Any]] = None) -> Dict:
+        """메시지 처리 메인 메서드 - 동시에 들어온 동일 질문(같은 언어)은 하나의 처리 결과를 공유"""
+        session_language = (await self._session_call(self._touch_sessions, [session_id]))[0]
+        key = request_coalescer.make_key(message, session_language)
+        
+        result, coalesced = await request_coalescer.run(
+            key, lambda: self._process_message_uncoalesced(message, session_id, use_rag, intent_result)
+        )
+        if not coalesced:
+            return result
+        return await self._result_for_session(result, message, session_id)
+
+    async def _result_for_session(self, result: Dict, message: str, session_id: str) -> Dict:
+        """공유받은 결과를 현재 세션 기준으로 복사 (세션별 부수효과 재적용)"""
+        result = dict(result)
+        result['session_id'] = session_id
+        if result.get('intent') == 'language_change':
+            await self._session_call(self._handle_language_change, message, session_id)
+        return result
+
+    async def _session_call(self, func: Callable, *args) -> Any:
+        """세션 저장소 호출 (Redis 사용 시 실행 계층에서 실행 - 이벤트 루프 블로킹 방지)"""
+        if self.session_store.backend == 'redis':
+            return await execution_layer.run_blocking('session', func, *args)
+        return func(*args)
+
+    def _touch_sessions(self, session_ids: List[str]) -> List[str]:
+        """세션 활동 기록 + 언어 조회 (블로킹 - 한 번의 실행 계층 호출로 묶음)"""
+        languages = []
+        for session_id in session_ids:
+            self.session_store.touch(session_id)
+            languages.append(self.session_store.get_language(session_id))
+        return languages
+
+    def _get_batch_semaphore(self) -> asyncio.Semaphore:
+        """일괄 처리 공유 동시 실행 한도"""
+        if self._batch_semaphore is None:
+            self._batch_semaphore = asyncio.Semaphore(self.batch_concurrency)
+        return self._batch_semaphore
+
+    async def process_batch(self, items: List[Dict[str, Any]]) -> List[Dict]:
+        """
+        여러 메시지 일괄 처리 (Spring 백엔드 다이제스트/알림용)
+
+        - 동일 질문(같은 언어)은 한 번만 처리하고 결과를 복사
+        - 고유 질문들의 Intent는 한 번의 배치 임베딩 호출로 분류
+        - 모든 일괄 요청이 공유하는 동시 실행 한도 안에서 동시 처리
+
+        Args:
+            items: {'message', 'session_id', 'use_rag'} 딕셔너리 목록
+
+        Returns:
+            입력 순서와 같은 결과 목록 (실패 항목은 'error' 포함)
+        """
+        # 1단계: 동일 질문 묶기 (단건 요청과 같은 병합 키 사용)
+        groups: Dict[Tuple[str, str], List[int]] = {}
+        languages = await self._session_call(self._touch_sessions, [item['session_id'] for item in items])
+        for index, (item, language) in enumerate(zip(items, languages)):
+            groups.setdefault(request_coalescer.make_key(item['message'], language), []).append(index)
+        
+        keys = list(groups)
+        leaders = [groups[key][0] for key in keys]
+        logger.info(f"📦 일괄 처리 시작: {len(items)}건 (고유 {len(leaders)}건)")
+        
+        # 2단계: 고유 질문 Intent 일괄 분류
+        intent_results = await self.classify_intents_batch([items[index]['message'] for index in leaders])
+        
+        # 3단계: 고유 질문 동시 처리 (동시에 들어온 단건 요청과도 병합)
+        semaphore = self._get_batch_semaphore()
+        
+        async def run_one(key: Tuple[str, str], index: int, intent_result: Dict[str, Any]) -> Dict:
+            item = items[index]
+            async with semaphore:
+                result, coalesced = await request_coalescer.run(
+                    key, lambda: self._process_message_uncoalesced(
+                        item['message'], item['session_id'], item.get('use_rag', True), intent_result
+                    )
+                )
+            if coalesced:
+                return await self._result_for_session(result, item['message'], item['session_id'])
+            return result
+        
+        outcomes = await asyncio.gather(
+            *(run_one(key, index, intent_result) for key, index, intent_result in zip(keys, leaders, intent_results)),
+            return_exceptions=True
+        )
+        
+        # 4단계: 입력 순서대로 결과 배치
+        results: List[Optional[Dict]] = [None] * len(items)
+        for key, outcome in zip(keys, outcomes):
+            for position, index in enumerate(groups[key]):
+                item = items[index]
+                if isinstance(outcome, Exception):
+                    logger.error(f"💥 일괄 처리 항목 실패 [{index}]: {outcome}")
+                    results[index] = {
+                        'message': "죄송합니다. 처리 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
+                        'session_id': item['session_id'],
+                        'data_sources': [],
+                        'error': str(outcome)
+                    }
+                elif position == 0:
+                    results[index] = outcome
+                else:
+                    results[index] = await self._result_for_session(outcome, item['message'], item['session_id'])
+        
+        logger.info(f"✅ 일괄 처리 완료: {len(items)}건")
+        return results
 
-    async def process_message(self, message: str, session_id: str, use_rag: bool = True) -> Dict:
-        """메시지 처리 메인 메서드 - 완전 커스텀 로직"""
+    async def _process_message_uncoalesced(self, message: str, session_id: str, use_rag: bool = True,
+                                           intent_result: Optional[Dict[str, Any]] = None) -> Dict:
+        """메시지 처리 - 완전 커스텀 로직 (intent_result가 주어지면 분류 단계 생략)"""
         try:
             logger.info(f"🔥 Custom Agent 메시지 처리 시작: {message[:50]}...")
 
-            # 1단계: Intent 분류
-            intent_result = await self.classify_intent(message)
+            # 1단계: Intent 분류 (일괄 처리에서 미리 분류된 경우 재사용)
+            if intent_result is None:
+                intent_result = await self.classify_intent(message)
             intent = intent_result['intent']
             confidence = intent_result['confidence']
 
             logger.info(f"📊 분류된 Intent: {intent} (신뢰도: {confidence:.2f})")
 
-            # 2단계: Intent별 직접 처리
-            response_text = await self._process_by_intent(intent, message, session_id)
+            # 2단계: Intent별 직접 처리 (응답 캐시 우선)
+            cache_key = await self._response_cache_key(intent, message, session_id)
+            response_text = await self._get_cached_response(cache_key)
+            cached = response_text is not None
+            if not cached:
+                response_text = await self._process_by_intent(intent, message, session_id)
+                await self._store_cached_response(cache_key, intent, response_text)
 
             # 3단계: 응답 구성
             result = {
@@ -333,7 +540,7 @@ class CustomCryptoAgent:
                 'data_sources': self._get_data_sources(intent),
                 'confidence_score': confidence,
                 'intent': intent,
-                'processing_method': 'custom_agent'
+                'processing_method': 'custom_agent_cached' if cached else 'custom_agent'
             }
 
             logger.info(f"✅ Custom Agent 처리 완료: {len(response_text)}자 응답")
@@ -351,26 +558,142 @@ class CustomCryptoAgent:
             }
             return error_response
 
+    async def process_message_stream(self, message: str, session_id: str, use_rag: bool = True) -> AsyncIterator[Dict]:
+        """메시지 처리 (스트리밍) - 도구 진행 이벤트와 LLM 토큰을 도착 즉시 전달"""
+        try:
+            logger.info(f"🔥 Custom Agent 스트리밍 처리 시작: {message[:50]}...")
+            await self._session_call(self.session_store.touch, session_id)
+
+            # 1단계: Intent 분류 (첫 이벤트는 분류 직후 전송)
+            intent_result = await self.classify_intent(message)
+            intent = intent_result['intent']
+            confidence = intent_result['confidence']
+            yield intent_event(intent, confidence, intent_result.get('method'))
+
+            # 2단계: Intent별 처리 (응답 캐시 우선)
+            cache_key = await self._response_cache_key(intent, message, session_id)
+            response_text = await self._get_cached_response(cache_key)
+            cached = response_text is not None
+            if cached:
+                yield message_event(response_text)
+            elif intent == 'news_sentiment' and not self._is_chart_request(message):
+                response_chunks = []
+                completed = True
+                async for event in self._stream_news_query(message, session_id):
+                    if event['event'] in ('token', 'message'):
+                        response_chunks.append(event['data']['text'])
+                    elif event['event'] == 'progress' and event['data']['status'] == 'failed':
+                        completed = False
+                    yield event
+                response_text = ''.join(response_chunks).strip()
+                # 중간에 끊긴 응답(일부 토큰 / 원본 뉴스 대체)은 캐시하지 않음
+                if completed:
+                    await self._store_cached_response(cache_key, intent, response_text)
+            else:
+                yield progress_event(intent, 'started')
+                response_text = await self._process_by_intent(intent, message, session_id)
+                await self._store_cached_response(cache_key, intent, response_text)
+                yield progress_event(intent, 'completed')
+                yield message_event(response_text)
+
+            # 3단계: 최종 메타데이터
+            yield done_event({
+                'message': response_text,
+                'session_id': session_id,
+                'data_sources': self._get_data_sources(intent),
+                'confidence_score': confidence,
+                'intent': intent,
+                'processing_method': 'custom_agent_cached' if cached else 'custom_agent_stream'
+            })
+            logger.info(f"✅ Custom Agent 스트리밍 처리 완료: {len(response_text)}자 응답")
+
+        except Exception as e:
+            logger.error(f"💥 Custom Agent 스트리밍 처리 중 오류: {e}")
+            yield error_event("죄송합니다. 처리 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.", str(e))
+
+    async def _stream_news_query(self, message: str, session_id: str) -> AsyncIterator[Dict]:
+        """뉴스 질문 스트리밍 처리 - 검색 진행 이벤트 후 LLM 토큰 전달"""
+        yield progress_event('news_search', 'started')
+        raw_news_data = await execution_layer.run_blocking('news_sentiment', self.news_search_tool._run, message)
+        yield progress_event('news_search', 'completed')
+
+        # LLM이 없으면 원본 반환
+        if not self.llm:
+            yield message_event(raw_news_data)
+            return
+
+        session_language = await self._session_call(self.session_store.get_language, session_id)
+        prompt = self._build_news_enhancement_prompt(raw_news_data, message, session_language)
+
+        yield progress_event('llm_generation', 'started')
+        streamed_any = False
+        try:
+            async for token in execution_layer.iterate_blocking('news_sentiment', self._stream_llm, prompt):
+                streamed_any = True
+                yield token_event(token)
+            yield progress_event('llm_generation', 'completed')
+        except Exception as e:
+            logger.error(f"❌ 뉴스 응답 스트리밍 실패: {e}")
+            yield progress_event('llm_generation', 'failed', error=str(e))
+            # 토큰이 하나도 전달되지 않았으면 원본 뉴스로 대체
+            if not streamed_any:
+                yield message_event(raw_news_data)
+
+    def _stream_llm(self, prompt: str):
+        """LLM 스트리밍 응답을 토큰 단위로 반환 (블로킹 제너레이터 - 실행 계층에서 소비)"""
+        for chunk in self.llm.stream(prompt):
+            if chunk.content:
+                yield chunk.content
+
+    async def _response_cache_key(self, intent: str, message: str, session_id: str) -> Optional[str]:
+        """응답 캐시 키 (캐시 대상 Intent가 아니면 None)"""
+        if not response_cache.is_cacheable(intent):
+            return None
+        session_language = await self._session_call(self.session_store.get_language, session_id)
+        return response_cache.make_key(intent, message, self._extract_coin_name(message), session_language)
+
+    async def _get_cached_response(self, cache_key: Optional[str]) -> Optional[str]:
+        """응답 캐시 조회 (Redis 사용 시 실행 계층에서 실행)"""
+        if cache_key is None:
+            return None
+        if response_cache.use_redis:
+            return await execution_layer.run_blocking('cache', response_cache.get, cache_key)
+        return response_cache.get(cache_key)
+
+    async def _store_cached_response(self, cache_key: Optional[str], intent: str, response_text: str):
+        """응답 캐시 저장 (오류 응답 제외)"""
+        if cache_key is None or not response_cache.is_cacheable(intent, response_text):
+            return
+        if response_cache.use_redis:
+            await execution_layer.run_blocking('cache', response_cache.set, cache_key, intent, response_text)
+        else:
+            response_cache.set(cache_key, intent, response_text)
+
     async def _process_by_intent(self, intent: str, message: str, session_id: str) -> str:
-        """Intent별 직접 처리"""
+        """Intent별 직접 처리 (Intent별 처리 시간/오류 지표 기록)"""
+        with track_intent(intent) as tracker:
+            return tracker.record_result(await self._dispatch_by_intent(intent, message, session_id))
+
+    async def _dispatch_by_intent(self, intent: str, message: str, session_id: str) -> str:
+        """Intent별 핸들러 호출 (블로킹 도구 호출은 실행 계층의 스레드 풀에서 실행)"""
         
         if intent == 'news_sentiment':
-            return self._handle_news_query(message, session_id)
+            return await execution_layer.run_blocking(intent, self._handle_news_query, message, session_id)
         
         elif intent == 'price_lookup':
-            return self._handle_price_query(message)
+            return await execution_layer.run_blocking(intent, self._handle_price_query, message)
         
         elif intent == 'historical_data':
-            return self._handle_historical_query(message)
+            return await execution_layer.run_blocking(intent, self._handle_historical_query, message)
         
         elif intent == 'technical_analysis':
-            return self._handle_chart_query(message)
+            return await execution_layer.run_blocking(intent, self._handle_chart_query, message)
         
         elif intent == 'casual_chat':
             return self._handle_casual_chat(message, session_id)
         
         elif intent == 'language_change':
-            return self._handle_language_change(message, session_id)
+            return await self._session_call(self._handle_language_change, message, session_id)
         
         else:
             return "죄송합니다. 질문을 이해하지 못했습니다. 다시 한번 말씀해주세요."
@@ -381,14 +704,14 @@ class CustomCryptoAgent:
             logger.info(f"📰 뉴스 쿼리 처리: {message}")
             
             # 차트 관련 키워드가 있으면 차트 생성
-            if any(keyword in message.lower() for keyword in ['차트', 'chart', '그래프', '이동평균', 'rsi', 'macd']):
+            if self._is_chart_request(message):
                 return self._handle_chart_query(message)
             
             # 뉴스만 검색
             raw_news_data = self.news_search_tool._run(message)
             
             # 세션 언어 확인
-            session_language = self.session_languages.get(session_id, 'ko')  # 기본값: 한글
+            session_language = self.session_store.get_language(session_id)  # 기본값: 한글
             
             # ChatGPT 스타일로 뉴스 재구성
             enhanced_response = self._enhance_news_response(raw_news_data, message, session_language)
@@ -397,14 +720,18 @@ class CustomCryptoAgent:
             
         except Exception as e:
             logger.error(f"❌ 뉴스 처리 실패: {e}")
-            return f"죄송합니다. 뉴스 검색 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"죄송합니다. 뉴스 검색 중 오류가 발생했습니다: {str(e)}")
+    
+    def _is_chart_request(self, message: str) -> bool:
+        """뉴스 질문 중 차트를 요청하는지 확인"""
+        return any(keyword in message.lower() for keyword in ['차트', 'chart', '그래프', '이동평균', 'rsi', 'macd'])
     
     def _handle_chart_query(self, message: str) -> str:
         """차트 관련 질문 처리 - Upbit API + Plotly 전문 차트"""
         try:
             logger.info(f"📊 차트 쿼리 처리: {message}")
             
-            from langchain_service.services.upbit_chart_generator import UpbitChartGenerator
+            from langchain_service.services.upbit_chart_generator import UpbitChartGenerator, render_chart
             from datetime import datetime
             
             chart_gen = UpbitChartGenerator()
@@ -423,14 +750,13 @@ class CustomCryptoAgent:
                 days = 7
             
             # 차트 타입 결정
-            if any(keyword in message.lower() for keyword in ['종합', '전체', 'rsi', 'macd', '거래량', '지표']):
-                # 종합 차트 (모든 지표 포함)
-                chart_base64 = chart_gen.generate_comprehensive_chart("KRW-BTC", days)
-                chart_type = "종합 기술 분석"
-            else:
-                # 간단 차트 (가격 + 이동평균)
-                chart_base64 = chart_gen.generate_simple_price_chart("KRW-BTC", days)
-                chart_type = "가격 & 이동평균"
+            comprehensive = any(keyword in message.lower() for keyword in ['종합', '전체', 'rsi', 'macd', '거래량', '지표'])
+            # 종합 차트 (모든 지표 포함) / 간단 차트 (가격 + 이동평균)
+            chart_type = "종합 기술 분석" if comprehensive else "가격 & 이동평균"
+            
+            # plotly/kaleido 렌더링은 CPU 바운드이므로 프로세스 풀에서 실행
+            with track_tool('upbit_chart_renderer'):
+                chart_base64 = execution_layer.run_cpu_sync(render_chart, "KRW-BTC", days, comprehensive)
             
             if chart_base64.startswith("data:image"):
                 # 시장 분석 데이터 추가
@@ -512,11 +838,11 @@ class CustomCryptoAgent:
                 
                 return chart_response
             else:
-                return f"차트 생성 실패: {chart_base64}"
+                return ErrorResult(f"차트 생성 실패: {chart_base64}")
                 
         except Exception as e:
             logger.error(f"❌ 차트 처리 실패: {e}")
-            return f"차트 생성 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"차트 생성 중 오류가 발생했습니다: {str(e)}")
 
     def _handle_price_query(self, message: str) -> str:
         """가격 관련 질문 처리"""
@@ -535,7 +861,7 @@ class CustomCryptoAgent:
             
         except Exception as e:
             logger.error(f"❌ 가격 처리 실패: {e}")
-            return f"죄송합니다. 가격 조회 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"죄송합니다. 가격 조회 중 오류가 발생했습니다: {str(e)}")
 
     def _handle_historical_query(self, message: str) -> str:
         """과거 데이터 관련 질문 처리"""
@@ -549,7 +875,7 @@ class CustomCryptoAgent:
             
         except Exception as e:
             logger.error(f"❌ 과거 데이터 처리 실패: {e}")
-            return f"죄송합니다. 과거 데이터 조회 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"죄송합니다. 과거 데이터 조회 중 오류가 발생했습니다: {str(e)}")
 
     def _handle_technical_query(self, message: str) -> str:
         """기술적 분석 관련 질문 처리"""
@@ -563,7 +889,7 @@ class CustomCryptoAgent:
             
         except Exception as e:
             logger.error(f"❌ 기술 분석 처리 실패: {e}")
-            return f"죄송합니다. 기술 분석 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"죄송합니다. 기술 분석 중 오류가 발생했습니다: {str(e)}")
 
     def _handle_casual_chat(self, message: str, session_id: str) -> str:
         """일반 대화 처리"""
@@ -602,7 +928,7 @@ class CustomCryptoAgent:
             logger.info(f"🌐 언어 변경 요청: {message} (세션: {session_id})")
             
             # 세션의 언어를 영어로 변경
-            self.session_languages[session_id] = 'en'
+            self.session_store.set_language(session_id, 'en')
             
             return "Sure! I'll respond in English from now on. Feel free to ask me about cryptocurrency news, prices, or technical analysis! 🚀"
             
@@ -702,25 +1028,17 @@ class CustomCryptoAgent:
             logger.error(f"통합 분석 생성 실패: {e}")
             return news_data  # 실패 시 기본 뉴스 데이터 반환
 
-    def _enhance_news_response(self, raw_news_data: str, user_query: str, language: str = 'ko') -> str:
-        """뉴스 데이터를 ChatGPT 스타일로 고급화"""
-        try:
-            logger.info(f"🎨 뉴스 응답 고급화 시작 (언어: {language})")
-            
-            # LLM이 없으면 원본 반환
-            if not self.llm:
-                logger.warning("LLM이 초기화되지 않아 원본 뉴스 데이터 반환")
-                return raw_news_data
-            
-            # 현재 날짜 가져오기
-            if language == 'en':
-                current_date = datetime.now().strftime("%B %d, %Y")
-            else:
-                current_date = datetime.now().strftime("%Y년 %m월 %d일")
-            
-            # 언어별 ChatGPT 스타일 변환 프롬프트
-            if language == 'en':
-                enhancement_prompt = f"""Please reorganize the following Bitcoin news data in a professional ChatGPT style.
+    def _build_news_enhancement_prompt(self, raw_news_data: str, user_query: str, language: str = 'ko') -> str:
+        """뉴스 재구성용 LLM 프롬프트 생성 (일반/스트리밍 응답 공용)"""
+        # 현재 날짜 가져오기
+        if language == 'en':
+            current_date = datetime.now().strftime("%B %d, %Y")
+        else:
+            current_date = datetime.now().strftime("%Y년 %m월 %d일")
+        
+        # 언어별 ChatGPT 스타일 변환 프롬프트
+        if language == 'en':
+            enhancement_prompt = f"""Please reorganize the following Bitcoin news data in a professional ChatGPT style.
 
 User Question: "{user_query}"
 Raw News Data:
@@ -746,8 +1064,8 @@ Raw News Data:
    - Keep original news links/sources but integrate naturally
 
 Please respond in English only."""
-            else:
-                enhancement_prompt = f"""다음 비트코인 뉴스 데이터를 ChatGPT 스타일로 전문적이고 예쁘게 재구성해주세요.
+        else:
+            enhancement_prompt = f"""다음 비트코인 뉴스 데이터를 ChatGPT 스타일로 전문적이고 예쁘게 재구성해주세요.
 
 사용자 질문: "{user_query}"
 원본 뉴스 데이터:
@@ -779,8 +1097,23 @@ Please respond in English only."""
 
 한국어로만 답변해주세요."""
 
+        return enhancement_prompt
+
+    def _enhance_news_response(self, raw_news_data: str, user_query: str, language: str = 'ko') -> str:
+        """뉴스 데이터를 ChatGPT 스타일로 고급화"""
+        try:
+            logger.info(f"🎨 뉴스 응답 고급화 시작 (언어: {language})")
+            
+            # LLM이 없으면 원본 반환
+            if not self.llm:
+                logger.warning("LLM이 초기화되지 않아 원본 뉴스 데이터 반환")
+                return raw_news_data
+            
+            enhancement_prompt = self._build_news_enhancement_prompt(raw_news_data, user_query, language)
+            
             # LLM으로 뉴스 재구성
-            enhanced_response = self.llm.predict(enhancement_prompt)
+            with track_external('openai', 'chat'):
+                enhanced_response = self.llm.predict(enhancement_prompt)
             
             logger.info(f"✅ 뉴스 응답 고급화 완료: {len(enhanced_response)}자")
             return enhanced_response.strip()
@@ -816,6 +1149,16 @@ Please respond in English only."""
             logger.error(f"❌ Custom Agent 상태 확인 실패: {e}")
             return False
 
+def precompute_intent_embeddings() -> int:
+    """Intent 인덱스를 미리 로드(없으면 생성)하여 프로세스 공유 (pre-fork 워밍업용, 블로킹)"""
+    global _shared_intent_index
+    _shared_intent_index, source = load_or_build_index(
+        embedding_service.model_for(USE_INTENT), INTENT_EXAMPLES, CustomCryptoAgent._get_sentence_embeddings
+    )
+    
+    logger.info(f"✅ Intent 인덱스 사전 로드 완료 ({source}): 총 {_shared_intent_index.size}개")
+    return _shared_intent_index.size
+
 # 기존 ChatbotAgent 클래스와 호환성을 위한 별칭
 ChatbotAgent = CustomCryptoAgent
 CryptoChatbotAgent = CustomCryptoAgent
\ No newline at end of file
@@ -9,12 +9,47 @@ from psycopg2.extras import RealDictCursor
 import logging
 import sys
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
 import json
 from datetime import datetime
 import numpy as np
 from openai import OpenAI
 
+# 지표 / 챗봇 응답 캐시 (API 서버에서는 langchain_service 패키지 경로로 로드되어 에이전트와 같은 인스턴스를 사용,
+# 단독 실행 파이프라인에서는 Redis 공유 세대 증가로 서버 캐시를 무효화)
+try:
+    from langchain_service.services.metrics import track_db
+    from langchain_service.services.embedding_service import embedding_service, content_key, DEFAULT_EMBEDDING_MODEL
+    from langchain_service.services.embedding_providers import USE_INGEST, USE_SEARCH
+    from langchain_service.services.vector_storage import storage_from_env
+    from langchain_service.services.table_embeddings import table_embedding_models
+    from langchain_service.services.article_index import article_index
+    from langchain_service.services.vector_index import vector_index_manager
+    from langchain_service.services.vector_search import execute_search, vector_literal
+    from langchain_service.services.response_cache import response_cache
+    RESPONSE_CACHE_AVAILABLE = True
+except ImportError:
+    from services.metrics import track_db
+    from services.embedding_service import embedding_service, content_key, DEFAULT_EMBEDDING_MODEL
+    from services.embedding_providers import USE_INGEST, USE_SEARCH
+    from services.vector_storage import storage_from_env
+    from services.table_embeddings import table_embedding_models
+    from services.article_index import article_index
+    from services.vector_index import vector_index_manager
+    from services.vector_search import execute_search, vector_literal
+    try:
+        from services.response_cache import response_cache
+        RESPONSE_CACHE_AVAILABLE = True
+    except ImportError:
+        RESPONSE_CACHE_AVAILABLE = False
+
+# 임베딩 입력 텍스트 종류 (crypto_news_summary.embedding_source)
+EMBEDDING_SOURCE_TITLE_SUMMARY = 'title+summary'
+EMBEDDING_SOURCE_SUMMARY = 'summary'
+
+# 유사도 검색 결과 컬럼
+SEARCH_COLUMNS = ['id', 'title', 'summary', 'url', 'source', 'published_date', 'keywords', 'sentiment', 'created_at']
+
 # Windows 콘솔 UTF-8 설정
 if sys.platform == "win32":
     os.environ['PYTHONIOENCODING'] = 'utf-8'
@@ -66,7 +101,12 @@ class DualDatabaseService:
         
         # OpenAI 임베딩 모델 초기화
         self.openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-        self.embedding_dimension = 1536
+        
+        # 모델 기록이 없을 때의 설정 모델 (차원별로 한 번만 결정)
+        self._configured_models: Dict[int, str] = {}
+        
+        # 벡터 저장 방식 (EMBEDDING_STORAGE: full / halfvec / binary, 압축 컬럼 인덱스 + 전체 정밀도 재정렬)
+        self.vector_storage = storage_from_env(self.embedding_dimension)
         
         # 데이터베이스 초기화
         self.init_databases()
@@ -103,7 +143,7 @@ class DualDatabaseService:
                     cur.execute("CREATE EXTENSION IF NOT EXISTS vector;")
                     
                     # 뉴스 요약 테이블 (벡터 검색용)
-                    cur.execute("""
+                    cur.execute(f"""
                         CREATE TABLE IF NOT EXISTS crypto_news_summary (
                             id SERIAL PRIMARY KEY,
                             title TEXT NOT NULL,
@@ -114,19 +154,25 @@ class DualDatabaseService:
                             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                             keywords TEXT[],
                             sentiment VARCHAR(20),
-                            embedding vector(1536),
+                            embedding vector({self.embedding_dimension}),
                             metadata JSONB
                         );
                     """)
                     
-                    # 벡터 유사도 검색을 위한 IVFFlat 인덱스 생성
+                    # 임베딩 출처 기록 (모델 / 입력 텍스트 종류 / 입력 텍스트 캐시 키) - 기존 테이블 마이그레이션
                     cur.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_summary_embedding 
-                        ON crypto_news_summary 
-                        USING ivfflat (embedding vector_cosine_ops) 
-                        WITH (lists = 100);
+                        ALTER TABLE crypto_news_summary
+                            ADD COLUMN IF NOT EXISTS embedding_model TEXT,
+                            ADD COLUMN IF NOT EXISTS embedding_source TEXT,
+                            ADD COLUMN IF NOT EXISTS embedding_text_hash CHAR(64);
                     """)
-                    self.logger.info("Vector IVFFlat index created successfully")
+                    
+                    # 압축 저장 방식이면 압축 컬럼 / HNSW 인덱스 (기존 행은 migrate_vector_storage.py로 채움)
+                    self.vector_storage.ensure_schema(cur, 'crypto_news_summary')
+                    
+                    # 벡터 유사도 검색 인덱스 (압축 저장 방식은 압축 컬럼 인덱스로 검색)
+                    if not self.vector_storage.compact:
+                        vector_index_manager.ensure_index(cur, 'crypto_news_summary')
                     
                     cur.execute("""
                         CREATE INDEX IF NOT EXISTS idx_summary_published_date 
@@ -179,25 +225,160 @@ class DualDatabaseService:
             self.logger.error(f"PostgreSQL database initialization failed: {e}")
             raise
     
-    def generate_embedding(self, text: str) -> List[float]:
-        """OpenAI 텍스트 임베딩 생성"""
+    @property
+    def table_embedding(self):
+        """crypto_news_summary.embedding 모델 (재조회 주기마다 다시 읽어 재임베딩 교체 반영)"""
+        return table_embedding_models.get('crypto_news_summary', self.get_pgvector_connection)
+    
+    @property
+    def embedding_dimension(self) -> int:
+        return self.table_embedding.dimension
+    
+    @property
+    def ingest_model(self) -> str:
+        """
+        저장 모델: 재임베딩으로 교체된 테이블은 기록된 모델 (reembed_corpus.py),
+        기록이 없으면 EMBEDDING_PROVIDER_INGEST (벡터 컬럼 차원과 같아야 함)
+        """
+        table_embedding = self.table_embedding
+        if table_embedding.recorded:
+            return table_embedding.model
+        dimension = table_embedding.dimension
+        if dimension not in self._configured_models:
+            model = self._resolve_embedding_model(USE_INGEST, dimension)
+            search_model = self._resolve_embedding_model(USE_SEARCH, dimension)
+            if search_model != model:
+                self.logger.warning(
+                    f"검색 임베딩 모델({search_model})이 저장 모델({model})과 달라 저장 모델로 검색합니다"
+                )
+            self._configured_models[dimension] = model
+        return self._configured_models[dimension]
+    
+    @property
+    def search_model(self) -> str:
+        """검색 모델 (저장된 벡터와 같은 벡터 공간이어야 하므로 저장 모델과 같음)"""
+        return self.ingest_model
+    
+    def _resolve_embedding_model(self, use: str, dimension: int) -> str:
+        """용도별 설정 모델 (벡터 컬럼 차원과 다르면 기본 OpenAI 모델 사용)"""
+        try:
+            model = embedding_service.model_for(use)
+            if embedding_service.dimension_for(model) == dimension:
+                return model
+            self.logger.warning(
+                f"{use} 임베딩 모델 {model}의 차원이 vector({dimension})와 달라 {DEFAULT_EMBEDDING_MODEL} 사용"
+            )
+        except Exception as e:
+            self.logger.warning(f"{use} 임베딩 제공자 설정 실패, {DEFAULT_EMBEDDING_MODEL} 사용: {e}")
+        return DEFAULT_EMBEDDING_MODEL
+    
+    def generate_embedding(self, text: str, model: str = None) -> List[float]:
+        """텍스트 임베딩 생성 (기본값: 저장 모델, 공용 임베딩 캐시 사용 - 같은 텍스트는 다시 요청하지 않음)"""
         try:
             if not text.strip():
                 return [0.0] * self.embedding_dimension
             
-            response = self.openai_client.embeddings.create(
-                model="text-embedding-ada-002",
-                input=text
-            )
-            
-            return response.data[0].embedding
+            return embedding_service.embed(text, model or self.ingest_model)
             
         except Exception as e:
             self.logger.error(f"OpenAI embedding generation failed: {e}")
             return [0.0] * self.embedding_dimension
     
-    def insert_news_article(self, article_data: Dict[str, Any]) -> bool:
-        """뉴스 기사를 두 데이터베이스에 분리 저장"""
+    def generate_query_embedding(self, query: str) -> List[float]:
+        """검색 질의 임베딩 (검색 모델, 반복 질의는 질의 LRU에서 반환)"""
+        try:
+            if not query.strip():
+                return [0.0] * self.embedding_dimension
+            
+            return embedding_service.embed_query(query, self.search_model)
+            
+        except Exception as e:
+            self.logger.error(f"Query embedding generation failed: {e}")
+            return [0.0] * self.embedding_dimension
+    
+    @staticmethod
+    def _summary_embedding_text(article_data: Dict[str, Any]) -> str:
+        """요약 임베딩 대상 텍스트 (제목 + 요약)"""
+        return f"{article_data.get('title', '')} {article_data.get('summary', '')}"
+    
+    def embed_new_articles(self, articles: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        아직 저장되지 않은 기사의 요약 임베딩을 배치로 생성 (토큰 예산 단위 1~2회 요청)
+        
+        Returns:
+            URL → insert_news_article에 넘길 임베딩 필드 (embedding, embedding_model, embedding_source, embedding_text)
+        """
+        urls = [article['url'] for article in articles if article.get('url')]
+        try:
+            with self.get_pgvector_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT url FROM crypto_news_summary WHERE url = ANY(%s)", (urls,))
+                    existing = {row[0] for row in cur.fetchall()}
+        except Exception as e:
+            self.logger.warning(f"기존 기사 조회 실패, 전체 기사 임베딩: {e}")
+            existing = set()
+        
+        pending = [
+            (article['url'], self._summary_embedding_text(article)) for article in articles
+            if article.get('url') and article['url'] not in existing and article.get('embedding') is None
+        ]
+        pending = [(url, text) for url, text in pending if text.strip()]
+        if not pending:
+            return {}
+        
+        vectors = embedding_service.embed_many([text for _, text in pending], self.ingest_model, skip_failed=True)
+        return {
+            url: {
+                'embedding': vector,
+                'embedding_model': self.ingest_model,
+                'embedding_source': EMBEDDING_SOURCE_TITLE_SUMMARY,
+                'embedding_text': text
+            }
+            for (url, text), vector in zip(pending, vectors) if vector is not None
+        }
+    
+    def _resolve_embedding(self, article_data: Dict[str, Any]):
+        """
+        저장할 임베딩과 출처 결정 (호출자가 준 벡터가 있으면 재사용, 없으면 제목 + 요약으로 생성)
+        
+        Returns:
+            (임베딩, 모델, 입력 텍스트 종류, 입력 텍스트 캐시 키)
+        """
+        embedding = article_data.get('embedding')
+        if embedding is not None:
+            if len(embedding) == self.embedding_dimension:
+                model = article_data.get('embedding_model') or DEFAULT_EMBEDDING_MODEL
+                text = article_data.get('embedding_text')
+                return (list(embedding), model, article_data.get('embedding_source') or 'caller',
+                        content_key(model, text) if text else None)
+            self.logger.warning(
+                f"전달된 임베딩 차원 불일치 ({len(embedding)} != {self.embedding_dimension}), 새로 생성: {article_data.get('url')}"
+            )
+        
+        text = self._summary_embedding_text(article_data)
+        return (self.generate_embedding(text), self.ingest_model, EMBEDDING_SOURCE_TITLE_SUMMARY,
+                content_key(self.ingest_model, text))
+    
+    def invalidate_response_cache(self, reason: str = "new articles stored"):
+        """새 기사 저장 후 챗봇 응답 캐시 무효화"""
+        if not RESPONSE_CACHE_AVAILABLE:
+            return
+        try:
+            response_cache.invalidate(reason)
+        except Exception as e:
+            self.logger.warning(f"응답 캐시 무효화 실패: {e}")
+    
+    @track_db('insert_article')
+    def insert_news_article(self, article_data: Dict[str, Any], invalidate_cache: bool = True) -> bool:
+        """
+        뉴스 기사를 두 데이터베이스에 분리 저장 (새 요약 저장 시 응답 캐시 무효화)
+        
+        article_data에 미리 계산한 임베딩이 있으면 다시 생성하지 않고 저장:
+            embedding: 벡터 (1536차원)
+            embedding_model: 생성 모델 (기본값: text-embedding-ada-002)
+            embedding_source: 입력 텍스트 종류 (예: summary, title+summary)
+            embedding_text: 입력 텍스트 (캐시 키로 기록)
+        """
         url = article_data['url']
         success_summary = False
         success_content = False
@@ -209,19 +390,28 @@ class DualDatabaseService:
                     # 중복 확인
                     cur.execute("SELECT id FROM crypto_news_summary WHERE url = %s", (url,))
                     if not cur.fetchone():
-                        # 임베딩 생성 (제목 + 요약)
-                        embedding_text = f"{article_data.get('title', '')} {article_data.get('summary', '')}"
-                        embedding = self.generate_embedding(embedding_text)
+                        # 임베딩 (전달된 벡터 재사용, 없으면 제목 + 요약으로 생성)
+                        embedding, embedding_model, embedding_source, embedding_text_hash = \
+                            self._resolve_embedding(article_data)
                         
                         # 날짜 처리
                         published_date = self._process_date(article_data.get('published_date'))
                         
+                        # 압축 저장 방식이면 같은 벡터의 압축 값도 함께 저장
+                        compact_column, compact_value, compact_params = '', '', ()
+                        if self.vector_storage.compact:
+                            compact_column = f", {self.vector_storage.column}"
+                            compact_value = f", {self.vector_storage.compact_expression('%s::vector')}"
+                            compact_params = (embedding,)
+                        
                         # 요약 데이터 삽입
-                        cur.execute("""
+                        cur.execute(f"""
                             INSERT INTO crypto_news_summary 
                             (title, summary, url, source, published_date, 
-                             keywords, sentiment, embedding, metadata)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s::vector, %s)
+                             keywords, sentiment, embedding, metadata,
+                             embedding_model, embedding_source, embedding_text_hash{compact_column})
+                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s::vector, %s, %s, %s, %s{compact_value})
+                            RETURNING id, created_at
                         """, (
                             article_data.get('title', ''),
                             article_data.get('summary', ''),
@@ -234,11 +424,28 @@ class DualDatabaseService:
                             json.dumps({
                                 'summary_length': len(article_data.get('summary', '')),
                                 'keyword_count': len(article_data.get('keywords', []))
-                            })
-                        ))
+                            }),
+                            embedding_model,
+                            embedding_source,
+                            embedding_text_hash
+                        ) + compact_params)
+                        article_id, created_at = cur.fetchone()
                         
                         conn.commit()
                         success_summary = True
+                        
+                        # 메모리 인덱스에 바로 반영 (API 서버에서 저장한 경우, 다른 프로세스 저장분은 주기적으로 적재)
+                        article_index.add({
+                            'id': article_id,
+                            'title': article_data.get('title', ''),
+                            'summary': article_data.get('summary', ''),
+                            'url': url,
+                            'source': article_data.get('source', ''),
+                            'published_date': published_date,
+                            'keywords': article_data.get('keywords', []),
+                            'sentiment': article_data.get('sentiment', 'neutral'),
+                            'created_at': created_at
+                        }, embedding, model=embedding_model)
                         self.logger.info(f"Summary saved to PgVector: {article_data.get('title', '')[:50]}...")
             
             # 2. 본문을 PostgreSQL에 저장 (백업으로 PgVector 사용)
@@ -305,10 +512,16 @@ class DualDatabaseService:
                 except Exception as backup_error:
                     self.logger.error(f"백업 저장도 실패: {backup_error}")
             
+            if success_summary and invalidate_cache:
+                self.invalidate_response_cache()
+            
             return success_summary and success_content
                     
         except Exception as e:
             self.logger.error(f"Failed to insert article: {e}")
+            if 'dimensions' in str(e):
+                # 재임베딩 교체 직후 (컬럼 차원 변경) → 다음 호출에서 모델 기록을 다시 읽음
+                table_embedding_models.invalidate('crypto_news_summary')
             return False
     
     def _process_date(self, published_date):
@@ -322,30 +535,76 @@ class DualDatabaseService:
             return datetime.now()
         return published_date
     
-    def search_similar_articles(self, query: str, limit: int = 10, similarity_threshold: float = 0.3) -> List[Dict[str, Any]]:
-        """유사한 기사 검색 (PgVector에서)"""
+    @track_db('vector_search')
+    def search_similar_articles(self, query: str, limit: int = 10, similarity_threshold: float = 0.3,
+                                **filters) -> List[Dict[str, Any]]:
+        """유사한 기사 검색 (메모리 인덱스 우선, 없으면 PgVector / 필터는 search_similar_by_embedding 참고)"""
+        return self.search_similar_by_embedding(self.generate_query_embedding(query), limit, similarity_threshold, **filters)
+    
+    def search_similar_by_embedding(self, query_embedding: List[float], limit: int = 10,
+                                    similarity_threshold: float = 0.3,
+                                    published_after: datetime = None,
+                                    published_before: datetime = None,
+                                    sources: Sequence[str] = None,
+                                    sentiments: Sequence[str] = None) -> List[Dict[str, Any]]:
+        """
+        이미 계산된 벡터로 유사한 기사 검색 (중복 확인 등 임베딩 재생성 없이)
+        
+        메모리 인덱스(article_index)가 준비되어 있으면 프로세스 안에서 검색하고,
+        없으면 PgVector 검색 (압축 저장 방식이면 후보 재정렬)
+        
+        Args:
+            published_after / published_before: 발행일 범위 [after, before)
+            sources: 출처 목록
+            sentiments: 감성 목록 (positive / negative / neutral)
+        """
+        results = article_index.search(
+            query_embedding, limit, similarity_threshold, model=self.search_model,
+            published_after=published_after, published_before=published_before,
+            sources=sources, sentiments=sentiments
+        )
+        if results is not None:
+            return results
+        
+        conditions, params = [], {}
+        if published_after is not None:
+            conditions.append('published_date >= %(published_after)s')
+            params['published_after'] = published_after
+        if published_before is not None:
+            conditions.append('published_date < %(published_before)s')
+            params['published_before'] = published_before
+        if sources:
+            conditions.append('source = ANY(%(sources)s)')
+            params['sources'] = list(sources)
+        if sentiments:
+            conditions.append('sentiment = ANY(%(sentiments)s)')
+            params['sentiments'] = list(sentiments)
         try:
-            query_embedding = self.generate_embedding(query)
-            
             with self.get_pgvector_connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                    cur.execute("""
-                        SELECT id, title, summary, url, source, published_date, 
-                               keywords, sentiment, created_at,
-                               1 - (embedding <=> %s::vector) as similarity
-                        FROM crypto_news_summary
-                        WHERE 1 - (embedding <=> %s::vector) > %s
-                        ORDER BY embedding <=> %s::vector
-                        LIMIT %s
-                    """, (query_embedding, query_embedding, similarity_threshold, query_embedding, limit))
-                    
-                    results = cur.fetchall()
+                    # 재현율 목표에 맞춘 probes / ef_search (압축 저장 방식은 후보 수 기준으로 압축 컬럼 인덱스에)
+                    storage = self.vector_storage
+                    results = execute_search(
+                        cur,
+                        storage.search_sql('crypto_news_summary', SEARCH_COLUMNS, conditions),
+                        {
+                            'query': vector_literal(query_embedding),
+                            'threshold': similarity_threshold,
+                            'limit': limit,
+                            'candidates': storage.candidates_for(limit),
+                            **params
+                        },
+                        'crypto_news_summary',
+                        storage.candidates_for(limit) if storage.compact else limit,
+                        index=storage.index_name('crypto_news_summary') if storage.compact else None
+                    )
                     return [dict(row) for row in results]
                     
         except Exception as e:
             self.logger.error(f"Similar articles search failed: {e}")
             return []
     
+    @track_db('article_content')
     def get_article_content(self, url: str) -> Optional[Dict[str, Any]]:
         """URL로 기사 본문 조회 (PostgreSQL에서)"""
         try:
@@ -362,6 +621,7 @@ class DualDatabaseService:
             self.logger.error(f"Content retrieval failed: {e}")
             return None
     
+    @track_db('recent_articles')
     def get_recent_articles(self, hours: int = 24, limit: int = 50) -> List[Dict[str, Any]]:
         """최근 기사 조회 (요약만)"""
         try:
@@ -383,6 +643,7 @@ class DualDatabaseService:
             self.logger.error(f"Recent articles query failed: {e}")
             return []
     
+    @track_db('statistics')
     def get_statistics(self) -> Dict[str, Any]:
         """양쪽 데이터베이스 통계 조회"""
         try:
@@ -407,14 +668,26 @@ class DualDatabaseService:
             return {}
     
     def batch_insert_articles(self, articles: List[Dict[str, Any]]) -> int:
-        """뉴스 기사 일괄 삽입"""
+        """뉴스 기사 일괄 삽입 (새 기사 임베딩은 배치 요청 1~2회로 생성해 전달)"""
         success_count = 0
         
+        try:
+            embeddings = self.embed_new_articles(articles)
+        except Exception as e:
+            self.logger.warning(f"임베딩 배치 생성 실패, 기사별로 생성: {e}")
+            embeddings = {}
+        
         for article in articles:
-            if self.insert_news_article(article):
+            if self.insert_news_article({**article, **embeddings.get(article.get('url'), {})}, invalidate_cache=False):
                 success_count += 1
         
+        # 배치 단위로 한 번만 무효화
+        if success_count:
+            self.invalidate_response_cache(f"{success_count} articles stored")
+        
         self.logger.info(f"Successfully inserted {success_count}/{len(articles)} articles to dual databases")
+        if not self.vector_storage.compact:
+            vector_index_manager.after_bulk_load('crypto_news_summary', self.get_pgvector_connection, success_count)
         return success_count
 
 # 사용 예시
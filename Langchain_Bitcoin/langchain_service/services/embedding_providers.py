@@ -0,0 +1,209 @@
+"""
+임베딩 제공자
+용도(Intent 분류 / 검색 / 저장)별로 원격 OpenAI 또는 로컬 CPU 모델을 선택
+
+- openai: text-embedding-ada-002 등 원격 API (네트워크 왕복, 토큰 과금)
+- local: SentenceTransformer 로컬 CPU 추론 (배치 인코딩, 스레드 수 조정, int8 동적 양자화 / ONNX 선택)
+
+환경변수 (값: openai | openai:<모델> | local | local:<모델>)
+- EMBEDDING_PROVIDER_INTENT: Intent 분류 (질문 / 예시 문장)
+- EMBEDDING_PROVIDER_SEARCH: 검색 질의
+- EMBEDDING_PROVIDER_INGEST: 뉴스 저장 (검색과 같은 벡터 공간이어야 함)
+
+로컬 모델 설정
+- LOCAL_EMBEDDING_MODEL: 기본 all-MiniLM-L6-v2 (한국어 질문은 paraphrase-multilingual-MiniLM-L12-v2 권장)
+- LOCAL_EMBEDDING_BACKEND: torch | onnx (ONNX Runtime, sentence-transformers>=3.2 필요)
+- LOCAL_EMBEDDING_QUANTIZE: true면 int8 동적 양자화 (torch: Linear 계층, onnx: LOCAL_EMBEDDING_ONNX_FILE)
+- LOCAL_EMBEDDING_THREADS: 추론 스레드 수 (기본값: min(4, CPU 수))
+- LOCAL_EMBEDDING_BATCH_SIZE: 인코딩 배치 크기
+"""
+
+import logging
+import os
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from .metrics import track_external
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+USE_INTENT = 'intent'
+USE_SEARCH = 'search'
+USE_INGEST = 'ingest'
+
+DEFAULT_OPENAI_MODEL = 'text-embedding-ada-002'
+DEFAULT_LOCAL_MODEL = 'all-MiniLM-L6-v2'
+
+# 모델 로드 없이 알 수 있는 차원
+KNOWN_DIMENSIONS = {
+    'text-embedding-ada-002': 1536,
+    'text-embedding-3-small': 1536,
+    'text-embedding-3-large': 3072,
+    'all-MiniLM-L6-v2': 384,
+    'paraphrase-multilingual-MiniLM-L12-v2': 384,
+}
+
+
+@lru_cache(maxsize=None)
+def load_sentence_transformer(model_name: str = DEFAULT_LOCAL_MODEL):
+    """SentenceTransformer 모델 반환 (프로세스당 1회 로드, pre-fork 워밍업 시 워커들이 공유)"""
+    logger.info(f"SentenceTransformer 모델 로드: {model_name}")
+    return SentenceTransformer(model_name)
+
+
+class EmbeddingProvider:
+    """임베딩 제공자 기본 클래스 (텍스트 목록 → 임베딩 목록, 입력 순서 유지)"""
+
+    remote = False
+
+    def __init__(self, model: str):
+        self.model = model
+        self._dimension: Optional[int] = KNOWN_DIMENSIONS.get(model)
+
+    @property
+    def cache_model(self) -> str:
+        """캐시 키에 쓰는 모델 식별자 (양자화 등으로 벡터가 달라지면 구분)"""
+        return self.model
+
+    @property
+    def dimension(self) -> int:
+        if self._dimension is None:
+            self._dimension = len(self.embed(['dimension probe'])[0])
+        return self._dimension
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        raise NotImplementedError
+
+    def warmup(self):
+        """첫 요청 지연 제거 (모델 로드 / 연결 생성)"""
+        self.embed(['warmup'])
+
+    def describe(self) -> Dict[str, object]:
+        return {'model': self.cache_model, 'remote': self.remote, 'dimension': self._dimension}
+
+    def __call__(self, texts: List[str]) -> List[List[float]]:
+        return self.embed(texts)
+
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    """OpenAI 임베딩 API (목록 입력 1회 호출)"""
+
+    remote = True
+
+    def __init__(self, model: str = DEFAULT_OPENAI_MODEL):
+        super().__init__(model)
+        self._client = None
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        if self._client is None:
+            from openai import OpenAI
+            self._client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        with track_external('openai', 'embedding'):
+            response = self._client.embeddings.create(model=self.model, input=list(texts))
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+
+class LocalEmbeddingProvider(EmbeddingProvider):
+    """SentenceTransformer 로컬 CPU 추론 (지연 로드)"""
+
+    def __init__(self,
+                 model: str = None,
+                 backend: str = None,
+                 quantize: bool = None,
+                 threads: int = None,
+                 batch_size: int = None):
+        super().__init__(model or os.getenv('LOCAL_EMBEDDING_MODEL', DEFAULT_LOCAL_MODEL))
+        self.backend = (backend or os.getenv('LOCAL_EMBEDDING_BACKEND', 'torch')).lower()
+        if quantize is None:
+            quantize = os.getenv('LOCAL_EMBEDDING_QUANTIZE', 'false').lower() == 'true'
+        self.quantize = quantize
+        self.threads = threads or int(os.getenv('LOCAL_EMBEDDING_THREADS', min(4, os.cpu_count() or 1)))
+        self.batch_size = batch_size or int(os.getenv('LOCAL_EMBEDDING_BATCH_SIZE', 64))
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def cache_model(self) -> str:
+        if self.backend == 'onnx':
+            return f"{self.model}@onnx{'-int8' if self.quantize else ''}"
+        return f"{self.model}@int8" if self.quantize else self.model
+
+    def _load(self):
+        """모델 로드 (스레드 수 설정, 양자화 / ONNX 적용)"""
+        with self._lock:
+            if self._model is not None:
+                return self._model
+            if not SENTENCE_TRANSFORMERS_AVAILABLE:
+                raise RuntimeError("sentence-transformers가 설치되지 않아 로컬 임베딩을 사용할 수 없습니다")
+
+            import torch
+            torch.set_num_threads(self.threads)
+
+            if self.backend == 'onnx':
+                try:
+                    model_kwargs = {'provider': 'CPUExecutionProvider'}
+                    onnx_file = os.getenv('LOCAL_EMBEDDING_ONNX_FILE')
+                    if self.quantize and onnx_file:
+                        model_kwargs['file_name'] = onnx_file
+                    self._model = SentenceTransformer(self.model, backend='onnx', model_kwargs=model_kwargs)
+                    logger.info(f"✅ 로컬 임베딩 모델 로드 (ONNX): {self.cache_model}, 스레드 {self.threads}")
+                    return self._model
+                except Exception as e:
+                    logger.warning(f"⚠️ ONNX 백엔드 로드 실패, torch 사용: {e}")
+                    self.backend = 'torch'
+
+            if self.quantize:
+                # 양자화는 모델을 변경하므로 공유 인스턴스(PgVectorService 저장용)와 별도로 로드
+                model = SentenceTransformer(self.model)
+                self._model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            else:
+                self._model = load_sentence_transformer(self.model)
+            logger.info(f"✅ 로컬 임베딩 모델 로드: {self.cache_model}, 스레드 {self.threads}")
+            return self._model
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        model = self._model or self._load()
+        vectors = model.encode(
+            list(texts),
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        return vectors.tolist()
+
+    def describe(self) -> Dict[str, object]:
+        info = super().describe()
+        info.update({'backend': self.backend, 'quantize': self.quantize, 'threads': self.threads})
+        return info
+
+
+def create_provider(spec: str) -> EmbeddingProvider:
+    """설정 문자열로 제공자 생성 (openai | openai:<모델> | local | local:<모델>)"""
+    kind, _, model = (spec or 'openai').strip().partition(':')
+    kind = kind.lower()
+    if kind == 'openai':
+        return OpenAIEmbeddingProvider(model or DEFAULT_OPENAI_MODEL)
+    if kind == 'local':
+        return LocalEmbeddingProvider(model or None)
+    raise ValueError(f"알 수 없는 임베딩 제공자: {spec}")
+
+
+_providers_by_spec: Dict[str, EmbeddingProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_provider(use: str) -> EmbeddingProvider:
+    """용도별 제공자 (같은 설정은 같은 인스턴스 공유)"""
+    spec = os.getenv(f"EMBEDDING_PROVIDER_{use.upper()}", 'openai')
+    with _providers_lock:
+        if spec not in _providers_by_spec:
+            _providers_by_spec[spec] = create_provider(spec)
+            logger.info(f"🧩 임베딩 제공자 ({use}): {spec}")
+        return _providers_by_spec[spec]
@@ -0,0 +1,616 @@
+"""
+공용 임베딩 서비스
+모든 임베딩 호출 지점(채팅 Intent 분류, 뉴스 검색, 파이프라인 저장)이 같은 캐시를 거치도록 통합
+
+- 캐시 키: (모델, 정규화된 텍스트)의 SHA-256 → 같은 텍스트는 모델당 한 번만 임베딩
+- 1단계: 프로세스 내 LRU (float32 배열로 보관)
+- 2단계: Redis 또는 Postgres 영구 저장소 (워커 / 파이프라인 프로세스 간 공유, 재시작 후에도 유지)
+- 저장소 장애 시 모델 호출로 대체 (임베딩 실패로 이어지지 않음)
+- 캐시에 없는 텍스트는 토큰 예산 단위 배치로 요청 (분당 토큰/요청 한도 페이싱, 실패 배치 재시도 및 분할)
+- 검색 질의는 별도 LRU(메모리 상한)를 먼저 거침 → 저장용 대량 임베딩이 인기 검색어를 밀어내지 않음
+- 용도(intent / search / ingest)별 제공자 선택은 embedding_providers 참고
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, deque
+from dataclasses import dataclass, asdict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .embedding_providers import (
+    DEFAULT_OPENAI_MODEL, USE_INGEST, USE_INTENT, USE_SEARCH, OpenAIEmbeddingProvider, get_provider
+)
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+try:
+    import psycopg2
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = DEFAULT_OPENAI_MODEL
+
+REDIS_KEY_PREFIX = 'embedding'
+
+# 텍스트 목록 → 임베딩 목록 (입력 순서 유지)
+EmbedFunction = Callable[[List[str]], List[List[float]]]
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (유니코드 NFC, 앞뒤/연속 공백 정리)"""
+    return ' '.join(unicodedata.normalize('NFC', text or '').split())
+
+
+def content_key(model: str, text: str) -> str:
+    """(모델, 정규화된 텍스트) 기준 캐시 키"""
+    return hashlib.sha256(f"{model}\x00{normalize_text(text)}".encode('utf-8')).hexdigest()
+
+
+@lru_cache(maxsize=8)
+def _tokenizer(model: str):
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding('cl100k_base')
+
+
+def count_tokens(text: str, model: str = DEFAULT_EMBEDDING_MODEL) -> int:
+    """입력 토큰 수 (tiktoken 미설치 시 UTF-8 바이트 / 3으로 추정 - 한글 1글자 ≈ 1토큰, 영문은 과대 추정)"""
+    if TIKTOKEN_AVAILABLE:
+        return len(_tokenizer(model).encode(text))
+    return len(text.encode('utf-8')) // 3 + 1
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = DEFAULT_EMBEDDING_MODEL) -> str:
+    """모델 입력 한도를 넘는 텍스트 자르기"""
+    if TIKTOKEN_AVAILABLE:
+        tokens = _tokenizer(model).encode(text)
+        return text if len(tokens) <= max_tokens else _tokenizer(model).decode(tokens[:max_tokens])
+    encoded = text.encode('utf-8')
+    if len(encoded) // 3 + 1 <= max_tokens:
+        return text
+    return encoded[:max_tokens * 3].decode('utf-8', errors='ignore')
+
+
+def plan_batches(token_counts: Sequence[int], max_tokens: int, max_items: int) -> List[List[int]]:
+    """입력 순서대로 토큰 예산 / 항목 수 한도 안에서 배치 구성 (인덱스 목록)"""
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+    for index, tokens in enumerate(token_counts):
+        if current and (current_tokens + tokens > max_tokens or len(current) >= max_items):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(index)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    return getattr(error, 'status_code', None) or getattr(getattr(error, 'response', None), 'status_code', None)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """429 응답의 Retry-After 헤더 (초)"""
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        value = headers.get('retry-after')
+        return float(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """분당 요청 수 / 토큰 수 한도 페이싱 (1분 슬라이딩 윈도우) 및 429 응답 후 대기"""
+
+    def __init__(self, tokens_per_minute: int, requests_per_minute: int):
+        self.tokens_per_minute = tokens_per_minute
+        self.requests_per_minute = requests_per_minute
+        self._window: deque = deque()  # (시각, 토큰 수)
+        self._window_tokens = 0
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int) -> float:
+        """한도 내에서 요청 가능할 때까지 대기 (대기한 초 반환)"""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._window and now - self._window[0][0] >= 60:
+                    self._window_tokens -= self._window.popleft()[1]
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    over_requests = self.requests_per_minute and len(self._window) >= self.requests_per_minute
+                    over_tokens = (self.tokens_per_minute and self._window
+                                   and self._window_tokens + tokens > self.tokens_per_minute)
+                    if not (over_requests or over_tokens):
+                        self._window.append((now, tokens))
+                        self._window_tokens += tokens
+                        return waited
+                    wait = 60 - (now - self._window[0][0])
+            time.sleep(wait)
+            waited += wait
+
+    def block(self, seconds: float):
+        """429 응답 후 일정 시간 요청 중지"""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """임베딩 캐시 / 배치 호출 통계"""
+    local_hits: int = 0
+    store_hits: int = 0
+    misses: int = 0
+    provider_calls: int = 0
+    store_writes: int = 0
+    store_errors: int = 0
+    evictions: int = 0
+    batch_retries: int = 0
+    batch_splits: int = 0
+    rate_limited: int = 0
+    failed_texts: int = 0
+    paced_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (적중률 포함)"""
+        data = asdict(self)
+        lookups = self.local_hits + self.store_hits + self.misses
+        data['hit_ratio'] = round((self.local_hits + self.store_hits) / lookups, 3) if lookups else 0.0
+        return data
+
+
+class RedisEmbeddingStore:
+    """Redis 임베딩 저장소 (float32 바이트, 선택적 TTL)"""
+
+    name = 'redis'
+
+    def __init__(self, ttl: int = 0):
+        self.ttl = ttl
+        self.client = redis.Redis(
+            host=os.getenv('REDIS_HOST', 'localhost'),
+            port=int(os.getenv('REDIS_PORT', 6379)),
+            socket_connect_timeout=2,
+            socket_timeout=2
+        )
+        self.client.ping()
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        values = self.client.mget([f"{REDIS_KEY_PREFIX}:{key}" for key in keys])
+        return {
+            key: np.frombuffer(value, dtype=np.float32)
+            for key, value in zip(keys, values) if value
+        }
+
+    def set_many(self, model: str, items: Dict[str, np.ndarray]):
+        pipe = self.client.pipeline(transaction=False)
+        for key, vector in items.items():
+            pipe.set(f"{REDIS_KEY_PREFIX}:{key}", vector.tobytes(), ex=self.ttl or None)
+        pipe.execute()
+
+
+class PostgresEmbeddingStore:
+    """Postgres 임베딩 저장소 (벡터 DB와 같은 인스턴스의 embedding_cache 테이블)"""
+
+    name = 'postgres'
+
+    def __init__(self):
+        self.connection_params = {
+            'host': os.getenv('DB_HOST', 'localhost'),
+            'port': int(os.getenv('DB_PORT', 5435)),
+            'database': os.getenv('DB_NAME', 'mydb'),
+            'user': os.getenv('DB_USER', 'myuser'),
+            'password': os.getenv('DB_PASSWORD', 'mypassword')
+        }
+        self._conn = None
+        self._lock = threading.Lock()
+        with self._lock:
+            with self._connection().cursor() as cur:
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS embedding_cache (
+                        cache_key CHAR(64) PRIMARY KEY,
+                        model TEXT NOT NULL,
+                        dimension INTEGER NOT NULL,
+                        embedding BYTEA NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    );
+                """)
+
+    def _connection(self):
+        """지속 연결 반환 (끊어진 경우 재연결)"""
+        if self._conn is None or self._conn.closed:
+            self._conn = psycopg2.connect(connect_timeout=2, **self.connection_params)
+            self._conn.autocommit = True
+        return self._conn
+
+    def _execute(self, func):
+        with self._lock:
+            try:
+                with self._connection().cursor() as cur:
+                    return func(cur)
+            except psycopg2.OperationalError:
+                # 연결 끊김: 다음 호출에서 재연결
+                self._conn = None
+                raise
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        def query(cur):
+            cur.execute("SELECT cache_key, embedding FROM embedding_cache WHERE cache_key = ANY(%s)", (keys,))
+            return cur.fetchall()
+        return {key: np.frombuffer(bytes(value), dtype=np.float32) for key, value in self._execute(query)}
+
+    def set_many(self, model: str, items: Dict[str, np.ndarray]):
+        from psycopg2.extras import execute_values
+
+        def insert(cur):
+            execute_values(cur, """
+                INSERT INTO embedding_cache (cache_key, model, dimension, embedding)
+                VALUES %s ON CONFLICT (cache_key) DO NOTHING
+            """, [(key, model, len(vector), psycopg2.Binary(vector.tobytes())) for key, vector in items.items()])
+        self._execute(insert)
+
+
+class QueryEmbeddingCache:
+    """검색 질의 → 임베딩 LRU (정규화된 질의 기준, 바이트 상한)"""
+
+    # 항목당 키 / OrderedDict 노드 / ndarray 헤더 추정치
+    ENTRY_OVERHEAD_BYTES = 200
+
+    def __init__(self, max_bytes: int = None):
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            os.getenv('EMBEDDING_QUERY_CACHE_MAX_BYTES', 32 * 1024 * 1024))
+        self._entries: 'OrderedDict[tuple, np.ndarray]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _entry_bytes(self, key: tuple, vector: np.ndarray) -> int:
+        return vector.nbytes + len(key[1].encode('utf-8')) + self.ENTRY_OVERHEAD_BYTES
+
+    def get(self, key: tuple) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def put(self, key: tuple, vector: np.ndarray):
+        size = self._entry_bytes(key, vector)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= self._entry_bytes(key, previous)
+            self._entries[key] = vector
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                old_key, old_vector = self._entries.popitem(last=False)
+                self._bytes -= self._entry_bytes(old_key, old_vector)
+                self.evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 3) if lookups else 0.0,
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+            'evictions': self.evictions
+        }
+
+
+class EmbeddingService:
+    """내용 주소 기반 캐시를 갖는 공용 임베딩 서비스"""
+
+    def __init__(self, max_entries: int = None, backend: str = None):
+        """
+        초기화
+
+        Args:
+            max_entries: 로컬 LRU 최대 항목 수 (환경변수 EMBEDDING_CACHE_MAX_ENTRIES)
+            backend: 영구 저장소 redis / postgres / none (환경변수 EMBEDDING_CACHE_BACKEND)
+        """
+        self.enabled = os.getenv('EMBEDDING_CACHE_ENABLED', 'true').lower() == 'true'
+        self.max_entries = max_entries or int(os.getenv('EMBEDDING_CACHE_MAX_ENTRIES', 5000))
+        self.backend = (backend or os.getenv('EMBEDDING_CACHE_BACKEND', 'redis')).lower()
+        self.store_ttl = int(os.getenv('EMBEDDING_CACHE_TTL', 30 * 24 * 3600))
+
+        # 배치 요청 설정 (OpenAI: 요청당 최대 2048개 입력, 입력당 8191 토큰)
+        self.batch_max_tokens = int(os.getenv('EMBEDDING_BATCH_MAX_TOKENS', 50000))
+        self.batch_max_items = int(os.getenv('EMBEDDING_BATCH_MAX_ITEMS', 512))
+        self.max_input_tokens = int(os.getenv('EMBEDDING_MAX_INPUT_TOKENS', 8000))
+        self.batch_retries = int(os.getenv('EMBEDDING_BATCH_RETRIES', 3))
+        self.retry_base_delay = float(os.getenv('EMBEDDING_RETRY_BASE_DELAY', 1.0))
+        self.tokens_per_minute = int(os.getenv('EMBEDDING_TOKENS_PER_MINUTE', 1000000))
+        self.requests_per_minute = int(os.getenv('EMBEDDING_REQUESTS_PER_MINUTE', 3000))
+
+        self._providers: Dict[str, EmbedFunction] = {}
+        self._rate_limiters: Dict[str, RateLimiter] = {}
+        self._entries: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._store = None
+        self._store_checked = False
+        self._stats = EmbeddingCacheStats()
+        self.query_cache = QueryEmbeddingCache()
+
+    def register_provider(self, model: str, provider: EmbedFunction, remote: bool = None):
+        """
+        모델별 임베딩 제공자 등록 (예: SentenceTransformer 로컬 모델)
+
+        Args:
+            model: 모델 이름 (캐시 키에 포함)
+            provider: 텍스트 목록 → 임베딩 목록 (embedding_providers.EmbeddingProvider 또는 함수)
+            remote: 원격 API 여부 (입력 토큰 자르기 / 분당 한도 페이싱 적용, 기본값: 제공자의 remote 속성)
+        """
+        if remote is None:
+            remote = getattr(provider, 'remote', False)
+        self._providers[model] = provider
+        if remote:
+            self._rate_limiters[model] = RateLimiter(self.tokens_per_minute, self.requests_per_minute)
+        else:
+            self._rate_limiters.pop(model, None)
+
+    def _provider(self, model: str) -> EmbedFunction:
+        if model not in self._providers:
+            if not model.startswith('text-embedding'):
+                raise ValueError(f"등록되지 않은 임베딩 모델: {model}")
+            self.register_provider(model, OpenAIEmbeddingProvider(model))
+        return self._providers[model]
+
+    def model_for(self, use: str) -> str:
+        """용도(intent / search / ingest)에 설정된 제공자의 모델 식별자 (처음 사용 시 등록)"""
+        provider = get_provider(use)
+        if provider.cache_model not in self._providers:
+            self.register_provider(provider.cache_model, provider)
+        return provider.cache_model
+
+    def dimension_for(self, model: str) -> int:
+        """모델 임베딩 차원 (등록된 제공자 기준, 알 수 없으면 1회 임베딩으로 확인)"""
+        provider = self._provider(model)
+        dimension = getattr(provider, 'dimension', None)
+        return dimension if dimension is not None else len(provider(['dimension probe'])[0])
+
+    def _get_store(self):
+        """영구 저장소 반환 (지연 연결, 실패 시 로컬 캐시만 사용)"""
+        if not self._store_checked:
+            self._store_checked = True
+            try:
+                if self.backend == 'redis' and REDIS_AVAILABLE:
+                    self._store = RedisEmbeddingStore(ttl=self.store_ttl)
+                elif self.backend == 'postgres' and PSYCOPG2_AVAILABLE:
+                    self._store = PostgresEmbeddingStore()
+                if self._store:
+                    logger.info(f"✅ 임베딩 캐시 저장소 연결 완료: {self._store.name}")
+            except Exception as e:
+                logger.warning(f"⚠️ 임베딩 캐시 저장소({self.backend}) 연결 실패, 로컬 캐시만 사용: {e}")
+                self._store = None
+        return self._store
+
+    def embed(self, text: str, model: str = None, use: str = USE_SEARCH) -> List[float]:
+        """단일 텍스트 임베딩 (블로킹 - 비동기 코드에서는 실행 계층에서 호출)"""
+        return self.embed_many([text], model, use=use)[0]
+
+    def embed_query(self, query: str, model: str = None, use: str = USE_SEARCH) -> List[float]:
+        """
+        검색 질의 임베딩 (블로킹) - 모든 검색 진입점이 사용
+
+        자주 반복되는 질의는 질의 LRU에서 바로 반환 (공용 캐시 / 저장소 조회와 모델 호출 모두 생략)
+        """
+        model = model or self.model_for(use)
+        if not self.enabled:
+            return self.embed(query, model, use=use)
+        key = (model, normalize_text(query))
+        vector = self.query_cache.get(key)
+        if vector is None:
+            vector = np.asarray(self.embed(query, model, use=use), dtype=np.float32)
+            self.query_cache.put(key, vector)
+        return vector.tolist()
+
+    def embed_many(self,
+                   texts: Sequence[str],
+                   model: str = None,
+                   skip_failed: bool = False,
+                   use: str = USE_SEARCH) -> List[Optional[List[float]]]:
+        """
+        여러 텍스트 임베딩 (캐시에 없는 텍스트만 모아서 토큰 예산 단위 배치로 요청)
+
+        Args:
+            texts: 임베딩할 텍스트 목록
+            model: 임베딩 모델 (지정하지 않으면 용도별 설정 제공자)
+            skip_failed: 재시도 후에도 실패한 텍스트를 None으로 반환 (False면 예외 전파)
+            use: 용도 (intent / search / ingest)
+
+        Returns:
+            입력 순서대로의 임베딩 목록
+        """
+        if not texts:
+            return []
+        model = model or self.model_for(use)
+        if not self.enabled:
+            return [None if vector is None else vector.tolist()
+                    for vector in self._compute(model, [normalize_text(text) for text in texts], skip_failed)]
+
+        keys = [content_key(model, text) for text in texts]
+        found: Dict[str, np.ndarray] = {}
+
+        # 1단계: 로컬 LRU
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = vector
+        self._stats.local_hits += sum(1 for key in keys if key in found)
+
+        # 2단계: 영구 저장소
+        missing = list(dict.fromkeys(key for key in keys if key not in found))
+        store = self._get_store() if missing else None
+        if store:
+            try:
+                stored = store.get_many(missing)
+            except Exception as e:
+                self._stats.store_errors += 1
+                logger.debug(f"임베딩 캐시 저장소 조회 실패: {e}")
+                stored = {}
+            self._stats.store_hits += sum(1 for key in keys if key in stored)
+            found.update(stored)
+            self._store_local(stored)
+            missing = [key for key in missing if key not in stored]
+
+        # 3단계: 모델 호출 (같은 배치 안의 중복 텍스트는 한 번만)
+        if missing:
+            missing_keys = set(missing)
+            self._stats.misses += sum(1 for key in keys if key in missing_keys)
+            # 캐시 키와 일치하도록 정규화된 텍스트를 임베딩
+            text_by_key = dict(zip(keys, texts))
+            vectors = self._compute(model, [normalize_text(text_by_key[key]) for key in missing], skip_failed)
+            computed = {key: vector for key, vector in zip(missing, vectors) if vector is not None}
+            found.update(computed)
+            self._store_local(computed)
+            if store:
+                try:
+                    store.set_many(model, computed)
+                    self._stats.store_writes += len(computed)
+                except Exception as e:
+                    self._stats.store_errors += 1
+                    logger.debug(f"임베딩 캐시 저장소 저장 실패: {e}")
+
+        return [found[key].tolist() if key in found else None for key in keys]
+
+    def _compute(self, model: str, texts: List[str], skip_failed: bool) -> List[Optional[np.ndarray]]:
+        """제공자 호출 (토큰 예산 단위 배치, 실패 항목은 None)"""
+        provider = self._provider(model)
+        limiter = self._rate_limiters.get(model)
+        if limiter:
+            texts = [truncate_to_tokens(text, self.max_input_tokens, model) for text in texts]
+            token_counts = [count_tokens(text, model) for text in texts]
+        else:
+            token_counts = [1] * len(texts)
+
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        batches = plan_batches(token_counts, self.batch_max_tokens, self.batch_max_items)
+        for batch in batches:
+            vectors = self._call_batch(provider, limiter, [texts[i] for i in batch],
+                                       sum(token_counts[i] for i in batch), skip_failed)
+            for index, vector in zip(batch, vectors):
+                results[index] = vector
+        if len(batches) > 1:
+            logger.info(f"🧮 임베딩 {len(texts)}건을 {len(batches)}개 배치로 요청")
+        return results
+
+    def _call_batch(self,
+                    provider: EmbedFunction,
+                    limiter: Optional[RateLimiter],
+                    texts: List[str],
+                    tokens: int,
+                    skip_failed: bool) -> List[Optional[np.ndarray]]:
+        """
+        배치 1개 요청 (지수 백오프 재시도, 429는 Retry-After만큼 전체 대기)
+        재시도 후에도 입력 오류(4xx)로 실패하면 반으로 나눠 문제 텍스트만 격리
+        """
+        error: Optional[Exception] = None
+        for attempt in range(self.batch_retries + 1):
+            if limiter:
+                self._stats.paced_seconds += limiter.acquire(tokens)
+            try:
+                vectors = provider(texts)
+                self._stats.provider_calls += 1
+                return [np.asarray(vector, dtype=np.float32) for vector in vectors]
+            except Exception as e:
+                error = e
+                self._stats.provider_calls += 1
+                status = _status_code(e)
+                if status is not None and 400 <= status < 500 and status != 429:
+                    break  # 입력 오류는 같은 요청으로 재시도해도 실패
+                if attempt == self.batch_retries:
+                    break
+                delay = self.retry_base_delay * (2 ** attempt)
+                self._stats.batch_retries += 1
+                if status == 429:
+                    self._stats.rate_limited += 1
+                    delay = _retry_after(e) or delay
+                    if limiter:
+                        limiter.block(delay)
+                        continue
+                logger.warning(f"⚠️ 임베딩 배치 요청 실패 ({len(texts)}건, {attempt + 1}회), {delay:.1f}초 후 재시도: {e}")
+                time.sleep(delay)
+
+        status = _status_code(error)
+        if len(texts) > 1 and status is not None and 400 <= status < 500 and status != 429:
+            self._stats.batch_splits += 1
+            middle = len(texts) // 2
+            ratio = middle / len(texts)
+            return (self._call_batch(provider, limiter, texts[:middle], int(tokens * ratio), skip_failed)
+                    + self._call_batch(provider, limiter, texts[middle:], tokens - int(tokens * ratio), skip_failed))
+
+        if not skip_failed:
+            raise error
+        self._stats.failed_texts += len(texts)
+        logger.error(f"❌ 임베딩 배치 실패 ({len(texts)}건 제외): {error}")
+        return [None] * len(texts)
+
+    def _store_local(self, items: Dict[str, np.ndarray]):
+        """로컬 LRU 저장 (크기 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        if not items:
+            return
+        with self._lock:
+            for key, vector in items.items():
+                self._entries[key] = vector
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """임베딩 캐시 통계"""
+        stats = self._stats.to_dict()
+        stats.update({
+            'enabled': self.enabled,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'store': self._store.name if self._store else None,
+            'paced_seconds': round(self._stats.paced_seconds, 3),
+            'models': sorted(self._providers),
+            'query_cache': self.query_cache.get_stats()
+        })
+        try:
+            stats['providers'] = {use: get_provider(use).describe() for use in (USE_INTENT, USE_SEARCH, USE_INGEST)}
+        except ValueError as e:
+            stats['providers'] = {'error': str(e)}
+        return stats
+
+
+# 전역 임베딩 서비스 인스턴스
+embedding_service = EmbeddingService()
@@ -6,7 +6,7 @@
 import logging
 import os
 import asyncio
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, AsyncIterator
 from datetime import datetime
 from openai import OpenAI
 
@@ -14,6 +14,11 @@ from openai import OpenAI
 from langchain_service.tools.advanced_news_analyzer import AdvancedNewsAnalyzer, MarketSentimentAnalyzer, TrendAnalyzer
 from langchain_service.tools.realtime_market_data import RealTimeMarketDataTool, MarketHeatmapTool
 from langchain_service.core.database_manager import db_manager
+from langchain_service.services.execution_service import execution_layer
+from langchain_service.services.metrics import track_external
+from langchain_service.services.stream_events import (
+    intent_event, progress_event, token_event, message_event, done_event, error_event
+)
 
 # 기존 도구들
 from langchain_service.tools.news_tools import CryptoNewsSearchTool, LatestNewsLookupTool, DatabaseStatsTool
@@ -236,44 +241,79 @@ class EnhancedCryptoAgent:
             logger.error(f"Intent 처리 실패 ({intent}): {e}")
             return f"분석 처리 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
     
-    async def _comprehensive_claude_analysis(self, message: str) -> str:
-        """Claude 수준의 종합 분석"""
+    async def process_message_stream(self, message: str, session_id: str, use_rag: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """메시지 처리 (스트리밍) - 도구 진행 이벤트와 AI 결론 토큰을 도착 즉시 전달"""
         try:
-            logger.info("🔍 Claude 수준 종합 분석 시작")
-            
-            # 다중 도구 병렬 실행
-            tasks = []
-            
-            # 뉴스 분석
-            if self.advanced_news_analyzer:
-                tasks.append(self.advanced_news_analyzer._arun(message))
-            
-            # 시장 데이터 분석
-            if self.realtime_market_tool:
-                tasks.append(self.realtime_market_tool._arun(message))
-            
-            # 시장 심리 분석
-            if self.market_sentiment_analyzer:
-                tasks.append(self.market_sentiment_analyzer._run())
+            logger.info(f"🧠 Enhanced Agent 스트리밍 처리 시작: {message[:50]}...")
             
-            # 트렌드 분석
-            if self.trend_analyzer:
-                tasks.append(self.trend_analyzer._run())
-            
-            # 병렬 실행
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # 결과 통합
-            news_analysis = results[0] if len(results) > 0 and not isinstance(results[0], Exception) else "뉴스 분석 데이터 부족"
-            market_analysis = results[1] if len(results) > 1 and not isinstance(results[1], Exception) else "시장 데이터 분석 제한"
-            sentiment_analysis = results[2] if len(results) > 2 and not isinstance(results[2], Exception) else "시장 심리 분석 제한"
-            trend_analysis = results[3] if len(results) > 3 and not isinstance(results[3], Exception) else "트렌드 분석 제한"
+            intent_result = await self._classify_enhanced_intent(message)
+            intent = intent_result['intent']
+            confidence = intent_result['confidence']
+            yield intent_event(intent, confidence)
             
-            # Claude 스타일 종합 보고서 생성
-            current_date = datetime.now().strftime("%Y년 %m월 %d일")
-            current_time = datetime.now().strftime("%H:%M")
+            response_chunks = []
+            if intent == 'comprehensive_analysis':
+                async for event in self._comprehensive_analysis_stream(message):
+                    if event['event'] in ('token', 'message'):
+                        response_chunks.append(event['data']['text'])
+                    yield event
+            elif intent == 'news_analysis' and self.advanced_news_analyzer:
+                async for event in self.advanced_news_analyzer.astream_analysis(message):
+                    if event['event'] == 'message':
+                        response_chunks.append(event['data']['text'])
+                    yield event
+            else:
+                yield progress_event(intent, 'started')
+                response_text = await self._process_enhanced_intent(intent, message, session_id)
+                response_text = await self._enhance_response_quality(response_text, message, intent)
+                yield progress_event(intent, 'completed')
+                yield message_event(response_text)
+                response_chunks.append(response_text)
+            
+            response_text = ''.join(response_chunks)
+            yield done_event({
+                'message': response_text,
+                'session_id': session_id,
+                'data_sources': self._get_enhanced_data_sources(intent),
+                'confidence_score': confidence,
+                'intent': intent,
+                'processing_method': 'enhanced_claude_level_agent_stream',
+                'analysis_depth': self._get_analysis_depth(intent),
+                'timestamp': datetime.now().isoformat()
+            })
             
-            comprehensive_report = f"""# 🔍 암호화폐 시장 종합 분석 보고서
+        except Exception as e:
+            logger.error(f"💥 Enhanced Agent 스트리밍 처리 중 오류: {e}")
+            yield error_event("분석 처리 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.", str(e))
+    
+    def _comprehensive_analysis_tasks(self, message: str) -> Dict[str, Any]:
+        """종합 분석에 사용할 도구 작업들 (동기 도구는 실행 계층 스레드 풀에서 실행)"""
+        tasks = {}
+        
+        # 뉴스 분석
+        if self.advanced_news_analyzer:
+            tasks['news'] = self.advanced_news_analyzer._arun(message)
+        
+        # 시장 데이터 분석
+        if self.realtime_market_tool:
+            tasks['market'] = self.realtime_market_tool._arun(message)
+        
+        # 시장 심리 분석
+        if self.market_sentiment_analyzer:
+            tasks['sentiment'] = execution_layer.run_blocking('comprehensive_analysis', self.market_sentiment_analyzer._run)
+        
+        # 트렌드 분석
+        if self.trend_analyzer:
+            tasks['trend'] = execution_layer.run_blocking('comprehensive_analysis', self.trend_analyzer._run)
+        
+        return tasks
+    
+    def _comprehensive_report_body(self, results: Dict[str, Any]) -> str:
+        """종합 분석 보고서 본문 (AI 결론 이전까지)"""
+        current_date = datetime.now().strftime("%Y년 %m월 %d일")
+        current_time = datetime.now().strftime("%H:%M")
+        
+        return f"""# 🔍 암호화폐 시장 종합 분석 보고서
 
 **분석 기준**: {current_date} {current_time} | **AI 분석**: Claude 수준 엔진
 
@@ -281,43 +321,123 @@ class EnhancedCryptoAgent:
 
 ## 📰 **뉴스 기반 시장 분석**
 
-{news_analysis}
+{results['news']}
 
 ---
 
 ## 📊 **실시간 시장 데이터 분석**
 
-{market_analysis}
+{results['market']}
 
 ---
 
 ## 🎭 **시장 심리 현황**
 
-{sentiment_analysis}
+{results['sentiment']}
 
 ---
 
 ## 📈 **트렌드 분석**
 
-{trend_analysis}
+{results['trend']}
 
 ---
 
 ## 🎯 **AI 종합 결론**
 
-{await self._generate_ai_conclusion(message, news_analysis, market_analysis, sentiment_analysis, trend_analysis)}
+"""
+    
+    def _comprehensive_report_footer(self) -> str:
+        """종합 분석 보고서 꼬리말"""
+        return """
 
 ---
 
 *🤖 이 분석은 Claude 수준의 AI 엔진이 실시간 데이터를 종합하여 생성한 것으로, 투자 결정 시 참고용으로만 활용하시기 바랍니다.*
 """
-
-            return comprehensive_report
+    
+    def _normalize_comprehensive_results(self, results: Dict[str, Any]) -> Dict[str, Any]:
+        """도구 결과 정리 (실패/누락 시 기본 문구)"""
+        defaults = {
+            'news': "뉴스 분석 데이터 부족",
+            'market': "시장 데이터 분석 제한",
+            'sentiment': "시장 심리 분석 제한",
+            'trend': "트렌드 분석 제한"
+        }
+        return {
+            name: results[name] if name in results and not isinstance(results[name], Exception) else default
+            for name, default in defaults.items()
+        }
+    
+    async def _comprehensive_claude_analysis(self, message: str) -> str:
+        """Claude 수준의 종합 분석"""
+        try:
+            logger.info("🔍 Claude 수준 종합 분석 시작")
+            
+            # 다중 도구 병렬 실행
+            tasks = self._comprehensive_analysis_tasks(message)
+            gathered = await asyncio.gather(*tasks.values(), return_exceptions=True)
+            
+            # 결과 통합
+            results = self._normalize_comprehensive_results(dict(zip(tasks.keys(), gathered)))
+            
+            # Claude 스타일 종합 보고서 생성
+            conclusion = await self._generate_ai_conclusion(
+                message, results['news'], results['market'], results['sentiment'], results['trend']
+            )
+            
+            return self._comprehensive_report_body(results) + conclusion + self._comprehensive_report_footer()
             
         except Exception as e:
             logger.error(f"종합 분석 실패: {e}")
             return f"종합 분석 중 오류가 발생했습니다: {str(e)}"
     
+    async def _comprehensive_analysis_stream(self, message: str) -> AsyncIterator[Dict[str, Any]]:
+        """종합 분석 (스트리밍) - 도구 완료 순서대로 진행 이벤트, 이후 AI 결론 토큰 전달"""
+        tasks = self._comprehensive_analysis_tasks(message)
+        
+        async def run_named(name, awaitable):
+            try:
+                return name, await awaitable
+            except Exception as e:
+                return name, e
+        
+        for name in tasks:
+            yield progress_event(name, 'started')
+        
+        raw_results = {}
+        for finished in asyncio.as_completed([run_named(name, task) for name, task in tasks.items()]):
+            name, result = await finished
+            raw_results[name] = result
+            if isinstance(result, Exception):
+                yield progress_event(name, 'failed', error=str(result))
+            else:
+                yield progress_event(name, 'completed')
+        
+        results = self._normalize_comprehensive_results(raw_results)
+        yield message_event(self._comprehensive_report_body(results))
+        
+        # AI 결론은 토큰 단위로 스트리밍
+        yield progress_event('ai_conclusion', 'started')
+        prompt = self._build_conclusion_prompt(
+            message, results['news'], results['market'], results['sentiment'], results['trend']
+        )
+        streamed_any = False
+        try:
+            async for token in execution_layer.iterate_blocking(
+                'comprehensive_analysis', self._stream_completion, prompt, "gpt-3.5-turbo", 500, 0.3
+            ):
+                streamed_any = True
+                yield token_event(token)
+            yield progress_event('ai_conclusion', 'completed')
+        except Exception as llm_error:
+            logger.warning(f"AI 결론 스트리밍 실패: {llm_error}")
+            yield progress_event('ai_conclusion', 'failed', error=str(llm_error))
+            if not streamed_any:
+                yield message_event(self._default_conclusion())
+        
+        yield message_event(self._comprehensive_report_footer())
+    
     async def _market_sentiment_analysis(self, message: str) -> str:
         """시장 심리 분석"""
         try:
@@ -455,7 +575,9 @@ class EnhancedCryptoAgent:
 향상된 응답을 제공해주세요:"""
 
                 try:
-                    enhanced = self.openai_client.chat.completions.create(
+                    enhanced = await execution_layer.run_blocking(
+                        'comprehensive_analysis',
+                        track_external('openai', 'chat')(self.openai_client.chat.completions.create),
                         model="gpt-4",
                         messages=[{"role": "user", "content": enhancement_prompt}],
                         max_tokens=1500,
@@ -474,10 +596,9 @@ class EnhancedCryptoAgent:
             logger.error(f"응답 품질 향상 실패: {e}")
             return response
     
-    async def _generate_ai_conclusion(self, query: str, news: str, market: str, sentiment: str, trend: str) -> str:
-        """AI 종합 결론 생성"""
-        try:
-            conclusion_prompt = f"""다음 분석 결과들을 종합하여 전문가 수준의 결론을 생성해주세요.
+    def _build_conclusion_prompt(self, query: str, news: str, market: str, sentiment: str, trend: str) -> str:
+        """AI 종합 결론 프롬프트 생성 (일반/스트리밍 응답 공용)"""
+        conclusion_prompt = f"""다음 분석 결과들을 종합하여 전문가 수준의 결론을 생성해주세요.
 
 사용자 질문: "{query}"
 
@@ -494,8 +615,44 @@ class EnhancedCryptoAgent:
 
 결론:"""
 
+        return conclusion_prompt
+    
+    def _default_conclusion(self) -> str:
+        """AI 결론 생성 실패 시 기본 결론"""
+        return """**핵심 포인트:**
+• 다양한 데이터를 종합한 분석이 완료되었습니다
+• 시장 상황과 뉴스 동향을 반영한 인사이트를 제공했습니다
+• 기술적 지표와 심리적 요인을 고려한 분석을 수행했습니다
+
+**투자자 권고:**
+현재 분석된 정보를 바탕으로 신중한 투자 결정을 내리시기 바랍니다.
+
+**주의사항:**
+이 분석은 참고용이며, 투자 결정은 개인의 책임입니다."""
+    
+    def _stream_completion(self, prompt: str, model: str, max_tokens: int, temperature: float):
+        """OpenAI 스트리밍 응답을 토큰 단위로 반환 (블로킹 제너레이터 - 실행 계층에서 소비)"""
+        with track_external('openai', 'chat_stream'):
+            stream = self.openai_client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True
+            )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    
+    async def _generate_ai_conclusion(self, query: str, news: str, market: str, sentiment: str, trend: str) -> str:
+        """AI 종합 결론 생성"""
+        try:
+            conclusion_prompt = self._build_conclusion_prompt(query, news, market, sentiment, trend)
+
             try:
-                conclusion = self.openai_client.chat.completions.create(
+                conclusion = await execution_layer.run_blocking(
+                    'comprehensive_analysis',
+                    track_external('openai', 'chat')(self.openai_client.chat.completions.create),
                     model="gpt-3.5-turbo",
                     messages=[{"role": "user", "content": conclusion_prompt}],
                     max_tokens=500,
@@ -506,16 +663,7 @@ class EnhancedCryptoAgent:
                 
             except Exception as llm_error:
                 logger.warning(f"AI 결론 생성 실패: {llm_error}")
-                return """**핵심 포인트:**
-• 다양한 데이터를 종합한 분석이 완료되었습니다
-• 시장 상황과 뉴스 동향을 반영한 인사이트를 제공했습니다
-• 기술적 지표와 심리적 요인을 고려한 분석을 수행했습니다
-
-**투자자 권고:**
-현재 분석된 정보를 바탕으로 신중한 투자 결정을 내리시기 바랍니다.
-
-**주의사항:**
-이 분석은 참고용이며, 투자 결정은 개인의 책임입니다."""
+                return self._default_conclusion()
                 
         except Exception as e:
             logger.error(f"AI 결론 생성 실패: {e}")
@@ -535,12 +683,13 @@ class EnhancedCryptoAgent:
 한국어로 응답해주세요:"""
 
             try:
-                error_response = self.openai_client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[{"role": "user", "content": error_prompt}],
-                    max_tokens=300,
-                    temperature=0.4
-                )
+                with track_external('openai', 'chat'):
+                    error_response = self.openai_client.chat.completions.create(
+                        model="gpt-3.5-turbo",
+                        messages=[{"role": "user", "content": error_prompt}],
+                        max_tokens=300,
+                        temperature=0.4
+                    )
                 
                 return error_response.choices[0].message.content.strip()
                 
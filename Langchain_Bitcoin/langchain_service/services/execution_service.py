@@ -0,0 +1,276 @@
+"""
+실행 계층 (Execution Layer)
+동기 도구 호출(psycopg2, requests, plotly/kaleido)을 이벤트 루프 밖에서 실행
+
+- I/O 바운드 작업: 크기가 제한된 스레드 풀
+- CPU 바운드 작업 (차트 렌더링): 프로세스 풀
+- Intent별 동시 실행 제한 및 대기열 지표
+- 호출자가 취소/타임아웃(asyncio.wait_for)해도 스레드의 작업은 멈출 수 없으므로
+  작업이 실제로 끝날 때까지 Intent 슬롯을 유지 (반복 타임아웃이 스레드 풀을 고갈시키지 않도록)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, asdict
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Intent별 기본 동시 실행 제한 (차트는 무거우므로 적게, 가격 조회는 넉넉하게)
+DEFAULT_INTENT_LIMITS = {
+    'price_lookup': 16,
+    'news_sentiment': 8,
+    'historical_data': 4,
+    'technical_analysis': 2,
+    'comprehensive_analysis': 4,
+    'intent_classification': 16,
+    'news_search': 8,
+    'pipeline': 1,
+    'health': 4,
+    'cache': 16,
+    'session': 16,
+}
+
+
+@dataclass
+class IntentExecutionStats:
+    """Intent별 실행 통계"""
+    limit: int
+    waiting: int = 0
+    active: int = 0
+    completed: int = 0
+    failed: int = 0
+    abandoned: int = 0
+    max_waiting: int = 0
+    total_wait_seconds: float = 0.0
+    total_run_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (평균 대기/실행 시간 포함)"""
+        data = asdict(self)
+        finished = self.completed + self.failed
+        data['avg_wait_ms'] = round(self.total_wait_seconds / finished * 1000, 2) if finished else 0.0
+        data['avg_run_ms'] = round(self.total_run_seconds / finished * 1000, 2) if finished else 0.0
+        return data
+
+
+class ExecutionLayer:
+    """블로킹 작업을 위한 비동기 실행 계층"""
+
+    def __init__(self,
+                 max_workers: int = None,
+                 max_processes: int = None,
+                 intent_limits: Dict[str, int] = None):
+        """초기화"""
+        self.max_workers = max_workers or int(os.getenv('EXECUTION_MAX_WORKERS', 32))
+        self.max_processes = max_processes or int(os.getenv('EXECUTION_MAX_PROCESSES', 2))
+        self.default_limit = int(os.getenv('EXECUTION_DEFAULT_LIMIT', 8))
+
+        # Intent별 제한: 기본값 → 생성자 인자 → 환경변수 (EXECUTION_LIMIT_PRICE_LOOKUP=32 등)
+        self.intent_limits = dict(DEFAULT_INTENT_LIMITS)
+        if intent_limits:
+            self.intent_limits.update(intent_limits)
+        for intent in list(self.intent_limits):
+            env_value = os.getenv(f"EXECUTION_LIMIT_{intent.upper()}")
+            if env_value:
+                self.intent_limits[intent] = int(env_value)
+
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, IntentExecutionStats] = {}
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        """스레드 풀 반환 (지연 생성)"""
+        if self._thread_pool is None:
+            with self._pool_lock:
+                if self._thread_pool is None:
+                    self._thread_pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="exec-io"
+                    )
+                    logger.info(f"✅ 실행 계층 스레드 풀 생성: {self.max_workers}개")
+        return self._thread_pool
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """프로세스 풀 반환 (지연 생성, 스레드와 안전하게 공존하도록 spawn 사용)"""
+        if self._process_pool is None:
+            with self._pool_lock:
+                if self._process_pool is None:
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self.max_processes,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                    logger.info(f"✅ 실행 계층 프로세스 풀 생성: {self.max_processes}개")
+        return self._process_pool
+
+    def _limit_for(self, intent: str) -> int:
+        """Intent별 동시 실행 제한 반환"""
+        return self.intent_limits.get(intent, self.default_limit)
+
+    def _get_semaphore(self, intent: str) -> asyncio.Semaphore:
+        """Intent별 세마포어 반환"""
+        if intent not in self._semaphores:
+            self._semaphores[intent] = asyncio.Semaphore(self._limit_for(intent))
+        return self._semaphores[intent]
+
+    def _get_stats(self, intent: str) -> IntentExecutionStats:
+        """Intent별 통계 객체 반환"""
+        if intent not in self._stats:
+            self._stats[intent] = IntentExecutionStats(limit=self._limit_for(intent))
+        return self._stats[intent]
+
+    async def run_blocking(self, intent: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        동기(블로킹) 함수를 스레드 풀에서 실행
+
+        Args:
+            intent: 동시 실행 제한을 적용할 Intent 이름
+            func: 실행할 동기 함수
+        """
+        return await self._run(intent, self._get_thread_pool(), partial(func, *args, **kwargs))
+
+    async def run_cpu_bound(self, intent: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        CPU 바운드 함수를 프로세스 풀에서 실행
+        func와 인자는 pickle 가능해야 함 (모듈 최상위 함수)
+        """
+        return await self._run(intent, self._get_process_pool(), partial(func, *args, **kwargs))
+
+    async def iterate_blocking(self, intent: str, func: Callable, *args, **kwargs) -> AsyncIterator[Any]:
+        """
+        동기 제너레이터(LLM 스트리밍 등)를 스레드 풀에서 소비하며 항목을 도착 즉시 비동기로 전달
+        소비자가 중단하면 다음 항목에서 생산 스레드도 중단됨
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+        stop_requested = threading.Event()
+
+        def produce():
+            try:
+                for item in func(*args, **kwargs):
+                    if stop_requested.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, (item, None))
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, (finished, e))
+                return
+            loop.call_soon_threadsafe(queue.put_nowait, (finished, None))
+
+        producer = asyncio.ensure_future(self._run(intent, self._get_thread_pool(), produce))
+        # 소비자가 먼저 종료된 경우에도 생산자 예외가 유실 경고를 남기지 않도록 처리
+        producer.add_done_callback(lambda f: f.cancelled() or f.exception())
+        try:
+            while True:
+                item, error = await queue.get()
+                if item is finished:
+                    if error:
+                        raise error
+                    break
+                yield item
+        finally:
+            stop_requested.set()
+
+    def run_cpu_sync(self, func: Callable, *args, timeout: float = None, **kwargs) -> Any:
+        """
+        스레드 풀 안의 동기 코드에서 CPU 바운드 작업을 프로세스 풀로 위임
+        프로세스 풀을 사용할 수 없는 환경에서는 현재 스레드에서 직접 실행
+        """
+        try:
+            future = self._get_process_pool().submit(func, *args, **kwargs)
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            logger.warning(f"⚠️ 프로세스 풀 사용 불가, 현재 스레드에서 실행: {e}")
+            return func(*args, **kwargs)
+
+        try:
+            return future.result(timeout=timeout)
+        except BrokenProcessPool as e:
+            logger.warning(f"⚠️ 프로세스 풀 손상, 재생성 후 현재 스레드에서 실행: {e}")
+            with self._pool_lock:
+                self._process_pool = None
+            return func(*args, **kwargs)
+
+    async def _run(self, intent: str, executor, call: Callable) -> Any:
+        """세마포어로 동시 실행을 제한하며 executor에서 실행"""
+        stats = self._get_stats(intent)
+        semaphore = self._get_semaphore(intent)
+
+        queued_at = time.perf_counter()
+        stats.waiting += 1
+        stats.max_waiting = max(stats.max_waiting, stats.waiting)
+        try:
+            await semaphore.acquire()
+        finally:
+            stats.waiting -= 1
+
+        started_at = time.perf_counter()
+        stats.total_wait_seconds += started_at - queued_at
+        stats.active += 1
+        try:
+            future = asyncio.get_running_loop().run_in_executor(executor, call)
+        except Exception:
+            self._finish(stats, semaphore, started_at, failed=True)
+            raise
+
+        try:
+            result = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # 호출자만 취소됨 - 스레드는 계속 실행 중이므로 끝날 때 슬롯 반환
+            stats.abandoned += 1
+            future.add_done_callback(
+                lambda f: self._finish(stats, semaphore, started_at, failed=f.cancelled() or f.exception() is not None)
+            )
+            raise
+        except Exception:
+            self._finish(stats, semaphore, started_at, failed=True)
+            raise
+        self._finish(stats, semaphore, started_at, failed=False)
+        return result
+
+    @staticmethod
+    def _finish(stats: IntentExecutionStats, semaphore: asyncio.Semaphore, started_at: float, failed: bool):
+        """작업 종료 기록 및 Intent 슬롯 반환"""
+        if failed:
+            stats.failed += 1
+        else:
+            stats.completed += 1
+        stats.active -= 1
+        stats.total_run_seconds += time.perf_counter() - started_at
+        semaphore.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """실행 계층 통계 (대기열 깊이, 풀 사용률)"""
+        intents = {intent: stats.to_dict() for intent, stats in self._stats.items()}
+        active_total = sum(stats.active for stats in self._stats.values())
+        return {
+            'thread_pool_size': self.max_workers,
+            'process_pool_size': self.max_processes,
+            'active_total': active_total,
+            'queue_depth_total': sum(stats.waiting for stats in self._stats.values()),
+            'thread_pool_utilization': round(min(active_total / self.max_workers, 1.0), 3),
+            'intents': intents
+        }
+
+    def shutdown(self, wait: bool = False):
+        """풀 정리"""
+        with self._pool_lock:
+            if self._thread_pool:
+                self._thread_pool.shutdown(wait=wait, cancel_futures=True)
+                self._thread_pool = None
+            if self._process_pool:
+                self._process_pool.shutdown(wait=wait, cancel_futures=True)
+                self._process_pool = None
+        logger.info("🛑 실행 계층 종료")
+
+
+# 전역 실행 계층 인스턴스
+execution_layer = ExecutionLayer()
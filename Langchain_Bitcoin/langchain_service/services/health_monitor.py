@@ -0,0 +1,222 @@
+"""
+상태 모니터 (Health Monitor)
+의존성(Postgres, Redis, 파이프라인, 에이전트) 상태를 백그라운드에서 주기적으로 동시 점검하고
+/health, /ready 요청에는 마지막 스냅샷을 즉시 반환
+
+- 점검마다 타임아웃 적용 (느린 의존성이 점검 루프를 막지 않음)
+- 비용이 큰 통계(COUNT 쿼리)는 별도의 긴 주기로만 갱신
+- 이벤트 루프 지연(lag)을 함께 측정하여 /live에 노출
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .execution_service import execution_layer
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+STATUS_HEALTHY = 'healthy'
+STATUS_UNHEALTHY = 'unhealthy'
+STATUS_NOT_INITIALIZED = 'not_initialized'
+STATUS_TIMEOUT = 'timeout'
+STATUS_PENDING = 'pending'
+
+
+@dataclass
+class ProbeResult:
+    """단일 의존성 점검 결과"""
+    status: str = STATUS_PENDING
+    latency_ms: float = 0.0
+    checked_at: Optional[str] = None
+    error: Optional[str] = None
+    details: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (빈 필드 제외)"""
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+
+@dataclass
+class Probe:
+    """등록된 점검 항목"""
+    name: str
+    check: Callable[[], Awaitable[Any]]
+    critical: bool = True
+    timeout: float = 3.0
+    result: ProbeResult = field(default_factory=ProbeResult)
+
+
+def ping_redis() -> Optional[bool]:
+    """Redis 연결 확인 (블로킹, redis 패키지가 없으면 None)"""
+    if not REDIS_AVAILABLE:
+        return None
+    client = redis.Redis(
+        host=os.getenv('REDIS_HOST', 'localhost'),
+        port=int(os.getenv('REDIS_PORT', 6379)),
+        socket_connect_timeout=2,
+        socket_timeout=2
+    )
+    try:
+        return bool(client.ping())
+    finally:
+        client.close()
+
+
+class HealthMonitor:
+    """백그라운드 의존성 점검 및 상태 스냅샷 제공"""
+
+    def __init__(self, interval: float = None, stats_interval: float = None):
+        """초기화"""
+        self.interval = interval or float(os.getenv('HEALTH_PROBE_INTERVAL', 10))
+        self.stats_interval = stats_interval or float(os.getenv('HEALTH_STATS_INTERVAL', 300))
+        self._probes: Dict[str, Probe] = {}
+        self._stats_provider: Optional[Callable[[], Awaitable[Dict]]] = None
+        self._stats: Dict[str, Any] = {}
+        self._stats_refreshed_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._last_cycle_at: Optional[str] = None
+        self._loop_lag_ms = 0.0
+
+    def register(self, name: str, check: Callable[[], Awaitable[Any]], critical: bool = True, timeout: float = 3.0):
+        """
+        점검 항목 등록
+
+        Args:
+            name: 의존성 이름
+            check: 점검 코루틴 함수 (True/False, 상세 dict, 미초기화 시 None 반환)
+            critical: /ready 판단에 포함할지 여부
+            timeout: 점검 타임아웃 (초)
+        """
+        self._probes[name] = Probe(name=name, check=check, critical=critical, timeout=timeout)
+
+    def set_stats_provider(self, provider: Callable[[], Awaitable[Dict]]):
+        """긴 주기로 갱신할 통계 조회 함수 등록"""
+        self._stats_provider = provider
+
+    async def start(self):
+        """백그라운드 점검 시작 (첫 점검은 즉시 수행)"""
+        if self._task and not self._task.done():
+            return
+        await self.run_probes()
+        self._task = asyncio.create_task(self._loop())
+        logger.info(f"🏥 상태 모니터 시작: {self.interval}초 주기, 점검 {len(self._probes)}개")
+
+    async def stop(self):
+        """백그라운드 점검 중지"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _loop(self):
+        """주기적 점검 루프 (sleep 지연으로 이벤트 루프 lag 측정)"""
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self._loop_lag_ms = round(max(time.perf_counter() - expected, 0.0) * 1000, 2)
+            try:
+                await self.run_probes()
+                await self._refresh_stats()
+            except Exception as e:
+                logger.error(f"❌ 상태 점검 루프 오류: {e}")
+
+    async def run_probes(self):
+        """등록된 점검을 동시에 실행"""
+        await asyncio.gather(*(self._run_probe(probe) for probe in self._probes.values()))
+        self._last_cycle_at = datetime.now().isoformat()
+
+    async def _run_probe(self, probe: Probe):
+        """단일 점검 실행 (타임아웃/예외를 상태로 변환)"""
+        started = time.perf_counter()
+        result = ProbeResult()
+        try:
+            outcome = await asyncio.wait_for(probe.check(), timeout=probe.timeout)
+            if outcome is None:
+                result.status = STATUS_NOT_INITIALIZED
+            elif isinstance(outcome, dict):
+                result.status = STATUS_HEALTHY
+                result.details = outcome
+            else:
+                result.status = STATUS_HEALTHY if outcome else STATUS_UNHEALTHY
+        except asyncio.TimeoutError:
+            result.status = STATUS_TIMEOUT
+            result.error = f"no response within {probe.timeout}s"
+        except Exception as e:
+            result.status = STATUS_UNHEALTHY
+            result.error = str(e)
+
+        result.latency_ms = round((time.perf_counter() - started) * 1000, 2)
+        result.checked_at = datetime.now().isoformat()
+
+        if result.status != probe.result.status and probe.result.status != STATUS_PENDING:
+            logger.warning(f"🏥 상태 변경: {probe.name} {probe.result.status} → {result.status}")
+        probe.result = result
+
+    async def _refresh_stats(self, force: bool = False):
+        """비용이 큰 통계를 긴 주기로 갱신"""
+        if not self._stats_provider:
+            return
+        if not force and time.monotonic() - self._stats_refreshed_at < self.stats_interval:
+            return
+        self._stats_refreshed_at = time.monotonic()
+        try:
+            stats = await self._stats_provider()
+            if stats:
+                self._stats = stats
+        except Exception as e:
+            logger.debug(f"통계 갱신 실패: {e}")
+
+    def status_of(self, name: str) -> str:
+        """의존성 상태 문자열"""
+        probe = self._probes.get(name)
+        return probe.result.status if probe else STATUS_NOT_INITIALIZED
+
+    def is_ready(self) -> bool:
+        """필수 의존성이 모두 정상인지 여부"""
+        return all(
+            probe.result.status == STATUS_HEALTHY
+            for probe in self._probes.values() if probe.critical
+        )
+
+    def liveness(self) -> Dict[str, Any]:
+        """프로세스 생존 정보 (의존성 점검 없음)"""
+        running = self._task is not None and not self._task.done()
+        return {
+            'status': 'alive',
+            'monitor_running': running,
+            'event_loop_lag_ms': self._loop_lag_ms,
+            'last_probe_cycle': self._last_cycle_at
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """마지막 점검 스냅샷"""
+        return {
+            'ready': self.is_ready(),
+            'last_probe_cycle': self._last_cycle_at,
+            'probe_interval_seconds': self.interval,
+            'checks': {name: probe.result.to_dict() for name, probe in self._probes.items()},
+            'database_stats': self._stats
+        }
+
+
+async def probe_redis() -> Optional[bool]:
+    """Redis 점검 (스레드 풀에서 실행)"""
+    return await execution_layer.run_blocking('health', ping_redis)
+
+
+# 전역 상태 모니터 인스턴스
+health_monitor = HealthMonitor()
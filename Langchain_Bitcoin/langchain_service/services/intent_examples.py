@@ -0,0 +1,347 @@
+"""
+Intent 예시 문장 / 로컬 분류기 학습 · 평가 데이터
+
+- INTENT_EXAMPLES: 임베딩 분류 인덱스 예시 (바꾸면 Intent 인덱스가 다시 생성됨)
+- LOCAL_TRAINING_EXAMPLES: 로컬 n-gram 분류기에만 추가로 쓰는 학습 문장 (임베딩 호출 없음)
+- EVALUATION_EXAMPLES: 학습에 쓰지 않는 평가 문장 (evaluate_intent_classifier.py - 정확도 / 로컬 처리 비율)
+- OUT_OF_DOMAIN_EXAMPLES: 의미 없는 입력 (세션 상태를 바꾸는 Intent로 분류되면 안 됨)
+"""
+
+from typing import Dict, List
+
+# Intent 분류를 위한 예시 문장들 (Sentence Embedding용)
+INTENT_EXAMPLES = {
+    'news_sentiment': [
+        '비트코인 최신뉴스 알려줘',
+        '암호화폐 관련 소식이 궁금해',
+        '비트코인 뉴스 요약해줘',
+        '최근 비트코인 기사 보여줘',
+        '비트코인 트럼프 관련 뉴스',
+        '코인 시장 분석 기사',
+        'Bitcoin latest news please',
+        'crypto news headlines today'
+    ],
+    'price_lookup': [
+        '비트코인 지금 얼마야?',
+        'BTC 현재 가격이 궁금해',
+        '비트코인 시세 알려줘',
+        '암호화폐 가격 확인하고 싶어',
+        '비트코인 값 얼마인지 알려줘',
+        '코인 현재 시세 보여줘',
+        'What is Bitcoin price now?',
+        'How much is BTC today?'
+    ],
+    'historical_data': [
+        '어제 비트코인 종가가 어땠어?',
+        '과거 비트코인 데이터 보고 싶어',
+        '지난주 암호화폐 시세는?',
+        '이전 가격 정보 알려줘',
+        '작년 비트코인 최고가는?',
+        '과거 통계 데이터 확인하고 싶어',
+        'Yesterday Bitcoin closing price',
+        'Historical crypto data'
+    ],
+    'technical_analysis': [
+        '20일 이평선과 현재 가격 차이 보여줘',
+        '비트코인 차트 분석해줘',
+        '기술적 지표 확인하고 싶어',
+        'RSI 지수는 어떻게 돼?',
+        'MACD 패턴 분석 부탁해',
+        '추세선 분석 결과는?',
+        'Bitcoin technical analysis',
+        'Chart pattern analysis'
+    ],
+    'casual_chat': [
+        '안녕하세요',
+        '고마워요',
+        '도움이 되었어요',
+        '안녕히 가세요',
+        '반갑습니다',
+        '오늘 날씨 어때요?',
+        'Hello there',
+        'Thank you so much',
+        'Good morning',
+        'How are you?'
+    ],
+    'language_change': [
+        '아니 한글말고 영어로 대답해줘',
+        '영어로 답변해줘',
+        '영어로 말해줘',
+        'Please answer in English',
+        'Switch to English',
+        'Respond in English'
+    ]
+}
+
+LOCAL_TRAINING_EXAMPLES: Dict[str, List[str]] = {
+    'news_sentiment': [
+        '비트코인 뉴스',
+        '코인 뉴스 알려줘',
+        '오늘 암호화폐 뉴스 뭐 있어?',
+        '비트코인 관련 최신 소식',
+        '이더리움 뉴스 보여줘',
+        '리플 관련 기사 찾아줘',
+        '솔라나 소식 있어?',
+        '최근 코인 시장 소식 요약',
+        'ETF 승인 관련 뉴스',
+        '미국 규제 관련 코인 뉴스',
+        '반감기 관련 기사 보여줘',
+        '비트코인 호재 뉴스 있어?',
+        '악재 소식 알려줘',
+        '시장 분위기 어때? 뉴스 기준으로',
+        '코인 헤드라인 정리해줘',
+        '거래소 해킹 뉴스',
+        '트럼프 코인 발언 기사',
+        '비트코인 관련 소식 좀 알려줄래',
+        '뉴스 감성 분석해줘',
+        'latest crypto news',
+        'Bitcoin news today',
+        'any news about Ethereum?',
+        'show me recent bitcoin articles',
+        'what are the headlines in crypto',
+        'news sentiment for BTC'
+    ],
+    'price_lookup': [
+        '비트코인 가격',
+        '비트코인 얼마?',
+        'BTC 시세',
+        '이더리움 지금 얼마야',
+        'ETH 가격 알려줘',
+        '리플 시세 알려줘',
+        'XRP 얼마야',
+        '솔라나 현재가',
+        '도지코인 가격 궁금해',
+        '코인 가격 알려줘',
+        '비트코인 원화 가격',
+        '업비트 비트코인 시세',
+        '지금 비트 얼마임',
+        '현재 코인 시세 어때',
+        '비트코인 시가총액 알려줘',
+        '이더 가격 확인',
+        '에이다 가격',
+        '비트코인 24시간 변동률',
+        '비트코인 지금 올랐어?',
+        'BTC price',
+        'ETH price now',
+        'how much is ethereum',
+        'current price of XRP',
+        'bitcoin price in KRW',
+        'what is the price of solana'
+    ],
+    'historical_data': [
+        '어제 비트코인 가격',
+        '어제 종가 알려줘',
+        '지난달 비트코인 시세',
+        '일주일 전 비트코인 가격',
+        '작년 이맘때 비트코인 얼마였어',
+        '2021년 비트코인 최고가',
+        '지난주 이더리움 가격 변화',
+        '한 달 전 시세 알려줘',
+        '과거 가격 추이 보여줘',
+        '최근 30일 가격 기록',
+        '지난 1년 비트코인 가격 변화',
+        '역대 최고가 언제였어?',
+        '어제 대비 얼마나 올랐어',
+        '이전 최저가 알려줘',
+        '과거 거래 데이터',
+        '작년 12월 비트코인 가격',
+        '지난 분기 수익률',
+        '예전 시세 기록 보고 싶어',
+        'bitcoin price yesterday',
+        'last week BTC price',
+        'historical ethereum prices',
+        'price history of bitcoin',
+        'all time high of bitcoin',
+        'what was BTC last month',
+        'past 30 days price data'
+    ],
+    'technical_analysis': [
+        '비트코인 차트',
+        '차트 보여줘',
+        'BTC 차트',
+        '이더리움 차트 분석',
+        'RSI 지표 보여줘',
+        'RSI 과매수야?',
+        'MACD 알려줘',
+        '볼린저 밴드 분석',
+        '이동평균선 보여줘',
+        '5일 이평선',
+        '골든크로스 나왔어?',
+        '지지선 저항선 알려줘',
+        '캔들 차트 보여줘',
+        '거래량 분석해줘',
+        '기술적 분석 해줘',
+        '추세 분석',
+        '일봉 차트',
+        '4시간봉 분석',
+        '스토캐스틱 지표',
+        '종합 분석 부탁해',
+        'BTC chart',
+        'show me the bitcoin chart',
+        'RSI for ethereum',
+        'moving average analysis',
+        'support and resistance levels'
+    ],
+    'casual_chat': [
+        '안녕',
+        '하이',
+        '감사합니다',
+        '고마워',
+        '잘 지내?',
+        '넌 누구야?',
+        '뭐 할 수 있어?',
+        '좋은 하루 보내',
+        '수고했어',
+        '잘 자',
+        '배고프다',
+        '오늘 기분 좋아',
+        '심심해',
+        '재밌는 얘기 해줘',
+        '너 이름이 뭐야',
+        '도와줘서 고마워',
+        '반가워',
+        '좋은 아침이에요',
+        'hi',
+        'thanks',
+        'who are you',
+        'what can you do',
+        'nice to meet you',
+        'good night',
+        'bye'
+    ],
+    'language_change': [
+        '영어로 대답해줘',
+        '영어로 해줘',
+        '영어로 바꿔줘',
+        '앞으로 영어로 답해줘',
+        '답변 영어로 부탁해',
+        '한국어 말고 영어로',
+        '영어로 설명해줘',
+        '영어로 얘기해',
+        'answer in English',
+        'English please',
+        'reply in English',
+        'speak English',
+        'can you respond in English?',
+        'change language to English',
+        'use English from now on'
+    ]
+}
+
+EVALUATION_EXAMPLES: Dict[str, List[str]] = {
+    'news_sentiment': [
+        '최신 비트코인 뉴스',
+        '비트코인 뉴스 좀 보여줘',
+        '요즘 코인 관련 소식 뭐야',
+        '이더리움 관련 최신 기사',
+        '오늘 나온 암호화폐 기사 요약해줘',
+        '비트코인 ETF 뉴스 있어?',
+        '코인 시장 뉴스 감성 어때',
+        '리플 소송 관련 소식',
+        '최근 규제 뉴스 알려줘',
+        '트럼프 비트코인 뉴스',
+        'recent crypto headlines',
+        'give me the latest bitcoin news',
+        'news about solana',
+        'what is happening in crypto news'
+    ],
+    'price_lookup': [
+        '비트코인 가격 알려줘',
+        '이더리움 가격',
+        'BTC 지금 얼마',
+        '비트코인 현재 시세 알려줘',
+        '리플 얼마야?',
+        '솔라나 가격 알려줘',
+        '도지 시세',
+        '지금 이더 얼마임',
+        '비트코인 값 알려줘',
+        '코인 시세 좀',
+        'bitcoin price now',
+        'how much is BTC',
+        'ETH current price',
+        'price of dogecoin'
+    ],
+    'historical_data': [
+        '어제 비트코인 종가',
+        '지난주 비트코인 가격 알려줘',
+        '한 달 전 이더리움 가격',
+        '작년 비트코인 최고가 얼마였어',
+        '과거 시세 보여줘',
+        '최근 일주일 가격 기록',
+        '어제 이더리움 얼마였어',
+        '비트코인 역대 최고가',
+        '지난해 가격 변화 알려줘',
+        '3개월 전 비트코인 가격',
+        'bitcoin price last week',
+        'yesterday ETH closing price',
+        'BTC price history',
+        'what was bitcoin worth last year'
+    ],
+    'technical_analysis': [
+        'BTC 차트 보여줘',
+        'RSI 알려줘',
+        '비트코인 RSI 지금 몇이야',
+        '이더리움 MACD 분석',
+        '비트코인 이동평균선 분석해줘',
+        '20일 이평선 보여줘',
+        '볼린저 밴드 어때',
+        '비트코인 기술적 분석',
+        '차트 패턴 분석해줘',
+        '거래량 차트 보여줘',
+        'bitcoin chart analysis',
+        'show BTC chart',
+        'MACD for bitcoin',
+        'technical indicators for ETH'
+    ],
+    'casual_chat': [
+        '안녕하세요 반가워요',
+        '고맙습니다',
+        '잘 있어',
+        '오늘 날씨 좋네',
+        '너는 뭐 하는 봇이야?',
+        '심심한데 얘기하자',
+        '좋은 저녁이에요',
+        '고마워 큰 도움 됐어',
+        '수고하셨습니다',
+        '하이 반가워',
+        'hello',
+        'thank you',
+        'good morning to you',
+        'how is it going'
+    ],
+    'language_change': [
+        '영어로 답해줘',
+        '이제부터 영어로 말해줘',
+        '영어로 대답 부탁해',
+        '한글 말고 영어로 해줘',
+        '영어로 바꿔서 말해줘',
+        'please reply in English',
+        'answer me in English',
+        'switch language to English',
+        'English only please',
+        'can you speak English'
+    ]
+}
+
+OUT_OF_DOMAIN_EXAMPLES: List[str] = [
+    'asdfgh',
+    '1234',
+    'ㅋㅋㅋㅋ',
+    'qwerty uiop',
+    '...',
+    'ㅎㅎ',
+    'zxcv',
+    '?????',
+    'lorem ipsum dolor',
+    '아아아아'
+]
+
+
+def merge_examples(*example_sets: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Intent별 예시 문장 합치기 (순서 유지, 중복 제거)"""
+    merged: Dict[str, List[str]] = {}
+    for examples in example_sets:
+        for intent, texts in examples.items():
+            merged.setdefault(intent, [])
+            merged[intent].extend(text for text in texts if text not in merged[intent])
+    return merged
@@ -0,0 +1,178 @@
+"""
+Intent 예시 임베딩 인덱스
+Intent 예시 문장 임베딩을 정규화된 행렬로 보관하여 분류를 행렬-벡터 곱 1회로 수행
+
+- 디스크(.npz)에 (모델, 예시 문장 집합) 해시 단위로 저장 → 재시작 시 임베딩 호출 없음
+- 예시 문장이나 임베딩 모델이 바뀌면 해시가 달라져 새로 생성
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_DIR = Path(__file__).parent.parent / '.cache' / 'intent_index'
+
+
+def example_set_key(model: str, intent_examples: Dict[str, List[str]]) -> str:
+    """(모델, Intent 예시 문장 집합) 해시"""
+    payload = json.dumps([model, intent_examples], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class IntentIndex:
+    """정규화된 예시 임베딩 행렬 (같은 Intent의 예시는 연속된 행)"""
+
+    def __init__(self, model: str, key: str, intents: List[str], examples: List[str],
+                 labels: np.ndarray, matrix: np.ndarray):
+        self.model = model
+        self.key = key
+        self.intents = intents
+        self.examples = examples
+        self.labels = labels
+        self.matrix = matrix
+        # Intent별 첫 행 위치 (Intent별 최대 유사도를 reduceat으로 계산)
+        self._offsets = np.searchsorted(labels, np.arange(len(intents)))
+
+    @classmethod
+    def build(cls, model: str, intent_examples: Dict[str, List[str]], vectors: List[List[float]]) -> 'IntentIndex':
+        """예시 임베딩(Intent 순서대로 펼친 목록)으로 인덱스 생성"""
+        intents = [intent for intent, examples in intent_examples.items() if examples]
+        examples = [example for intent in intents for example in intent_examples[intent]]
+        labels = np.asarray([i for i, intent in enumerate(intents) for _ in intent_examples[intent]], dtype=np.int32)
+        matrix = _normalize_rows(np.asarray(vectors, dtype=np.float32))
+        if len(matrix) != len(examples):
+            raise ValueError(f"예시 수({len(examples)})와 임베딩 수({len(matrix)})가 다릅니다")
+        return cls(model, example_set_key(model, intent_examples), intents, examples, labels, matrix)
+
+    @property
+    def size(self) -> int:
+        return len(self.examples)
+
+    def classify(self, vector: List[float], top_k: int = 3) -> Dict[str, Any]:
+        """입력 임베딩 1개 분류"""
+        return self.classify_many([vector], top_k)[0]
+
+    def classify_many(self, vectors: List[List[float]], top_k: int = 3) -> List[Dict[str, Any]]:
+        """
+        입력 임베딩 여러 개를 행렬 곱 1회로 분류
+
+        Returns:
+            입력별 {intent, similarity, similarities(Intent별 최대), best_example, top_examples}
+        """
+        queries = _normalize_rows(np.asarray(vectors, dtype=np.float32))
+        scores = queries @ self.matrix.T                                   # (입력 수, 예시 수)
+        per_intent = np.maximum.reduceat(scores, self._offsets, axis=1)   # (입력 수, Intent 수)
+        k = min(top_k, self.size)
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+        results = []
+        for row, intent_scores, candidates in zip(scores, per_intent, top):
+            best = int(intent_scores.argmax())
+            ranked = candidates[np.argsort(-row[candidates])]
+            results.append({
+                'intent': self.intents[best],
+                'similarity': float(intent_scores[best]),
+                'similarities': {intent: float(score) for intent, score in zip(self.intents, intent_scores)},
+                'best_example': self.examples[int(ranked[0])],
+                'top_examples': [
+                    {'intent': self.intents[self.labels[i]], 'example': self.examples[i], 'similarity': float(row[i])}
+                    for i in ranked
+                ]
+            })
+        return results
+
+    def save(self, path: Path):
+        """원자적 저장 (임시 파일 기록 후 교체 - 여러 워커가 동시에 저장해도 손상 없음)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.npz.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(
+                    f,
+                    model=np.asarray(self.model),
+                    key=np.asarray(self.key),
+                    intents=np.asarray(self.intents),
+                    examples=np.asarray(self.examples),
+                    labels=self.labels,
+                    matrix=self.matrix
+                )
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: Path, expected_key: str) -> Optional['IntentIndex']:
+        """저장된 인덱스 로드 (해시가 다르거나 손상되면 None)"""
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data['key']) != expected_key:
+                    return None
+                return cls(str(data['model']), str(data['key']), data['intents'].tolist(),
+                           data['examples'].tolist(), data['labels'], data['matrix'])
+        except Exception as e:
+            logger.warning(f"⚠️ Intent 인덱스 로드 실패 ({path.name}), 새로 생성: {e}")
+            return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'model': self.model,
+            'key': self.key[:16],
+            'intents': len(self.intents),
+            'examples': self.size,
+            'dimension': int(self.matrix.shape[1]) if self.size else 0
+        }
+
+
+def index_path(model: str, key: str, index_dir: Path = None) -> Path:
+    """인덱스 파일 경로 (INTENT_INDEX_DIR, 파일명에 모델과 해시 포함)"""
+    directory = Path(index_dir or os.getenv('INTENT_INDEX_DIR') or DEFAULT_INDEX_DIR)
+    return directory / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', model)}-{key[:16]}.npz"
+
+
+def load_or_build_index(model: str,
+                        intent_examples: Dict[str, List[str]],
+                        embed_many: Callable[[List[str]], List[List[float]]],
+                        index_dir: Path = None) -> Tuple[IntentIndex, str]:
+    """
+    디스크의 인덱스를 로드하거나 없으면 임베딩하여 생성 후 저장 (블로킹)
+
+    Returns:
+        (인덱스, 'disk' 또는 'built')
+    """
+    key = example_set_key(model, intent_examples)
+    path = index_path(model, key, index_dir)
+
+    started = time.perf_counter()
+    index = IntentIndex.load(path, key)
+    if index is not None:
+        logger.info(f"✅ Intent 인덱스 로드: {path.name} ({index.size}개 예시, {(time.perf_counter() - started) * 1000:.1f}ms)")
+        return index, 'disk'
+
+    flat = [example for examples in intent_examples.values() for example in examples]
+    index = IntentIndex.build(model, intent_examples, embed_many(flat))
+    try:
+        index.save(path)
+        logger.info(f"💾 Intent 인덱스 저장: {path}")
+    except Exception as e:
+        logger.warning(f"⚠️ Intent 인덱스 저장 실패 (다음 시작 시 다시 생성): {e}")
+    return index, 'built'
@@ -0,0 +1,230 @@
+"""
+백그라운드 작업 관리 (뉴스 파이프라인 실행)
+수 분이 걸리는 수집 → 전처리 → 저장 작업을 HTTP 연결과 분리하여 실행하고 진행 상황을 조회
+
+- 제출 즉시 작업 ID 반환, 실제 작업은 실행 계층 'pipeline' 스레드에서 수행 (스레드를 얻기 전까지 queued)
+- 단계별 진행률 / 건수 / 오류를 /pipeline/jobs/{id}로 조회
+- 같은 그룹에 종류와 인자가 같은 작업이 대기/실행 중이면 그 작업에 병합,
+  인자가 다르면 새 작업으로 등록하고 앞선 작업이 끝난 뒤 실행
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .execution_service import execution_layer
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_SUCCEEDED = 'succeeded'
+JOB_FAILED = 'failed'
+
+STAGE_PENDING = 'pending'
+STAGE_RUNNING = 'running'
+STAGE_COMPLETED = 'completed'
+STAGE_SKIPPED = 'skipped'
+STAGE_FAILED = 'failed'
+
+
+class Job:
+    """백그라운드 작업 (진행 상황은 작업 스레드에서 갱신되므로 잠금으로 보호)"""
+
+    def __init__(self, kind: str, group: str, params: Dict[str, Any], stages: List[str]):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.group = group
+        self.params = params
+        self.status = JOB_QUEUED
+        self.current_stage: Optional[str] = None
+        self.stages: Dict[str, Dict[str, Any]] = OrderedDict(
+            (stage, {'status': STAGE_PENDING}) for stage in stages
+        )
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.merged_requests = 0
+        self.created_at = datetime.now().isoformat()
+        self.started_at: Optional[str] = None
+        self.finished_at: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        """실행 대기 또는 실행 중 여부"""
+        return self.status in (JOB_QUEUED, JOB_RUNNING)
+
+    def report_progress(self, stage: str, status: str = STAGE_RUNNING, **info):
+        """
+        단계 진행 상황 갱신 (파이프라인의 progress_callback, 작업 스레드에서 호출)
+
+        Args:
+            stage: 단계 이름
+            status: running / completed / skipped / failed
+            info: 건수 등 단계별 정보 (예: done=10, total=50)
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            entry = self.stages.setdefault(stage, {'status': STAGE_PENDING})
+            if entry['status'] == STAGE_PENDING:
+                entry['started_at'] = now
+            if status in (STAGE_COMPLETED, STAGE_SKIPPED, STAGE_FAILED):
+                entry['finished_at'] = now
+            entry['status'] = status
+            entry.update(info)
+            self.current_stage = stage
+
+    def mark_running(self):
+        """실행 시작 기록 (실행 계층 스레드를 얻은 시점, 작업 스레드에서 호출)"""
+        self.status = JOB_RUNNING
+        self.started_at = datetime.now().isoformat()
+
+    def fail_running_stages(self, error: str):
+        """작업 실패 시 진행 중이던 단계를 실패로 표시"""
+        now = datetime.now().isoformat()
+        with self._lock:
+            for entry in self.stages.values():
+                if entry['status'] == STAGE_RUNNING:
+                    entry.update(status=STAGE_FAILED, finished_at=now, error=error)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """조회용 딕셔너리"""
+        with self._lock:
+            stages = {name: dict(entry) for name, entry in self.stages.items()}
+        completed = sum(1 for entry in stages.values() if entry['status'] in (STAGE_COMPLETED, STAGE_SKIPPED))
+        data = {
+            'job_id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'params': self.params,
+            'current_stage': self.current_stage,
+            'progress': round(completed / len(stages), 2) if stages else None,
+            'stages': stages,
+            'merged_requests': self.merged_requests,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+        if self.result is not None:
+            data['result'] = self.result
+        if self.error:
+            data['error'] = self.error
+        return data
+
+
+class JobManager:
+    """백그라운드 작업 제출 / 조회 / 중복 실행 병합"""
+
+    def __init__(self, history_limit: int = None):
+        """초기화"""
+        self.history_limit = history_limit or int(os.getenv('JOB_HISTORY_LIMIT', 50))
+        self._jobs: 'OrderedDict[str, Job]' = OrderedDict()
+        # 그룹별 마지막으로 제출된 작업 (다음 작업은 이 작업이 끝난 뒤 실행)
+        self._active_by_group: Dict[str, Job] = {}
+
+    def submit(self,
+               kind: str,
+               func: Callable[..., Dict[str, Any]],
+               params: Dict[str, Any],
+               stages: List[str],
+               group: Optional[str] = None,
+               execution_intent: str = 'pipeline') -> Tuple[Job, bool]:
+        """
+        작업 제출 (같은 그룹에 종류와 인자가 같은 작업이 대기/실행 중이면 그 작업을 반환)
+
+        Args:
+            kind: 작업 종류 (예: pipeline_run)
+            func: 블로킹 작업 함수 (progress_callback 키워드 인자를 받아야 함)
+            params: 작업 함수 인자
+            stages: 진행률 계산용 단계 이름 목록
+            group: 동시 실행을 막을 그룹 (기본값: kind)
+            execution_intent: 실행 계층 Intent
+
+        Returns:
+            (작업, 새로 생성 여부)
+        """
+        group = group or kind
+        for existing in self._jobs.values():
+            if existing.active and existing.group == group and existing.kind == kind and existing.params == params:
+                existing.merged_requests += 1
+                logger.info(f"🔁 진행 중인 작업에 병합: {existing.kind} {existing.id}")
+                return existing, False
+
+        previous = self._active_by_group.get(group)
+        job = Job(kind, group, params, stages)
+        self._jobs[job.id] = job
+        self._active_by_group[group] = job
+        self._trim_history()
+
+        after = previous.task if previous and previous.active else None
+        job.task = asyncio.create_task(self._run(job, func, execution_intent, after))
+        logger.info(f"📋 작업 제출: {kind} {job.id} {params}" + (f" (대기: {previous.id})" if after else ""))
+        return job, True
+
+    async def _run(self, job: Job, func: Callable[..., Dict[str, Any]], execution_intent: str,
+                   after: Optional[asyncio.Task] = None):
+        """작업 실행 (앞선 같은 그룹 작업 종료 대기 → 실행 계층 스레드에서 블로킹 함수 호출)"""
+        def run():
+            job.mark_running()
+            return func(progress_callback=job.report_progress, **job.params)
+
+        try:
+            if after:
+                await asyncio.wait([after])
+            job.result = await execution_layer.run_blocking(execution_intent, run)
+            job.status = JOB_SUCCEEDED
+            logger.info(f"✅ 작업 완료: {job.kind} {job.id}")
+        except Exception as e:
+            job.status = JOB_FAILED
+            job.error = str(e)
+            job.fail_running_stages(job.error)
+            logger.error(f"❌ 작업 실패: {job.kind} {job.id} - {e}")
+        finally:
+            job.finished_at = datetime.now().isoformat()
+            if self._active_by_group.get(job.group) is job:
+                del self._active_by_group[job.group]
+
+    def _trim_history(self):
+        """완료된 오래된 작업부터 제거"""
+        while len(self._jobs) > self.history_limit:
+            for job_id, job in self._jobs.items():
+                if not job.active:
+                    del self._jobs[job_id]
+                    break
+            else:
+                return
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """작업 조회"""
+        return self._jobs.get(job_id)
+
+    def list_jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """최근 작업 목록 (최신순)"""
+        return [job.to_dict() for job in list(self._jobs.values())[::-1][:limit]]
+
+    async def wait(self, job: Job, timeout: float = None) -> Job:
+        """작업 완료 대기 (요청이 취소되어도 작업은 계속 실행)"""
+        if job.task:
+            await asyncio.wait_for(asyncio.shield(job.task), timeout=timeout)
+        return job
+
+    def get_stats(self) -> Dict[str, Any]:
+        """작업 통계"""
+        counts: Dict[str, int] = {}
+        for job in self._jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            'tracked_jobs': len(self._jobs),
+            'active_groups': [group for group, job in self._active_by_group.items() if job.active],
+            'by_status': counts
+        }
+
+
+# 전역 작업 관리자 인스턴스
+job_manager = JobManager()
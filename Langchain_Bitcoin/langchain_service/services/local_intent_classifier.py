@@ -0,0 +1,308 @@
+"""
+로컬 Intent 분류기
+문자 n-gram TF-IDF + 다항 로지스틱 회귀(softmax, L2)로 네트워크 호출 없이 Intent 분류
+
+- 학습 데이터: Intent 예시 문장 + 로컬 학습 문장(intent_examples) + 운영 트래픽 기록(임베딩 분류 결과, 수동 교정 포함)
+- 신뢰도 보정: 교차 검증 예측으로 온도(temperature)를 맞춰 확률이 실제 정답률에 가깝도록 조정
+  (학습 문장이 LOCAL_INTENT_CALIBRATION_SAMPLES보다 많으면 그만큼만 표본으로 교차 검증 - 시작 시간 제한)
+- 임계값: 교차 검증 예측의 신뢰도별 정밀도(precision)에서 목표 정밀도를 만족하는 가장 낮은 신뢰도 (threshold)
+  - LOCAL_INTENT_PRECISION (기본값 0.95): 신뢰도가 그 이상이면 원격 임베딩 분류를 생략
+  - LOCAL_INTENT_FALLBACK_PRECISION (기본값 0.9): 임베딩 분류를 쓸 수 없을 때 / 요청 처리 전 빠른 분류에서 사용
+- 평가: evaluate_intent_classifier.py (학습에 쓰지 않은 평가 문장의 정확도 / 로컬 처리 비율)
+
+트래픽 기록 (INTENT_TRAFFIC_LOG, JSON Lines: {"text", "intent", "source", "score"})
+- 사용자 질문 원문이 저장되므로 경로를 지정했을 때만 기록 (기본값: 기록 안 함, 예: .cache/intent_traffic.jsonl)
+- 임베딩 분류 유사도가 INTENT_TRAFFIC_MIN_SIMILARITY 이상인 질문을 기록하여 다음 시작 시 학습
+- INTENT_TRAFFIC_LOG_MAX_BYTES를 넘으면 <경로>.1로 교체 (이전 .1은 삭제, 학습은 두 파일 모두 사용)
+- 같은 문장은 마지막 기록의 Intent 사용 (수동 교정 줄을 추가하면 덮어씀)
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter as TermCounter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NGRAM_RANGE = (1, 4)
+MAX_FEATURES = int(os.getenv('LOCAL_INTENT_MAX_FEATURES', 50000))
+L2_PENALTY = float(os.getenv('LOCAL_INTENT_L2', 1e-3))
+TRAIN_ITERATIONS = 100
+LEARNING_RATE = 0.5
+CALIBRATION_FOLDS = 5
+CALIBRATION_MAX_SAMPLES = int(os.getenv('LOCAL_INTENT_CALIBRATION_SAMPLES', 2000))
+TEMPERATURE_GRID = np.geomspace(0.01, 100.0, 121)
+SERVING_PRECISION = float(os.getenv('LOCAL_INTENT_PRECISION', 0.95))
+FALLBACK_PRECISION = float(os.getenv('LOCAL_INTENT_FALLBACK_PRECISION', 0.9))
+# 임계값 하한 (교차 검증 문장이 적어 정밀도 곡선이 낙관적일 때도 과반 확률 미만은 사용하지 않음)
+MIN_THRESHOLD = 0.5
+
+_PUNCTUATION = re.compile(r"[?!.,~'\"()\[\]]+")
+_WHITESPACE = re.compile(r'\s+')
+
+
+def char_ngrams(text: str) -> List[str]:
+    """정규화한 문장의 문자 n-gram (공백 포함, 단어 경계 정보 유지)"""
+    normalized = _WHITESPACE.sub(' ', _PUNCTUATION.sub(' ', text.lower())).strip()
+    padded = f" {normalized} "
+    return [
+        padded[i:i + n]
+        for n in range(NGRAM_RANGE[0], NGRAM_RANGE[1] + 1)
+        for i in range(len(padded) - n + 1)
+        if padded[i:i + n].strip()
+    ]
+
+
+class _Features:
+    """희소 입력 묶음 (행별로 등장한 n-gram 어휘 번호와 IDF 가중치, 행마다 L2 정규화)"""
+
+    def __init__(self, vocabulary: Dict[str, int], idf: np.ndarray, texts: Sequence[str]):
+        indices: List[int] = []
+        rows: List[int] = []
+        for row, text in enumerate(texts):
+            features = {vocabulary[gram] for gram in char_ngrams(text) if gram in vocabulary}
+            indices.extend(features)
+            rows.extend([row] * len(features))
+        self.size = len(texts)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.rows = np.asarray(rows, dtype=np.int64)
+        values = idf[self.indices]
+        norms = np.sqrt(np.bincount(self.rows, weights=values ** 2, minlength=self.size))
+        norms[norms == 0] = 1.0
+        self.values = values / norms[self.rows]
+
+    def dot(self, weights: np.ndarray) -> np.ndarray:
+        """입력 × 가중치 (Intent 수, 어휘 수)ᵀ → (행 수, Intent 수)"""
+        return np.column_stack([
+            np.bincount(self.rows, weights=row[self.indices] * self.values, minlength=self.size) for row in weights
+        ])
+
+    def transpose_dot(self, gradient: np.ndarray, vocabulary_size: int) -> np.ndarray:
+        """행별 기울기 (행 수, Intent 수)ᵀ × 입력 → (Intent 수, 어휘 수)"""
+        return np.stack([
+            np.bincount(self.indices, weights=column[self.rows] * self.values, minlength=vocabulary_size)
+            for column in np.ascontiguousarray(gradient.T)
+        ])
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    shifted = np.exp(logits - logits.max(axis=1, keepdims=True))
+    return shifted / shifted.sum(axis=1, keepdims=True)
+
+
+def _fit(features: _Features, labels: np.ndarray, shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """다항 로지스틱 회귀 (교차 엔트로피 + L2, 전체 배치 Adam) → (가중치 (Intent 수, 어휘 수), 편향)"""
+    weights, bias = np.zeros(shape), np.zeros(shape[0])
+    targets = np.eye(shape[0])[labels]
+    moments = [(np.zeros_like(weights), np.zeros_like(weights)), (np.zeros_like(bias), np.zeros_like(bias))]
+    for step in range(1, TRAIN_ITERATIONS + 1):
+        gradient = (_softmax(features.dot(weights) + bias) - targets) / len(labels)
+        gradients = (features.transpose_dot(gradient, shape[1]) + L2_PENALTY * weights, gradient.sum(axis=0))
+        for parameter, grad, (first, second) in zip((weights, bias), gradients, moments):
+            first *= 0.9
+            first += 0.1 * grad
+            second *= 0.999
+            second += 0.001 * grad ** 2
+            parameter -= LEARNING_RATE * (first / (1 - 0.9 ** step)) / (np.sqrt(second / (1 - 0.999 ** step)) + 1e-8)
+    return weights, bias
+
+
+def _logits(features: _Features, model: Tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    weights, bias = model
+    return features.dot(weights) + bias
+
+
+def _precision_threshold(confidence: np.ndarray, correct: np.ndarray, precision: float) -> float:
+    """신뢰도가 임계값 이상인 예측의 정밀도가 목표 이상인 가장 낮은 임계값 (없으면 1.0 - 로컬 결과 사용 안 함)"""
+    order = np.argsort(-confidence)
+    cumulative = np.cumsum(correct[order]) / np.arange(1, len(order) + 1)
+    passing = np.flatnonzero(cumulative >= precision)
+    if not len(passing):
+        return 1.0
+    return max(MIN_THRESHOLD, float(confidence[order][passing[-1]]))
+
+
+class LocalIntentClassifier:
+    """문자 n-gram TF-IDF 로지스틱 회귀 + 온도 보정 + 정밀도 기준 임계값"""
+
+    def __init__(self, intents: List[str], vocabulary: Dict[str, int], idf: np.ndarray,
+                 model: Tuple[np.ndarray, np.ndarray], temperature: float, stats: Dict[str, Any],
+                 cv_confidence: np.ndarray, cv_correct: np.ndarray):
+        self.intents = intents
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.model = model
+        self.temperature = temperature
+        self.stats = stats
+        self._cv_confidence = cv_confidence
+        self._cv_correct = cv_correct
+
+    @classmethod
+    def train(cls, samples: List[Tuple[str, str]], seed: int = 0) -> 'LocalIntentClassifier':
+        """(문장, Intent) 목록으로 학습"""
+        started = time.perf_counter()
+        intents = sorted({intent for _, intent in samples})
+        label_of = {intent: i for i, intent in enumerate(intents)}
+        texts = [text for text, _ in samples]
+        labels = np.asarray([label_of[intent] for _, intent in samples])
+
+        # 어휘: 등장 문장 수 기준 상위 MAX_FEATURES개, 흔한 n-gram일수록 낮은 가중치 (IDF)
+        document_frequency = TermCounter(gram for text in texts for gram in set(char_ngrams(text)))
+        common = document_frequency.most_common(MAX_FEATURES)
+        vocabulary = {gram: i for i, (gram, _) in enumerate(common)}
+        idf = np.log((1 + len(texts)) / (1 + np.asarray([count for _, count in common], dtype=np.float64))) + 1
+        shape = (len(intents), len(vocabulary))
+        features = _Features(vocabulary, idf, texts)
+
+        # 교차 검증 예측 → 온도 보정 + 정밀도 곡선 (보지 않은 문장 기준, 트래픽이 많으면 일부 표본만 - 시작 시간 제한)
+        rng = np.random.default_rng(seed)
+        calibration = np.zeros(len(samples), dtype=bool)
+        calibration[rng.permutation(len(samples))[:CALIBRATION_MAX_SAMPLES]] = True
+        cv_features, cv_labels = _subset(features, calibration), labels[calibration]
+        folds = rng.permutation(len(cv_labels)) % min(CALIBRATION_FOLDS, len(cv_labels))
+        held_out_logits = np.zeros((len(cv_labels), len(intents)))
+        for fold in np.unique(folds):
+            held_out = folds == fold
+            fold_model = _fit(_subset(cv_features, ~held_out), cv_labels[~held_out], shape)
+            held_out_logits[held_out] = _logits(_subset(cv_features, held_out), fold_model)
+
+        def negative_log_likelihood(temperature: float) -> float:
+            probabilities = _softmax(held_out_logits / temperature)
+            return float(-np.mean(np.log(probabilities[np.arange(len(cv_labels)), cv_labels] + 1e-12)))
+
+        temperature = float(min(TEMPERATURE_GRID, key=negative_log_likelihood))
+        calibrated = _softmax(held_out_logits / temperature)
+        confidence = calibrated.max(axis=1)
+        correct = calibrated.argmax(axis=1) == cv_labels
+
+        stats = {
+            'samples': len(samples),
+            'features': len(vocabulary),
+            'temperature': round(temperature, 3),
+            'cv_accuracy': round(float(correct.mean()), 3),
+            'cv_mean_confidence': round(float(confidence.mean()), 3),
+            'train_seconds': round(time.perf_counter() - started, 2)
+        }
+        return cls(intents, vocabulary, idf, _fit(features, labels, shape), temperature, stats, confidence, correct)
+
+    def threshold(self, precision: float) -> float:
+        """교차 검증에서 목표 정밀도를 만족한 가장 낮은 신뢰도 (이 값 이상인 예측만 사용)"""
+        return _precision_threshold(self._cv_confidence, self._cv_correct, precision)
+
+    def thresholds(self, confidence: Optional[float] = None,
+                   fallback_confidence: Optional[float] = None) -> Tuple[float, float]:
+        """(원격 분류 생략 임계값, 폴백 임계값) - 고정값이 없으면 목표 정밀도로 계산, 폴백은 생략 임계값 이하"""
+        serving = self.threshold(SERVING_PRECISION) if confidence is None else confidence
+        fallback = self.threshold(FALLBACK_PRECISION) if fallback_confidence is None else fallback_confidence
+        return serving, min(serving, fallback)
+
+    def predict_many(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        """문장별 {intent, confidence, probabilities}"""
+        probabilities = _softmax(_logits(_Features(self.vocabulary, self.idf, texts), self.model) / self.temperature)
+        results = []
+        for row in probabilities:
+            best = int(row.argmax())
+            results.append({
+                'intent': self.intents[best],
+                'confidence': float(row[best]),
+                'probabilities': {intent: float(p) for intent, p in zip(self.intents, row)}
+            })
+        return results
+
+    def predict(self, text: str) -> Dict[str, Any]:
+        return self.predict_many([text])[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {'intents': len(self.intents), **self.stats}
+
+
+def _subset(features: _Features, mask: np.ndarray) -> _Features:
+    """행 일부만 선택한 입력 묶음 (행 번호 재배치)"""
+    subset = _Features.__new__(_Features)
+    new_rows = np.cumsum(mask) - 1
+    keep = mask[features.rows]
+    subset.size = int(mask.sum())
+    subset.indices = features.indices[keep]
+    subset.rows = new_rows[features.rows[keep]]
+    subset.values = features.values[keep]
+    return subset
+
+
+class IntentTrafficLog:
+    """분류된 운영 질문 기록 (다음 학습 데이터)"""
+
+    def __init__(self, path: Optional[str] = None, max_examples: int = None, max_text_length: int = 200,
+                 max_bytes: int = None):
+        configured = os.getenv('INTENT_TRAFFIC_LOG', '') if path is None else path
+        self.path = Path(configured) if configured else None
+        self.max_examples = max_examples or int(os.getenv('INTENT_TRAFFIC_MAX_EXAMPLES', 5000))
+        self.max_text_length = max_text_length
+        self.max_bytes = max_bytes or int(os.getenv('INTENT_TRAFFIC_LOG_MAX_BYTES', 5 * 1024 * 1024))
+        self._lock = threading.Lock()
+
+    @property
+    def rotated_path(self) -> Path:
+        return self.path.with_name(self.path.name + '.1')
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def append(self, text: str, intent: str, source: str, score: float):
+        """기록 1줄 추가 (실패해도 분류에는 영향 없음)"""
+        if not self.enabled or not text.strip():
+            return
+        line = json.dumps({
+            'text': text.strip()[:self.max_text_length], 'intent': intent, 'source': source, 'score': round(score, 4)
+        }, ensure_ascii=False)
+        try:
+            with self._lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                if self.path.exists() and self.path.stat().st_size >= self.max_bytes:
+                    os.replace(self.path, self.rotated_path)
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+        except OSError as e:
+            logger.debug(f"Intent 트래픽 기록 실패: {e}")
+
+    def load(self, intents: Sequence[str]) -> List[Tuple[str, str]]:
+        """최근 기록 (교체된 이전 파일 → 현재 파일 순, 문장별 마지막 Intent, 알려진 Intent만)"""
+        if not self.enabled:
+            return []
+        latest: Dict[str, str] = {}
+        known = set(intents)
+        for path in (self.rotated_path, self.path):
+            if not path.exists():
+                continue
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record.get('intent') in known and record.get('text'):
+                        latest.pop(record['text'], None)
+                        latest[record['text']] = record['intent']
+        return list(latest.items())[-self.max_examples:]
+
+
+def train_local_classifier(intent_examples: Dict[str, List[str]],
+                           traffic_log: IntentTrafficLog) -> LocalIntentClassifier:
+    """예시 문장 + 트래픽 기록으로 학습 (블로킹)"""
+    samples = [(example, intent) for intent, examples in intent_examples.items() for example in examples]
+    example_texts = {text for text, _ in samples}
+    traffic = [(text, intent) for text, intent in traffic_log.load(list(intent_examples)) if text not in example_texts]
+    classifier = LocalIntentClassifier.train(samples + traffic)
+    logger.info(
+        f"✅ 로컬 Intent 분류기 학습: 예시 {len(samples)}개 + 트래픽 {len(traffic)}개, "
+        f"교차 검증 정확도 {classifier.stats['cv_accuracy']:.3f}, 온도 {classifier.temperature:.2f}, "
+        f"{classifier.stats['train_seconds']}초"
+    )
+    return classifier
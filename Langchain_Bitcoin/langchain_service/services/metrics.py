@@ -0,0 +1,471 @@
+"""
+지표 수집 (Prometheus 텍스트 형식)
+채팅 지연 시간이 어디서 발생하는지(Intent 분류, DB 검색, Upbit, OpenAI, 차트 렌더링) 수치로 노출
+
+- Histogram: 처리 시간 분포 (Intent / 도구 / DB 쿼리 계열 / 외부 호출)
+- Counter: 오류 횟수 (예외 + 예외 대신 반환된 ErrorResult 오류 문구)
+- Collector: 캐시 적중률, 풀 사용률 등 다른 모듈의 통계를 조회 시점에 변환
+
+외부 라이브러리 없이 /metrics 응답(text/plain; version=0.0.4)을 생성
+
+멀티 워커(serve.py): PROMETHEUS_MULTIPROC_DIR를 설정하면 워커마다 METRICS_FLUSH_SECONDS(기본값: 5초)마다
+자기 지표를 <디렉터리>/metrics_<pid>_<시작 시각>.json에 기록하고, /metrics는 모든 워커 파일을 합쳐 응답
+(어느 워커가 요청을 받아도 같은 합계 → 카운터 초기화로 보이지 않음)
+- Counter / Histogram / counter 타입 수집기: 워커 합계 (종료된 워커 값도 유지, serve.py 시작 시 디렉터리 정리)
+- 그 밖의 수집기(gauge): 살아 있는 워커만 worker 레이블(pid)로 구분
+"""
+
+import asyncio
+import functools
+import glob
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# 기본 버킷 (초): 수 ms 캐시 적중부터 수십 초 LLM 응답까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: Any) -> str:
+    """레이블 값 이스케이프"""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    """레이블 문자열 생성"""
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+def _format_value(value: float) -> str:
+    """값 문자열 생성"""
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """지표 공통 기능 (레이블 조합별 값 보관)"""
+
+    metric_type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_key(self, labels: Dict[str, Any]) -> Tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 불일치 {sorted(labels)} != {sorted(self.labelnames)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+    def dump(self) -> List[List]:
+        """[[레이블 값 목록, 값], ...] (멀티 워커 파일 기록용)"""
+        raise NotImplementedError
+
+    def merge(self, samples: List[List]):
+        """다른 워커의 dump 결과를 더함"""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """누적 카운터"""
+
+    metric_type = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        """증가"""
+        key = self._label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(dict(zip(self.labelnames, key)))} {_format_value(value)}")
+        return lines
+
+    def dump(self) -> List[List]:
+        with self._lock:
+            return [[list(key), value] for key, value in self._values.items()]
+
+    def merge(self, samples: List[List]):
+        with self._lock:
+            for key, value in samples:
+                key = tuple(key)
+                self._values[key] = self._values.get(key, 0.0) + value
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        # key -> [버킷별 개수..., 합계, 개수]
+        self._values: Dict[Tuple, List[float]] = {}
+
+    def observe(self, value: float, **labels):
+        """관측값 기록"""
+        key = self._label_key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            items = [(key, list(state)) for key, state in self._values.items()]
+        for key, state in items:
+            labels = dict(zip(self.labelnames, key))
+            for index, bound in enumerate(self.buckets):
+                bucket_labels = dict(labels, le=_format_value(bound))
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {_format_value(state[index])}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {_format_value(state[-1])}")
+        return lines
+
+    def dump(self) -> List[List]:
+        with self._lock:
+            return [[list(key), list(state)] for key, state in self._values.items()]
+
+    def merge(self, samples: List[List]):
+        with self._lock:
+            for key, values in samples:
+                if len(values) != len(self.buckets) + 2:
+                    continue  # 버킷 구성이 다른 버전의 워커
+                state = self._values.setdefault(tuple(key), [0.0] * (len(self.buckets) + 2))
+                for index, value in enumerate(values):
+                    state[index] += value
+
+
+class ErrorResult(str):
+    """
+    예외 대신 반환하는 오류 문구 (도구 / Intent 핸들러)
+
+    일반 문자열처럼 그대로 사용자에게 전달되고, 기록기는 오류로 집계
+    """
+
+
+class _Tracker:
+    """처리 시간/오류 기록기 (with 문과 동기/비동기 함수 데코레이터 모두 지원)"""
+
+    def __init__(self, histogram: Histogram, errors: Optional[Counter], labels: Dict[str, Any]):
+        self.histogram = histogram
+        self.errors = errors
+        self.labels = labels
+        self._started = 0.0
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.observe(time.perf_counter() - self._started, **self.labels)
+        if exc_type is not None and self.errors is not None:
+            self.errors.inc(**self.labels)
+        return False
+
+    def record_result(self, result: Any) -> Any:
+        """반환값이 ErrorResult면 오류로 집계 (예외 없이 오류 문구를 반환하는 경로)"""
+        if isinstance(result, ErrorResult) and self.errors is not None:
+            self.errors.inc(**self.labels)
+        return result
+
+    def __call__(self, func: Callable) -> Callable:
+        histogram, errors, labels = self.histogram, self.errors, self.labels
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with _Tracker(histogram, errors, labels) as tracker:
+                    return tracker.record_result(await func(*args, **kwargs))
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Tracker(histogram, errors, labels) as tracker:
+                return tracker.record_result(func(*args, **kwargs))
+        return wrapper
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MetricsRegistry:
+    """지표 저장소"""
+
+    def __init__(self, multiprocess_dir: Optional[str] = None):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[Tuple[str, str, str, List[Tuple[Dict, float]]]]]] = []
+        self._lock = threading.Lock()
+        self.multiprocess_dir = multiprocess_dir or None
+        self.flush_seconds = float(os.getenv('METRICS_FLUSH_SECONDS', 5))
+        self._snapshot_path: Optional[str] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """카운터 반환 (없으면 생성)"""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """히스토그램 반환 (없으면 생성)"""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def register_collector(self, collector: Callable[[], Iterable[Tuple[str, str, str, List[Tuple[Dict, float]]]]]):
+        """
+        조회 시점 수집기 등록
+
+        collector는 (이름, 타입, 설명, [(레이블, 값), ...]) 목록을 반환
+        """
+        self._collectors.append(collector)
+
+    def _collect(self) -> List[Tuple[str, str, str, List[Tuple[Dict, float]]]]:
+        """수집기 실행 (실패한 수집기는 건너뜀, 값이 None인 항목 제외)"""
+        families = []
+        for collector in self._collectors:
+            try:
+                for name, metric_type, documentation, samples in list(collector()):
+                    families.append((name, metric_type, documentation,
+                                     [(dict(labels), float(value)) for labels, value in samples if value is not None]))
+            except Exception as e:
+                logger.debug(f"지표 수집기 실패: {e}")
+        return families
+
+    @staticmethod
+    def _render(metrics: Iterable[_Metric], families) -> str:
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        for name, metric_type, documentation, samples in families:
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in samples:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식으로 출력 (멀티 워커 디렉터리가 있으면 모든 워커 합계)"""
+        if self._snapshot_path:
+            try:
+                return self._render_multiprocess()
+            except Exception as e:
+                logger.warning(f"⚠️ 워커 지표 합산 실패, 현재 워커 지표만 응답: {e}")
+        return self._render(list(self._metrics.values()), self._collect())
+
+    # ------------------------------------------------------------------ 멀티 워커
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 워커 지표 (파일 기록용)"""
+        return {
+            'pid': os.getpid(),
+            'metrics': [
+                {
+                    'name': metric.name, 'type': metric.metric_type, 'documentation': metric.documentation,
+                    'labelnames': list(metric.labelnames),
+                    'buckets': list(metric.buckets[:-1]) if isinstance(metric, Histogram) else None,
+                    'values': metric.dump()
+                }
+                for metric in list(self._metrics.values())
+            ],
+            'collected': self._collect()
+        }
+
+    def flush(self):
+        """현재 워커 지표를 파일에 기록"""
+        if self._snapshot_path:
+            self._write_snapshot(self.snapshot())
+
+    def _render_multiprocess(self) -> str:
+        self.flush()
+        merged: Dict[str, _Metric] = {}
+        families: Dict[str, Tuple[str, str, Dict[Tuple, Tuple[Dict, float]]]] = {}
+        for path in sorted(glob.glob(os.path.join(self.multiprocess_dir, 'metrics_*.json'))):
+            try:
+                with open(path, encoding='utf-8') as file:
+                    snapshot = json.load(file)
+            except (OSError, ValueError):
+                continue  # 기록 중 / 손상된 파일
+            for entry in snapshot['metrics']:
+                metric = merged.get(entry['name'])
+                if metric is None:
+                    if entry['type'] == Histogram.metric_type:
+                        metric = Histogram(entry['name'], entry['documentation'], entry['labelnames'], entry['buckets'])
+                    else:
+                        metric = Counter(entry['name'], entry['documentation'], entry['labelnames'])
+                    merged[entry['name']] = metric
+                metric.merge(entry['values'])
+
+            alive = _pid_alive(snapshot['pid'])
+            for name, metric_type, documentation, samples in snapshot['collected']:
+                _, _, values = families.setdefault(name, (metric_type, documentation, {}))
+                for labels, value in samples:
+                    if metric_type == 'counter':
+                        key = tuple(sorted(labels.items()))
+                        values[key] = (labels, values.get(key, (labels, 0.0))[1] + value)
+                    elif alive:
+                        labels = dict(labels, worker=snapshot['pid'])
+                        values[tuple(sorted(labels.items()))] = (labels, value)
+
+        return self._render(merged.values(), [
+            (name, metric_type, documentation, list(values.values()))
+            for name, (metric_type, documentation, values) in families.items()
+        ])
+
+    async def start_multiprocess(self):
+        """워커 시작 시 호출 - 주기적으로 지표 파일 기록 (PROMETHEUS_MULTIPROC_DIR가 없으면 아무것도 하지 않음)"""
+        if not self.multiprocess_dir or self._flush_task:
+            return
+        os.makedirs(self.multiprocess_dir, exist_ok=True)
+        self._snapshot_path = os.path.join(self.multiprocess_dir, f"metrics_{os.getpid()}_{int(time.time())}.json")
+        self.flush()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(f"📊 멀티 워커 지표 기록: {self._snapshot_path} ({self.flush_seconds}초 주기)")
+
+    async def stop_multiprocess(self):
+        """워커 종료 시 호출 - 마지막 값 기록 (종료된 워커의 카운터도 합계에 남음)"""
+        if not self._flush_task:
+            return
+        self._flush_task.cancel()
+        try:
+            await self._flush_task
+        except asyncio.CancelledError:
+            pass
+        self._flush_task = None
+        self.flush()
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            try:
+                # 수집기는 이벤트 루프에서 실행 (각 모듈 통계를 루프 밖에서 읽지 않도록), 파일 쓰기만 스레드에서
+                snapshot = self.snapshot()
+                await asyncio.to_thread(self._write_snapshot, snapshot)
+            except Exception as e:
+                logger.warning(f"⚠️ 워커 지표 기록 실패: {e}")
+
+    def _write_snapshot(self, snapshot: Dict[str, Any]):
+        """임시 파일 → rename (읽는 쪽이 쓰는 중인 파일을 보지 않음)"""
+        temporary = f"{self._snapshot_path}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump(snapshot, file)
+        os.replace(temporary, self._snapshot_path)
+
+
+# 전역 지표 저장소
+metrics = MetricsRegistry(os.getenv('PROMETHEUS_MULTIPROC_DIR'))
+
+# 채팅 처리 지표
+INTENT_LATENCY = metrics.histogram(
+    'chat_intent_duration_seconds', 'Intent별 응답 처리 시간', ['intent'])
+INTENT_ERRORS = metrics.counter(
+    'chat_intent_errors_total', 'Intent별 처리 오류 횟수 (예외 + 오류 응답)', ['intent'])
+INTENT_CLASSIFICATION_LATENCY = metrics.histogram(
+    'chat_intent_classification_duration_seconds', 'Intent 분류 시간', ['method'])
+INTENT_CLASSIFICATION_PATH = metrics.counter(
+    'chat_intent_classification_path_total', 'Intent 분류를 처리한 경로 (local / embedding / local_fallback / keyword)', ['path'])
+
+# 도구 / DB / 외부 호출 지표
+TOOL_LATENCY = metrics.histogram(
+    'tool_run_duration_seconds', 'LangChain 도구 실행 시간', ['tool'])
+TOOL_ERRORS = metrics.counter(
+    'tool_run_errors_total', 'LangChain 도구 실행 오류 횟수 (예외 + 오류 응답)', ['tool'])
+DB_QUERY_LATENCY = metrics.histogram(
+    'db_query_duration_seconds', 'DB 쿼리 계열별 실행 시간', ['family'])
+DB_QUERY_ERRORS = metrics.counter(
+    'db_query_errors_total', 'DB 쿼리 계열별 예외 횟수', ['family'])
+EXTERNAL_CALL_LATENCY = metrics.histogram(
+    'external_call_duration_seconds', '외부 HTTP/LLM 호출 시간', ['service', 'operation'])
+EXTERNAL_CALL_ERRORS = metrics.counter(
+    'external_call_errors_total', '외부 HTTP/LLM 호출 실패 횟수', ['service', 'operation'])
+
+
+def track_intent(intent: str) -> _Tracker:
+    """Intent 처리 시간 기록"""
+    return _Tracker(INTENT_LATENCY, INTENT_ERRORS, {'intent': intent})
+
+
+def track_classification(method: str) -> _Tracker:
+    """Intent 분류 시간 기록"""
+    return _Tracker(INTENT_CLASSIFICATION_LATENCY, None, {'method': method})
+
+
+def track_tool(tool: str) -> _Tracker:
+    """도구 실행 시간 기록"""
+    return _Tracker(TOOL_LATENCY, TOOL_ERRORS, {'tool': tool})
+
+
+def track_db(family: str) -> _Tracker:
+    """DB 쿼리 시간 기록 (데코레이터 또는 with 문)"""
+    return _Tracker(DB_QUERY_LATENCY, DB_QUERY_ERRORS, {'family': family})
+
+
+def track_external(service: str, operation: str) -> _Tracker:
+    """외부 호출 시간 기록 (데코레이터 또는 with 문)"""
+    return _Tracker(EXTERNAL_CALL_LATENCY, EXTERNAL_CALL_ERRORS, {'service': service, 'operation': operation})
+
+
+def instrument_tool_run(func: Callable) -> Callable:
+    """LangChain 도구 _run / _arun 데코레이터 (도구 이름을 레이블로 사용)"""
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            with track_tool(getattr(self, 'name', type(self).__name__)) as tracker:
+                return tracker.record_result(await func(self, *args, **kwargs))
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with track_tool(getattr(self, 'name', type(self).__name__)) as tracker:
+            return tracker.record_result(func(self, *args, **kwargs))
+    return wrapper
@@ -35,7 +35,7 @@ class NewsCollector:
         # 뉴스 소스 설정
         self.news_sources = {
             'newsdata_io': {
-                'url': 'https://newsdata.io/api/1/news',
+                'url': f"{os.getenv('NEWSDATA_BASE_URL', 'https://newsdata.io/api/1')}/news",
                 'type': 'api',
                 'params': {
                     'apikey': self.newsdata_api_key,
@@ -63,6 +63,13 @@ class NewsCollector:
             }
         }
         
+        # RSS 피드 주소 교체 (부하 테스트 시 로컬 스텁: {NEWS_RSS_BASE_URL}/{소스 이름})
+        rss_base_url = os.getenv('NEWS_RSS_BASE_URL')
+        if rss_base_url:
+            for source_name, config in self.news_sources.items():
+                if config.get('type') == 'rss':
+                    config['rss_url'] = f"{rss_base_url.rstrip('/')}/{source_name}"
+        
         # 한국 뉴스 소스
         self.korean_sources = {
             'coinness': {
@@ -10,10 +10,31 @@ import numpy as np
 from sentence_transformers import SentenceTransformer
 from dataclasses import asdict
 
+try:
+    from langchain_service.services.embedding_service import embedding_service
+    from langchain_service.services.embedding_providers import load_sentence_transformer
+    from langchain_service.services.table_embeddings import table_embedding_models
+    from langchain_service.services.vector_index import vector_index_manager
+    from langchain_service.services.vector_search import execute_search, nearest_sql, vector_literal
+except ImportError:
+    from services.embedding_service import embedding_service
+    from services.embedding_providers import load_sentence_transformer
+    from services.table_embeddings import table_embedding_models
+    from services.vector_index import vector_index_manager
+    from services.vector_search import execute_search, nearest_sql, vector_literal
+
 # Windows 콘솔 UTF-8 설정
 if sys.platform == "win32":
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 
+EMBEDDING_MODEL_NAME = 'all-MiniLM-L6-v2'
+
+SEARCH_COLUMNS = ['id', 'title', 'summary', 'url', 'source', 'published_date', 'keywords', 'sentiment', 'created_at']
+
+def get_embedding_model(model_name: str = EMBEDDING_MODEL_NAME) -> SentenceTransformer:
+    """SentenceTransformer 모델 반환 (프로세스당 1회 로드, pre-fork 워밍업 시 워커들이 공유)"""
+    return load_sentence_transformer(model_name)
+
 class PgVectorService:
     def __init__(self, 
                  host: str = "localhost", 
@@ -33,12 +54,24 @@ class PgVectorService:
         self.logger = logging.getLogger(__name__)
         
         # 임베딩 모델 초기화
-        self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-        self.embedding_dimension = 384  # all-MiniLM-L6-v2의 차원
+        self.embedding_model = get_embedding_model()
         
         # 데이터베이스 연결 및 초기 설정
         self.init_database()
     
+    @property
+    def table_embedding(self):
+        """crypto_news.embedding 모델 (재임베딩 교체 기록, 기본값 all-MiniLM-L6-v2 384차원)"""
+        return table_embedding_models.get('crypto_news', self.get_connection)
+    
+    @property
+    def embedding_model_name(self) -> str:
+        return self.table_embedding.model
+    
+    @property
+    def embedding_dimension(self) -> int:
+        return self.table_embedding.dimension
+    
     def get_connection(self):
         """데이터베이스 연결 반환"""
         try:
@@ -57,7 +90,7 @@ class PgVectorService:
                     cur.execute("CREATE EXTENSION IF NOT EXISTS vector;")
                     
                     # 뉴스 테이블 생성
-                    cur.execute("""
+                    cur.execute(f"""
                         CREATE TABLE IF NOT EXISTS crypto_news (
                             id SERIAL PRIMARY KEY,
                             title TEXT NOT NULL,
@@ -69,17 +102,13 @@ class PgVectorService:
                             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                             keywords TEXT[],
                             sentiment VARCHAR(20),
-                            embedding vector(384),
+                            embedding vector({self.embedding_dimension}),
                             raw_data JSONB
                         );
                     """)
                     
-                    # 인덱스 생성
-                    cur.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_crypto_news_embedding 
-                        ON crypto_news USING ivfflat (embedding vector_cosine_ops) 
-                        WITH (lists = 100);
-                    """)
+                    # 벡터 인덱스 (HNSW, 또는 행이 쌓인 뒤 행 수 기준 lists의 IVFFlat)
+                    vector_index_manager.ensure_index(cur, 'crypto_news')
                     
                     cur.execute("""
                         CREATE INDEX IF NOT EXISTS idx_crypto_news_published_date 
@@ -104,20 +133,36 @@ class PgVectorService:
             raise
     
     def generate_embedding(self, text: str) -> List[float]:
-        """텍스트 임베딩 생성"""
+        """텍스트 임베딩 생성 (공용 임베딩 캐시 사용)"""
         try:
             if not text.strip():
                 return [0.0] * self.embedding_dimension
             
-            embedding = self.embedding_model.encode(text)
-            return embedding.tolist()
+            return embedding_service.embed(text, self.embedding_model_name)
             
         except Exception as e:
             self.logger.error(f"Embedding generation failed: {e}")
             return [0.0] * self.embedding_dimension
     
+    def generate_query_embedding(self, query: str) -> List[float]:
+        """검색 질의 임베딩 (반복 질의는 질의 LRU에서 반환)"""
+        try:
+            if not query.strip():
+                return [0.0] * self.embedding_dimension
+            
+            return embedding_service.embed_query(query, self.embedding_model_name)
+            
+        except Exception as e:
+            self.logger.error(f"Query embedding generation failed: {e}")
+            return [0.0] * self.embedding_dimension
+    
+    @staticmethod
+    def _embedding_text(article_data: Dict[str, Any]) -> str:
+        """임베딩 대상 텍스트 (제목 + 요약 + 내용)"""
+        return f"{article_data.get('title', '')} {article_data.get('summary', '')} {article_data.get('content', '')}"
+    
     def insert_news_article(self, article_data: Dict[str, Any]) -> bool:
-        """뉴스 기사 삽입"""
+        """뉴스 기사 삽입 (article_data['embedding']에 컬럼 차원과 같은 벡터가 있으면 그대로 저장)"""
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
@@ -127,9 +172,10 @@ class PgVectorService:
                         self.logger.info(f"Article already exists: {article_data['url']}")
                         return False
                     
-                    # 임베딩 생성 (제목 + 요약 + 내용)
-                    embedding_text = f"{article_data.get('title', '')} {article_data.get('summary', '')} {article_data.get('content', '')}"
-                    embedding = self.generate_embedding(embedding_text)
+                    # 임베딩 (같은 모델로 미리 계산된 벡터가 있으면 재사용, 없으면 제목 + 요약 + 내용으로 생성)
+                    embedding = article_data.get('embedding')
+                    if embedding is None or len(embedding) != self.embedding_dimension:
+                        embedding = self.generate_embedding(self._embedding_text(article_data))
                     
                     # 날짜 처리
                     published_date = article_data.get('published_date')
@@ -166,38 +212,43 @@ class PgVectorService:
                     
         except Exception as e:
             self.logger.error(f"Failed to insert article: {e}")
+            if 'dimensions' in str(e):
+                # 재임베딩 교체 직후 (컬럼 차원 변경) → 다음 호출에서 모델 기록을 다시 읽음
+                table_embedding_models.invalidate('crypto_news')
             return False
     
     def batch_insert_articles(self, articles: List[Dict[str, Any]]) -> int:
-        """뉴스 기사 일괄 삽입"""
+        """뉴스 기사 일괄 삽입 (임베딩은 한 번의 배치 인코딩으로 미리 생성)"""
         success_count = 0
         
+        texts = [self._embedding_text(article) for article in articles]
+        try:
+            embedding_service.embed_many([text for text in texts if text.strip()], self.embedding_model_name, skip_failed=True)
+        except Exception as e:
+            self.logger.warning(f"Batch embedding failed, embedding per article: {e}")
+        
         for article in articles:
             if self.insert_news_article(article):
                 success_count += 1
         
         self.logger.info(f"Successfully inserted {success_count}/{len(articles)} articles")
+        vector_index_manager.after_bulk_load('crypto_news', self.get_connection, success_count)
         return success_count
     
     def search_similar_articles(self, query: str, limit: int = 10, similarity_threshold: float = 0.3) -> List[Dict[str, Any]]:
         """유사한 기사 검색"""
         try:
-            # 쿼리 임베딩 생성
-            query_embedding = self.generate_embedding(query)
+            # 쿼리 임베딩 생성 (검색 질의 LRU 우선)
+            query_embedding = self.generate_query_embedding(query)
             
             with self.get_connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                    cur.execute("""
-                        SELECT id, title, summary, url, source, published_date, 
-                               keywords, sentiment, created_at,
-                               1 - (embedding <=> %s) as similarity
-                        FROM crypto_news
-                        WHERE 1 - (embedding <=> %s) > %s
-                        ORDER BY embedding <=> %s
-                        LIMIT %s
-                    """, (query_embedding, query_embedding, similarity_threshold, query_embedding, limit))
-                    
-                    results = cur.fetchall()
+                    # 인덱스로 상위 limit개 → 임계값 적용 (질의 벡터 1회 바인딩)
+                    results = execute_search(cur, nearest_sql('crypto_news', SEARCH_COLUMNS), {
+                        'query': vector_literal(query_embedding),
+                        'threshold': similarity_threshold,
+                        'limit': limit
+                    }, 'crypto_news', limit)
                     return [dict(row) for row in results]
                     
         except Exception as e:
@@ -6,6 +6,7 @@ Upbit API와 연동하여 실시간 가격 정보를 캐싱하고 제공
 
 import json
 import logging
+import os
 import redis
 import requests
 from datetime import datetime, timedelta
@@ -14,6 +15,11 @@ import asyncio
 import time
 from concurrent.futures import ThreadPoolExecutor
 
+try:
+    from langchain_service.services.metrics import track_external
+except ImportError:
+    from services.metrics import track_external
+
 logger = logging.getLogger(__name__)
 
 class RedisPriceService:
@@ -22,7 +28,7 @@ class RedisPriceService:
     def __init__(self, redis_host: str = "localhost", redis_port: int = 6379, db: int = 0):
         """초기화"""
         self.redis_client = None
-        self.upbit_base_url = "https://api.upbit.com/v1"
+        self.upbit_base_url = os.getenv('UPBIT_BASE_URL', "https://api.upbit.com/v1")
         
         # Redis 연결
         try:
@@ -108,8 +114,9 @@ class RedisPriceService:
             url = f"{self.upbit_base_url}/ticker"
             params = {"markets": ",".join(markets)}
             
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            with track_external('upbit', 'ticker'):
+                response = requests.get(url, params=params, timeout=10)
+                response.raise_for_status()
             
             data = response.json()
             
@@ -0,0 +1,394 @@
+"""
+임베딩 재생성(backfill) 엔진
+테이블 전체를 지정한 모델로 다시 임베딩하여 그림자 컬럼에 채운 뒤 한 트랜잭션에서 embedding 컬럼과 교체
+
+1. prepare: 그림자 컬럼 embedding_<모델> vector(<차원>) 추가, 진행 기록(embedding_backfill_jobs) 생성
+2. backfill: id 순서 배치로 임베딩 → 그림자 컬럼 UPDATE와 진행 위치(last_id)를 같은 트랜잭션에 기록
+   (중단 후 다시 실행하면 마지막 위치부터, 행/초 제한과 배치 간 대기로 DB / 임베딩 API 부하 조절)
+3. create_index: 그림자 컬럼 HNSW 인덱스를 CONCURRENTLY 생성 (수집 쓰기를 막지 않음)
+4. swap: 잠금 없이 남은 행(backfill 이후 추가 / 임베딩 실패) 다시 채움 → 쓰기 잠금 →
+   새 벡터가 없는 행이 있으면 취소(force면 진행) → 컬럼 / 인덱스 이름 교체 + 모델 기록 → 커밋
+   잠금 동안에는 임베딩 API를 호출하지 않음, 교체 전 벡터는 embedding_prev 컬럼에 남음 (cleanup으로 제거)
+
+검색 / 저장 경로는 table_embeddings의 모델 기록을 읽으므로 교체 후 같은 모델로 질의를 임베딩
+"""
+
+import logging
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from psycopg2.extras import RealDictCursor, execute_values
+
+from .embedding_providers import USE_INGEST
+from .embedding_service import embedding_service
+from .table_embeddings import (
+    MODELS_TABLE, ensure_models_table, record_table_model, register_spec, table_embedding_models
+)
+from .vector_index import METHOD_HNSW, TABLE_VECTOR_INDEXES, record_index_build, vector_index_manager
+from .vector_search import vector_literal
+
+logger = logging.getLogger(__name__)
+
+JOBS_TABLE = 'embedding_backfill_jobs'
+PREVIOUS_COLUMN = 'embedding_prev'
+
+# 임베딩 입력 텍스트 컬럼 (각 저장 경로의 입력과 같은 순서: PgVectorService 제목 + 요약 + 내용, DualDatabaseService 제목 + 요약)
+TABLE_TEXT_COLUMNS = {
+    'crypto_news': ('title', 'summary', 'content'),
+    'crypto_news_summary': ('title', 'summary'),
+}
+
+# 행 단위 임베딩 출처 컬럼이 있는 테이블 (교체 시 함께 갱신)
+PROVENANCE_TABLES = {'crypto_news_summary'}
+
+
+def shadow_column(model: str) -> str:
+    """모델별 그림자 컬럼 이름 (PostgreSQL 식별자 길이 63자 이내)"""
+    return f"embedding_{re.sub(r'[^a-z0-9]+', '_', model.lower()).strip('_')}"[:63]
+
+
+def embedding_text(row: Dict[str, Any], columns) -> str:
+    return ' '.join(str(row.get(column) or '') for column in columns)
+
+
+def ensure_jobs_table(cur):
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS {JOBS_TABLE} (
+            table_name TEXT NOT NULL,
+            column_name TEXT NOT NULL,
+            spec TEXT NOT NULL,
+            model TEXT NOT NULL,
+            dimension INTEGER NOT NULL,
+            last_id BIGINT NOT NULL DEFAULT 0,
+            processed BIGINT NOT NULL DEFAULT 0,
+            failed BIGINT NOT NULL DEFAULT 0,
+            status TEXT NOT NULL DEFAULT 'running',
+            started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (table_name, column_name)
+        )
+    """)
+
+
+class ReembeddingJob:
+    """테이블 하나를 모델 하나로 다시 임베딩하는 작업 (진행 상태는 DB에 기록)"""
+
+    def __init__(self,
+                 conn,
+                 table: str,
+                 spec: str,
+                 batch_size: int = 256,
+                 rows_per_second: float = 0.0,
+                 sleep: float = 0.0,
+                 lock_timeout: float = 10.0):
+        """
+        Args:
+            conn: psycopg2 연결 (작업이 트랜잭션을 직접 관리)
+            table: 대상 테이블 (TABLE_TEXT_COLUMNS)
+            spec: 임베딩 제공자 설정 (openai:<모델> | local:<모델>)
+            batch_size: 배치당 행 수 (임베딩 요청 1회 + UPDATE 1회)
+            rows_per_second: 처리 속도 상한 (0이면 제한 없음)
+            sleep: 배치 사이 대기 (초)
+            lock_timeout: 교체 시 잠금 대기 한도 (초, 초과하면 교체 취소 → 다시 실행)
+        """
+        if table not in TABLE_TEXT_COLUMNS:
+            raise ValueError(f"재임베딩을 지원하지 않는 테이블: {table}")
+        self.conn = conn
+        self.table = table
+        self.spec = spec
+        self.model, self.dimension = register_spec(spec)
+        self.column = shadow_column(self.model)
+        self.batch_size = batch_size
+        self.rows_per_second = rows_per_second
+        self.sleep = sleep
+        self.lock_timeout = lock_timeout
+
+    @property
+    def index_name(self) -> str:
+        return f"idx_{self.table}_{self.column}"[:63]
+
+    def state(self) -> Optional[Dict[str, Any]]:
+        """진행 기록 (없으면 None)"""
+        with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute("SELECT to_regclass(%s) IS NOT NULL AS found", (JOBS_TABLE,))
+            if not cur.fetchone()['found']:
+                self.conn.commit()
+                return None
+            cur.execute(f"SELECT * FROM {JOBS_TABLE} WHERE table_name = %s AND column_name = %s",
+                        (self.table, self.column))
+            row = cur.fetchone()
+        self.conn.commit()
+        return dict(row) if row else None
+
+    def prepare(self) -> Dict[str, Any]:
+        """그림자 컬럼 / 진행 기록 생성 (이미 있으면 그대로 - 이어서 진행)"""
+        with self.conn.cursor() as cur:
+            ensure_jobs_table(cur)
+            ensure_models_table(cur)
+            cur.execute(f"ALTER TABLE {self.table} ADD COLUMN IF NOT EXISTS {self.column} vector({self.dimension})")
+            cur.execute(f"""
+                INSERT INTO {JOBS_TABLE} (table_name, column_name, spec, model, dimension)
+                VALUES (%s, %s, %s, %s, %s)
+                ON CONFLICT (table_name, column_name) DO UPDATE
+                SET status = CASE WHEN {JOBS_TABLE}.status = 'swapped' THEN 'running' ELSE {JOBS_TABLE}.status END,
+                    last_id = CASE WHEN {JOBS_TABLE}.status = 'swapped' THEN 0 ELSE {JOBS_TABLE}.last_id END,
+                    updated_at = CURRENT_TIMESTAMP
+            """, (self.table, self.column, self.spec, self.model, self.dimension))
+        self.conn.commit()
+        state = self.state()
+        logger.info(f"🧱 그림자 컬럼 준비: {self.table}.{self.column} vector({self.dimension}), "
+                    f"진행 위치 id > {state['last_id']}")
+        return state
+
+    def remaining(self, after_id: int = 0) -> int:
+        with self.conn.cursor() as cur:
+            cur.execute(f"SELECT count(*) FROM {self.table} WHERE {self.column} IS NULL AND id > %s", (after_id,))
+            count = cur.fetchone()[0]
+        self.conn.commit()
+        return count
+
+    def _fill_batch(self, cur, after_id: int) -> Dict[str, int]:
+        """id > after_id 중 그림자 컬럼이 비어 있는 행 1배치 임베딩 / UPDATE (커밋은 호출자)"""
+        columns = TABLE_TEXT_COLUMNS[self.table]
+        cur.execute(f"""
+            SELECT id, {', '.join(columns)} FROM {self.table}
+            WHERE {self.column} IS NULL AND id > %s
+            ORDER BY id
+            LIMIT %s
+        """, (after_id, self.batch_size))
+        rows = cur.fetchall()
+        if not rows:
+            return {'last_id': after_id, 'rows': 0, 'updated': 0, 'failed': 0}
+
+        texts = [embedding_text(row, columns) for row in rows]
+        embeddable = [i for i, text in enumerate(texts) if text.strip()]
+        vectors = embedding_service.embed_many(
+            [texts[i] for i in embeddable], self.model, skip_failed=True, use=USE_INGEST
+        ) if embeddable else []
+        values = [
+            (rows[i]['id'], vector_literal(vector))
+            for i, vector in zip(embeddable, vectors) if vector is not None
+        ]
+        if values:
+            execute_values(cur, f"""
+                UPDATE {self.table} SET {self.column} = data.vector::vector
+                FROM (VALUES %s) AS data (id, vector)
+                WHERE {self.table}.id = data.id
+            """, values, page_size=len(values))
+        return {'last_id': rows[-1]['id'], 'rows': len(rows), 'updated': len(values), 'failed': len(rows) - len(values)}
+
+    def backfill(self, max_rows: int = None) -> Dict[str, Any]:
+        """
+        진행 위치부터 끝까지 채움 (배치마다 커밋 → 중단해도 완료된 배치는 유지)
+
+        Args:
+            max_rows: 이번 실행에서 처리할 최대 행 수 (None이면 끝까지)
+        """
+        state = self.prepare()
+        last_id = state['last_id']
+        total = self.remaining(last_id)
+        logger.info(f"📦 재임베딩 대상: {total}행 ({self.table} → {self.model})")
+
+        done = failed = 0
+        started = time.perf_counter()
+        while max_rows is None or done < max_rows:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                batch = self._fill_batch(cur, last_id)
+                if not batch['rows']:
+                    cur.execute(f"""
+                        UPDATE {JOBS_TABLE} SET status = 'filled', updated_at = CURRENT_TIMESTAMP
+                        WHERE table_name = %s AND column_name = %s
+                    """, (self.table, self.column))
+                    self.conn.commit()
+                    break
+                cur.execute(f"""
+                    UPDATE {JOBS_TABLE}
+                    SET last_id = %s, processed = processed + %s, failed = failed + %s,
+                        status = 'running', updated_at = CURRENT_TIMESTAMP
+                    WHERE table_name = %s AND column_name = %s
+                """, (batch['last_id'], batch['updated'], batch['failed'], self.table, self.column))
+            self.conn.commit()
+
+            last_id = batch['last_id']
+            done += batch['rows']
+            failed += batch['failed']
+            elapsed = time.perf_counter() - started
+            logger.info(f"  {done}/{total} (id ≤ {last_id}, 실패 {failed}, {done / max(elapsed, 1e-9):.0f}행/초)")
+
+            # 속도 상한: 처리량이 rows_per_second를 넘지 않도록 대기
+            if self.rows_per_second:
+                ahead = done / self.rows_per_second - elapsed
+                if ahead > 0:
+                    time.sleep(ahead)
+            if self.sleep:
+                time.sleep(self.sleep)
+
+        return {'rows': done, 'failed': failed, 'last_id': last_id, 'seconds': round(time.perf_counter() - started, 1)}
+
+    def create_index(self):
+        """그림자 컬럼 HNSW 인덱스 (CONCURRENTLY - 쓰기를 막지 않음, 빈 테이블에서도 유효)"""
+        previous = self.conn.autocommit
+        self.conn.autocommit = True
+        try:
+            with self.conn.cursor() as cur:
+                logger.info(f"🔨 인덱스 생성: {self.index_name}")
+                cur.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {self.index_name} "
+                    f"ON {self.table} USING hnsw ({self.column} vector_cosine_ops)"
+                )
+        finally:
+            self.conn.autocommit = previous
+
+    def catch_up(self) -> Dict[str, int]:
+        """
+        그림자 컬럼이 빈 행 전체를 다시 채움 (잠금 없이, 배치마다 커밋)
+
+        backfill 이후 추가된 행과 임베딩에 실패한 행(진행 위치 이전 포함)을 처리하고
+        진행 기록의 failed를 아직 새 벡터가 없는 행 수로 갱신
+        """
+        last_id = updated = 0
+        while True:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                batch = self._fill_batch(cur, last_id)
+                if batch['rows']:
+                    cur.execute(f"""
+                        UPDATE {JOBS_TABLE} SET processed = processed + %s, updated_at = CURRENT_TIMESTAMP
+                        WHERE table_name = %s AND column_name = %s
+                    """, (batch['updated'], self.table, self.column))
+            self.conn.commit()
+            if not batch['rows']:
+                break
+            last_id = batch['last_id']
+            updated += batch['updated']
+
+        with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+            missing = self._missing(cur)
+            cur.execute(f"""
+                UPDATE {JOBS_TABLE} SET failed = %s, updated_at = CURRENT_TIMESTAMP
+                WHERE table_name = %s AND column_name = %s
+            """, (missing, self.table, self.column))
+        self.conn.commit()
+        if updated or missing:
+            logger.info(f"🔁 남은 행 다시 채움: {updated}행, 새 벡터 없음 {missing}행")
+        return {'updated': updated, 'missing': missing}
+
+    def _missing(self, cur) -> int:
+        """기존 벡터는 있는데 새 벡터가 없는 행 수 (교체하면 검색에서 빠지는 행)"""
+        cur.execute(f"""
+            SELECT count(*) AS missing FROM {self.table}
+            WHERE {self.column} IS NULL AND embedding IS NOT NULL
+        """)
+        return cur.fetchone()['missing']
+
+    def _compact_columns(self, cur) -> List[str]:
+        """기존 벡터에서 만든 압축 컬럼 (vector_storage) - 교체하면 다른 모델 벡터가 되므로 먼저 제거 필요"""
+        cur.execute("""
+            SELECT column_name FROM information_schema.columns
+            WHERE table_name = %s AND (column_name LIKE 'embedding\\_halfvec%%' OR column_name = 'embedding_binary')
+        """, (self.table,))
+        return [row['column_name'] for row in cur.fetchall()]
+
+    def swap(self, force: bool = False) -> Dict[str, Any]:
+        """
+        embedding 컬럼 교체 (한 트랜잭션: 검색은 교체 직전까지 기존 벡터, 커밋 후 새 벡터)
+
+        남은 행은 잠금 전에 채우고, 잠금 동안에는 확인 / 이름 교체만 수행
+
+        Args:
+            force: 새 벡터가 없는 행(임베딩 실패, 잠금 직전 추가)이 있어도 교체 (그 행은 검색에서 빠짐)
+        """
+        state = self.state()
+        if state is None:
+            raise RuntimeError(f"진행 기록이 없습니다 - 먼저 backfill 실행 ({self.table} → {self.model})")
+        if state['status'] == 'swapped':
+            raise RuntimeError(f"이미 교체된 작업입니다: {self.table}.{self.column}")
+        primary_index = TABLE_VECTOR_INDEXES[self.table]
+
+        started = time.perf_counter()
+        caught_up = self.catch_up()['updated']
+        try:
+            with self.conn.cursor(cursor_factory=RealDictCursor) as cur:
+                compact = self._compact_columns(cur)
+                if compact:
+                    raise RuntimeError(
+                        f"압축 컬럼 {', '.join(compact)}이(가) 기존 벡터 기준입니다 - "
+                        f"EMBEDDING_STORAGE=full로 전환 후 제거하고 교체 뒤 migrate_vector_storage.py 다시 실행"
+                    )
+                cur.execute(f"SET LOCAL lock_timeout = '{int(self.lock_timeout * 1000)}ms'")
+                # 쓰기만 막음 (검색은 이름 교체 직전까지 계속)
+                cur.execute(f"LOCK TABLE {self.table} IN SHARE ROW EXCLUSIVE MODE")
+
+                missing = self._missing(cur)
+                if missing and not force:
+                    raise RuntimeError(
+                        f"새 벡터가 없는 행 {missing}개 - 다시 실행하면 남은 행을 채운 뒤 교체 "
+                        f"(임베딩이 계속 실패하는 행을 검색에서 빼고 교체하려면 --force)"
+                    )
+                cur.execute(f"SELECT coalesce(max(id), 0) AS last_id FROM {self.table}")
+                last_id = cur.fetchone()['last_id']
+
+                cur.execute(f"ALTER TABLE {self.table} DROP COLUMN IF EXISTS {PREVIOUS_COLUMN}")
+                cur.execute(f"ALTER TABLE {self.table} RENAME COLUMN embedding TO {PREVIOUS_COLUMN}")
+                cur.execute(f"ALTER TABLE {self.table} RENAME COLUMN {self.column} TO embedding")
+                cur.execute(f"ALTER INDEX IF EXISTS {primary_index} RENAME TO {primary_index}_prev")
+                cur.execute(f"ALTER INDEX IF EXISTS {self.index_name} RENAME TO {primary_index}")
+
+                if self.table in PROVENANCE_TABLES:
+                    cur.execute(f"""
+                        UPDATE {self.table}
+                        SET embedding_model = %s, embedding_source = 'title+summary', embedding_text_hash = NULL
+                        WHERE embedding IS NOT NULL
+                    """, (self.model,))
+
+                record_table_model(cur, self.table, self.spec, self.model, self.dimension)
+                cur.execute(f"SELECT count(*) AS rows FROM {self.table} WHERE embedding IS NOT NULL")
+                record_index_build(cur, self.table, primary_index, METHOD_HNSW, None, cur.fetchone()['rows'])
+                cur.execute(f"""
+                    UPDATE {JOBS_TABLE}
+                    SET status = 'swapped', last_id = %s, failed = %s, updated_at = CURRENT_TIMESTAMP
+                    WHERE table_name = %s AND column_name = %s
+                """, (last_id, missing, self.table, self.column))
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        table_embedding_models.invalidate(self.table)
+        vector_index_manager.invalidate(self.table)
+        result = {
+            'table': self.table,
+            'model': self.model,
+            'dimension': self.dimension,
+            'caught_up': caught_up,
+            'rows_without_embedding': missing,
+            'seconds': round(time.perf_counter() - started, 2)
+        }
+        logger.info(f"✅ 임베딩 컬럼 교체 완료: {result}")
+        return result
+
+
+def cleanup(conn, table: str):
+    """교체 전 벡터 컬럼(embedding_prev) / 인덱스 제거"""
+    with conn.cursor() as cur:
+        cur.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS {PREVIOUS_COLUMN}")
+    conn.commit()
+    logger.info(f"🗑️ 이전 벡터 컬럼 제거: {table}.{PREVIOUS_COLUMN}")
+
+
+def job_status(conn) -> List[Dict[str, Any]]:
+    """진행 기록 + 테이블별 모델 기록"""
+    with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        ensure_jobs_table(cur)
+        ensure_models_table(cur)
+        cur.execute(f"""
+            SELECT j.table_name, j.column_name, j.model, j.dimension, j.last_id, j.processed, j.failed,
+                   j.status, j.updated_at, m.model AS current_model
+            FROM {JOBS_TABLE} j
+            LEFT JOIN {MODELS_TABLE} m
+                ON m.table_name = j.table_name AND m.column_name = 'embedding'
+            ORDER BY j.table_name, j.updated_at
+        """)
+        rows = [dict(row) for row in cur.fetchall()]
+    conn.commit()
+    return rows
@@ -0,0 +1,112 @@
+"""
+요청 병합 (Single-flight Request Coalescing)
+동일한 질문이 동시에 여러 세션에서 들어올 때 하나의 처리 결과를 공유
+
+- 키: 정규화된 메시지 + 세션 언어
+- 첫 요청(leader)만 실제 처리, 진행 중 도착한 동일 요청(follower)은 같은 결과를 대기
+- 처리가 끝나면 즉시 키를 제거 (결과 캐싱이 아닌 진행 중 요청만 병합)
+"""
+
+import asyncio
+import logging
+import os
+import re
+from dataclasses import dataclass, asdict
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_TRAILING_PUNCTUATION = '?!.~ '
+
+
+def normalize_message(message: str) -> str:
+    """병합 키용 메시지 정규화 (대소문자, 공백, 끝 문장부호 무시)"""
+    normalized = _WHITESPACE_PATTERN.sub(' ', message.strip().lower())
+    return normalized.rstrip(_TRAILING_PUNCTUATION)
+
+
+@dataclass
+class CoalescingStats:
+    """요청 병합 통계"""
+    requests: int = 0
+    leaders: int = 0
+    hits: int = 0
+    failures: int = 0
+    max_fanout: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (병합 비율 포함)"""
+        data = asdict(self)
+        data['hit_ratio'] = round(self.hits / self.requests, 3) if self.requests else 0.0
+        return data
+
+
+class RequestCoalescer:
+    """진행 중인 동일 요청을 하나의 계산으로 병합"""
+
+    def __init__(self, enabled: bool = None):
+        """초기화"""
+        if enabled is None:
+            enabled = os.getenv('COALESCING_ENABLED', 'true').lower() == 'true'
+        self.enabled = enabled
+        self._in_flight: Dict[Tuple, asyncio.Future] = {}
+        self._fanout: Dict[Tuple, int] = {}
+        self._stats = CoalescingStats()
+
+    def make_key(self, message: str, language: str) -> Tuple[str, str]:
+        """병합 키 생성"""
+        return normalize_message(message), language
+
+    async def run(self, key: Tuple, factory: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        키 단위로 요청 병합 실행
+
+        Args:
+            key: 병합 키 (make_key)
+            factory: 실제 처리를 수행하는 코루틴 함수 (leader만 호출)
+
+        Returns:
+            (결과, 병합 여부) - 병합 여부가 True면 다른 요청의 결과를 공유받은 것
+        """
+        if not self.enabled:
+            return await factory(), False
+
+        self._stats.requests += 1
+        task = self._in_flight.get(key)
+        coalesced = task is not None
+
+        if coalesced:
+            self._stats.hits += 1
+            self._fanout[key] += 1
+            self._stats.max_fanout = max(self._stats.max_fanout, self._fanout[key])
+            logger.debug(f"🔗 진행 중인 요청에 병합: {key[0][:30]} (대기 {self._fanout[key]}건)")
+        else:
+            self._stats.leaders += 1
+            # 별도 태스크로 실행하여 leader 요청이 취소되어도 follower는 결과를 받을 수 있도록 함
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            self._fanout[key] = 1
+            task.add_done_callback(lambda finished, key=key: self._on_done(key, finished))
+
+        return await asyncio.shield(task), coalesced
+
+    def _on_done(self, key: Tuple, task: asyncio.Future):
+        """처리 완료 시 진행 중 목록에서 제거"""
+        self._in_flight.pop(key, None)
+        fanout = self._fanout.pop(key, 1)
+        if task.cancelled() or task.exception() is not None:
+            self._stats.failures += 1
+        elif fanout > 1:
+            logger.info(f"🔗 요청 병합 완료: {key[0][:30]} → {fanout}건 응답")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """요청 병합 통계 (현재 진행 중인 키 수 포함)"""
+        stats = self._stats.to_dict()
+        stats['enabled'] = self.enabled
+        stats['in_flight'] = len(self._in_flight)
+        return stats
+
+
+# 전역 요청 병합 인스턴스
+request_coalescer = RequestCoalescer()
@@ -0,0 +1,276 @@
+"""
+Intent별 응답 캐시
+(intent, 정규화된 질문, 코인, 언어) 단위로 챗봇 응답을 재사용하여 OpenAI / Upbit 호출 절감
+
+- 1단계: 프로세스 내 LRU (항목 수 + 바이트 상한, 너무 큰 응답은 저장하지 않음)
+- 2단계: Redis (선택, 워커 간 공유)
+- Intent별 TTL: 가격은 수 초, 뉴스는 수 분, 차트는 다음 일봉 마감(00:00 UTC = 09:00 KST)까지
+- 뉴스 파이프라인이 새 기사를 저장하면 세대(generation) 증가로 전체 무효화
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from .request_coalescer import normalize_message
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Intent별 기본 TTL (초). None은 다음 일봉 마감까지, 목록에 없는 Intent는 캐시하지 않음
+DEFAULT_INTENT_TTLS = {
+    'price_lookup': 5,
+    'news_sentiment': 300,
+    'historical_data': 600,
+    'technical_analysis': None,
+}
+
+# 항목당 키 / OrderedDict 노드 / 튜플 추정치
+ENTRY_OVERHEAD_BYTES = 200
+
+# 오류 응답은 캐시하지 않음 (핸들러가 예외 대신 오류 문구를 반환함)
+ERROR_MARKERS = ('오류가 발생했습니다',)
+
+REDIS_KEY_PREFIX = 'chat_response'
+REDIS_GENERATION_KEY = f'{REDIS_KEY_PREFIX}:generation'
+
+
+def seconds_until_daily_close(now: datetime = None) -> int:
+    """다음 일봉 마감(00:00 UTC)까지 남은 초"""
+    now = now or datetime.now(timezone.utc)
+    next_close = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return max(int((next_close - now).total_seconds()), 1)
+
+
+@dataclass
+class ResponseCacheStats:
+    """응답 캐시 통계"""
+    local_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    oversized: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (적중률 포함)"""
+        data = asdict(self)
+        lookups = self.local_hits + self.redis_hits + self.misses
+        data['hit_ratio'] = round((self.local_hits + self.redis_hits) / lookups, 3) if lookups else 0.0
+        return data
+
+
+class ResponseCache:
+    """Intent별 TTL을 갖는 2단계 응답 캐시"""
+
+    def __init__(self, max_entries: int = None, use_redis: bool = None, max_bytes: int = None):
+        """초기화"""
+        self.enabled = os.getenv('RESPONSE_CACHE_ENABLED', 'true').lower() == 'true'
+        self.max_entries = max_entries or int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', 2048))
+        # 차트 응답(base64 이미지)은 수백 KB라 항목 수만으로는 메모리가 제한되지 않음
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            os.getenv('RESPONSE_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+        self.max_entry_bytes = int(os.getenv('RESPONSE_CACHE_MAX_ENTRY_BYTES', 1024 * 1024))
+
+        # Intent별 TTL: 기본값 → 환경변수 (RESPONSE_CACHE_TTL_PRICE_LOOKUP=10 등)
+        self.intent_ttls = dict(DEFAULT_INTENT_TTLS)
+        for intent in list(self.intent_ttls):
+            env_value = os.getenv(f"RESPONSE_CACHE_TTL_{intent.upper()}")
+            if env_value:
+                self.intent_ttls[intent] = int(env_value)
+
+        if use_redis is None:
+            use_redis = os.getenv('RESPONSE_CACHE_REDIS', 'false').lower() == 'true'
+        self.use_redis = use_redis and REDIS_AVAILABLE
+        self._redis_client = None
+        self._redis_checked = False
+        self._redis_generation = 0
+        self._redis_generation_checked_at = 0.0
+        self.redis_generation_refresh = float(os.getenv('RESPONSE_CACHE_GENERATION_REFRESH', 1.0))
+
+        # key -> (expires_at, generation, message, size)
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._stats = ResponseCacheStats()
+
+    def ttl_for(self, intent: str) -> Optional[int]:
+        """Intent별 TTL (캐시 대상이 아니면 0)"""
+        if intent not in self.intent_ttls:
+            return 0
+        ttl = self.intent_ttls[intent]
+        return seconds_until_daily_close() if ttl is None else ttl
+
+    def is_cacheable(self, intent: str, message: str = None) -> bool:
+        """캐시 대상 여부"""
+        if not self.enabled or not self.ttl_for(intent):
+            return False
+        if message is not None and any(marker in message for marker in ERROR_MARKERS):
+            return False
+        return True
+
+    def make_key(self, intent: str, query: str, coin: str, language: str) -> str:
+        """캐시 키 생성"""
+        params = json.dumps([intent, normalize_message(query), coin, language], ensure_ascii=False)
+        return f"{intent}:{hashlib.md5(params.encode()).hexdigest()}"
+
+    def _get_redis(self):
+        """Redis 클라이언트 반환 (지연 연결, 실패 시 비활성화)"""
+        if not self.use_redis:
+            return None
+        if not self._redis_checked:
+            self._redis_checked = True
+            try:
+                client = redis.Redis(
+                    host=os.getenv('REDIS_HOST', 'localhost'),
+                    port=int(os.getenv('REDIS_PORT', 6379)),
+                    decode_responses=True,
+                    socket_connect_timeout=2,
+                    socket_timeout=2
+                )
+                client.ping()
+                self._redis_client = client
+                logger.info("✅ 응답 캐시 Redis 연결 완료")
+            except Exception as e:
+                logger.warning(f"⚠️ 응답 캐시 Redis 연결 실패, 로컬 캐시만 사용: {e}")
+                self._redis_client = None
+        return self._redis_client
+
+    def _current_redis_generation(self, client) -> int:
+        """공유 세대 번호 (다른 워커/파이프라인의 무효화 반영, 짧게 로컬 캐시)"""
+        now = time.monotonic()
+        if now - self._redis_generation_checked_at >= self.redis_generation_refresh:
+            generation = int(client.get(REDIS_GENERATION_KEY) or 0)
+            if generation != self._redis_generation:
+                # 다른 프로세스에서 무효화됨 → 로컬 캐시도 비움
+                self._clear_local()
+                self._redis_generation = generation
+            self._redis_generation_checked_at = now
+        return self._redis_generation
+
+    def _clear_local(self):
+        """로컬 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._generation += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시 조회 (블로킹 - Redis 사용 시 실행 계층에서 호출)"""
+        client = self._get_redis()
+        if client:
+            try:
+                self._current_redis_generation(client)
+            except Exception as e:
+                logger.debug(f"응답 캐시 세대 조회 실패: {e}")
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                expires_at, generation, message, size = entry
+                if generation == self._generation and expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self._stats.local_hits += 1
+                    return message
+                del self._entries[key]
+                self._bytes -= size
+
+        if client:
+            try:
+                cached = client.get(f"{REDIS_KEY_PREFIX}:{self._redis_generation}:{key}")
+                if cached:
+                    remaining = client.ttl(f"{REDIS_KEY_PREFIX}:{self._redis_generation}:{key}")
+                    self._store_local(key, cached, max(remaining, 1))
+                    self._stats.redis_hits += 1
+                    return cached
+            except Exception as e:
+                logger.debug(f"응답 캐시 Redis 조회 실패: {e}")
+
+        self._stats.misses += 1
+        return None
+
+    def set(self, key: str, intent: str, message: str):
+        """캐시 저장 (블로킹 - Redis 사용 시 실행 계층에서 호출)"""
+        ttl = self.ttl_for(intent)
+        if not ttl:
+            return
+        if self._entry_bytes(key, message) > self.max_entry_bytes:
+            self._stats.oversized += 1
+            return
+        self._store_local(key, message, ttl)
+        self._stats.stores += 1
+
+        client = self._get_redis()
+        if client:
+            try:
+                client.setex(f"{REDIS_KEY_PREFIX}:{self._redis_generation}:{key}", ttl, message)
+            except Exception as e:
+                logger.debug(f"응답 캐시 Redis 저장 실패: {e}")
+
+    @staticmethod
+    def _entry_bytes(key: str, message: str) -> int:
+        return len(key) + len(message.encode('utf-8')) + ENTRY_OVERHEAD_BYTES
+
+    def _store_local(self, key: str, message: str, ttl: int):
+        """로컬 LRU 저장 (항목 수 / 바이트 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        size = self._entry_bytes(key, message)
+        if size > self.max_entry_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[3]
+            self._entries[key] = (time.time() + ttl, self._generation, message, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[3]
+                self._stats.evictions += 1
+
+    def invalidate(self, reason: str = ""):
+        """전체 무효화 (새 뉴스 저장 시) - 로컬 세대 증가 및 Redis 공유 세대 증가"""
+        self._clear_local()
+        self._stats.invalidations += 1
+
+        client = self._get_redis()
+        if client:
+            try:
+                self._redis_generation = int(client.incr(REDIS_GENERATION_KEY))
+                self._redis_generation_checked_at = time.monotonic()
+            except Exception as e:
+                logger.debug(f"응답 캐시 Redis 무효화 실패: {e}")
+
+        logger.info(f"🧹 응답 캐시 무효화{f': {reason}' if reason else ''}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """응답 캐시 통계"""
+        stats = self._stats.to_dict()
+        stats.update({
+            'enabled': self.enabled,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+            'max_entry_bytes': self.max_entry_bytes,
+            'redis': self._redis_client is not None,
+            'intent_ttls': self.intent_ttls
+        })
+        return stats
+
+
+# 전역 응답 캐시 인스턴스
+response_cache = ResponseCache()
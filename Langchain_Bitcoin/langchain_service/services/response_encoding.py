@@ -0,0 +1,211 @@
+"""
+응답 직렬화 / 압축 계층
+큰 응답(최근 뉴스 50건, base64 차트 이미지가 포함된 채팅 응답)을 빠르게 직렬화하고 압축하여 전송
+
+- FastJSONResponse: orjson 사용 (미설치 시 표준 json + datetime/Decimal/UUID 변환)
+- ResponseEncodingMiddleware: Accept-Encoding에 따라 brotli / gzip 압축 (일정 크기 이상, 스트리밍 제외)
+- 엔드포인트별 직렬화 크기 / 전송 크기 / 직렬화·압축 시간을 지표로 기록
+"""
+
+import contextvars
+import gzip
+import json
+import logging
+import os
+import time
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.routing import Match
+
+from .metrics import metrics
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 응답 크기 버킷 (바이트): 1KB ~ 4MB
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+RESPONSE_SIZE = metrics.histogram(
+    'http_response_size_bytes', '엔드포인트별 응답 크기 (serialized: 직렬화 직후, wire: 압축 후 전송)',
+    ['endpoint', 'stage'], buckets=SIZE_BUCKETS)
+RESPONSE_ENCODE_LATENCY = metrics.histogram(
+    'http_response_encode_duration_seconds', '엔드포인트별 응답 직렬화 / 압축 시간',
+    ['endpoint', 'step'], buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25))
+RESPONSE_ENCODING_TOTAL = metrics.counter(
+    'http_response_encoding_total', '엔드포인트별 응답 인코딩 횟수', ['endpoint', 'encoding'])
+
+# 요청 단위 직렬화 시간 (미들웨어가 설정하고 FastJSONResponse가 기록)
+_encode_timing: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar(
+    'response_encode_timing', default=None
+)
+
+COMPRESSIBLE_TYPES = ('application/json', 'text/plain', 'text/html', 'text/csv')
+
+
+def _default(obj: Any) -> Any:
+    """표준 json 폴백용 변환"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, 'tolist'):
+        # numpy 배열 / 스칼라
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 직렬화 (UTF-8 바이트)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(content, ensure_ascii=False, separators=(',', ':'), default=_default).encode('utf-8')
+
+
+class FastJSONResponse(JSONResponse):
+    """빠른 JSON 응답 (직렬화 시간을 요청 컨텍스트에 기록)"""
+
+    def render(self, content: Any) -> bytes:
+        started = time.perf_counter()
+        body = dumps(content)
+        timing = _encode_timing.get()
+        if timing is not None:
+            timing['serialize'] = timing.get('serialize', 0.0) + (time.perf_counter() - started)
+        return body
+
+
+def _route_path(scope: Dict[str, Any]) -> str:
+    """지표 레이블용 라우트 경로 (/pipeline/jobs/{job_id} 형태, 경로 파라미터로 레이블이 늘어나지 않도록)"""
+    route = scope.get('route')
+    if route is not None and hasattr(route, 'path'):
+        return route.path
+    app = scope.get('app')
+    router = getattr(app, 'router', None)
+    for candidate in getattr(router, 'routes', []):
+        try:
+            match, _ = candidate.matches(scope)
+        except Exception:
+            continue
+        if match == Match.FULL:
+            return getattr(candidate, 'path', scope.get('path', 'unknown'))
+    return 'unmatched'
+
+
+class ResponseEncodingMiddleware:
+    """Accept-Encoding 협상 압축 및 응답 크기/시간 기록 (ASGI 미들웨어)"""
+
+    def __init__(self, app, minimum_size: int = None, gzip_level: int = None, brotli_quality: int = None):
+        self.app = app
+        self.minimum_size = minimum_size or int(os.getenv('COMPRESSION_MIN_SIZE', 1024))
+        self.gzip_level = gzip_level or int(os.getenv('COMPRESSION_GZIP_LEVEL', 5))
+        self.brotli_quality = brotli_quality or int(os.getenv('COMPRESSION_BROTLI_QUALITY', 4))
+        self.enabled = os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true'
+
+    def _choose_encoding(self, scope: Dict[str, Any]) -> Optional[str]:
+        """클라이언트가 허용한 인코딩 중 선택 (brotli 우선)"""
+        if not self.enabled:
+            return None
+        accepted = {
+            part.split(';')[0].strip().lower()
+            for part in Headers(scope=scope).get('accept-encoding', '').split(',')
+            if part.strip() and not part.strip().endswith(';q=0')
+        }
+        if BROTLI_AVAILABLE and 'br' in accepted:
+            return 'br'
+        if 'gzip' in accepted:
+            return 'gzip'
+        return None
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == 'br':
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._choose_encoding(scope)
+        timing: Dict[str, float] = {}
+        token = _encode_timing.set(timing)
+        start_message: Optional[Dict[str, Any]] = None
+        streaming = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, streaming
+            if message['type'] == 'http.response.start':
+                # 본문 크기를 알 때까지 헤더 전송 보류
+                start_message = message
+                return
+            if message['type'] != 'http.response.body' or streaming:
+                await send(message)
+                return
+            if message.get('more_body', False):
+                # 스트리밍 응답 (SSE 등): 버퍼링 / 압축 없이 그대로 전달
+                streaming = True
+                await send(start_message)
+                await send(message)
+                return
+            await self._send_complete(scope, start_message, message.get('body', b''), encoding, timing, send)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _encode_timing.reset(token)
+
+    async def _send_complete(self, scope, start_message, body: bytes, encoding: Optional[str],
+                             timing: Dict[str, float], send):
+        """전체 본문이 준비된 응답 전송 (조건 충족 시 압축)"""
+        start_message['headers'] = list(start_message.get('headers', []))
+        headers = MutableHeaders(raw=start_message['headers'])
+        content_type = headers.get('content-type', '')
+        endpoint = _route_path(scope)
+
+        applied = 'identity'
+        wire_body = body
+        if (encoding and len(body) >= self.minimum_size
+                and 'content-encoding' not in headers
+                and content_type.startswith(COMPRESSIBLE_TYPES)):
+            started = time.perf_counter()
+            compressed = self._compress(body, encoding)
+            RESPONSE_ENCODE_LATENCY.observe(time.perf_counter() - started, endpoint=endpoint, step='compress')
+            if len(compressed) < len(body):
+                wire_body = compressed
+                applied = encoding
+                headers['content-encoding'] = encoding
+                headers['content-length'] = str(len(wire_body))
+        if self.enabled and content_type.startswith(COMPRESSIBLE_TYPES):
+            headers.add_vary_header('Accept-Encoding')
+
+        if 'serialize' in timing:
+            RESPONSE_ENCODE_LATENCY.observe(timing['serialize'], endpoint=endpoint, step='serialize')
+        RESPONSE_SIZE.observe(len(body), endpoint=endpoint, stage='serialized')
+        RESPONSE_SIZE.observe(len(wire_body), endpoint=endpoint, stage='wire')
+        RESPONSE_ENCODING_TOTAL.inc(endpoint=endpoint, encoding=applied)
+
+        await send(start_message)
+        await send({'type': 'http.response.body', 'body': wire_body, 'more_body': False})
@@ -0,0 +1,182 @@
+"""
+세션 상태 저장소
+세션별 언어 설정과 활동 기록을 워커 간에 공유하기 위한 교체 가능한 백엔드
+
+- memory: 프로세스 내 딕셔너리 (단일 워커 / 개발용)
+- redis: Redis 공유 저장소 (멀티 워커 운영용, 어느 워커든 모든 세션 처리 가능)
+
+SESSION_BACKEND 환경변수로 선택 (기본값: memory)
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LANGUAGE = 'ko'
+
+
+class SessionStore:
+    """세션 저장소 인터페이스"""
+
+    backend = 'base'
+
+    def __init__(self, ttl: int = None):
+        """초기화"""
+        self.ttl = ttl or int(os.getenv('SESSION_TTL', 86400))
+
+    def get_language(self, session_id: str) -> str:
+        """세션 언어 조회 (기본값: 한글)"""
+        raise NotImplementedError
+
+    def set_language(self, session_id: str, language: str):
+        """세션 언어 설정"""
+        raise NotImplementedError
+
+    def touch(self, session_id: str):
+        """세션 활동 기록"""
+        raise NotImplementedError
+
+    def active_session_count(self) -> int:
+        """TTL 내 활동한 세션 수"""
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict:
+        """저장소 통계"""
+        return {
+            'backend': self.backend,
+            'ttl_seconds': self.ttl,
+            'active_sessions': self.active_session_count()
+        }
+
+
+class MemorySessionStore(SessionStore):
+    """프로세스 내 세션 저장소"""
+
+    backend = 'memory'
+
+    def __init__(self, ttl: int = None):
+        """초기화"""
+        super().__init__(ttl)
+        self._languages: Dict[str, str] = {}
+        self._last_seen: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get_language(self, session_id: str) -> str:
+        """세션 언어 조회 (기본값: 한글)"""
+        return self._languages.get(session_id, DEFAULT_LANGUAGE)
+
+    def set_language(self, session_id: str, language: str):
+        """세션 언어 설정"""
+        with self._lock:
+            self._languages[session_id] = language
+            self._last_seen[session_id] = time.time()
+
+    def touch(self, session_id: str):
+        """세션 활동 기록 (만료된 세션 정리)"""
+        now = time.time()
+        with self._lock:
+            self._last_seen[session_id] = now
+            if len(self._last_seen) % 1000 == 0:
+                self._evict_expired(now)
+
+    def _evict_expired(self, now: float):
+        """TTL이 지난 세션 제거"""
+        expired = [sid for sid, seen in self._last_seen.items() if now - seen > self.ttl]
+        for sid in expired:
+            self._last_seen.pop(sid, None)
+            self._languages.pop(sid, None)
+
+    def active_session_count(self) -> int:
+        """TTL 내 활동한 세션 수"""
+        cutoff = time.time() - self.ttl
+        return sum(1 for seen in self._last_seen.values() if seen >= cutoff)
+
+
+class RedisSessionStore(SessionStore):
+    """Redis 공유 세션 저장소"""
+
+    backend = 'redis'
+    key_prefix = 'chat_session'
+
+    def __init__(self, ttl: int = None, client=None):
+        """초기화"""
+        super().__init__(ttl)
+        self.redis_client = client or redis.Redis(
+            host=os.getenv('REDIS_HOST', 'localhost'),
+            port=int(os.getenv('REDIS_PORT', 6379)),
+            db=int(os.getenv('SESSION_REDIS_DB', 0)),
+            decode_responses=True,
+            socket_connect_timeout=2,
+            socket_timeout=2
+        )
+        self.redis_client.ping()
+        logger.info("✅ Redis 세션 저장소 연결 완료")
+
+    def _language_key(self, session_id: str) -> str:
+        return f"{self.key_prefix}:{session_id}:language"
+
+    @property
+    def _active_key(self) -> str:
+        return f"{self.key_prefix}:active"
+
+    def get_language(self, session_id: str) -> str:
+        """세션 언어 조회 (Redis 오류 시 기본값)"""
+        try:
+            return self.redis_client.get(self._language_key(session_id)) or DEFAULT_LANGUAGE
+        except Exception as e:
+            logger.warning(f"⚠️ 세션 언어 조회 실패: {e}")
+            return DEFAULT_LANGUAGE
+
+    def set_language(self, session_id: str, language: str):
+        """세션 언어 설정 (TTL 적용)"""
+        try:
+            self.redis_client.setex(self._language_key(session_id), self.ttl, language)
+        except Exception as e:
+            logger.warning(f"⚠️ 세션 언어 저장 실패: {e}")
+
+    def touch(self, session_id: str):
+        """세션 활동 기록 (정렬 집합에 마지막 활동 시각 저장)"""
+        now = time.time()
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.zadd(self._active_key, {session_id: now})
+            pipe.zremrangebyscore(self._active_key, 0, now - self.ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.debug(f"세션 활동 기록 실패: {e}")
+
+    def active_session_count(self) -> int:
+        """TTL 내 활동한 세션 수"""
+        try:
+            return int(self.redis_client.zcount(self._active_key, time.time() - self.ttl, '+inf'))
+        except Exception as e:
+            logger.debug(f"세션 수 조회 실패: {e}")
+            return 0
+
+
+def create_session_store(backend: Optional[str] = None) -> SessionStore:
+    """환경설정에 맞는 세션 저장소 생성 (Redis 사용 불가 시 메모리로 대체)"""
+    backend = (backend or os.getenv('SESSION_BACKEND', 'memory')).lower()
+
+    if backend == 'redis':
+        if not REDIS_AVAILABLE:
+            logger.warning("⚠️ redis 패키지가 없어 메모리 세션 저장소를 사용합니다")
+        else:
+            try:
+                return RedisSessionStore()
+            except Exception as e:
+                logger.warning(f"⚠️ Redis 세션 저장소 연결 실패, 메모리 저장소 사용: {e}")
+    elif backend != 'memory':
+        logger.warning(f"⚠️ 알 수 없는 세션 백엔드 '{backend}', 메모리 저장소 사용")
+
+    return MemorySessionStore()
@@ -0,0 +1,220 @@
+"""
+단계적 시작 관리자 (Staged Startup)
+서버는 즉시 요청을 받기 시작하고, 무거운 구성요소(벡터 DB, 에이전트, Intent 임베딩, 뉴스 파이프라인)는
+백그라운드에서 의존성 순서를 지키며 동시에 초기화
+
+구성요소 상태: pending → initializing → ready / failed (의존성 실패 시 skipped)
+전체 단계: starting → ready / degraded (선택 구성요소 실패) / failed (필수 구성요소 실패)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+STATE_PENDING = 'pending'
+STATE_INITIALIZING = 'initializing'
+STATE_READY = 'ready'
+STATE_FAILED = 'failed'
+STATE_SKIPPED = 'skipped'
+
+PHASE_STARTING = 'starting'
+PHASE_READY = 'ready'
+PHASE_DEGRADED = 'degraded'
+PHASE_FAILED = 'failed'
+
+
+@dataclass
+class Component:
+    """초기화 대상 구성요소"""
+    name: str
+    initializer: Callable[[], Awaitable[Any]]
+    depends_on: Sequence[str] = ()
+    critical: bool = True
+    timeout: float = 60.0
+    retries: int = 0
+    state: str = STATE_PENDING
+    attempts: int = 0
+    error: Optional[str] = None
+    waited_ms: float = 0.0
+    duration_ms: float = 0.0
+    ready_at: Optional[str] = None
+    done: Optional[asyncio.Event] = field(default=None, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """상태 딕셔너리 (단계별 소요 시간 포함)"""
+        data = {
+            'state': self.state,
+            'critical': self.critical,
+            'depends_on': list(self.depends_on),
+            'attempts': self.attempts,
+            'dependency_wait_ms': self.waited_ms,
+            'init_ms': self.duration_ms
+        }
+        if self.ready_at:
+            data['ready_at'] = self.ready_at
+        if self.error:
+            data['error'] = self.error
+        return data
+
+
+class StartupManager:
+    """구성요소 단계적 초기화 및 준비 상태 관리"""
+
+    def __init__(self, retry_delay: float = None):
+        """초기화"""
+        self.retry_delay = retry_delay or float(os.getenv('STARTUP_RETRY_DELAY', 2.0))
+        self._components: Dict[str, Component] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    def register(self,
+                 name: str,
+                 initializer: Callable[[], Awaitable[Any]],
+                 depends_on: Sequence[str] = (),
+                 critical: bool = True,
+                 timeout: float = None,
+                 retries: int = None):
+        """
+        구성요소 등록
+
+        Args:
+            name: 구성요소 이름
+            initializer: 초기화 코루틴 함수
+            depends_on: 먼저 준비되어야 하는 구성요소 이름
+            critical: 실패 시 전체 단계를 failed로 볼지 여부
+            timeout: 시도당 제한 시간 (초)
+            retries: 실패 시 재시도 횟수
+        """
+        self._components[name] = Component(
+            name=name,
+            initializer=initializer,
+            depends_on=tuple(depends_on),
+            critical=critical,
+            timeout=timeout or float(os.getenv('STARTUP_COMPONENT_TIMEOUT', 60)),
+            retries=int(os.getenv('STARTUP_RETRIES', 2)) if retries is None else retries
+        )
+
+    def start(self):
+        """백그라운드 초기화 시작 (즉시 반환)"""
+        if self._task and not self._task.done():
+            return
+        for component in self._components.values():
+            component.done = asyncio.Event()
+        self._started_at = time.perf_counter()
+        self._task = asyncio.create_task(self._run_all())
+        logger.info(f"🚀 단계적 초기화 시작: {', '.join(self._components)}")
+
+    async def stop(self):
+        """진행 중인 초기화 취소"""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def wait(self, timeout: float = None) -> str:
+        """모든 구성요소 초기화 완료까지 대기 (스크립트/테스트용)"""
+        if self._task:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout=timeout)
+        return self.phase
+
+    async def _run_all(self):
+        """모든 구성요소를 동시에 초기화 (각자 의존성 완료를 대기)"""
+        await asyncio.gather(*(self._run_component(component) for component in self._components.values()))
+        self._finished_at = time.perf_counter()
+        elapsed = round(self._finished_at - self._started_at, 2)
+        logger.info(f"🎉 단계적 초기화 종료: {self.phase} ({elapsed}초)")
+
+    async def _run_component(self, component: Component):
+        """단일 구성요소 초기화 (의존성 대기 → 시도/재시도)"""
+        try:
+            wait_started = time.perf_counter()
+            for dependency in component.depends_on:
+                dep = self._components.get(dependency)
+                if dep is None:
+                    continue
+                await dep.done.wait()
+                if dep.state != STATE_READY:
+                    component.state = STATE_SKIPPED
+                    component.error = f"dependency '{dependency}' {dep.state}"
+                    logger.warning(f"⏭️ {component.name} 초기화 건너뜀: {component.error}")
+                    return
+            component.waited_ms = round((time.perf_counter() - wait_started) * 1000, 1)
+
+            for attempt in range(component.retries + 1):
+                component.attempts = attempt + 1
+                component.state = STATE_INITIALIZING
+                started = time.perf_counter()
+                try:
+                    await asyncio.wait_for(component.initializer(), timeout=component.timeout)
+                    component.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+                    component.state = STATE_READY
+                    component.error = None
+                    component.ready_at = datetime.now().isoformat()
+                    logger.info(f"✅ {component.name} 준비 완료 ({component.duration_ms}ms)")
+                    return
+                except asyncio.TimeoutError:
+                    component.error = f"timeout after {component.timeout}s"
+                except Exception as e:
+                    component.error = str(e)
+                component.duration_ms = round((time.perf_counter() - started) * 1000, 1)
+
+                if attempt < component.retries:
+                    delay = self.retry_delay * (2 ** attempt)
+                    logger.warning(f"⚠️ {component.name} 초기화 실패 ({component.error}), {delay}초 후 재시도")
+                    await asyncio.sleep(delay)
+
+            component.state = STATE_FAILED
+            log = logger.error if component.critical else logger.warning
+            log(f"❌ {component.name} 초기화 실패: {component.error}")
+        finally:
+            component.done.set()
+
+    def state(self, name: str) -> str:
+        """구성요소 상태"""
+        component = self._components.get(name)
+        return component.state if component else STATE_PENDING
+
+    def is_ready(self, name: str) -> bool:
+        """구성요소 준비 여부"""
+        return self.state(name) == STATE_READY
+
+    def is_initializing(self, name: str) -> bool:
+        """구성요소가 아직 초기화 중인지 여부 (곧 사용 가능)"""
+        return self.state(name) in (STATE_PENDING, STATE_INITIALIZING)
+
+    @property
+    def phase(self) -> str:
+        """전체 시작 단계"""
+        states: List[Component] = list(self._components.values())
+        if any(c.critical and c.state in (STATE_FAILED, STATE_SKIPPED) for c in states):
+            return PHASE_FAILED
+        if any(c.state in (STATE_PENDING, STATE_INITIALIZING) for c in states):
+            return PHASE_STARTING
+        if all(c.state == STATE_READY for c in states):
+            return PHASE_READY
+        return PHASE_DEGRADED
+
+    def snapshot(self) -> Dict[str, Any]:
+        """시작 단계 및 구성요소별 상태/소요 시간"""
+        elapsed = None
+        if self._started_at is not None:
+            end = self._finished_at or time.perf_counter()
+            elapsed = round((end - self._started_at) * 1000, 1)
+        return {
+            'phase': self.phase,
+            'elapsed_ms': elapsed,
+            'components': {name: component.to_dict() for name, component in self._components.items()}
+        }
+
+
+# 전역 시작 관리자 인스턴스
+startup_manager = StartupManager()
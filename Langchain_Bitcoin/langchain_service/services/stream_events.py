@@ -0,0 +1,44 @@
+"""
+스트리밍 이벤트 정의
+/chat/stream (Server-Sent Events)에서 사용하는 이벤트 딕셔너리 생성 헬퍼
+
+이벤트 종류:
+- intent: Intent 분류 결과 (첫 이벤트)
+- progress: 도구 실행 단계 진행 상황
+- token: LLM 토큰 (도착 즉시 전달)
+- message: 도구 결과 등 한 번에 전달되는 텍스트 블록
+- done: 최종 ChatResponse 메타데이터 (마지막 이벤트)
+- error: 처리 중 오류
+"""
+
+from typing import Any, Dict
+
+
+def intent_event(intent: str, confidence: float, method: str = None) -> Dict[str, Any]:
+    """Intent 분류 이벤트"""
+    return {'event': 'intent', 'data': {'intent': intent, 'confidence_score': confidence, 'method': method}}
+
+
+def progress_event(stage: str, status: str, **details) -> Dict[str, Any]:
+    """도구 진행 이벤트 (status: started / completed / failed)"""
+    return {'event': 'progress', 'data': {'stage': stage, 'status': status, **details}}
+
+
+def token_event(text: str) -> Dict[str, Any]:
+    """LLM 토큰 이벤트"""
+    return {'event': 'token', 'data': {'text': text}}
+
+
+def message_event(text: str) -> Dict[str, Any]:
+    """텍스트 블록 이벤트"""
+    return {'event': 'message', 'data': {'text': text}}
+
+
+def done_event(response: Dict[str, Any]) -> Dict[str, Any]:
+    """최종 응답 이벤트"""
+    return {'event': 'done', 'data': response}
+
+
+def error_event(message: str, error: str) -> Dict[str, Any]:
+    """오류 이벤트"""
+    return {'event': 'error', 'data': {'message': message, 'error': error}}
@@ -0,0 +1,210 @@
+"""
+테이블별 임베딩 모델 기록
+벡터 컬럼에 어떤 모델의 벡터가 들어 있는지 DB(embedding_column_models)에 기록하고
+저장 / 검색 경로가 컬럼과 같은 모델로 임베딩하도록 조회
+
+- 기록이 없으면 기존 저장 경로의 모델 (crypto_news: 로컬 all-MiniLM-L6-v2, crypto_news_summary: OpenAI ada)
+- 재임베딩 전환(reembed_corpus.py swap)이 같은 트랜잭션에서 기록 → 실행 중인 서비스는 재조회 주기 안에 반영
+
+환경변수
+- EMBEDDING_MODEL_REFRESH_SECONDS: 기록 재조회 주기 (기본값: 60)
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .embedding_providers import LocalEmbeddingProvider, create_provider
+from .embedding_service import embedding_service
+
+try:
+    import psycopg2
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MODELS_TABLE = 'embedding_column_models'
+
+# 기록이 없을 때의 모델 (각 테이블을 채워 온 저장 경로 기준)
+DEFAULT_TABLE_SPECS = {
+    'crypto_news': 'local:all-MiniLM-L6-v2',
+    'crypto_news_summary': 'openai:text-embedding-ada-002',
+}
+
+
+@dataclass(frozen=True)
+class TableEmbedding:
+    """테이블 embedding 컬럼의 모델"""
+    table: str
+    spec: str
+    model: str
+    dimension: int
+    recorded: bool
+
+
+def ensure_models_table(cur):
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS {MODELS_TABLE} (
+            table_name TEXT NOT NULL,
+            column_name TEXT NOT NULL,
+            spec TEXT NOT NULL,
+            model TEXT NOT NULL,
+            dimension INTEGER NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (table_name, column_name)
+        )
+    """)
+
+
+def record_table_model(cur, table: str, spec: str, model: str, dimension: int, column: str = 'embedding'):
+    """컬럼 모델 기록 (호출자 트랜잭션 안에서 실행 → 컬럼 교체와 함께 커밋)"""
+    ensure_models_table(cur)
+    cur.execute(f"""
+        INSERT INTO {MODELS_TABLE} (table_name, column_name, spec, model, dimension)
+        VALUES (%s, %s, %s, %s, %s)
+        ON CONFLICT (table_name, column_name) DO UPDATE
+        SET spec = EXCLUDED.spec, model = EXCLUDED.model, dimension = EXCLUDED.dimension,
+            updated_at = CURRENT_TIMESTAMP
+    """, (table, column, spec, model, dimension))
+
+
+_registered_specs: Dict[str, Tuple[str, int]] = {}
+_registered_lock = threading.Lock()
+
+
+def register_spec(spec: str) -> Tuple[str, int]:
+    """
+    제공자 설정(openai:<모델> | local:<모델>)을 공용 임베딩 서비스에 등록
+
+    저장된 벡터와 같아야 하므로 로컬 모델은 양자화 / ONNX 설정과 무관하게 원본 torch 모델 사용
+
+    Returns:
+        (임베딩 서비스 모델 식별자, 차원)
+    """
+    with _registered_lock:
+        if spec not in _registered_specs:
+            kind, _, model = spec.strip().partition(':')
+            if kind.lower() == 'local':
+                provider = LocalEmbeddingProvider(model or None, backend='torch', quantize=False)
+            else:
+                provider = create_provider(spec)
+            embedding_service.register_provider(provider.cache_model, provider)
+            _registered_specs[spec] = (provider.cache_model, provider.dimension)
+        return _registered_specs[spec]
+
+
+def connection_params() -> Dict[str, Any]:
+    """PgVector 연결 정보 (DualDatabaseService와 같은 환경변수)"""
+    return {
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'port': int(os.getenv('DB_PORT', 5435)),
+        'database': os.getenv('DB_NAME', 'mydb'),
+        'user': os.getenv('DB_USER', 'myuser'),
+        'password': os.getenv('DB_PASSWORD', 'mypassword')
+    }
+
+
+class TableEmbeddingModels:
+    """테이블별 모델 조회 (재조회 주기 동안 프로세스 안에서 캐시)"""
+
+    def __init__(self, refresh_seconds: float = None):
+        self.refresh_seconds = refresh_seconds if refresh_seconds is not None else \
+            float(os.getenv('EMBEDDING_MODEL_REFRESH_SECONDS', 60))
+        self._entries: Dict[str, Tuple[float, TableEmbedding]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, table: str, connect: Callable = None) -> TableEmbedding:
+        """
+        테이블 embedding 컬럼의 모델 (블로킹 - 주기마다 DB 조회)
+
+        Args:
+            table: 테이블 이름
+            connect: 연결 생성 함수 (기본값: DB_* 환경변수)
+        """
+        with self._lock:
+            cached = self._entries.get(table)
+        if cached and time.monotonic() - cached[0] < self.refresh_seconds:
+            return cached[1]
+
+        try:
+            entry = self._lookup(table, connect)
+        except Exception as e:
+            if cached:
+                logger.debug(f"임베딩 모델 기록 재조회 실패, 이전 값 사용 ({table}): {e}")
+                entry = cached[1]
+            else:
+                logger.warning(f"⚠️ 임베딩 모델 기록 조회 실패, 기본 모델 사용 ({table}): {e}")
+                entry = self._default(table)
+
+        if cached is None or cached[1] != entry:
+            logger.info(f"🧭 {table}.embedding 모델: {entry.model} ({entry.dimension}차원, "
+                        f"{'기록' if entry.recorded else '기본값'})")
+        with self._lock:
+            self._entries[table] = (time.monotonic(), entry)
+        return entry
+
+    def model(self, table: str, connect: Callable = None) -> str:
+        return self.get(table, connect).model
+
+    def embed_query(self, table: str, query: str) -> List[float]:
+        """테이블 벡터와 같은 모델로 검색 질의 임베딩 (블로킹, 질의 LRU 사용)"""
+        return embedding_service.embed_query(query, self.get(table).model)
+
+    def invalidate(self, table: Optional[str] = None):
+        """다음 조회 시 DB에서 다시 읽음 (차원 불일치 오류 등 전환 감지 시)"""
+        with self._lock:
+            if table is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(table, None)
+
+    def _lookup(self, table: str, connect: Callable = None) -> TableEmbedding:
+        if connect is None:
+            if not PSYCOPG2_AVAILABLE:
+                return self._default(table)
+            connect = lambda: psycopg2.connect(**connection_params())  # noqa: E731
+        conn = connect()
+        try:
+            with conn.cursor() as cur:
+                # 기록 테이블이 없어도 호출자 트랜잭션 오류가 나지 않도록 존재 여부 먼저 확인
+                cur.execute("SELECT to_regclass(%s) IS NOT NULL AS found", (MODELS_TABLE,))
+                row = cur.fetchone()
+                if not (row['found'] if isinstance(row, dict) else row[0]):
+                    return self._default(table)
+                cur.execute(f"""
+                    SELECT spec, dimension FROM {MODELS_TABLE}
+                    WHERE table_name = %s AND column_name = 'embedding'
+                """, (table,))
+                row = cur.fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return self._default(table)
+        spec, dimension = (row['spec'], row['dimension']) if isinstance(row, dict) else row
+        model, _ = register_spec(spec)
+        return TableEmbedding(table, spec, model, int(dimension), True)
+
+    @staticmethod
+    def _default(table: str) -> TableEmbedding:
+        if table not in DEFAULT_TABLE_SPECS:
+            raise ValueError(f"임베딩 모델을 알 수 없는 테이블: {table}")
+        spec = DEFAULT_TABLE_SPECS[table]
+        model, dimension = register_spec(spec)
+        return TableEmbedding(table, spec, model, dimension, False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = [entry for _, entry in self._entries.values()]
+        return {
+            entry.table: {'model': entry.model, 'dimension': entry.dimension, 'recorded': entry.recorded}
+            for entry in entries
+        }
+
+
+# 전역 인스턴스
+table_embedding_models = TableEmbeddingModels()
@@ -7,6 +7,7 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+import os
 import requests
 import base64
 import io
@@ -19,7 +20,7 @@ logger = logging.getLogger(__name__)
 
 class UpbitChartGenerator:
     def __init__(self):
-        self.base_url = "https://api.upbit.com/v1"
+        self.base_url = os.getenv('UPBIT_BASE_URL', "https://api.upbit.com/v1")
         
     def get_candle_data(self, market: str = "KRW-BTC", count: int = 365, unit: str = "days") -> pd.DataFrame:
         """Upbit API에서 캔들 데이터 가져오기"""
@@ -401,4 +402,14 @@ class UpbitChartGenerator:
             
         except Exception as e:
             logger.error(f"시장 분석 실패: {e}")
-            return {}
\ No newline at end of file
+            return {}
+
+def render_chart(market: str = "KRW-BTC", days: int = 30, comprehensive: bool = False) -> str:
+    """
+    차트 렌더링 진입점 (프로세스 풀 실행용)
+    plotly/kaleido 렌더링은 CPU 바운드이므로 pickle 가능한 최상위 함수로 노출
+    """
+    chart_gen = UpbitChartGenerator()
+    if comprehensive:
+        return chart_gen.generate_comprehensive_chart(market, days)
+    return chart_gen.generate_simple_price_chart(market, days)
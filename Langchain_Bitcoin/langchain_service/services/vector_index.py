@@ -0,0 +1,619 @@
+"""
+벡터 인덱스 관리
+embedding 컬럼 인덱스를 행 수에 맞게 만들고 다시 만들며, 검색마다 재현율 목표에 맞춰 탐색 범위(probes / ef_search) 설정
+
+- 방식: HNSW (pgvector 0.5 이상, 빈 테이블에서도 유효) 또는 IVFFlat
+  IVFFlat은 행이 충분히 쌓인 뒤 lists = 행 수 / 1000 (100만 행 초과: sqrt(행 수))로 생성
+  (빈 테이블에 만든 IVFFlat은 중심점이 의미 없고 lists도 다시 조정되지 않음)
+- maintain (대량 저장 후 백그라운드 스레드 / manage_vector_index.py): 인덱스가 없거나, 설정 방식과 다르거나,
+  생성 기록이 없거나, lists가 현재 행 수 기준의 절반 이하 / 두 배 이상이면 새 이름으로 CONCURRENTLY 생성 → 짧은 트랜잭션에서 교체
+  행이 IVFFlat 최소 행 수보다 적은데 생성 기록 없는 IVFFlat(예전 lists=100)이 있으면 제거 → 정확 검색
+- 보정(calibrate): 저장된 벡터 표본으로 정확 검색 대비 recall@10을 probes / ef_search 값별로 측정해 기록
+  → 검색마다 재현율 목표를 만족하는 가장 작은 값 사용 (보정 전에는 경험식)
+- 상태: 생성 시 행 수 / 이후 추가된 행 수, 추정 재현율 (기록: vector_index_builds)
+
+환경변수
+- VECTOR_INDEX_METHOD: auto | hnsw | ivfflat (기본값: auto - pgvector 0.5 이상이면 hnsw)
+- VECTOR_RECALL_TARGET: 검색 재현율 목표 (기본값: 0.95)
+- VECTOR_INDEX_IVFFLAT_MIN_ROWS: IVFFlat 인덱스를 만들 최소 행 수, 그 전에는 정확 검색 (기본값: 10000)
+- VECTOR_INDEX_HNSW_M / VECTOR_INDEX_HNSW_EF_CONSTRUCTION: HNSW 생성 설정 (기본값: 16 / 64)
+- VECTOR_INDEX_CALIBRATION_QUERIES: 보정 질의 수 (기본값: 20)
+- VECTOR_INDEX_AUTO_MAINTAIN: 대량 저장 후 백그라운드 자동 점검 (기본값: true)
+- VECTOR_INDEX_MAINTAIN_INTERVAL_SECONDS: 테이블별 자동 점검 최소 간격 (기본값: 600)
+- VECTOR_INDEX_REFRESH_SECONDS: 인덱스 상태 재조회 주기 (기본값: 60)
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .table_embeddings import connection_params
+
+try:
+    import psycopg2
+    PSYCOPG2_AVAILABLE = True
+except ImportError:
+    PSYCOPG2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BUILDS_TABLE = 'vector_index_builds'
+
+# embedding 컬럼 인덱스 이름 (서비스 시작 DDL / 재임베딩 교체와 같은 이름)
+TABLE_VECTOR_INDEXES = {
+    'crypto_news': 'idx_crypto_news_embedding',
+    'crypto_news_summary': 'idx_summary_embedding',
+}
+
+METHOD_HNSW = 'hnsw'
+METHOD_IVFFLAT = 'ivfflat'
+SEARCH_PARAMETERS = {METHOD_HNSW: 'hnsw.ef_search', METHOD_IVFFLAT: 'ivfflat.probes'}
+
+HNSW_MIN_VERSION = (0, 5, 0)
+HNSW_EF_SEARCH_DEFAULT = 40
+HNSW_EF_SEARCH_MAX = 1000
+HNSW_EF_SEARCH_STEPS = (10, 20, 40, 80, 160, 320, 640, 1000)
+
+IVFFLAT_ROWS_PER_LIST = 1000
+CALIBRATION_K = 10
+LISTS_REBUILD_RATIO = 2
+RECALIBRATE_GROWTH = 2
+SWAP_LOCK_TIMEOUT_MS = 5000
+
+
+def ivfflat_lists(rows: int) -> int:
+    """행 수 기준 IVFFlat lists (pgvector 권장값)"""
+    if rows <= 1_000_000:
+        return max(1, rows // IVFFLAT_ROWS_PER_LIST)
+    return int(math.sqrt(rows))
+
+
+def _fetch_dict(cur) -> Optional[Dict[str, Any]]:
+    """일반 / RealDictCursor 모두에서 행을 dict로"""
+    row = cur.fetchone()
+    if row is None or isinstance(row, dict):
+        return row
+    return dict(zip([column[0] for column in cur.description], row))
+
+
+@dataclass(frozen=True)
+class IndexState:
+    """embedding 인덱스 상태 (pg_catalog + 생성 / 보정 기록)"""
+    table: str
+    index: str
+    method: Optional[str]
+    lists: Optional[int]
+    rows: int
+    rows_at_build: Optional[int]
+    built_at: Optional[datetime]
+    calibration: Tuple[Tuple[int, float], ...]
+    calibrated_rows: Optional[int]
+
+    @property
+    def tracked(self) -> bool:
+        return self.rows_at_build is not None
+
+    @property
+    def rows_since_build(self) -> Optional[int]:
+        return None if self.rows_at_build is None else max(0, self.rows - self.rows_at_build)
+
+
+def ensure_builds_table(cur):
+    cur.execute(f"""
+        CREATE TABLE IF NOT EXISTS {BUILDS_TABLE} (
+            index_name TEXT PRIMARY KEY,
+            table_name TEXT NOT NULL,
+            method TEXT NOT NULL,
+            lists INTEGER,
+            rows_at_build BIGINT,
+            built_at TIMESTAMP,
+            calibration JSONB,
+            calibrated_rows BIGINT,
+            calibrated_at TIMESTAMP
+        )
+    """)
+
+
+def record_index_build(cur, table: str, index: str, method: str, lists: Optional[int], rows: int):
+    """인덱스 생성 기록 (호출자 트랜잭션 안에서 실행, 이전 보정 결과는 지움)"""
+    ensure_builds_table(cur)
+    cur.execute(f"""
+        INSERT INTO {BUILDS_TABLE} (index_name, table_name, method, lists, rows_at_build, built_at)
+        VALUES (%s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+        ON CONFLICT (index_name) DO UPDATE
+        SET table_name = EXCLUDED.table_name, method = EXCLUDED.method, lists = EXCLUDED.lists,
+            rows_at_build = EXCLUDED.rows_at_build, built_at = EXCLUDED.built_at,
+            calibration = NULL, calibrated_rows = NULL, calibrated_at = NULL
+    """, (index, table, method, lists, rows))
+
+
+def count_vector_rows(cur, table: str) -> int:
+    cur.execute(f"SELECT count(*) AS rows FROM {table} WHERE embedding IS NOT NULL")
+    return int(_fetch_dict(cur)['rows'])
+
+
+def read_index_state(cur, table: str, index: str) -> IndexState:
+    """pg_catalog의 인덱스 방식 / lists / 테이블 행 수(추정) + 생성 / 보정 기록"""
+    cur.execute("""
+        SELECT am.amname AS method, c.reloptions AS options, t.reltuples AS rows
+        FROM pg_class c
+        JOIN pg_am am ON am.oid = c.relam
+        JOIN pg_index i ON i.indexrelid = c.oid
+        JOIN pg_class t ON t.oid = i.indrelid
+        WHERE c.oid = to_regclass(%s) AND i.indisvalid
+    """, (index,))
+    catalog = _fetch_dict(cur)
+    if catalog is None:
+        cur.execute("SELECT reltuples AS rows FROM pg_class WHERE oid = to_regclass(%s)", (table,))
+        catalog = _fetch_dict(cur) or {'rows': 0}
+        catalog.update(method=None, options=None)
+
+    lists = None
+    for option in catalog.get('options') or []:
+        name, _, value = option.partition('=')
+        if name == 'lists':
+            lists = int(value)
+    if catalog['method'] == METHOD_IVFFLAT and lists is None:
+        lists = 100  # pgvector 기본값
+
+    record = None
+    cur.execute("SELECT to_regclass(%s) IS NOT NULL AS found", (BUILDS_TABLE,))
+    if _fetch_dict(cur)['found']:
+        cur.execute(f"""
+            SELECT method, lists, rows_at_build, built_at, calibration, calibrated_rows
+            FROM {BUILDS_TABLE} WHERE index_name = %s
+        """, (index,))
+        record = _fetch_dict(cur)
+    # 기록 이후 다른 경로로 바뀐 인덱스면 기록 무시
+    if record and (record['method'] != catalog['method'] or record['lists'] != lists):
+        record = None
+    record = record or {}
+    calibration = record.get('calibration') or []
+    if isinstance(calibration, str):
+        calibration = json.loads(calibration)
+
+    return IndexState(
+        table=table,
+        index=index,
+        method=catalog['method'],
+        lists=lists,
+        rows=max(0, int(catalog['rows'] or 0)),
+        rows_at_build=record.get('rows_at_build'),
+        built_at=record.get('built_at'),
+        calibration=tuple((int(value), float(recall)) for value, recall in calibration),
+        calibrated_rows=record.get('calibrated_rows')
+    )
+
+
+class VectorIndexManager:
+    """embedding 인덱스 생성 / 재생성 / 검색 탐색 범위 설정"""
+
+    def __init__(self):
+        self.method = os.getenv('VECTOR_INDEX_METHOD', 'auto').strip().lower()
+        self.recall_target = float(os.getenv('VECTOR_RECALL_TARGET', 0.95))
+        self.ivfflat_min_rows = int(os.getenv('VECTOR_INDEX_IVFFLAT_MIN_ROWS', 10000))
+        self.hnsw_m = int(os.getenv('VECTOR_INDEX_HNSW_M', 16))
+        self.hnsw_ef_construction = int(os.getenv('VECTOR_INDEX_HNSW_EF_CONSTRUCTION', 64))
+        self.calibration_queries = int(os.getenv('VECTOR_INDEX_CALIBRATION_QUERIES', 20))
+        self.auto_maintain = os.getenv('VECTOR_INDEX_AUTO_MAINTAIN', 'true').lower() == 'true'
+        self.refresh_seconds = float(os.getenv('VECTOR_INDEX_REFRESH_SECONDS', 60))
+        self.maintain_interval = float(os.getenv('VECTOR_INDEX_MAINTAIN_INTERVAL_SECONDS', 600))
+        if self.method not in ('auto', METHOD_HNSW, METHOD_IVFFLAT):
+            logger.warning(f"⚠️ 알 수 없는 VECTOR_INDEX_METHOD: {self.method} - auto 사용")
+            self.method = 'auto'
+
+        self._states: Dict[str, Tuple[float, IndexState]] = {}
+        self._lock = threading.Lock()
+        self._maintaining = threading.Lock()
+        self._maintained_at: Dict[str, float] = {}
+
+    # ------------------------------------------------------------------ 생성
+
+    def resolve_method(self, cur) -> str:
+        """설정 방식 (auto / hnsw는 pgvector 버전이 낮으면 ivfflat)"""
+        if self.method == METHOD_IVFFLAT:
+            return METHOD_IVFFLAT
+        cur.execute("SELECT extversion AS version FROM pg_extension WHERE extname = 'vector'")
+        row = _fetch_dict(cur)
+        version = tuple(int(part) for part in re.findall(r'\d+', row['version'])[:3]) if row else ()
+        if version >= HNSW_MIN_VERSION:
+            return METHOD_HNSW
+        if self.method == METHOD_HNSW:
+            logger.warning(f"⚠️ pgvector {row['version'] if row else '-'}는 HNSW 미지원 - IVFFlat 사용")
+        return METHOD_IVFFLAT
+
+    def index_sql(self, table: str, index: str, method: str, lists: int = None, concurrently: bool = False) -> str:
+        if method == METHOD_IVFFLAT:
+            options = f"lists = {lists}"
+        else:
+            options = f"m = {self.hnsw_m}, ef_construction = {self.hnsw_ef_construction}"
+        return (
+            f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {index} "
+            f"ON {table} USING {method} (embedding vector_cosine_ops) WITH ({options})"
+        )
+
+    def ensure_index(self, cur, table: str):
+        """
+        서비스 시작 시 (스키마 생성 트랜잭션 안에서) 인덱스가 없을 때만 생성
+
+        IVFFlat은 행이 VECTOR_INDEX_IVFFLAT_MIN_ROWS 이상일 때만 만들고, 그 전에는 정확 검색 → 대량 저장 후 maintain에서 생성
+        """
+        index = TABLE_VECTOR_INDEXES[table]
+        ensure_builds_table(cur)
+        state = read_index_state(cur, table, index)
+        method = self.resolve_method(cur)
+        if state.method is not None:
+            if state.method == METHOD_IVFFLAT and not state.tracked:
+                rows = count_vector_rows(cur, table)
+                if method == METHOD_IVFFLAT and rows < self.ivfflat_min_rows:
+                    # 행이 적어 다시 만들 수도 없으므로 제거하고 정확 검색 (작은 테이블이라 잠금이 짧음)
+                    cur.execute(f"DROP INDEX IF EXISTS {index}")
+                    self.invalidate(table)
+                    logger.warning(f"🗑️ {index}: 생성 기록 없는 IVFFlat (lists={state.lists}) 제거 - "
+                                   f"벡터 {rows}개 < {self.ivfflat_min_rows}, 정확 검색")
+                else:
+                    logger.warning(f"⚠️ {index}: 생성 기록 없는 IVFFlat (lists={state.lists}) - "
+                                   f"다음 대량 저장 또는 manage_vector_index.py maintain에서 행 수 기준으로 재생성")
+            return
+
+        rows = count_vector_rows(cur, table)
+        if method == METHOD_IVFFLAT and rows < self.ivfflat_min_rows:
+            logger.info(f"ℹ️ {table}: 벡터 {rows}개 < {self.ivfflat_min_rows} - IVFFlat 인덱스 없이 정확 검색")
+            return
+        lists = ivfflat_lists(rows) if method == METHOD_IVFFLAT else None
+        cur.execute(self.index_sql(table, index, method, lists))
+        record_index_build(cur, table, index, method, lists, rows)
+        self.invalidate(table)
+        logger.info(f"🔨 벡터 인덱스 생성: {index} ({method}{f', lists={lists}' if lists else ''}, 행 {rows}개)")
+
+    def plan(self, cur, table: str) -> Dict[str, Any]:
+        """필요한 작업 판단 (build: 생성 / 재생성, drop: 제거 후 정확 검색, calibrate: 보정만, None: 없음)"""
+        index = TABLE_VECTOR_INDEXES[table]
+        state = read_index_state(cur, table, index)
+        rows = count_vector_rows(cur, table)
+        method = self.resolve_method(cur)
+        lists = ivfflat_lists(rows) if method == METHOD_IVFFLAT else None
+        buildable = method == METHOD_HNSW or rows >= self.ivfflat_min_rows
+
+        action, reason = None, None
+        if state.method is None:
+            if buildable:
+                action, reason = 'build', '인덱스 없음'
+        elif state.method != method:
+            if buildable:
+                action, reason = 'build', f"{state.method} → {method}"
+        elif method == METHOD_IVFFLAT and not state.tracked:
+            if buildable:
+                action, reason = 'build', f"생성 기록 없음 (lists={state.lists}, 빈 테이블에서 생성되었을 수 있음)"
+            else:
+                action, reason = 'drop', f"생성 기록 없음 (lists={state.lists}), 행 {rows}개 < {self.ivfflat_min_rows}"
+        elif method == METHOD_IVFFLAT and buildable and (
+                lists >= state.lists * LISTS_REBUILD_RATIO or lists * LISTS_REBUILD_RATIO <= state.lists):
+            action, reason = 'build', f"lists {state.lists} → {lists} (행 {rows}개)"
+        elif rows and (not state.calibration or rows >= (state.calibrated_rows or 0) * RECALIBRATE_GROWTH):
+            action, reason = 'calibrate', '보정 기록 없음' if not state.calibration else \
+                f"보정 이후 행 {state.calibrated_rows} → {rows}"
+
+        return {
+            'table': table, 'index': index, 'action': action, 'reason': reason,
+            'method': method, 'lists': lists, 'rows': rows,
+            'current_method': state.method, 'current_lists': state.lists
+        }
+
+    def maintain(self, table: str, connect: Callable = None, rebuild: bool = False) -> Dict[str, Any]:
+        """
+        대량 저장 후 점검 → 필요하면 생성 / 재생성(CONCURRENTLY) 후 보정 (블로킹, 큰 테이블은 수 분)
+
+        Args:
+            table: 테이블 이름
+            connect: 연결 생성 함수 (기본값: DB_* 환경변수)
+            rebuild: 점검 결과와 관계없이 다시 생성
+        """
+        if not self._maintaining.acquire(blocking=False):
+            return {'table': table, 'action': None, 'reason': '다른 점검 진행 중'}
+        try:
+            conn = (connect or self._connect)()
+            try:
+                with conn.cursor() as cur:
+                    ensure_builds_table(cur)
+                    plan = self.plan(cur, table)
+                conn.commit()
+                if rebuild and plan['action'] != 'build':
+                    plan.update(action='build', reason='재생성 요청')
+                if plan['action'] == 'build':
+                    logger.info(f"🔨 벡터 인덱스 재생성: {plan['index']} - {plan['reason']}")
+                    self._build(conn, plan)
+                elif plan['action'] == 'drop':
+                    self._drop(conn, plan)
+                if plan['action'] in ('build', 'calibrate'):
+                    plan['calibration'] = self._calibrate(conn, table)
+            finally:
+                conn.close()
+        finally:
+            self._maintaining.release()
+            self.invalidate(table)
+        return plan
+
+    def after_bulk_load(self, table: str, connect: Callable, inserted: int):
+        """
+        저장 경로의 일괄 삽입 후 호출 → 백그라운드 스레드에서 점검 (VECTOR_INDEX_AUTO_MAINTAIN)
+
+        행 수 조회 / 재생성 / 보정은 수 분 걸릴 수 있으므로 저장 작업(파이프라인 작업)을 기다리게 하지 않고,
+        테이블별로 VECTOR_INDEX_MAINTAIN_INTERVAL_SECONDS에 한 번만 실행 (실패해도 저장에는 영향 없음)
+        """
+        if not self.auto_maintain or not inserted:
+            return
+        now = time.monotonic()
+        with self._lock:
+            last = self._maintained_at.get(table)
+            if last is not None and now - last < self.maintain_interval:
+                return
+            self._maintained_at[table] = now
+
+        def run():
+            try:
+                plan = self.maintain(table, connect)
+                if plan.get('action'):
+                    logger.info(f"✅ 벡터 인덱스 점검 완료: {plan['index']} {plan['action']} ({plan['reason']})")
+                elif 'index' not in plan:
+                    # 다른 점검이 진행 중이라 건너뜀 → 다음 저장에서 다시 시도
+                    with self._lock:
+                        self._maintained_at.pop(table, None)
+            except Exception as e:
+                logger.warning(f"⚠️ 벡터 인덱스 점검 실패 ({table}): {e}")
+
+        threading.Thread(target=run, name=f'vector-index-maintain-{table}', daemon=True).start()
+
+    def _build(self, conn, plan: Dict[str, Any]):
+        """새 이름으로 CONCURRENTLY 생성 → 짧은 트랜잭션에서 기존 인덱스와 교체"""
+        table, index = plan['table'], plan['index']
+        staging = f"{index}_rebuild"
+        started = time.perf_counter()
+        previous = conn.autocommit
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                # 이전에 중단된 생성(INVALID 인덱스) 정리
+                cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {staging}")
+                cur.execute(self.index_sql(table, staging, plan['method'], plan['lists'], concurrently=True))
+        finally:
+            conn.autocommit = previous
+
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"SET LOCAL lock_timeout = '{SWAP_LOCK_TIMEOUT_MS}ms'")
+                cur.execute(f"DROP INDEX IF EXISTS {index}")
+                cur.execute(f"ALTER INDEX {staging} RENAME TO {index}")
+                record_index_build(cur, table, index, plan['method'], plan['lists'], plan['rows'])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        lists = f", lists={plan['lists']}" if plan['lists'] else ''
+        logger.info(f"✅ 벡터 인덱스 교체: {index} ({plan['method']}{lists}, 행 {plan['rows']}개, "
+                    f"{time.perf_counter() - started:.1f}초)")
+
+    def _drop(self, conn, plan: Dict[str, Any]):
+        """인덱스 제거 (CONCURRENTLY - 검색 / 쓰기를 막지 않음) → 행이 충분히 쌓이면 maintain에서 생성"""
+        previous = conn.autocommit
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {plan['index']}")
+        finally:
+            conn.autocommit = previous
+        logger.info(f"🗑️ 벡터 인덱스 제거: {plan['index']} - {plan['reason']}, 정확 검색")
+
+    # ------------------------------------------------------------------ 보정
+
+    def calibrate(self, table: str, connect: Callable = None) -> List[Tuple[int, float]]:
+        """probes / ef_search 값별 recall@10 측정 후 기록 (블로킹)"""
+        conn = (connect or self._connect)()
+        try:
+            return self._calibrate(conn, table)
+        finally:
+            conn.close()
+            self.invalidate(table)
+
+    def _calibrate(self, conn, table: str) -> List[Tuple[int, float]]:
+        index = TABLE_VECTOR_INDEXES[table]
+        started = time.perf_counter()
+        with conn.cursor() as cur:
+            state = read_index_state(cur, table, index)
+            if state.method is None:
+                conn.rollback()
+                return []
+            cur.execute(f"""
+                SELECT id, embedding::text FROM {table}
+                WHERE embedding IS NOT NULL
+                ORDER BY random()
+                LIMIT %s
+            """, (self.calibration_queries,))
+            samples = [(row[0], row[1]) for row in cur.fetchall()]
+            if not samples:
+                conn.rollback()
+                return []
+
+            # 정답: 인덱스 없이 정확 검색
+            cur.execute("SET LOCAL enable_indexscan = off")
+            cur.execute("SET LOCAL enable_bitmapscan = off")
+            truth = [self._neighbors(cur, table, sample) for sample in samples]
+            conn.rollback()
+
+            curve = []
+            cur.execute("SET LOCAL enable_seqscan = off")
+            for value in self._calibration_values(state):
+                cur.execute("SELECT set_config(%s, %s, true)", (SEARCH_PARAMETERS[state.method], str(value)))
+                recall = statistics.mean(
+                    len(set(self._neighbors(cur, table, sample)) & set(expected)) / max(len(expected), 1)
+                    for sample, expected in zip(samples, truth)
+                )
+                curve.append((value, round(recall, 4)))
+                if recall >= 0.999:
+                    break
+            conn.rollback()
+
+            ensure_builds_table(cur)
+            cur.execute(f"""
+                INSERT INTO {BUILDS_TABLE} (index_name, table_name, method, lists, calibration, calibrated_rows, calibrated_at)
+                VALUES (%s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+                ON CONFLICT (index_name) DO UPDATE
+                SET calibration = EXCLUDED.calibration, calibrated_rows = EXCLUDED.calibrated_rows,
+                    calibrated_at = EXCLUDED.calibrated_at,
+                    method = EXCLUDED.method, lists = EXCLUDED.lists,
+                    -- 기록과 다른 인덱스를 보정했으면 생성 기록은 알 수 없음
+                    rows_at_build = CASE WHEN {BUILDS_TABLE}.method = EXCLUDED.method
+                        AND {BUILDS_TABLE}.lists IS NOT DISTINCT FROM EXCLUDED.lists
+                        THEN {BUILDS_TABLE}.rows_at_build END,
+                    built_at = CASE WHEN {BUILDS_TABLE}.method = EXCLUDED.method
+                        AND {BUILDS_TABLE}.lists IS NOT DISTINCT FROM EXCLUDED.lists
+                        THEN {BUILDS_TABLE}.built_at END
+            """, (index, table, state.method, state.lists, json.dumps(curve), count_vector_rows(cur, table)))
+        conn.commit()
+        logger.info(f"📏 벡터 인덱스 보정: {index} {SEARCH_PARAMETERS[state.method]} → recall@{CALIBRATION_K} "
+                    f"{curve} ({len(samples)}개 질의, {time.perf_counter() - started:.1f}초)")
+        return curve
+
+    @staticmethod
+    def _neighbors(cur, table: str, sample: Tuple[int, str]) -> List[int]:
+        """상위 CALIBRATION_K개 (질의로 쓴 기사 자신은 제외)"""
+        cur.execute(f"""
+            SELECT id FROM {table}
+            WHERE embedding IS NOT NULL
+            ORDER BY embedding <=> %s::vector
+            LIMIT %s
+        """, (sample[1], CALIBRATION_K + 1))
+        return [row[0] for row in cur.fetchall() if row[0] != sample[0]][:CALIBRATION_K]
+
+    @staticmethod
+    def _calibration_values(state: IndexState) -> List[int]:
+        if state.method == METHOD_HNSW:
+            return list(HNSW_EF_SEARCH_STEPS)
+        values, probes = [], 1
+        while probes < state.lists:
+            values.append(probes)
+            probes *= 2
+        return values + [state.lists]
+
+    # ------------------------------------------------------------------ 검색
+
+    def state(self, table: str, index: str = None, cur=None) -> Optional[IndexState]:
+        """인덱스 상태 (재조회 주기 동안 캐시, 조회 실패 시 이전 값 / None)"""
+        index = index or TABLE_VECTOR_INDEXES[table]
+        with self._lock:
+            cached = self._states.get(index)
+        if cached and time.monotonic() - cached[0] < self.refresh_seconds:
+            return cached[1]
+
+        try:
+            if cur is not None:
+                entry = read_index_state(cur, table, index)
+            else:
+                conn = self._connect()
+                try:
+                    with conn.cursor() as own_cur:
+                        entry = read_index_state(own_cur, table, index)
+                    conn.commit()
+                finally:
+                    conn.close()
+        except Exception as e:
+            logger.debug(f"벡터 인덱스 상태 조회 실패 ({index}): {e}")
+            return cached[1] if cached else None
+
+        with self._lock:
+            self._states[index] = (time.monotonic(), entry)
+        return entry
+
+    def search_value(self, state: IndexState, limit: int, recall_target: float = None) -> int:
+        """재현율 목표를 만족하는 가장 작은 probes / ef_search (보정 전에는 경험식)"""
+        target = self.recall_target if recall_target is None else recall_target
+        if state.calibration:
+            value = next((value for value, recall in state.calibration if recall >= target),
+                         state.calibration[-1][0])
+        else:
+            # 목표 재현율의 오즈비 기준 배율 (0.9 → 1배, 0.95 → 약 2배, 0.99 → 11배)
+            scale = max(1.0, target / max(1e-3, 1 - target) / 9)
+            if state.method == METHOD_HNSW:
+                value = math.ceil(HNSW_EF_SEARCH_DEFAULT * scale)
+            else:
+                value = math.ceil(math.sqrt(state.lists) * scale)
+
+        if state.method == METHOD_HNSW:
+            # ef_search보다 많은 행은 반환되지 않음
+            return min(HNSW_EF_SEARCH_MAX, max(value, limit))
+        # 탐색한 목록에 limit개 이상 들어 있도록
+        rows_per_list = max(1, state.rows // max(state.lists, 1))
+        return min(state.lists, max(value, math.ceil(limit / rows_per_list)))
+
+    def search_settings(self, table: str, limit: int, recall_target: float = None,
+                        index: str = None, cur=None) -> Dict[str, str]:
+        """검색에 적용할 설정 {'ivfflat.probes' | 'hnsw.ef_search': 값} (인덱스가 없으면 빈 dict)"""
+        state = self.state(table, index, cur)
+        if state is None or state.method not in SEARCH_PARAMETERS:
+            return {}
+        return {SEARCH_PARAMETERS[state.method]: str(self.search_value(state, limit, recall_target))}
+
+    def apply_search_settings(self, cur, table: str, limit: int, recall_target: float = None,
+                              index: str = None) -> Dict[str, str]:
+        """검색 트랜잭션 안에서 탐색 범위 설정 (set_config 로컬 - 트랜잭션이 끝나면 원래 값)"""
+        settings = self.search_settings(table, limit, recall_target, index, cur)
+        for name, value in settings.items():
+            cur.execute("SELECT set_config(%s, %s, true)", (name, value))
+        return settings
+
+    # ------------------------------------------------------------------ 상태
+
+    def health(self, state: IndexState) -> Dict[str, Any]:
+        """생성 후 추가된 행 / 추정 재현율 (보정 곡선에서 현재 목표로 고른 값의 재현율)"""
+        info = {
+            'index': state.index,
+            'method': state.method,
+            'lists': state.lists,
+            'rows': state.rows,
+            'rows_at_build': state.rows_at_build,
+            'rows_since_build': state.rows_since_build,
+            'built_at': state.built_at.isoformat() if state.built_at else None,
+            'calibrated_rows': state.calibrated_rows,
+            'recall_target': self.recall_target,
+            'search_parameter': SEARCH_PARAMETERS.get(state.method),
+            'search_value': None,
+            'estimated_recall': None if state.method else 1.0
+        }
+        if state.method in SEARCH_PARAMETERS:
+            value = self.search_value(state, CALIBRATION_K)
+            info['search_value'] = value
+            measured = [recall for calibrated, recall in state.calibration if calibrated <= value]
+            info['estimated_recall'] = measured[-1] if measured else None
+        return info
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """조회된 인덱스 상태 (DB 조회 없음)"""
+        with self._lock:
+            states = [state for _, state in self._states.values()]
+        return {state.table if state.index == TABLE_VECTOR_INDEXES.get(state.table) else state.index: self.health(state)
+                for state in states}
+
+    def invalidate(self, table: Optional[str] = None):
+        with self._lock:
+            if table is None:
+                self._states.clear()
+            else:
+                self._states = {index: entry for index, entry in self._states.items() if entry[1].table != table}
+
+    @staticmethod
+    def _connect():
+        if not PSYCOPG2_AVAILABLE:
+            raise RuntimeError("psycopg2가 설치되어 있지 않습니다")
+        return psycopg2.connect(**connection_params())
+
+
+# 전역 인스턴스
+vector_index_manager = VectorIndexManager()
@@ -0,0 +1,126 @@
+"""
+벡터 유사도 검색 SQL
+모든 검색 경로(PgVectorService / DualDatabaseService / DatabaseManager / CryptoNewsSearchTool)가 같은 형태의 SQL 사용
+
+- 인덱스로 거리순 상위 k개를 먼저 뽑고 임계값은 그 뒤에 적용
+  (WHERE 1 - (embedding <=> q) > 임계값은 인덱스 탐색 후보를 걸러 결과가 모자라거나 순차 탐색이 됨)
+- 거리는 한 번만 계산하고 질의 벡터도 한 번만 바인딩
+  psycopg2: float32 최단 표기 텍스트 1개 (리스트를 넘기면 ARRAY[...] 1536개 숫자가 매번 전송됨)
+  asyncpg: vector 이진 코덱 (register_vector_codec)
+- 검색 직전에 재현율 목표에 맞춘 probes / ef_search 설정 (vector_index)
+
+환경변수
+- VECTOR_SEARCH_EXPLAIN: off | plan | analyze - 검색마다 실행 계획 로그, 인덱스를 쓰지 않으면 경고 (기본값: off)
+"""
+
+import logging
+import os
+import struct
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .vector_index import vector_index_manager
+
+logger = logging.getLogger(__name__)
+
+EXPLAIN_MODE = os.getenv('VECTOR_SEARCH_EXPLAIN', 'off').strip().lower()
+
+
+def vector_literal(vector: Sequence[float]) -> str:
+    """vector 텍스트 표현 (float32 최단 표기 - 저장 정밀도와 같고 repr(float)보다 짧음)"""
+    return '[' + ','.join(map(str, np.asarray(vector, dtype=np.float32))) + ']'
+
+
+def encode_vector(vector: Sequence[float]) -> bytes:
+    """pgvector 이진 형식 (차원 uint16, 예약 uint16, float4 × 차원, 네트워크 바이트 순서)"""
+    values = np.asarray(vector, dtype='>f4')
+    return struct.pack('>HH', len(values), 0) + values.tobytes()
+
+
+def decode_vector(data: bytes) -> List[float]:
+    dimension, _ = struct.unpack_from('>HH', data)
+    return np.frombuffer(data, dtype='>f4', count=dimension, offset=4).astype(np.float32).tolist()
+
+
+async def register_vector_codec(conn):
+    """asyncpg 연결에 vector 이진 코덱 등록 (create_pool init, vector 확장이 없으면 건너뜀)"""
+    try:
+        await conn.set_type_codec(
+            'vector', schema='public', encoder=encode_vector, decoder=decode_vector, format='binary'
+        )
+    except ValueError as e:
+        logger.debug(f"vector 코덱 등록 건너뜀: {e}")
+
+
+def nearest_sql(table: str, columns: Sequence[str], conditions: Sequence[str] = (),
+                query: str = '%(query)s::vector', limit: str = '%(limit)s',
+                threshold: str = '%(threshold)s', similarity: str = 'similarity') -> str:
+    """
+    거리순 상위 limit개 → 임계값 적용 SQL
+
+    Args:
+        conditions: 추가 WHERE 조건 (인덱스 탐색과 함께 적용)
+        query / limit / threshold: 매개변수 자리 (psycopg2 기본값, asyncpg는 '$1::vector' 등)
+        similarity: 유사도 출력 컬럼 이름
+    """
+    select_columns = ', '.join(columns)
+    filters = ''.join(f" AND {condition}" for condition in conditions)
+    # ORDER BY에 출력 컬럼(distance)을 쓰면 계산 1번 + 인덱스 정렬 그대로 사용
+    return f"""
+        SELECT {select_columns}, 1 - distance AS {similarity}
+        FROM (
+            SELECT {select_columns}, embedding <=> {query} AS distance
+            FROM {table}
+            WHERE embedding IS NOT NULL{filters}
+            ORDER BY distance
+            LIMIT {limit}
+        ) nearest
+        WHERE 1 - distance > {threshold}
+        ORDER BY distance
+    """
+
+
+def _plan_nodes(plan: Dict[str, Any]):
+    yield plan
+    for child in plan.get('Plans', []):
+        yield from _plan_nodes(child)
+
+
+def explain(cur, sql: str, params: Any, analyze: bool = False) -> Dict[str, Any]:
+    """실행 계획 요약 (벡터 인덱스 사용 여부 / 순차 탐색 테이블 / 실행 시간)"""
+    cur.execute(f"EXPLAIN (FORMAT JSON{', ANALYZE, BUFFERS' if analyze else ''}) {sql}", params)
+    row = cur.fetchone()
+    document = (row['QUERY PLAN'] if isinstance(row, dict) else row[0])[0]
+    nodes = list(_plan_nodes(document['Plan']))
+    return {
+        'index_scans': [node['Index Name'] for node in nodes
+                        if node['Node Type'] in ('Index Scan', 'Index Only Scan') and node.get('Index Name')],
+        'seq_scans': [node['Relation Name'] for node in nodes if node['Node Type'] == 'Seq Scan'],
+        'total_cost': document['Plan']['Total Cost'],
+        'execution_ms': document.get('Execution Time'),
+        'plan': document['Plan']
+    }
+
+
+def execute_search(cur, sql: str, params: Dict[str, Any], table: str, limit: int,
+                   index: Optional[str] = None) -> List[Any]:
+    """
+    탐색 범위 설정 → (디버그) 실행 계획 로그 → 검색 (호출자 트랜잭션 안에서)
+
+    Args:
+        table: 인덱스 상태를 볼 테이블
+        limit: 인덱스에서 뽑을 행 수 (ef_search 하한)
+        index: embedding 외 컬럼 인덱스로 검색할 때 인덱스 이름 (압축 저장 방식)
+    """
+    settings = vector_index_manager.apply_search_settings(cur, table, limit, index=index)
+    if EXPLAIN_MODE in ('plan', 'analyze'):
+        summary = explain(cur, sql, params, analyze=EXPLAIN_MODE == 'analyze')
+        if summary['index_scans']:
+            logger.info(f"🔍 {table} 검색 계획: 인덱스 {summary['index_scans']} {settings}, "
+                        f"비용 {summary['total_cost']}, 실행 {summary['execution_ms']}ms")
+        else:
+            logger.warning(f"⚠️ {table} 검색이 벡터 인덱스를 쓰지 않음: 순차 탐색 {summary['seq_scans']} "
+                           f"(비용 {summary['total_cost']}, 실행 {summary['execution_ms']}ms)")
+    cur.execute(sql, params)
+    return cur.fetchall()
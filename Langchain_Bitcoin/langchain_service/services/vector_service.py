@@ -6,11 +6,15 @@
 import os
 import asyncio
 import logging
+import threading
 from typing import List, Dict, Optional
 import psycopg2
 from psycopg2.extras import RealDictCursor
 from openai import OpenAI
 
+from .execution_service import execution_layer
+from .metrics import track_db
+
 logger = logging.getLogger(__name__)
 
 class VectorService:
@@ -33,17 +37,32 @@ class VectorService:
             logger.info("✅ OpenAI 클라이언트 초기화 완료")
         else:
             logger.error("❌ OpenAI API 키가 설정되지 않았습니다")
+        
+        # DualDatabaseService 인스턴스 (생성 시 DDL을 실행하므로 재사용)
+        self._dual_db = None
+        self._dual_db_lock = threading.Lock()
+    
+    def _get_dual_db(self):
+        """DualDatabaseService 인스턴스 반환 (지연 생성, 블로킹)
+
+        여러 스레드 풀 스레드에서 동시에 호출되므로 잠금으로 한 번만 생성한다
+        (동시 생성 시 DDL이 겹쳐 인덱스 생성이 실패할 수 있음).
+        """
+        if self._dual_db is None:
+            with self._dual_db_lock:
+                if self._dual_db is None:
+                    from .dual_db_service import DualDatabaseService
+                    self._dual_db = DualDatabaseService()
+        return self._dual_db
     
     async def initialize(self):
         """서비스 초기화"""
         try:
             logger.info("🔧 벡터 서비스 초기화 중...")
             
-            # 데이터베이스 연결 테스트
-            await self._test_db_connection()
-            
-            # pgvector 확장 확인
-            await self._check_pgvector_extension()
+            # 데이터베이스 연결 테스트 및 pgvector 확장 확인 (블로킹 - 스레드 풀에서 실행)
+            await execution_layer.run_blocking('health', self._test_db_connection)
+            await execution_layer.run_blocking('health', self._check_pgvector_extension)
             
             logger.info("✅ 벡터 서비스 초기화 완료")
             
@@ -51,7 +70,7 @@ class VectorService:
             logger.error(f"❌ 벡터 서비스 초기화 실패: {e}")
             raise
     
-    async def _test_db_connection(self):
+    def _test_db_connection(self):
         """데이터베이스 연결 테스트"""
         try:
             conn = psycopg2.connect(**self.db_config)
@@ -67,7 +86,7 @@ class VectorService:
             logger.error(f"❌ 데이터베이스 연결 실패: {e}")
             raise
     
-    async def _check_pgvector_extension(self):
+    def _check_pgvector_extension(self):
         """pgvector 확장 확인"""
         try:
             conn = psycopg2.connect(**self.db_config)
@@ -103,14 +122,15 @@ class VectorService:
         try:
             logger.debug(f"🔍 벡터 검색 실행: {query}")
             
-            # DualDatabaseService 사용
-            from .dual_db_service import DualDatabaseService
-            dual_db = DualDatabaseService()
+            # DualDatabaseService 사용 (블로킹 - 스레드 풀에서 실행)
+            dual_db = await execution_layer.run_blocking('news_search', self._get_dual_db)
             
             # 벡터 검색 실행
-            search_results = dual_db.search_similar_articles(
-                query=query, 
-                limit=limit, 
+            search_results = await execution_layer.run_blocking(
+                'news_search',
+                dual_db.search_similar_articles,
+                query=query,
+                limit=limit,
                 similarity_threshold=0.2
             )
             
@@ -146,12 +166,13 @@ class VectorService:
         try:
             logger.debug(f"📰 최신 뉴스 조회: {limit}개")
             
-            # DualDatabaseService 사용
-            from .dual_db_service import DualDatabaseService
-            dual_db = DualDatabaseService()
+            # DualDatabaseService 사용 (블로킹 - 스레드 풀에서 실행)
+            dual_db = await execution_layer.run_blocking('news_search', self._get_dual_db)
             
             # 최근 뉴스 조회 (24시간)
-            news_results = dual_db.get_recent_articles(hours=24, limit=limit)
+            news_results = await execution_layer.run_blocking(
+                'news_search', dual_db.get_recent_articles, hours=24, limit=limit
+            )
             
             # 결과 형식 변환
             formatted_results = []
@@ -180,12 +201,11 @@ class VectorService:
             데이터베이스 통계 딕셔너리
         """
         try:
-            # DualDatabaseService 사용
-            from .dual_db_service import DualDatabaseService
-            dual_db = DualDatabaseService()
+            # DualDatabaseService 사용 (블로킹 - 스레드 풀에서 실행)
+            dual_db = await execution_layer.run_blocking('health', self._get_dual_db)
             
             # 통계 조회
-            stats = dual_db.get_statistics()
+            stats = await execution_layer.run_blocking('health', dual_db.get_statistics)
             
             result = {
                 'total_news': stats.get('summary_count', 0),
@@ -210,13 +230,8 @@ class VectorService:
             서비스 정상 여부
         """
         try:
-            # 데이터베이스 연결 확인
-            conn = psycopg2.connect(**self.db_config)
-            cur = conn.cursor()
-            cur.execute("SELECT 1;")
-            cur.fetchone()
-            cur.close()
-            conn.close()
+            # 데이터베이스 연결 확인 (블로킹 - 스레드 풀에서 실행)
+            await execution_layer.run_blocking('health', self._ping_database)
             
             # OpenAI 클라이언트 확인
             if not self.openai_client:
@@ -228,3 +243,13 @@ class VectorService:
         except Exception as e:
             logger.error(f"❌ 벡터 서비스 상태 확인 실패: {e}")
             return False
+    
+    @track_db('ping')
+    def _ping_database(self):
+        """데이터베이스 연결 확인 (블로킹)"""
+        conn = psycopg2.connect(**self.db_config)
+        cur = conn.cursor()
+        cur.execute("SELECT 1;")
+        cur.fetchone()
+        cur.close()
+        conn.close()
@@ -0,0 +1,177 @@
+"""
+벡터 저장 방식
+전체 정밀도 vector 컬럼 옆에 압축 컬럼(halfvec / bit)을 두고 압축 컬럼 인덱스로 후보를 찾은 뒤
+전체 정밀도로 재정렬(rerank)
+
+- full: 기존 방식 (vector 컬럼 + 인덱스)
+- halfvec: 반정밀도 (차원당 2바이트, 인덱스 크기 1/2)
+- halfvec:<차원>: 앞쪽 차원만 사용한 반정밀도 (text-embedding-3 계열처럼 앞쪽 차원에 정보가 모인 모델 전용)
+- binary: 부호 1비트 양자화 (차원당 1비트, 인덱스 크기 1/32, 후보를 넉넉히 뽑아 재정렬 필요)
+
+환경변수
+- EMBEDDING_STORAGE: full | halfvec | halfvec:<차원> | binary (기본값: full)
+- EMBEDDING_RERANK_FACTOR: 재정렬 후보 배수 (기본값: halfvec 4, binary 10)
+
+pgvector 0.7 이상 필요 (halfvec, binary_quantize, subvector). 기존 행은 migrate_vector_storage.py로 채움
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Sequence
+
+from .vector_search import nearest_sql
+
+logger = logging.getLogger(__name__)
+
+STORAGE_FULL = 'full'
+STORAGE_HALFVEC = 'halfvec'
+STORAGE_BINARY = 'binary'
+
+DEFAULT_RERANK_FACTORS = {STORAGE_FULL: 1, STORAGE_HALFVEC: 4, STORAGE_BINARY: 10}
+
+
+@dataclass(frozen=True)
+class VectorStorage:
+    """테이블 하나의 벡터 저장 방식"""
+    kind: str
+    dimension: int
+    compact_dimension: int
+    rerank_factor: int
+
+    @property
+    def compact(self) -> bool:
+        return self.kind != STORAGE_FULL
+
+    @property
+    def column(self) -> str:
+        """후보 검색 컬럼 (방식 / 차원별 이름 → 방식을 바꿔도 기존 컬럼과 충돌 없음)"""
+        if not self.compact:
+            return 'embedding'
+        suffix = '' if self.compact_dimension == self.dimension else f"_{self.compact_dimension}"
+        return f"embedding_{self.kind}{suffix}"
+
+    @property
+    def column_type(self) -> str:
+        return {
+            STORAGE_FULL: f"vector({self.dimension})",
+            STORAGE_HALFVEC: f"halfvec({self.compact_dimension})",
+            STORAGE_BINARY: f"bit({self.compact_dimension})",
+        }[self.kind]
+
+    @property
+    def operator_class(self) -> str:
+        return {
+            STORAGE_FULL: 'vector_cosine_ops',
+            STORAGE_HALFVEC: 'halfvec_cosine_ops',
+            STORAGE_BINARY: 'bit_hamming_ops',
+        }[self.kind]
+
+    @property
+    def distance_operator(self) -> str:
+        return '<~>' if self.kind == STORAGE_BINARY else '<=>'
+
+    @property
+    def bytes_per_vector(self) -> int:
+        """벡터 1개 데이터 크기 (헤더 제외)"""
+        return {
+            STORAGE_FULL: 4 * self.dimension,
+            STORAGE_HALFVEC: 2 * self.compact_dimension,
+            STORAGE_BINARY: (self.compact_dimension + 7) // 8,
+        }[self.kind]
+
+    def compact_expression(self, source: str) -> str:
+        """전체 정밀도 vector SQL 식 → 압축 값 SQL 식"""
+        if self.kind == STORAGE_BINARY:
+            return f"binary_quantize({source})::bit({self.compact_dimension})"
+        if self.kind == STORAGE_HALFVEC:
+            if self.compact_dimension != self.dimension:
+                # 코사인 거리는 크기와 무관하므로 앞쪽 차원만 잘라서 그대로 사용
+                source = f"subvector({source}, 1, {self.compact_dimension})"
+            return f"({source})::halfvec({self.compact_dimension})"
+        return source
+
+    def index_name(self, table: str) -> str:
+        return f"idx_{table}_{self.column}"
+
+    def ensure_schema(self, cur, table: str, create_index: bool = True):
+        """압축 컬럼 / HNSW 인덱스 생성 (full이면 아무것도 하지 않음, 빈 테이블에서도 유효한 HNSW 사용)"""
+        if not self.compact:
+            return
+        cur.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {self.column} {self.column_type}")
+        if create_index:
+            self.create_index(cur, table)
+
+    def create_index(self, cur, table: str, concurrently: bool = False):
+        """압축 컬럼 HNSW 인덱스 (concurrently: 쓰기를 막지 않음, autocommit 연결 필요)"""
+        cur.execute(
+            f"CREATE INDEX {'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {self.index_name(table)} "
+            f"ON {table} USING hnsw ({self.column} {self.operator_class})"
+        )
+
+    def search_sql(self, table: str, columns: Sequence[str], conditions: Sequence[str] = ()) -> str:
+        """
+        유사도 검색 SQL (이름 있는 매개변수: query, threshold, limit, candidates + 조건식의 매개변수)
+
+        full: 인덱스로 거리순 상위 limit개 → 임계값 적용 (vector_search.nearest_sql)
+        compact: 압축 컬럼 인덱스로 candidates개 후보 → 전체 정밀도 코사인 유사도로 재정렬 / 임계값 적용
+        conditions: 추가 WHERE 조건 (날짜 / 출처 / 감성 필터, compact는 후보 단계에서 적용)
+        """
+        if not self.compact:
+            return nearest_sql(table, columns, conditions)
+        select_columns = ', '.join(columns)
+        filters = ''.join(f" AND {condition}" for condition in conditions)
+        # 질의 벡터는 한 번만 바인딩 (후보 정렬 / 재정렬 모두 InitPlan 값 사용 → 인덱스 정렬 유지)
+        return f"""
+            WITH query AS MATERIALIZED (SELECT %(query)s::vector AS v)
+            SELECT {select_columns}, similarity
+            FROM (
+                SELECT {select_columns},
+                       1 - (embedding <=> (SELECT v FROM query)) AS similarity
+                FROM (
+                    SELECT {select_columns}, embedding
+                    FROM {table}
+                    WHERE {self.column} IS NOT NULL{filters}
+                    ORDER BY {self.column} {self.distance_operator} (SELECT {self.compact_expression('v')} FROM query)
+                    LIMIT %(candidates)s
+                ) candidates
+            ) reranked
+            WHERE similarity > %(threshold)s
+            ORDER BY similarity DESC
+            LIMIT %(limit)s
+        """
+
+    def candidates_for(self, limit: int) -> int:
+        return max(limit, limit * self.rerank_factor)
+
+    def describe(self) -> dict:
+        return {
+            'kind': self.kind,
+            'column': self.column,
+            'type': self.column_type,
+            'bytes_per_vector': self.bytes_per_vector,
+            'rerank_factor': self.rerank_factor
+        }
+
+
+def parse_storage(spec: str, dimension: int, rerank_factor: int = None) -> VectorStorage:
+    """설정 문자열 → 저장 방식 (full | halfvec | halfvec:<차원> | binary)"""
+    kind, _, size = (spec or STORAGE_FULL).strip().lower().partition(':')
+    if kind not in DEFAULT_RERANK_FACTORS:
+        raise ValueError(f"알 수 없는 벡터 저장 방식: {spec}")
+    compact_dimension = int(size) if size else dimension
+    if kind != STORAGE_HALFVEC and compact_dimension != dimension:
+        raise ValueError(f"차원 축소는 halfvec에서만 지원합니다: {spec}")
+    if not 0 < compact_dimension <= dimension:
+        raise ValueError(f"축소 차원은 1~{dimension} 범위여야 합니다: {spec}")
+    return VectorStorage(kind, dimension, compact_dimension, rerank_factor or DEFAULT_RERANK_FACTORS[kind])
+
+
+def storage_from_env(dimension: int) -> VectorStorage:
+    """EMBEDDING_STORAGE / EMBEDDING_RERANK_FACTOR 설정 (잘못된 값이면 full)"""
+    factor = os.getenv('EMBEDDING_RERANK_FACTOR')
+    try:
+        return parse_storage(os.getenv('EMBEDDING_STORAGE', STORAGE_FULL), dimension, int(factor) if factor else None)
+    except ValueError as e:
+        logger.warning(f"⚠️ {e} - full 저장 방식 사용")
+        return parse_storage(STORAGE_FULL, dimension)
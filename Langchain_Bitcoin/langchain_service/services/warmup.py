@@ -0,0 +1,79 @@
+"""
+Pre-fork 워밍업
+멀티 워커 서버(serve.py)가 워커를 fork하기 전에 마스터 프로세스에서 1회 수행하는 초기화
+
+- LangChain / 도구 모듈 import
+- Intent 예시 문장 임베딩 생성 (OpenAI 호출)
+- PgVectorService의 SentenceTransformer 모델 로드
+- 용도별 로컬 임베딩 제공자 모델 로드 (EMBEDDING_PROVIDER_*=local)
+
+fork 이후 워커들은 copy-on-write로 같은 메모리를 공유하므로 워커 수만큼 반복하지 않음
+스레드 풀 / 이벤트 루프 / DB 연결은 fork 이후 워커에서 생성되어야 하므로 여기서 만들지 않음
+"""
+
+import logging
+import time
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+def run_prefork_warmup() -> Dict[str, Any]:
+    """
+    fork 전 워밍업 실행 (블로킹, 각 단계 실패는 경고만 남기고 계속)
+
+    Returns:
+        단계별 결과 요약
+    """
+    summary: Dict[str, Any] = {}
+    started = time.perf_counter()
+
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+    # 1. LangChain 및 도구 모듈 import (워커별 import 비용 제거)
+    try:
+        from langchain_service.services import custom_crypto_agent  # noqa: F401
+        from langchain_service.tools import news_tools, price_tools  # noqa: F401
+        summary['modules'] = 'loaded'
+    except Exception as e:
+        logger.warning(f"⚠️ 워밍업 모듈 import 실패: {e}")
+        summary['modules'] = f"error: {e}"
+
+    # 2. Intent 예시 인덱스 (디스크에 있으면 임베딩 호출 없이 로드, 없으면 배치 1회로 생성 후 저장)
+    try:
+        from langchain_service.services.custom_crypto_agent import precompute_intent_embeddings
+        summary['intent_embeddings'] = precompute_intent_embeddings()
+    except Exception as e:
+        logger.warning(f"⚠️ Intent 인덱스 사전 로드 실패 (워커에서 생성): {e}")
+        summary['intent_embeddings'] = f"error: {e}"
+
+    # 3. SentenceTransformer 모델 (도구들이 services.* 경로로 import하므로 같은 경로로 로드)
+    try:
+        from services.pgvector_service import get_embedding_model
+        get_embedding_model()
+        summary['sentence_transformer'] = 'loaded'
+    except Exception as e:
+        logger.warning(f"⚠️ SentenceTransformer 모델 사전 로드 실패: {e}")
+        summary['sentence_transformer'] = f"error: {e}"
+
+    # 4. 용도별 로컬 임베딩 제공자 (양자화 / 스레드 설정된 모델, 첫 요청 지연 제거)
+    try:
+        from langchain_service.services.embedding_providers import (
+            USE_INGEST, USE_INTENT, USE_SEARCH, get_provider
+        )
+        for use in (USE_INTENT, USE_SEARCH, USE_INGEST):
+            provider = get_provider(use)
+            if not provider.remote:
+                provider.warmup()
+                summary[f'embedding_provider_{use}'] = provider.cache_model
+    except Exception as e:
+        logger.warning(f"⚠️ 로컬 임베딩 제공자 사전 로드 실패: {e}")
+        summary['embedding_providers'] = f"error: {e}"
+
+    summary['elapsed_seconds'] = round(time.perf_counter() - started, 2)
+    logger.info(f"🔥 Pre-fork 워밍업 완료: {summary}")
+    return summary
@@ -6,7 +6,7 @@ Claude 수준의 분석과 인사이트 제공
 import logging
 import os
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, AsyncIterator
 from datetime import datetime, timedelta
 from langchain.tools import BaseTool
 from pydantic import Field
@@ -15,6 +15,9 @@ import json
 import re
 
 from langchain_service.core.database_manager import db_manager, NewsArticle
+from langchain_service.services.execution_service import execution_layer
+from langchain_service.services.metrics import ErrorResult, instrument_tool_run, track_external
+from langchain_service.services.stream_events import progress_event, message_event
 
 logger = logging.getLogger(__name__)
 
@@ -51,22 +54,38 @@ class AdvancedNewsAnalyzer(BaseTool):
         finally:
             loop.close()
     
+    @instrument_tool_run
     async def _arun(self, query: str) -> str:
         """고급 뉴스 분석 실행"""
+        report = ""
+        async for event in self.astream_analysis(query):
+            if event['event'] == 'message':
+                report = event['data']['text']
+        return report
+    
+    async def astream_analysis(self, query: str) -> AsyncIterator[Dict[str, Any]]:
+        """고급 뉴스 분석 실행 (스트리밍) - 단계별 진행 이벤트 후 최종 보고서 전달"""
         try:
             logger.info(f"🔍 고급 뉴스 분석 시작: {query}")
             
             # 1단계: 관련 뉴스 수집
+            yield progress_event('news_collection', 'started')
             news_articles = await self._collect_relevant_news(query)
+            yield progress_event('news_collection', 'completed', article_count=len(news_articles))
             
             if not news_articles:
-                return "📰 현재 관련된 뉴스를 찾을 수 없습니다. 뉴스 파이프라인을 실행하여 최신 뉴스를 수집해보세요."
+                yield message_event("📰 현재 관련된 뉴스를 찾을 수 없습니다. 뉴스 파이프라인을 실행하여 최신 뉴스를 수집해보세요.")
+                return
             
             # 2단계: 뉴스 내용 심층 분석
+            yield progress_event('news_content_analysis', 'started')
             analysis_result = await self._analyze_news_content(news_articles, query)
+            yield progress_event('news_content_analysis', 'completed')
             
             # 3단계: 시장 데이터와 연계 분석
+            yield progress_event('market_context', 'started')
             market_context = await self._get_market_context()
+            yield progress_event('market_context', 'completed')
             
             # 4단계: Claude 스타일 종합 분석 보고서 생성
             comprehensive_report = await self._generate_comprehensive_report(
@@ -74,11 +93,11 @@ class AdvancedNewsAnalyzer(BaseTool):
             )
             
             logger.info(f"✅ 고급 뉴스 분석 완료: {len(comprehensive_report)}자")
-            return comprehensive_report
+            yield message_event(comprehensive_report)
             
         except Exception as e:
             logger.error(f"❌ 고급 뉴스 분석 실패: {e}")
-            return f"분석 중 오류가 발생했습니다: {str(e)}"
+            yield message_event(f"분석 중 오류가 발생했습니다: {str(e)}")
     
     async def _collect_relevant_news(self, query: str, limit: int = 10) -> List[NewsArticle]:
         """관련 뉴스 수집"""
@@ -182,7 +201,9 @@ JSON 형식으로 답변해주세요:
 }}"""
 
         try:
-            response = self.openai_client.chat.completions.create(
+            response = await execution_layer.run_blocking(
+                'news_sentiment',
+                track_external('openai', 'chat')(self.openai_client.chat.completions.create),
                 model="gpt-4",  # 더 정확한 분석을 위해 GPT-4 사용
                 messages=[{"role": "user", "content": analysis_prompt}],
                 max_tokens=1500,
@@ -341,6 +362,7 @@ class MarketSentimentAnalyzer(BaseTool):
         super().__init__()
         self.openai_client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
     
+    @instrument_tool_run
     def _run(self, query: str = "시장 감정 분석") -> str:
         """시장 감정 분석 실행"""
         loop = asyncio.new_event_loop()
@@ -398,12 +420,13 @@ class MarketSentimentAnalyzer(BaseTool):
 📈 **투자자 행동 권고**:
 [행동 가이드]"""
 
-            response = self.openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": sentiment_prompt}],
-                max_tokens=800,
-                temperature=0.2
-            )
+            with track_external('openai', 'chat'):
+                response = self.openai_client.chat.completions.create(
+                    model="gpt-3.5-turbo",
+                    messages=[{"role": "user", "content": sentiment_prompt}],
+                    max_tokens=800,
+                    temperature=0.2
+                )
             
             result = response.choices[0].message.content.strip()
             
@@ -415,7 +438,7 @@ class MarketSentimentAnalyzer(BaseTool):
             
         except Exception as e:
             logger.error(f"❌ 시장 감정 분석 실패: {e}")
-            return f"시장 감정 분석 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"시장 감정 분석 중 오류가 발생했습니다: {str(e)}")
 
 class TrendAnalyzer(BaseTool):
     """트렌드 분석 도구"""
@@ -431,6 +454,7 @@ class TrendAnalyzer(BaseTool):
     - 새로운 트렌드 발굴
     """
     
+    @instrument_tool_run
     def _run(self, period: str = "7d") -> str:
         """트렌드 분석 실행"""
         loop = asyncio.new_event_loop()
@@ -481,7 +505,7 @@ class TrendAnalyzer(BaseTool):
             
         except Exception as e:
             logger.error(f"❌ 트렌드 분석 실패: {e}")
-            return f"트렌드 분석 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"트렌드 분석 중 오류가 발생했습니다: {str(e)}")
     
     def _extract_trending_keywords(self, articles: List[NewsArticle]) -> List[Tuple[str, int]]:
         """트렌딩 키워드 추출"""
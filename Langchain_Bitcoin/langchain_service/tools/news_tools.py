@@ -9,6 +9,11 @@ from typing import Any, Dict
 from langchain.tools import BaseTool
 from pydantic import Field
 
+from langchain_service.services.execution_service import execution_layer
+from langchain_service.services.metrics import ErrorResult, instrument_tool_run
+from langchain_service.services.table_embeddings import table_embedding_models
+from langchain_service.services.vector_search import execute_search, nearest_sql, vector_literal
+
 logger = logging.getLogger(__name__)
 
 class CryptoNewsSearchTool(BaseTool):
@@ -29,6 +34,27 @@ class CryptoNewsSearchTool(BaseTool):
     
     vector_service: Any = Field(description="벡터 서비스 인스턴스")
     
+    @staticmethod
+    def _vector_search(cur, query: str, limit: int, similarity_threshold: float = 0.3):
+        """crypto_news 벡터 검색 (embedding 인덱스 사용, 실패하면 빈 목록 → 키워드 검색)"""
+        try:
+            query_embedding = table_embedding_models.embed_query('crypto_news', query)
+            return execute_search(
+                cur,
+                nearest_sql('crypto_news', ['id', 'title', 'summary', 'url', 'source', 'published_date'],
+                            similarity='relevance_score'),
+                {'query': vector_literal(query_embedding), 'threshold': similarity_threshold, 'limit': limit},
+                'crypto_news', limit
+            )
+        except Exception as e:
+            cur.connection.rollback()
+            if 'dimensions' in str(e):
+                # 재임베딩 교체 직후 (컬럼 차원 변경) → 다음 검색에서 모델 기록을 다시 읽음
+                table_embedding_models.invalidate('crypto_news')
+            logger.warning(f"벡터 검색 실패, 키워드 검색으로 폴백: {e}")
+            return []
+    
+    @instrument_tool_run
     def _run(self, query: str) -> str:
         """뉴스 검색 실행 - 개선된 버전"""
         try:
@@ -43,7 +69,7 @@ class CryptoNewsSearchTool(BaseTool):
             
             logger.debug(f"검색 파라미터 - 요청량: {requested_count}개")
             
-            # 직접 DB 검색으로 단순화 (벡터 검색 문제 우회)
+            # 직접 DB 검색 (벡터 검색 → 키워드 검색)
             try:
                 import psycopg2
                 from psycopg2.extras import RealDictCursor
@@ -59,55 +85,60 @@ class CryptoNewsSearchTool(BaseTool):
                 with conn.cursor(cursor_factory=RealDictCursor) as cur:
                     logger.debug(f"직접 DB 검색 실행 - 키워드: '{query}'")
                     
-                    # 키워드 기반 검색 + 최신순 정렬
-                    search_conditions = []
-                    search_params = []
+                    # 벡터 검색 우선 (crypto_news 벡터와 같은 모델로 질의 임베딩), 결과가 없으면 키워드 검색
+                    results = self._vector_search(cur, query, requested_count)
+                    if results:
+                        logger.info(f"벡터 검색 완료: {len(results)}개 결과")
+                    else:
+                        # 키워드 기반 검색 + 최신순 정렬
+                        search_conditions = []
+                        search_params = []
                     
-                    # 기본 키워드 검색
-                    basic_keywords = ['비트코인', 'bitcoin', 'btc', '암호화폐', 'crypto', 'ethereum', 'eth']
+                        # 기본 키워드 검색
+                        basic_keywords = ['비트코인', 'bitcoin', 'btc', '암호화폐', 'crypto', 'ethereum', 'eth']
                     
-                    # 사용자 쿼리에서 키워드 추출
-                    query_lower = query.lower()
-                    found_keywords = []
+                        # 사용자 쿼리에서 키워드 추출
+                        query_lower = query.lower()
+                        found_keywords = []
                     
-                    for keyword in basic_keywords:
-                        if keyword in query_lower:
-                            found_keywords.append(keyword)
+                        for keyword in basic_keywords:
+                            if keyword in query_lower:
+                                found_keywords.append(keyword)
                     
-                    # 구체적인 키워드가 있으면 해당 키워드로 검색
-                    if found_keywords:
-                        keyword_conditions = []
-                        for keyword in found_keywords:
-                            keyword_conditions.append('(title ILIKE %s OR summary ILIKE %s)')
-                            search_params.extend([f'%{keyword}%', f'%{keyword}%'])
+                        # 구체적인 키워드가 있으면 해당 키워드로 검색
+                        if found_keywords:
+                            keyword_conditions = []
+                            for keyword in found_keywords:
+                                keyword_conditions.append('(title ILIKE %s OR summary ILIKE %s)')
+                                search_params.extend([f'%{keyword}%', f'%{keyword}%'])
                         
-                        search_query = f'''
-                            SELECT id, title, summary, url, source, published_date,
-                                   CASE 
-                                       WHEN title ILIKE %s THEN 0.9
-                                       WHEN summary ILIKE %s THEN 0.7
-                                       ELSE 0.5
-                                   END as relevance_score
-                            FROM crypto_news 
-                            WHERE ({' OR '.join(keyword_conditions)})
-                            ORDER BY relevance_score DESC, published_date DESC 
-                            LIMIT %s
-                        '''
-                        search_params = [f'%{found_keywords[0]}%', f'%{found_keywords[0]}%'] + search_params + [requested_count]
+                            search_query = f'''
+                                SELECT id, title, summary, url, source, published_date,
+                                       CASE 
+                                           WHEN title ILIKE %s THEN 0.9
+                                           WHEN summary ILIKE %s THEN 0.7
+                                           ELSE 0.5
+                                       END as relevance_score
+                                FROM crypto_news 
+                                WHERE ({' OR '.join(keyword_conditions)})
+                                ORDER BY relevance_score DESC, published_date DESC 
+                                LIMIT %s
+                            '''
+                            search_params = [f'%{found_keywords[0]}%', f'%{found_keywords[0]}%'] + search_params + [requested_count]
                         
-                    else:
-                        # 키워드가 없으면 최신 뉴스 제공
-                        search_query = '''
-                            SELECT id, title, summary, url, source, published_date,
-                                   0.8 as relevance_score
-                            FROM crypto_news 
-                            ORDER BY published_date DESC 
-                            LIMIT %s
-                        '''
-                        search_params = [requested_count]
+                        else:
+                            # 키워드가 없으면 최신 뉴스 제공
+                            search_query = '''
+                                SELECT id, title, summary, url, source, published_date,
+                                       0.8 as relevance_score
+                                FROM crypto_news 
+                                ORDER BY published_date DESC 
+                                LIMIT %s
+                            '''
+                            search_params = [requested_count]
                     
-                    cur.execute(search_query, search_params)
-                    results = cur.fetchall()
+                        cur.execute(search_query, search_params)
+                        results = cur.fetchall()
                     
                     logger.info(f"직접 DB 검색 완료: {len(results)}개 결과")
                     
@@ -351,11 +382,11 @@ class CryptoNewsSearchTool(BaseTool):
             
         except Exception as e:
             logger.error(f"❌ 뉴스 검색 실패: {e}")
-            return f"뉴스 검색 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"뉴스 검색 중 오류가 발생했습니다: {str(e)}")
     
     async def _arun(self, query: str) -> str:
-        """비동기 뉴스 검색 실행"""
-        return self._run(query)
+        """비동기 뉴스 검색 실행 (실행 계층 스레드 풀)"""
+        return await execution_layer.run_blocking('news_search', self._run, query)
 
 
 class LatestNewsLookupTool(BaseTool):
@@ -376,6 +407,7 @@ class LatestNewsLookupTool(BaseTool):
     
     vector_service: Any = Field(description="벡터 서비스 인스턴스")
     
+    @instrument_tool_run
     def _run(self, query: str = "최신") -> str:
         """최신 뉴스 조회 실행"""
         try:
@@ -453,11 +485,11 @@ class LatestNewsLookupTool(BaseTool):
             
         except Exception as e:
             logger.error(f"❌ 최신 뉴스 조회 실패: {e}")
-            return f"최신 뉴스 조회 중 오류가 발생했습니다: {str(e)}. 데이터베이스에 뉴스 데이터가 있는지 확인해주세요."
+            return ErrorResult(f"최신 뉴스 조회 중 오류가 발생했습니다: {str(e)}. 데이터베이스에 뉴스 데이터가 있는지 확인해주세요.")
     
     async def _arun(self, query: str = "최신") -> str:
-        """비동기 최신 뉴스 조회 실행"""
-        return self._run(query)
+        """비동기 최신 뉴스 조회 실행 (실행 계층 스레드 풀)"""
+        return await execution_layer.run_blocking('news_search', self._run, query)
 
 
 class DatabaseStatsTool(BaseTool):
@@ -478,6 +510,7 @@ class DatabaseStatsTool(BaseTool):
     
     vector_service: Any = Field(description="벡터 서비스 인스턴스")
     
+    @instrument_tool_run
     def _run(self, query: str = "통계") -> str:
         """데이터베이스 통계 조회 실행"""
         try:
@@ -598,8 +631,8 @@ class DatabaseStatsTool(BaseTool):
             
         except Exception as e:
             logger.error(f"❌ 데이터베이스 통계 조회 실패: {e}")
-            return f"데이터베이스 통계 조회 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"데이터베이스 통계 조회 중 오류가 발생했습니다: {str(e)}")
     
     async def _arun(self, query: str = "통계") -> str:
-        """비동기 데이터베이스 통계 조회 실행"""
-        return self._run(query)
+        """비동기 데이터베이스 통계 조회 실행 (실행 계층 스레드 풀)"""
+        return await execution_layer.run_blocking('historical_data', self._run, query)
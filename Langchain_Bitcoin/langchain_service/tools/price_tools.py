@@ -12,6 +12,9 @@ from datetime import datetime
 import sys
 import os
 
+from langchain_service.services.execution_service import execution_layer
+from langchain_service.services.metrics import ErrorResult, instrument_tool_run, track_external
+
 # Redis 가격 서비스 import
 try:
     from services.redis_price_service import RedisPriceService
@@ -22,6 +25,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 업비트 API 주소 (부하 테스트 시 로컬 스텁으로 교체)
+UPBIT_BASE_URL = os.getenv('UPBIT_BASE_URL', 'https://api.upbit.com/v1')
+
 class CryptoPriceChecker(BaseTool):
     """암호화폐 실시간 가격 조회 도구"""
     
@@ -38,6 +44,7 @@ class CryptoPriceChecker(BaseTool):
     출력: 현재 가격, 변동률, 거래량 등 상세 정보
     """
     
+    @instrument_tool_run
     def _run(self, coin_symbol: str) -> str:
         """가격 정보 조회 실행 (Redis 캐싱 우선)"""
         try:
@@ -51,7 +58,7 @@ class CryptoPriceChecker(BaseTool):
 
         except Exception as e:
             logger.error(f"❌ 가격 조회 실패: {e}")
-            return f"가격 조회 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"가격 조회 중 오류가 발생했습니다: {str(e)}")
 
     def _get_price_with_redis(self, coin_symbol: str) -> str:
         """Redis 캐싱을 사용한 가격 조회"""
@@ -103,7 +110,7 @@ class CryptoPriceChecker(BaseTool):
             
         except Exception as e:
             logger.error(f"❌ 직접 API 가격 조회 실패: {e}")
-            return f"가격 조회 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"가격 조회 중 오류가 발생했습니다: {str(e)}")
     
     def _normalize_coin_symbol(self, coin_input: str) -> str:
         """코인 입력을 표준 심볼로 변환"""
@@ -153,11 +160,12 @@ class CryptoPriceChecker(BaseTool):
     def _fetch_upbit_price(self, markets: List[str]) -> List[Dict]:
         """업비트 API에서 가격 정보 조회"""
         try:
-            url = "https://api.upbit.com/v1/ticker"
+            url = f"{UPBIT_BASE_URL}/ticker"
             params = {"markets": ",".join(markets)}
             
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            with track_external('upbit', 'ticker'):
+                response = requests.get(url, params=params, timeout=10)
+                response.raise_for_status()
             
             return response.json()
             
@@ -225,7 +233,7 @@ Redis 서비스에서 가져온 가격 데이터 포맷팅"""
 
         except Exception as e:
             logger.error(f"❌ Redis 가격 정보 포맷팅 실패: {e}")
-            return f"{coin_name}의 가격 정보를 표시하는 중 오류가 발생했습니다."
+            return ErrorResult(f"{coin_name}의 가격 정보를 표시하는 중 오류가 발생했습니다.")
 
     def _format_price_info(self, price_data: Dict, coin_name: str) -> str:
         """기존 API 가격 데이터를 사용자 친화적 형태로 포맷팅"""
@@ -271,11 +279,11 @@ Redis 서비스에서 가져온 가격 데이터 포맷팅"""
             
         except Exception as e:
             logger.error(f"❌ 가격 정보 포맷팅 실패: {e}")
-            return f"{coin_name}의 가격 정보를 표시하는 중 오류가 발생했습니다."
+            return ErrorResult(f"{coin_name}의 가격 정보를 표시하는 중 오류가 발생했습니다.")
     
     async def _arun(self, coin_symbol: str) -> str:
-        """비동기 가격 조회 실행"""
-        return self._run(coin_symbol)
+        """비동기 가격 조회 실행 (실행 계층 스레드 풀)"""
+        return await execution_layer.run_blocking('price_lookup', self._run, coin_symbol)
 
 
 class MultiCoinPriceChecker(BaseTool):
@@ -294,6 +302,7 @@ class MultiCoinPriceChecker(BaseTool):
     출력: 여러 암호화폐의 가격 정보 요약
     """
     
+    @instrument_tool_run
     def _run(self, query: str) -> str:
         """여러 코인 가격 조회 실행 (Redis 캐싱 우선)"""
         try:
@@ -317,7 +326,7 @@ class MultiCoinPriceChecker(BaseTool):
 
         except Exception as e:
             logger.error(f"❌ 다중 가격 조회 실패: {e}")
-            return f"다중 가격 조회 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"다중 가격 조회 중 오류가 발생했습니다: {str(e)}")
 
     def _get_multiple_prices_with_redis(self, coin_symbols: List[str], query: str) -> str:
         """Redis 캐싱을 사용한 다중 코인 가격 조회"""
@@ -366,7 +375,7 @@ class MultiCoinPriceChecker(BaseTool):
             
         except Exception as e:
             logger.error(f"❌ 직접 API 다중 가격 조회 실패: {e}")
-            return f"다중 가격 조회 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"다중 가격 조회 중 오류가 발생했습니다: {str(e)}")
     
     def _extract_coins_from_query(self, query: str) -> List[str]:
         """쿼리에서 암호화폐 심볼 추출"""
@@ -399,11 +408,12 @@ class MultiCoinPriceChecker(BaseTool):
     def _fetch_upbit_price(self, markets: List[str]) -> List[Dict]:
         """업비트 API에서 여러 코인 가격 정보 조회"""
         try:
-            url = "https://api.upbit.com/v1/ticker"
+            url = f"{UPBIT_BASE_URL}/ticker"
             params = {"markets": ",".join(markets)}
             
-            response = requests.get(url, params=params, timeout=15)
-            response.raise_for_status()
+            with track_external('upbit', 'ticker'):
+                response = requests.get(url, params=params, timeout=15)
+                response.raise_for_status()
             
             return response.json()
             
@@ -453,7 +463,7 @@ Redis 서비스에서 가져온 다중 코인 가격 데이터 포맷팅"""
 
         except Exception as e:
             logger.error(f"❌ Redis 다중 가격 정보 포맷팅 실패: {e}")
-            return "가격 정보를 표시하는 중 오류가 발생했습니다."
+            return ErrorResult("가격 정보를 표시하는 중 오류가 발생했습니다.")
 
     def _format_multi_price_info(self, price_data_list: List[Dict]) -> str:
         """기존 API 여러 코인의 가격 데이터를 포맷팅"""
@@ -491,11 +501,11 @@ Redis 서비스에서 가져온 다중 코인 가격 데이터 포맷팅"""
             
         except Exception as e:
             logger.error(f"❌ 다중 가격 정보 포맷팅 실패: {e}")
-            return "가격 정보를 표시하는 중 오류가 발생했습니다."
+            return ErrorResult("가격 정보를 표시하는 중 오류가 발생했습니다.")
     
     async def _arun(self, query: str) -> str:
-        """비동기 다중 가격 조회 실행"""
-        return self._run(query)
+        """비동기 다중 가격 조회 실행 (실행 계층 스레드 풀)"""
+        return await execution_layer.run_blocking('price_lookup', self._run, query)
 
 
 class CoinMarketCapTool(BaseTool):
@@ -514,6 +524,7 @@ class CoinMarketCapTool(BaseTool):
     출력: 주요 암호화폐들의 시가총액 기반 순위
     """
     
+    @instrument_tool_run
     def _run(self, query: str = "시가총액") -> str:
         """시가총액 순위 조회 실행 (Redis 캐싱 우선)"""
         try:
@@ -530,7 +541,7 @@ class CoinMarketCapTool(BaseTool):
 
         except Exception as e:
             logger.error(f"❌ 시가총액 순위 조회 실패: {e}")
-            return f"시가총액 순위 조회 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"시가총액 순위 조회 중 오류가 발생했습니다: {str(e)}")
 
     def _get_market_cap_with_redis(self, top_coins: List[str], query: str) -> str:
         """Redis 캐싱을 사용한 시가총액 순위 조회"""
@@ -577,16 +588,17 @@ class CoinMarketCapTool(BaseTool):
             
         except Exception as e:
             logger.error(f"❌ 직접 API 시가총액 조회 실패: {e}")
-            return f"시가총액 순위 조회 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"시가총액 순위 조회 중 오류가 발생했습니다: {str(e)}")
     
     def _fetch_upbit_price(self, markets: List[str]) -> List[Dict]:
         """업비트 API에서 여러 코인 가격 정보 조회"""
         try:
-            url = "https://api.upbit.com/v1/ticker"
+            url = f"{UPBIT_BASE_URL}/ticker"
             params = {"markets": ",".join(markets)}
             
-            response = requests.get(url, params=params, timeout=15)
-            response.raise_for_status()
+            with track_external('upbit', 'ticker'):
+                response = requests.get(url, params=params, timeout=15)
+                response.raise_for_status()
             
             return response.json()
             
@@ -648,7 +660,7 @@ Redis 서비스에서 가져온 시가총액 순위 정보 포맷팅"""
 
         except Exception as e:
             logger.error(f"❌ Redis 시가총액 정보 포맷팅 실패: {e}")
-            return "시가총액 정보를 표시하는 중 오류가 발생했습니다."
+            return ErrorResult("시가총액 정보를 표시하는 중 오류가 발생했습니다.")
 
     def _format_market_cap_info(self, price_data_list: List[Dict]) -> str:
         """기존 API 시가총액 순위 정보 포맷팅"""
@@ -701,8 +713,8 @@ Redis 서비스에서 가져온 시가총액 순위 정보 포맷팅"""
             
         except Exception as e:
             logger.error(f"❌ 시가총액 정보 포맷팅 실패: {e}")
-            return "시가총액 정보를 표시하는 중 오류가 발생했습니다."
+            return ErrorResult("시가총액 정보를 표시하는 중 오류가 발생했습니다.")
     
     async def _arun(self, query: str = "시가총액") -> str:
-        """비동기 시가총액 순위 조회 실행"""
-        return self._run(query)
+        """비동기 시가총액 순위 조회 실행 (실행 계층 스레드 풀)"""
+        return await execution_layer.run_blocking('price_lookup', self._run, query)
@@ -17,6 +17,7 @@ import pandas as pd
 import numpy as np
 
 from langchain_service.core.database_manager import db_manager
+from langchain_service.services.metrics import ErrorResult, instrument_tool_run, track_external
 
 logger = logging.getLogger(__name__)
 
@@ -83,9 +84,9 @@ class RealTimeMarketDataTool(BaseTool):
     def __init__(self):
         super().__init__()
         self.api_endpoints = {
-            'upbit': 'https://api.upbit.com/v1/ticker',
+            'upbit': f"{os.getenv('UPBIT_BASE_URL', 'https://api.upbit.com/v1')}/ticker",
             'coinmarketcap': 'https://pro-api.coinmarketcap.com/v1/cryptocurrency/quotes/latest',
-            'coingecko': 'https://api.coingecko.com/api/v3/simple/price'
+            'coingecko': f"{os.getenv('COINGECKO_BASE_URL', 'https://api.coingecko.com/api/v3')}/simple/price"
         }
         self.supported_symbols = ['BTC', 'ETH', 'XRP', 'ADA', 'DOT', 'LINK', 'LTC', 'BCH']
         
@@ -98,6 +99,7 @@ class RealTimeMarketDataTool(BaseTool):
         finally:
             loop.close()
     
+    @instrument_tool_run
     async def _arun(self, query: str) -> str:
         """실시간 시장 데이터 분석 실행"""
         try:
@@ -119,7 +121,7 @@ class RealTimeMarketDataTool(BaseTool):
                 
         except Exception as e:
             logger.error(f"❌ 실시간 시장 데이터 분석 실패: {e}")
-            return f"시장 데이터 분석 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"시장 데이터 분석 중 오류가 발생했습니다: {str(e)}")
     
     def _determine_analysis_type(self, query: str) -> str:
         """쿼리 분석하여 분석 타입 결정"""
@@ -152,6 +154,7 @@ class RealTimeMarketDataTool(BaseTool):
         
         return 'BTC'  # 기본값
     
+    @track_external('upbit', 'ticker')
     async def _get_upbit_data(self, symbols: List[str]) -> Dict[str, MarketData]:
         """업비트 API에서 데이터 수집"""
         try:
@@ -184,6 +187,7 @@ class RealTimeMarketDataTool(BaseTool):
             logger.error(f"업비트 데이터 수집 실패: {e}")
             return {}
     
+    @track_external('coingecko', 'ticker')
     async def _get_coingecko_data(self, symbols: List[str]) -> Dict[str, MarketData]:
         """CoinGecko API에서 데이터 수집"""
         try:
@@ -421,7 +425,7 @@ class RealTimeMarketDataTool(BaseTool):
             
         except Exception as e:
             logger.error(f"단일 코인 분석 실패: {e}")
-            return f"{symbol} 분석 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"{symbol} 분석 중 오류가 발생했습니다: {str(e)}")
     
     async def _analyze_market_overview(self) -> str:
         """시장 전체 개요 분석"""
@@ -483,7 +487,7 @@ class RealTimeMarketDataTool(BaseTool):
             
         except Exception as e:
             logger.error(f"시장 개요 분석 실패: {e}")
-            return f"시장 개요 분석 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"시장 개요 분석 중 오류가 발생했습니다: {str(e)}")
     
     async def _perform_technical_analysis(self, symbol: str) -> str:
         """기술적 분석 전문 보고서"""
@@ -552,7 +556,7 @@ class RealTimeMarketDataTool(BaseTool):
             
         except Exception as e:
             logger.error(f"기술적 분석 실패: {e}")
-            return f"{symbol} 기술적 분석 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"{symbol} 기술적 분석 중 오류가 발생했습니다: {str(e)}")
     
     async def _comprehensive_market_analysis(self) -> str:
         """종합적인 시장 분석"""
@@ -601,7 +605,7 @@ class RealTimeMarketDataTool(BaseTool):
             
         except Exception as e:
             logger.error(f"종합 시장 분석 실패: {e}")
-            return f"종합 시장 분석 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"종합 시장 분석 중 오류가 발생했습니다: {str(e)}")
     
     async def _get_historical_prices(self, symbol: str, days: int = 30) -> List[float]:
         """과거 가격 데이터 조회 (데이터베이스 또는 API)"""
@@ -884,6 +888,7 @@ class MarketHeatmapTool(BaseTool):
     - 상대적 강도 분석
     """
     
+    @instrument_tool_run
     def _run(self, query: str = "히트맵") -> str:
         """시장 히트맵 분석 실행"""
         loop = asyncio.new_event_loop()
@@ -980,7 +985,7 @@ class MarketHeatmapTool(BaseTool):
             
         except Exception as e:
             logger.error(f"히트맵 분석 실패: {e}")
-            return f"히트맵 분석 중 오류가 발생했습니다: {str(e)}"
+            return ErrorResult(f"히트맵 분석 중 오류가 발생했습니다: {str(e)}")
     
     def _get_market_mood(self, avg_change: float, positive_ratio: float) -> str:
         """시장 분위기 판단"""
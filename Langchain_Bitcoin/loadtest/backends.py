@@ -0,0 +1,115 @@
+"""
+부하 테스트용 컨테이너 없는 Postgres / Redis 대체
+
+- Redis: fakeredis의 TCP 서버 (pip install "fakeredis>=2.21")
+- Postgres: pgserver 내장 Postgres + pgvector (pip install pgserver)
+
+설치되지 않은 경우 외부(docker-compose 등) 인스턴스를 그대로 사용하도록 빈 환경변수를 반환
+"""
+
+import logging
+import socket
+import tempfile
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger("loadtest.backends")
+
+try:
+    from fakeredis import TcpFakeServer
+    FAKEREDIS_AVAILABLE = True
+except ImportError:
+    FAKEREDIS_AVAILABLE = False
+
+try:
+    import pgserver
+    PGSERVER_AVAILABLE = True
+except ImportError:
+    PGSERVER_AVAILABLE = False
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class EmbeddedBackends:
+    """내장 Redis / Postgres 실행 관리"""
+
+    def __init__(self, use_redis: bool = True, use_postgres: bool = True):
+        self.use_redis = use_redis
+        self.use_postgres = use_postgres
+        self._redis_server = None
+        self._postgres = None
+        self._tempdir: Optional[tempfile.TemporaryDirectory] = None
+        self.env: Dict[str, str] = {}
+        self.summary: Dict[str, str] = {}
+
+    def start(self) -> Dict[str, str]:
+        """내장 백엔드 시작 후 서비스 프로세스에 전달할 환경변수 반환"""
+        if self.use_redis:
+            self._start_redis()
+        else:
+            self.summary['redis'] = 'external'
+        if self.use_postgres:
+            self._start_postgres()
+        else:
+            self.summary['postgres'] = 'external'
+        return self.env
+
+    def _start_redis(self):
+        if not FAKEREDIS_AVAILABLE:
+            logger.warning("⚠️ fakeredis가 없어 외부 Redis(REDIS_HOST/REDIS_PORT)를 사용합니다")
+            self.summary['redis'] = 'external (fakeredis not installed)'
+            return
+        port = _free_port()
+        self._redis_server = TcpFakeServer(('127.0.0.1', port), server_type='redis')
+        threading.Thread(target=self._redis_server.serve_forever, name='loadtest-redis', daemon=True).start()
+        self.env.update({'REDIS_HOST': '127.0.0.1', 'REDIS_PORT': str(port)})
+        self.summary['redis'] = f'fakeredis 127.0.0.1:{port}'
+        logger.info(f"🧪 내장 Redis 시작: 127.0.0.1:{port}")
+
+    def _start_postgres(self):
+        if not PGSERVER_AVAILABLE:
+            logger.warning("⚠️ pgserver가 없어 외부 Postgres(DB_* / POSTGRES_*)를 사용합니다")
+            self.summary['postgres'] = 'external (pgserver not installed)'
+            return
+        try:
+            self._tempdir = tempfile.TemporaryDirectory(prefix='loadtest-pg-')
+            self._postgres = pgserver.get_server(self._tempdir.name, cleanup_mode='stop')
+            self._postgres.psql('CREATE EXTENSION IF NOT EXISTS vector;')
+            uri = urlparse(self._postgres.get_uri())
+        except Exception as e:
+            logger.warning(f"⚠️ 내장 Postgres 시작 실패, 외부 Postgres 사용: {e}")
+            self.summary['postgres'] = f'external (pgserver failed: {e})'
+            return
+
+        # pgserver는 기본적으로 유닉스 소켓으로 접속 (host에 소켓 디렉토리 경로)
+        host = uri.hostname or (uri.query.split('host=')[-1] if 'host=' in uri.query else '')
+        port = str(uri.port or 5432)
+        user = uri.username or 'postgres'
+        password = uri.password or ''
+        database = (uri.path or '/postgres').lstrip('/') or 'postgres'
+        # 벡터 DB(DB_*)와 DualDatabaseService 콘텐츠 DB(POSTGRES_*) 모두 내장 Postgres로
+        self.env.update({
+            'DB_HOST': host, 'DB_PORT': port, 'DB_USER': user, 'DB_PASSWORD': password, 'DB_NAME': database,
+            'POSTGRES_HOST': host, 'POSTGRES_PORT': port, 'POSTGRES_USER': user,
+            'POSTGRES_PASSWORD': password, 'POSTGRES_DB': database,
+        })
+        self.summary['postgres'] = f"pgserver {self._tempdir.name}"
+        logger.info(f"🧪 내장 Postgres 시작: {self._postgres.get_uri()}")
+
+    def stop(self):
+        """내장 백엔드 종료"""
+        if self._redis_server is not None:
+            self._redis_server.shutdown()
+            self._redis_server.server_close()
+        if self._postgres is not None:
+            try:
+                self._postgres.cleanup()
+            except Exception as e:
+                logger.debug(f"내장 Postgres 종료 실패: {e}")
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
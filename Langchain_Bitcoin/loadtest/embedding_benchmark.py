@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+임베딩 제공자 벤치마크
+캐시를 거치지 않고 제공자를 직접 호출하여 질의 1건 지연 시간, 배치 처리량, Intent 예시 분류 정확도를 비교
+
+사용법:
+    python embedding_benchmark.py --providers openai,local,local-int8
+    python embedding_benchmark.py --providers local,local-onnx,local-int8:paraphrase-multilingual-MiniLM-L12-v2 --threads 2
+    python embedding_benchmark.py --output embedding-benchmark.json
+
+제공자 형식: openai[:모델] | local[:모델] | local-int8[:모델] | local-onnx[:모델] | local-onnx-int8[:모델]
+(OpenAI는 OPENAI_API_KEY / OPENAI_BASE_URL 필요 - 스텁 서버로도 측정 가능)
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np  # noqa: E402
+
+from langchain_service.services.embedding_providers import (  # noqa: E402
+    EmbeddingProvider, LocalEmbeddingProvider, OpenAIEmbeddingProvider, DEFAULT_OPENAI_MODEL
+)
+
+logger = logging.getLogger("loadtest.embedding_benchmark")
+
+QUERIES = [
+    '비트코인 지금 얼마야?', 'BTC 현재 가격이 궁금해', '이더리움 최신 뉴스 알려줘', '비트코인 RSI 분석해줘',
+    '어제 비트코인 종가가 어땠어?', '안녕 반가워', 'What is Bitcoin price now?', 'crypto news headlines today',
+    '리플 차트 보여줘', '솔라나 시세 알려줘', '비트코인 ETF 승인 소식', '지난주 이더리움 가격 추이',
+]
+
+SUMMARY = ("비트코인 현물 ETF로 하루 5억 달러 이상의 자금이 유입되며 가격이 다시 사상 최고치에 근접했다. "
+           "전문가들은 기관 수요와 반감기 이후 공급 감소가 맞물려 상승세가 이어질 수 있다고 전망했다. ")
+
+
+def create_benchmark_provider(spec: str, threads: int = None) -> EmbeddingProvider:
+    """벤치마크용 제공자 생성 (양자화 / ONNX 변형 포함)"""
+    kind, _, model = spec.partition(':')
+    if kind == 'openai':
+        return OpenAIEmbeddingProvider(model or DEFAULT_OPENAI_MODEL)
+    variants = {
+        'local': ('torch', False),
+        'local-int8': ('torch', True),
+        'local-onnx': ('onnx', False),
+        'local-onnx-int8': ('onnx', True),
+    }
+    if kind not in variants:
+        raise ValueError(f"알 수 없는 제공자: {spec}")
+    backend, quantize = variants[kind]
+    return LocalEmbeddingProvider(model or None, backend=backend, quantize=quantize, threads=threads)
+
+
+def load_intent_examples() -> Dict[str, List[str]]:
+    """에이전트의 Intent 예시 문장 (불러오지 못하면 생략)"""
+    try:
+        from langchain_service.services.intent_examples import INTENT_EXAMPLES
+        return INTENT_EXAMPLES
+    except Exception as e:
+        logger.warning(f"Intent 예시를 불러오지 못해 정확도 측정 생략: {e}")
+        return {}
+
+
+def intent_accuracy(provider: EmbeddingProvider, examples: Dict[str, List[str]]) -> float:
+    """예시 문장별로 자기 자신을 제외한 최근접 예시의 Intent가 같은 비율 (leave-one-out)"""
+    labels = [intent for intent, texts in examples.items() for _ in texts]
+    matrix = np.asarray(provider.embed([text for texts in examples.values() for text in texts]), dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    similarity = matrix @ matrix.T
+    np.fill_diagonal(similarity, -np.inf)
+    nearest = similarity.argmax(axis=1)
+    return float(np.mean([labels[i] == labels[j] for i, j in enumerate(nearest)]))
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def benchmark(spec: str, args, examples: Dict[str, List[str]]) -> Dict[str, Any]:
+    """제공자 1개 측정"""
+    provider = create_benchmark_provider(spec, args.threads)
+
+    started = time.perf_counter()
+    provider.warmup()
+    load_seconds = time.perf_counter() - started
+
+    # 질의 1건 지연 시간 (채팅 / 검색 경로)
+    latencies = []
+    for i in range(args.queries):
+        text = QUERIES[i % len(QUERIES)]
+        started = time.perf_counter()
+        provider.embed([text])
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    # 배치 처리량 (저장 경로)
+    batch = [f"{SUMMARY} ({i})" for i in range(args.batch_size)]
+    started = time.perf_counter()
+    vectors = provider.embed(batch)
+    batch_seconds = time.perf_counter() - started
+
+    result = {
+        'provider': spec,
+        **provider.describe(),
+        'dimension': len(vectors[0]),
+        'load_seconds': round(load_seconds, 2),
+        'query_p50_ms': round(statistics.median(latencies), 2),
+        'query_p95_ms': round(percentile(latencies, 95), 2),
+        'batch_size': args.batch_size,
+        'batch_seconds': round(batch_seconds, 3),
+        'batch_texts_per_second': round(args.batch_size / batch_seconds, 1),
+    }
+    if examples:
+        result['intent_accuracy'] = round(intent_accuracy(provider, examples), 3)
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="임베딩 제공자 벤치마크")
+    parser.add_argument('--providers', default='local,local-int8', help='쉼표로 구분한 제공자 목록')
+    parser.add_argument('--queries', type=int, default=100, help='질의 1건 지연 측정 횟수')
+    parser.add_argument('--batch-size', type=int, default=64, help='배치 처리량 측정 크기')
+    parser.add_argument('--threads', type=int, default=None, help='로컬 추론 스레드 수')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    examples = load_intent_examples()
+
+    results = []
+    for spec in [item.strip() for item in args.providers.split(',') if item.strip()]:
+        try:
+            results.append(benchmark(spec, args, examples))
+        except Exception as e:
+            logger.error(f"❌ {spec} 측정 실패: {e}")
+            results.append({'provider': spec, 'error': str(e)})
+
+    print()
+    header = f"{'provider':<28}{'dim':>6}{'load s':>8}{'p50 ms':>9}{'p95 ms':>9}{'batch/s':>10}{'intent acc':>12}"
+    print(header)
+    print('-' * len(header))
+    for row in results:
+        if 'error' in row:
+            print(f"{row['provider']:<28}  error: {row['error']}")
+            continue
+        print(f"{row['provider']:<28}{row['dimension']:>6}{row['load_seconds']:>8.2f}{row['query_p50_ms']:>9.2f}"
+              f"{row['query_p95_ms']:>9.2f}{row['batch_texts_per_second']:>10.1f}{row.get('intent_accuracy', '-'):>12}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding='utf-8')
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
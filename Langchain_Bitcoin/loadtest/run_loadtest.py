@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+LangChain 서비스 부하 테스트
+
+외부 API 스텁 서버와 (가능하면) 내장 Redis/Postgres를 띄우고 main.py 서비스를 실행한 뒤
+설정한 Intent 비율로 /chat, /news/search, /pipeline/run 요청을 보내 지연 시간 분포와 처리량을 측정
+
+사용법:
+    cd Langchain_Bitcoin/loadtest
+    python run_loadtest.py --duration 60 --concurrency 16
+    python run_loadtest.py --mix price=0.6,news=0.2,search=0.2 --rate 20
+    python run_loadtest.py --output result.json
+    python run_loadtest.py --baseline baseline.json --max-regression 0.2   # 회귀 시 종료 코드 1
+
+이미 실행 중인 서비스에 보내려면 --service-url http://localhost:8001 (스텁/백엔드는 직접 설정)
+"""
+
+import argparse
+import http.client
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from backends import EmbeddedBackends  # noqa: E402
+from stub_servers import StubServer  # noqa: E402
+
+logger = logging.getLogger("loadtest")
+
+SERVICE_DIR = Path(__file__).parent.parent / "langchain_service"
+
+# Intent별 채팅 질문 (Intent 분류가 골고루 나오도록 구성)
+CHAT_PROMPTS: Dict[str, List[str]] = {
+    'price': ['비트코인 가격 알려줘', 'BTC 시세', '이더리움 얼마야?', '리플 현재가 알려줘', '솔라나 가격'],
+    'news': ['최신 비트코인 뉴스 알려줘', '오늘 코인 소식', '이더리움 관련 기사 있어?'],
+    'technical': ['비트코인 차트 분석해줘', 'BTC RSI MACD 분석', '이더리움 이평선 분석'],
+    'historical': ['어제 비트코인 가격', '지난주 이더리움 시세'],
+    'casual': ['안녕', '고마워', '너는 뭘 할 수 있어?'],
+}
+SEARCH_QUERIES = ['비트코인 ETF', '이더리움 업그레이드', '거래소 규제', '채굴 난이도', '스테이블코인']
+
+DEFAULT_MIX = 'price=0.45,news=0.15,technical=0.08,historical=0.05,casual=0.10,search=0.15,pipeline=0.02'
+
+
+@dataclass
+class Sample:
+    """요청 1건 결과"""
+    scenario: str
+    latency: float
+    status: int
+    ok: bool
+    error: Optional[str] = None
+
+
+@dataclass
+class ScenarioReport:
+    """시나리오별 집계"""
+    count: int = 0
+    errors: int = 0
+    latencies: List[float] = field(default_factory=list)
+    statuses: Dict[str, int] = field(default_factory=dict)
+
+
+def parse_mix(text: str) -> List[Tuple[str, float]]:
+    """'price=0.5,news=0.2' 형식의 비율 파싱 (합계로 정규화)"""
+    weights = []
+    for part in text.split(','):
+        if not part.strip():
+            continue
+        name, _, value = part.partition('=')
+        name = name.strip()
+        if name not in CHAT_PROMPTS and name not in ('search', 'pipeline'):
+            raise ValueError(f"알 수 없는 시나리오: {name}")
+        weights.append((name, float(value)))
+    total = sum(weight for _, weight in weights)
+    if total <= 0:
+        raise ValueError("비율 합계가 0입니다")
+    return [(name, weight / total) for name, weight in weights]
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """최근접 순위 백분위수"""
+    if not sorted_values:
+        return None
+    rank = max(1, int(round(pct / 100 * len(sorted_values) + 0.5)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class HttpClient:
+    """워커별 keep-alive HTTP 클라이언트 (표준 라이브러리)"""
+
+    def __init__(self, base_url: str, timeout: float):
+        parsed = urlparse(base_url)
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.timeout = timeout
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+    def request(self, method: str, path: str, payload: Any = None) -> Tuple[int, bytes]:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload is not None else None
+        headers = {'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'}
+        for attempt in range(2):
+            if self._conn is None:
+                self._conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            try:
+                self._conn.request(method, path, body=body, headers=headers)
+                response = self._conn.getresponse()
+                data = response.read()
+                if response.getheader('Content-Encoding') == 'gzip':
+                    import gzip
+                    data = gzip.decompress(data)
+                return response.status, data
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # keep-alive 연결이 서버에서 닫힌 경우 1회 재연결
+                self.close()
+                if attempt:
+                    raise
+            except Exception:
+                self.close()
+                raise
+        raise RuntimeError("unreachable")
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def build_request(scenario: str, rng: random.Random, worker: int) -> Tuple[str, str, Dict]:
+    """시나리오별 요청 (메서드, 경로, 본문)"""
+    if scenario == 'search':
+        return 'POST', '/news/search', {'query': rng.choice(SEARCH_QUERIES), 'limit': 10}
+    if scenario == 'pipeline':
+        return 'POST', '/pipeline/run', {'hours_back': 24}
+    return 'POST', '/chat', {
+        'message': rng.choice(CHAT_PROMPTS[scenario]),
+        'session_id': f"loadtest-{worker}-{rng.randint(0, 49)}",
+        'use_rag': True
+    }
+
+
+def execute(client: HttpClient, scenario: str, rng: random.Random, worker: int, scheduled: float) -> Sample:
+    """요청 1건 실행 (지연 시간은 예정 시각 기준 - 대기 누락 보정)"""
+    method, path, payload = build_request(scenario, rng, worker)
+    try:
+        status, data = client.request(method, path, payload)
+    except Exception as e:
+        return Sample(scenario, time.perf_counter() - scheduled, 0, False, type(e).__name__)
+
+    latency = time.perf_counter() - scheduled
+    ok = 200 <= status < 300
+    error = None if ok else f"HTTP {status}"
+    if ok and path == '/chat':
+        # 채팅은 실패해도 200 + error 필드로 응답하므로 본문 확인
+        try:
+            body_error = json.loads(data).get('error')
+        except Exception:
+            body_error = 'invalid_json'
+        if body_error:
+            ok, error = False, str(body_error)[:80]
+    return Sample(scenario, latency, status, ok, error)
+
+
+class Pacer:
+    """개방형 부하 (초당 요청 수 고정) 예정 시각 분배"""
+
+    def __init__(self, rate: float, start: float):
+        self.interval = 1.0 / rate
+        self._next = start
+        self._lock = threading.Lock()
+
+    def next_slot(self) -> float:
+        with self._lock:
+            slot = self._next
+            self._next += self.interval
+        return slot
+
+
+def run_load(base_url: str, mix: List[Tuple[str, float]], duration: float, concurrency: int,
+             rate: Optional[float], seed: int, timeout: float, warmup: float) -> Tuple[List[Sample], float]:
+    """부하 실행 (워밍업 구간 결과는 제외)"""
+    names = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    samples: List[Sample] = []
+    samples_lock = threading.Lock()
+    start = time.perf_counter()
+    measure_from = start + warmup
+    deadline = measure_from + duration
+    pacer = Pacer(rate, start) if rate else None
+
+    def worker(index: int):
+        rng = random.Random(seed * 1000 + index)
+        client = HttpClient(base_url, timeout)
+        local: List[Sample] = []
+        try:
+            while True:
+                if pacer:
+                    scheduled = pacer.next_slot()
+                    if scheduled >= deadline:
+                        break
+                    delay = scheduled - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                else:
+                    scheduled = time.perf_counter()
+                    if scheduled >= deadline:
+                        break
+                sample = execute(client, rng.choices(names, weights)[0], rng, index, scheduled)
+                if scheduled >= measure_from:
+                    local.append(sample)
+        finally:
+            client.close()
+            with samples_lock:
+                samples.extend(local)
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='loadtest') as pool:
+        for future in [pool.submit(worker, i) for i in range(concurrency)]:
+            future.result()
+
+    elapsed = max(time.perf_counter() - measure_from, 1e-9)
+    return samples, min(elapsed, duration + timeout)
+
+
+def summarize(samples: List[Sample], elapsed: float) -> Dict[str, Any]:
+    """시나리오별 / 전체 p50/p95/p99, 처리량, 오류율"""
+    reports: Dict[str, ScenarioReport] = {}
+    for sample in samples:
+        for key in (sample.scenario, 'overall'):
+            report = reports.setdefault(key, ScenarioReport())
+            report.count += 1
+            report.latencies.append(sample.latency)
+            status_key = str(sample.status) if sample.status else (sample.error or 'exception')
+            report.statuses[status_key] = report.statuses.get(status_key, 0) + 1
+            if not sample.ok:
+                report.errors += 1
+
+    summary = {}
+    for name, report in sorted(reports.items(), key=lambda item: (item[0] == 'overall', item[0])):
+        values = sorted(report.latencies)
+        summary[name] = {
+            'requests': report.count,
+            'throughput_rps': round(report.count / elapsed, 2),
+            'error_rate': round(report.errors / report.count, 4) if report.count else 0.0,
+            'p50_ms': round(percentile(values, 50) * 1000, 1),
+            'p95_ms': round(percentile(values, 95) * 1000, 1),
+            'p99_ms': round(percentile(values, 99) * 1000, 1),
+            'max_ms': round(values[-1] * 1000, 1),
+            'statuses': report.statuses,
+        }
+    return summary
+
+
+def print_report(summary: Dict[str, Any], elapsed: float):
+    """표 형식 출력"""
+    print()
+    print(f"측정 구간: {elapsed:.1f}초")
+    header = f"{'scenario':<12}{'reqs':>8}{'rps':>9}{'err%':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+    print(header)
+    print('-' * len(header))
+    for name, row in summary.items():
+        print(f"{name:<12}{row['requests']:>8}{row['throughput_rps']:>9.2f}{row['error_rate'] * 100:>7.1f}%"
+              f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}{row['max_ms']:>10.1f}")
+    print()
+    for name, row in summary.items():
+        print(f"  {name}: {row['statuses']}")
+
+
+def compare_baseline(summary: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """기준 결과 대비 회귀 항목 (p95/p99 증가, 처리량 감소, 오류율 증가)"""
+    regressions = []
+    for name, row in summary.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for metric in ('p95_ms', 'p99_ms'):
+            if base[metric] and row[metric] > base[metric] * (1 + max_regression):
+                regressions.append(f"{name} {metric}: {base[metric]} → {row[metric]}")
+        if base['throughput_rps'] and row['throughput_rps'] < base['throughput_rps'] * (1 - max_regression):
+            regressions.append(f"{name} throughput_rps: {base['throughput_rps']} → {row['throughput_rps']}")
+        if row['error_rate'] > base['error_rate'] + 0.01:
+            regressions.append(f"{name} error_rate: {base['error_rate']} → {row['error_rate']}")
+    return regressions
+
+
+def wait_until_ready(base_url: str, timeout: float, process: Optional[subprocess.Popen]) -> bool:
+    """/ready가 200이 될 때까지 대기 (단계적 시작 완료)"""
+    client = HttpClient(base_url, 5)
+    deadline = time.time() + timeout
+    last = None
+    while time.time() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"서비스 프로세스가 종료되었습니다 (exit {process.returncode})")
+        try:
+            status, data = client.request('GET', '/ready')
+            last = data[:300]
+            if status == 200:
+                return True
+        except Exception as e:
+            last = str(e)
+        time.sleep(1)
+    logger.warning(f"⚠️ 서비스가 {timeout}초 내에 준비되지 않았습니다 (제한 모드로 측정): {last}")
+    return False
+
+
+def fetch_stats(base_url: str) -> Dict[str, Any]:
+    """종료 시점 서비스 통계 (캐시 적중률, 허용 제어 등)"""
+    try:
+        status, data = HttpClient(base_url, 10).request('GET', '/stats')
+        return json.loads(data) if status == 200 else {}
+    except Exception:
+        return {}
+
+
+def start_service(port: int, env: Dict[str, str], log_path: Path, workers: int) -> subprocess.Popen:
+    """uvicorn으로 서비스 실행 (로그는 파일로)"""
+    command = [sys.executable, '-m', 'uvicorn', 'main:app', '--host', '127.0.0.1', '--port', str(port),
+               '--workers', str(workers), '--log-level', 'warning']
+    log_file = open(log_path, 'w', encoding='utf-8')
+    logger.info(f"🚀 서비스 시작: {' '.join(command)} (로그: {log_path})")
+    return subprocess.Popen(command, cwd=SERVICE_DIR, env={**os.environ, **env},
+                            stdout=log_file, stderr=subprocess.STDOUT)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="LangChain 서비스 부하 테스트")
+    parser.add_argument('--duration', type=float, default=60, help='측정 시간 (초)')
+    parser.add_argument('--warmup', type=float, default=10, help='워밍업 시간 (초, 결과에서 제외)')
+    parser.add_argument('--concurrency', type=int, default=16, help='동시 요청 워커 수')
+    parser.add_argument('--rate', type=float, default=None, help='초당 요청 수 고정 (미지정 시 폐쇄형 부하)')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'시나리오 비율 (기본값: {DEFAULT_MIX})')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--timeout', type=float, default=60, help='요청 제한 시간 (초)')
+    parser.add_argument('--latency-scale', type=float, default=1.0, help='스텁 지연 시간 배율')
+    parser.add_argument('--service-url', default=None, help='이미 실행 중인 서비스 주소 (지정 시 서비스/스텁 실행 생략)')
+    parser.add_argument('--service-port', type=int, default=18001)
+    parser.add_argument('--workers', type=int, default=1, help='uvicorn 워커 수')
+    parser.add_argument('--ready-timeout', type=float, default=120)
+    parser.add_argument('--no-embedded-redis', action='store_true', help='내장 Redis 대신 외부 Redis 사용')
+    parser.add_argument('--no-embedded-postgres', action='store_true', help='내장 Postgres 대신 외부 Postgres 사용')
+    parser.add_argument('--output', default=None, help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', default=None, help='비교할 기준 결과 JSON')
+    parser.add_argument('--max-regression', type=float, default=0.2, help='허용 회귀 비율 (기본값: 20%%)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    mix = parse_mix(args.mix)
+
+    stubs = backends = process = None
+    environment: Dict[str, Any] = {}
+    try:
+        if args.service_url:
+            base_url = args.service_url.rstrip('/')
+        else:
+            stubs = StubServer(latency_scale=args.latency_scale, seed=args.seed).start()
+            backends = EmbeddedBackends(not args.no_embedded_redis, not args.no_embedded_postgres)
+            env = {**stubs.service_env(), **backends.start()}
+            environment = {'stubs': stubs.base_url, 'backends': backends.summary,
+                           'latency_scale': args.latency_scale}
+            process = start_service(args.service_port, env, Path.cwd() / 'loadtest-service.log', args.workers)
+            base_url = f"http://127.0.0.1:{args.service_port}"
+
+        ready = wait_until_ready(base_url, args.ready_timeout, process)
+        logger.info(f"📈 부하 시작: {args.concurrency} 워커, {args.duration}초 (+워밍업 {args.warmup}초), "
+                    f"{'개방형 ' + str(args.rate) + ' rps' if args.rate else '폐쇄형'}, 비율 {dict(mix)}")
+
+        samples, elapsed = run_load(base_url, mix, args.duration, args.concurrency, args.rate,
+                                    args.seed, args.timeout, args.warmup)
+        if not samples:
+            logger.error("❌ 측정된 요청이 없습니다")
+            return 2
+
+        summary = summarize(samples, elapsed)
+        print_report(summary, elapsed)
+
+        stats = fetch_stats(base_url)
+        result = {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'config': {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')},
+            'service_ready': ready,
+            'environment': environment,
+            'summary': summary,
+            'service_stats': {key: stats.get(key) for key in ('response_cache', 'embedding_cache', 'coalescing', 'admission', 'execution', 'jobs')},
+            'stub_requests': stubs.request_counts if stubs else None,
+        }
+        if args.output:
+            Path(args.output).write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding='utf-8')
+            logger.info(f"💾 결과 저장: {args.output}")
+
+        if args.baseline:
+            baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+            regressions = compare_baseline(summary, baseline.get('summary', baseline), args.max_regression)
+            if regressions:
+                print("❌ 기준 대비 회귀:")
+                for line in regressions:
+                    print(f"  - {line}")
+                return 1
+            print(f"✅ 기준 대비 회귀 없음 (허용 {args.max_regression:.0%})")
+        return 0
+    finally:
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        if backends is not None:
+            backends.stop()
+        if stubs is not None:
+            stubs.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
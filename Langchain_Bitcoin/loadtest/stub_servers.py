@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+외부 API 로컬 스텁 서버
+부하 테스트에서 api.upbit.com / OpenAI / CoinGecko / NewsData.io / RSS 피드를 대신하는 HTTP 서버
+
+- 표준 라이브러리만 사용 (ThreadingHTTPServer)
+- 엔드포인트별 지연 시간을 로그 정규 분포(중앙값, p95)로 재현
+- 고정 시드로 응답 데이터와 지연 시간 재현 가능
+
+단독 실행:
+    python stub_servers.py --port 18080 --latency-scale 1.0
+
+엔드포인트:
+    GET  /upbit/v1/ticker?markets=KRW-BTC,...
+    GET  /upbit/v1/candles/days?market=KRW-BTC&count=200
+    GET  /upbit/v1/candles/minutes/1?market=KRW-BTC&count=200
+    GET  /coingecko/api/v3/simple/price?ids=bitcoin,...
+    POST /openai/v1/embeddings
+    POST /openai/v1/chat/completions (stream 지원)
+    GET  /newsdata/api/1/news
+    GET  /rss/{source}
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import random
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger("loadtest.stubs")
+
+EMBEDDING_DIM = 1536
+
+# 엔드포인트별 지연 시간 (중앙값 ms, p95 ms) - 운영 환경 관측치 기준 대략값
+DEFAULT_LATENCIES: Dict[str, Tuple[float, float]] = {
+    'upbit_ticker': (35, 120),
+    'upbit_candles': (60, 200),
+    'coingecko_price': (150, 450),
+    'openai_embeddings': (120, 400),
+    'openai_chat': (900, 2500),
+    'newsdata_news': (400, 1200),
+    'rss_feed': (250, 900),
+}
+
+# 스트리밍 응답 토큰 간격 (ms)
+STREAM_TOKEN_INTERVAL_MS = 25
+
+COINS = {
+    'BTC': ('bitcoin', 95_000_000),
+    'ETH': ('ethereum', 4_800_000),
+    'XRP': ('ripple', 850),
+    'ADA': ('cardano', 650),
+    'DOT': ('polkadot', 9_500),
+    'LINK': ('chainlink', 21_000),
+    'LTC': ('litecoin', 120_000),
+    'BCH': ('bitcoin-cash', 600_000),
+    'SOL': ('solana', 230_000),
+    'DOGE': ('dogecoin', 220),
+}
+
+CHAT_REPLY = (
+    "비트코인은 최근 거래량이 늘어나며 변동성이 확대되는 모습입니다. "
+    "단기 이동평균선이 장기 이동평균선 위에 위치해 상승 추세가 유지되고 있으며, "
+    "RSI는 과매수 구간에 근접해 있어 단기 조정 가능성도 염두에 둘 필요가 있습니다. "
+    "주요 뉴스로는 현물 ETF 자금 유입과 규제 관련 발표가 시장 심리에 영향을 주고 있습니다. "
+    "투자 결정은 본인의 판단과 책임 하에 신중히 하시기 바랍니다."
+)
+
+
+class LatencyModel:
+    """로그 정규 분포 지연 시간 (중앙값과 p95로 모수 결정)"""
+
+    def __init__(self, latencies: Dict[str, Tuple[float, float]], scale: float = 1.0, seed: int = 42):
+        self.latencies = latencies
+        self.scale = scale
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self, name: str) -> float:
+        """지연 시간 샘플 (초)"""
+        median, p95 = self.latencies.get(name, (50, 150))
+        sigma = math.log(max(p95, median + 1) / median) / 1.645
+        with self._lock:
+            value = self._random.lognormvariate(math.log(median), sigma)
+        return value * self.scale / 1000
+
+    def sleep(self, name: str):
+        """지연 시간만큼 대기"""
+        delay = self.sample(name)
+        if delay > 0:
+            time.sleep(delay)
+
+
+def hashed_embedding(text: str, dim: int = EMBEDDING_DIM) -> List[float]:
+    """
+    문자 3-gram 특징 해싱 임베딩 (결정적)
+
+    같은 문장은 같은 벡터, 비슷한 문장은 높은 코사인 유사도를 가지므로
+    Intent 분류가 실제처럼 의미 있는 결과를 냄
+    """
+    vector = [0.0] * dim
+    normalized = ' '.join(text.lower().split())
+    padded = f"  {normalized}  "
+    for i in range(len(padded) - 2):
+        digest = hashlib.blake2b(padded[i:i + 3].encode('utf-8'), digest_size=8).digest()
+        index = int.from_bytes(digest[:4], 'little') % dim
+        sign = 1.0 if digest[4] & 1 else -1.0
+        vector[index] += sign
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (사용량 필드용)"""
+    return max(1, len(text) // 2)
+
+
+class StubState:
+    """스텁 서버 공유 상태 (지연 모델, 결정적 데이터, 요청 수)"""
+
+    def __init__(self, latency: LatencyModel, seed: int = 42, articles_per_feed: int = 20):
+        self.latency = latency
+        self.seed = seed
+        self.articles_per_feed = articles_per_feed
+        self.request_counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def count(self, name: str):
+        with self._lock:
+            self.request_counts[name] = self.request_counts.get(name, 0) + 1
+
+    def price(self, symbol: str) -> float:
+        """시간에 따라 천천히 움직이는 결정적 가격"""
+        base = COINS.get(symbol, (symbol.lower(), 1000))[1]
+        phase = (zlib.crc32(symbol.encode()) % 1000) / 1000 * math.tau
+        return round(base * (1 + 0.02 * math.sin(time.time() / 600 + phase)), 2)
+
+    def ticker(self, market: str) -> Dict:
+        symbol = market.split('-')[-1]
+        price = self.price(symbol)
+        prev = price / 1.012
+        return {
+            'market': market,
+            'trade_date': datetime.now(timezone.utc).strftime('%Y%m%d'),
+            'trade_price': price,
+            'opening_price': round(prev, 2),
+            'high_price': round(price * 1.018, 2),
+            'low_price': round(prev * 0.985, 2),
+            'prev_closing_price': round(prev, 2),
+            'change': 'RISE',
+            'change_price': round(price - prev, 2),
+            'change_rate': round((price - prev) / prev, 6),
+            'signed_change_price': round(price - prev, 2),
+            'signed_change_rate': round((price - prev) / prev, 6),
+            'trade_volume': 0.0123,
+            'acc_trade_volume_24h': 3456.789,
+            'acc_trade_price_24h': round(price * 3456.789, 2),
+            'timestamp': int(time.time() * 1000),
+        }
+
+    def candles(self, market: str, count: int, minutes: Optional[int]) -> List[Dict]:
+        """결정적 랜덤 워크 캔들 (최신순, 업비트 응답 형식)"""
+        rng = random.Random(f"{self.seed}:{market}:{minutes}")
+        symbol = market.split('-')[-1]
+        step = timedelta(minutes=minutes) if minutes else timedelta(days=1)
+        now = datetime.now().replace(second=0, microsecond=0)
+        price = self.price(symbol) * 0.7
+        rows = []
+        for i in range(count):
+            open_price = price
+            price = max(1.0, price * (1 + rng.gauss(0.0015, 0.03)))
+            high = max(open_price, price) * (1 + abs(rng.gauss(0, 0.01)))
+            low = min(open_price, price) * (1 - abs(rng.gauss(0, 0.01)))
+            moment = now - step * (count - 1 - i)
+            rows.append({
+                'market': market,
+                'candle_date_time_utc': (moment - timedelta(hours=9)).strftime('%Y-%m-%dT%H:%M:%S'),
+                'candle_date_time_kst': moment.strftime('%Y-%m-%dT%H:%M:%S'),
+                'opening_price': round(open_price, 2),
+                'high_price': round(high, 2),
+                'low_price': round(low, 2),
+                'trade_price': round(price, 2),
+                'timestamp': int(moment.timestamp() * 1000),
+                'candle_acc_trade_price': round(price * 1200, 2),
+                'candle_acc_trade_volume': round(abs(rng.gauss(1200, 300)), 4),
+            })
+        return rows[::-1]
+
+    def articles(self, source: str, count: int) -> List[Dict]:
+        """결정적 뉴스 기사 (최근 24시간 내 발행)"""
+        rng = random.Random(f"{self.seed}:{source}")
+        topics = ['비트코인 ETF 자금 유입', '이더리움 업그레이드 일정', '거래소 규제 발표', '채굴 난이도 상승',
+                  '스테이블코인 발행량 증가', '기관 투자자 매수세', '리플 소송 결과', '솔라나 네트워크 거래량']
+        now = datetime.now(timezone.utc)
+        items = []
+        for i in range(count):
+            topic = rng.choice(topics)
+            published = now - timedelta(minutes=rng.randint(5, 24 * 60 - 5))
+            items.append({
+                'title': f"[{source}] {topic} #{i + 1}",
+                'link': f"https://example.com/{source}/{i + 1}",
+                'description': f"{topic}에 대한 분석 기사입니다. " * 6,
+                'published': published,
+            })
+        return items
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """스텁 요청 처리"""
+
+    server_version = "LoadtestStub/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self) -> StubState:
+        return self.server.state
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send_json(self, payload, status: int = 200):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_text(self, text: str, content_type: str, status: int = 200):
+        body = text.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> Dict:
+        length = int(self.headers.get('Content-Length', 0) or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length).decode('utf-8'))
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        path = parsed.path.rstrip('/')
+
+        if path == '/health':
+            self._send_json({'status': 'ok', 'requests': self.state.request_counts})
+        elif path == '/upbit/v1/ticker':
+            self.state.count('upbit_ticker')
+            self.state.latency.sleep('upbit_ticker')
+            markets = [m for m in query.get('markets', 'KRW-BTC').split(',') if m]
+            self._send_json([self.state.ticker(market) for market in markets])
+        elif path.startswith('/upbit/v1/candles/'):
+            self.state.count('upbit_candles')
+            self.state.latency.sleep('upbit_candles')
+            minutes = int(path.rsplit('/', 1)[-1]) if '/minutes/' in path else None
+            count = min(int(query.get('count', 200)), 200)
+            self._send_json(self.state.candles(query.get('market', 'KRW-BTC'), count, minutes))
+        elif path == '/coingecko/api/v3/simple/price':
+            self.state.count('coingecko_price')
+            self.state.latency.sleep('coingecko_price')
+            ids = [i for i in query.get('ids', 'bitcoin').split(',') if i]
+            by_id = {coin_id: symbol for symbol, (coin_id, _) in COINS.items()}
+            payload = {}
+            for coin_id in ids:
+                usd = self.state.price(by_id.get(coin_id, 'BTC')) / 1400
+                payload[coin_id] = {'usd': round(usd, 4), 'usd_24h_change': 1.2,
+                                    'usd_24h_vol': round(usd * 1e6, 2), 'usd_market_cap': round(usd * 1e8, 2)}
+            self._send_json(payload)
+        elif path == '/newsdata/api/1/news':
+            self.state.count('newsdata_news')
+            self.state.latency.sleep('newsdata_news')
+            articles = self.state.articles('newsdata', self.state.articles_per_feed)
+            self._send_json({'status': 'success', 'totalResults': len(articles), 'results': [{
+                'article_id': hashlib.md5(a['link'].encode()).hexdigest(),
+                'title': a['title'],
+                'link': a['link'],
+                'description': a['description'],
+                'content': a['description'] * 3,
+                'pubDate': a['published'].strftime('%Y-%m-%d %H:%M:%S'),
+                'source_id': 'stub',
+                'keywords': ['bitcoin', 'crypto'],
+                'language': 'korean',
+            } for a in articles]})
+        elif path.startswith('/rss/'):
+            self.state.count('rss_feed')
+            self.state.latency.sleep('rss_feed')
+            source = path.split('/', 2)[-1]
+            self._send_text(self._render_rss(source), 'application/rss+xml; charset=utf-8')
+        else:
+            self._send_json({'error': f'unknown path {path}'}, status=404)
+
+    def do_POST(self):
+        path = urlparse(self.path).path.rstrip('/')
+        payload = self._read_json()
+
+        if path == '/openai/v1/embeddings':
+            self.state.count('openai_embeddings')
+            self.state.latency.sleep('openai_embeddings')
+            inputs = payload.get('input', [])
+            if isinstance(inputs, str):
+                inputs = [inputs]
+            self._send_json({
+                'object': 'list',
+                'model': payload.get('model', 'text-embedding-ada-002'),
+                'data': [{'object': 'embedding', 'index': i, 'embedding': hashed_embedding(str(text))}
+                         for i, text in enumerate(inputs)],
+                'usage': {'prompt_tokens': sum(estimate_tokens(str(t)) for t in inputs),
+                          'total_tokens': sum(estimate_tokens(str(t)) for t in inputs)},
+            })
+        elif path == '/openai/v1/chat/completions':
+            self.state.count('openai_chat')
+            if payload.get('stream'):
+                self._stream_chat(payload)
+            else:
+                self.state.latency.sleep('openai_chat')
+                self._send_json(self._chat_completion(payload))
+        else:
+            self._send_json({'error': f'unknown path {path}'}, status=404)
+
+    def _chat_completion(self, payload: Dict) -> Dict:
+        prompt = json.dumps(payload.get('messages', []), ensure_ascii=False)
+        return {
+            'id': f"chatcmpl-stub-{int(time.time() * 1000)}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': payload.get('model', 'gpt-3.5-turbo'),
+            'choices': [{'index': 0, 'finish_reason': 'stop',
+                         'message': {'role': 'assistant', 'content': CHAT_REPLY}}],
+            'usage': {'prompt_tokens': estimate_tokens(prompt), 'completion_tokens': estimate_tokens(CHAT_REPLY),
+                      'total_tokens': estimate_tokens(prompt) + estimate_tokens(CHAT_REPLY)},
+        }
+
+    def _stream_chat(self, payload: Dict):
+        """SSE 스트리밍 응답 (첫 토큰까지 지연 후 일정 간격으로 토큰 전송)"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        # 첫 토큰 지연은 전체 지연의 약 1/3
+        time.sleep(self.state.latency.sample('openai_chat') / 3)
+        base = {'id': f"chatcmpl-stub-{int(time.time() * 1000)}", 'object': 'chat.completion.chunk',
+                'created': int(time.time()), 'model': payload.get('model', 'gpt-3.5-turbo')}
+        words = CHAT_REPLY.split(' ')
+        for i, word in enumerate(words):
+            chunk = dict(base, choices=[{'index': 0, 'finish_reason': None,
+                                         'delta': {'content': word + (' ' if i < len(words) - 1 else '')}}])
+            self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode('utf-8'))
+            self.wfile.flush()
+            time.sleep(STREAM_TOKEN_INTERVAL_MS * self.state.latency.scale / 1000)
+        final = dict(base, choices=[{'index': 0, 'finish_reason': 'stop', 'delta': {}}])
+        self.wfile.write(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode('utf-8'))
+        self.wfile.flush()
+
+    def _render_rss(self, source: str) -> str:
+        items = []
+        for article in self.state.articles(source, self.state.articles_per_feed):
+            items.append(
+                "<item>"
+                f"<title>{article['title']}</title>"
+                f"<link>{article['link']}</link>"
+                f"<description>{article['description']}</description>"
+                f"<pubDate>{format_datetime(article['published'])}</pubDate>"
+                "</item>"
+            )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            f'<rss version="2.0"><channel><title>{source}</title><link>https://example.com/{source}</link>'
+            f'<description>loadtest stub feed</description>{"".join(items)}</channel></rss>'
+        )
+
+
+class StubServer:
+    """백그라운드 스레드에서 실행되는 스텁 서버"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency_scale: float = 1.0,
+                 seed: int = 42, latencies: Dict[str, Tuple[float, float]] = None):
+        self.httpd = ThreadingHTTPServer((host, port), StubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = StubState(LatencyModel(latencies or DEFAULT_LATENCIES, latency_scale, seed), seed)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_counts(self) -> Dict[str, int]:
+        return dict(self.httpd.state.request_counts)
+
+    def service_env(self) -> Dict[str, str]:
+        """서비스 프로세스가 스텁을 바라보도록 하는 환경변수"""
+        return {
+            'UPBIT_BASE_URL': f"{self.base_url}/upbit/v1",
+            'COINGECKO_BASE_URL': f"{self.base_url}/coingecko/api/v3",
+            'OPENAI_BASE_URL': f"{self.base_url}/openai/v1",
+            'OPENAI_API_KEY': 'sk-loadtest-stub',
+            'NEWSDATA_BASE_URL': f"{self.base_url}/newsdata/api/1",
+            'NEWSDATA_API_KEY': 'loadtest-stub',
+            'NEWS_RSS_BASE_URL': f"{self.base_url}/rss",
+        }
+
+    def start(self) -> 'StubServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='loadtest-stubs', daemon=True)
+        self._thread.start()
+        logger.info(f"🧪 스텁 서버 시작: {self.base_url}")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="외부 API 스텁 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=18080)
+    parser.add_argument('--latency-scale', type=float, default=1.0, help='지연 시간 배율 (0이면 지연 없음)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    server = StubServer(args.host, args.port, args.latency_scale, args.seed).start()
+    for key, value in server.service_env().items():
+        print(f"export {key}={value}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()